@@ -0,0 +1,302 @@
+"""
+Benchmarks for the backtest engine's hot paths — no ThetaData cache needed.
+
+Each run writes a synthetic cache (backtest.synthetic: seeded SPX/VIX
+random walk, Black-Scholes-priced SPXW chain) per data resolution into a
+temp dir and times:
+
+    build_lookup/<res>          _build_chain_lookup on one day's chain  (rows/s)
+    scan_strike/<res>           _scan_for_viable_strike, both sides     (scans/s)
+    simulate_day/<res>/e<N>     simulate_day with N entries, day cached (days/s)
+    run_backtest/<res>          full run_backtest, cold caches          (days/s)
+
+Every case reports the best of --repeat samples.  Raw rates depend on the
+machine, so each is also turned into a score: rate × the time this machine
+takes for a fixed numpy + dict calibration workload.  Scores recorded on one
+box are comparable on another to within a few tens of percent — hence the
+generous default threshold.
+
+The baseline lives in backtest/benchmark_baseline.json.  A run compares
+every case against it and exits with status 1 when any score dropped by
+more than --threshold.
+
+Usage:
+    python -m backtest.benchmark                       # run all, compare to baseline
+    python -m backtest.benchmark --quick               # 5min/1min, fewer days, 1 sample
+    python -m backtest.benchmark --only simulate_day   # cases whose name contains this
+    python -m backtest.benchmark --update-baseline     # record the current scores
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backtest import engine
+from backtest.config import BacktestConfig, live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.index_series import clear_index_cache
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+RESOLUTIONS = ("5min", "1min", "5sec")
+ENTRY_COUNTS = (1, 3, 5)
+ENTRY_TIMES = ["10:15", "10:45", "11:15", "11:45", "12:15"]
+BENCH_START = date(2024, 3, 4)
+
+# Strikes either side of the open; 5-sec chains are ~60× the rows of 5-min
+_HALF_WIDTH = {"5min": 400, "1min": 400, "5sec": 150}
+
+
+@dataclass
+class CaseResult:
+    name: str
+    rate: float       # ops per second (best sample)
+    unit: str
+    score: float      # rate × calibration seconds
+
+    def as_dict(self) -> dict:
+        return {"rate": self.rate, "unit": self.unit, "score": self.score}
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+# ── Timing ─────────────────────────────────────────────────────────────────
+
+def best_rate(fn: Callable[[], object], ops: float, repeat: int = 3,
+              min_time: float = 0.2) -> float:
+    """Best ops/s over `repeat` samples; each sample calls fn for >= min_time."""
+    best = 0.0
+    for _ in range(max(1, repeat)):
+        n, t0 = 0, time.perf_counter()
+        while True:
+            fn()
+            n += 1
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_time:
+                break
+        best = max(best, n * ops / elapsed)
+    return best
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Seconds this machine needs for a fixed numpy + pure-Python workload (best of repeat)."""
+    rng = np.random.default_rng(0)
+    a = rng.random(200_000)
+    keys = np.sort(a)
+    table = {i: float(i) for i in range(50_000)}
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        np.searchsorted(keys, a)
+        np.sort(a)
+        total = 0.0
+        for i in range(50_000):
+            total += table[i]
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+# ── Cases ──────────────────────────────────────────────────────────────────
+
+def _bench_config(cache_dir: Path, resolution: str, days: Sequence[date]) -> BacktestConfig:
+    cfg = deepcopy(live_config())
+    cfg.cache_dir = str(cache_dir)
+    cfg.data_resolution = resolution
+    cfg.start_date, cfg.end_date = days[0], days[-1]
+    cfg.entry_times = list(ENTRY_TIMES)
+    cfg.result_cache_dir = None
+    cfg.use_real_greeks = False
+    return cfg
+
+
+def _cold_caches():
+    DAY_CACHE.clear(shared=True)
+    clear_index_cache()
+
+
+def run_cases(work_dir: Path, resolutions: Sequence[str] = RESOLUTIONS,
+              entry_counts: Sequence[int] = ENTRY_COUNTS, n_days: int = 5,
+              repeat: int = 3, min_time: float = 0.2, only: Optional[str] = None,
+              calibration: Optional[float] = None, log: Callable[[str], None] = print
+              ) -> Dict[str, CaseResult]:
+    """Write synthetic caches under work_dir and time every (matching) case."""
+    calibration = calibrate() if calibration is None else calibration
+    days = trading_days(BENCH_START, n_days)
+    out: Dict[str, CaseResult] = {}
+
+    def case(name: str, unit: str, fn: Callable[[], object], ops: float):
+        if only and only not in name:
+            return
+        rate = best_rate(fn, ops, repeat, min_time)
+        out[name] = CaseResult(name, rate, unit, rate * calibration)
+        log(f"  {name:<28} {rate:>14,.1f} {unit}")
+
+    for res in resolutions:
+        names = [f"build_lookup/{res}", f"scan_strike/{res}", f"run_backtest/{res}",
+                 *(f"simulate_day/{res}/e{n}" for n in entry_counts)]
+        if only and not any(only in name for name in names):
+            continue   # don't write a cache nothing will read
+        cache_dir = Path(work_dir) / res
+        if not cache_dir.exists():
+            log(f"  writing synthetic {res} cache ({n_days} days)...")
+            write_synthetic_cache(cache_dir, days, resolution=res, with_greeks=False,
+                                  half_width=_HALF_WIDTH[res])
+        cfg = _bench_config(cache_dir, res, days)
+        _cold_caches()
+        day = days[0]
+        data = engine.get_day_data(day, cfg, cache_dir)
+
+        case(f"build_lookup/{res}", "rows/s",
+             lambda: engine._build_chain_lookup(data.chain_df), len(data.chain_df))
+
+        points = []
+        for ms in data.all_times[::max(1, len(data.all_times) // 24)]:
+            spx = data.spx.at(ms)
+            if spx > 0:
+                points.append((round(spx / 5) * 5, ms))
+
+        def scan():
+            for spx_rounded, ms in points:
+                for side in ("call", "put"):
+                    engine._scan_for_viable_strike(data.lookup, spx_rounded, side, 50, 60, 25,
+                                                   cfg.min_call_credit * 100, ms, cfg)
+
+        case(f"scan_strike/{res}", "scans/s", scan, 2 * len(points))
+
+        for n in entry_counts:
+            cfg_n = deepcopy(cfg)
+            cfg_n.entry_times = ENTRY_TIMES[:n]
+            case(f"simulate_day/{res}/e{n}", "days/s",
+                 lambda c=cfg_n: engine.simulate_day(day, c, cache_dir, set()), 1)
+
+        def full_run():
+            _cold_caches()
+            engine.run_backtest(cfg, verbose=False)
+
+        case(f"run_backtest/{res}", "days/s", full_run, len(days))
+        _cold_caches()
+    return out
+
+
+# ── Baseline ───────────────────────────────────────────────────────────────
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[dict]:
+    if not Path(path).exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, CaseResult], calibration: float,
+                  path: Path = BASELINE_PATH):
+    """Write results as the baseline; cases not re-run keep their old entry."""
+    old = load_baseline(path) or {}
+    cases = dict(old.get("cases", {}))
+    cases.update({name: r.as_dict() for name, r in results.items()})
+    data = {
+        "recorded": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "machine": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "calibration_s": calibration,
+        "cases": dict(sorted(cases.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def compare(results: Dict[str, dict], baseline: dict,
+            threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """Cases whose score fell more than `threshold` below the baseline's."""
+    out = []
+    for name, r in sorted(results.items()):
+        base = baseline.get("cases", {}).get(name)
+        if base and base.get("score") and r["score"] < base["score"] * (1 - threshold):
+            out.append(Regression(name, base["score"], r["score"]))
+    return out
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Backtest engine benchmarks (synthetic data)")
+    ap.add_argument("--quick", action="store_true",
+                    help="5min + 1min only, 2 days, 1 sample per case")
+    ap.add_argument("--only", default=None, help="only cases whose name contains this")
+    ap.add_argument("--days", type=int, default=None, help="synthetic days (default 5, quick 2)")
+    ap.add_argument("--repeat", type=int, default=None, help="samples per case (default 3)")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help=f"allowed score drop vs baseline (default {DEFAULT_THRESHOLD:.0%})")
+    ap.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline JSON path")
+    ap.add_argument("--update-baseline", action="store_true",
+                    help="write this run's scores to the baseline instead of comparing")
+    ap.add_argument("--work-dir", default=None,
+                    help="keep the synthetic caches here (default: a temp dir)")
+    args = ap.parse_args(argv)
+
+    resolutions = ("5min", "1min") if args.quick else RESOLUTIONS
+    n_days = args.days or (2 if args.quick else 5)
+    repeat = args.repeat or (1 if args.quick else 3)
+
+    calibration = calibrate()
+    print(f"\n  Calibration: {calibration * 1e3:.1f} ms\n")
+    with tempfile.TemporaryDirectory(prefix="backtest_bench_") as tmp:
+        work_dir = Path(args.work_dir) if args.work_dir else Path(tmp)
+        results = run_cases(work_dir, resolutions, n_days=n_days, repeat=repeat,
+                            only=args.only, calibration=calibration)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        save_baseline(results, calibration, baseline_path)
+        print(f"\n  Baseline written: {baseline_path} ({len(results)} cases)")
+        return 0
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"\n  No baseline at {baseline_path} — record one with --update-baseline")
+        return 0
+
+    print(f"\n  {'Case':<28} {'Baseline':>10} {'Now':>10} {'Change':>8}")
+    for name, r in sorted(results.items()):
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            print(f"  {name:<28} {'-':>10} {r.score:>10.2f}      new")
+            continue
+        print(f"  {name:<28} {base['score']:>10.2f} {r.score:>10.2f} "
+              f"{r.score / base['score'] - 1:>+8.0%}")
+
+    regressions = compare({n: r.as_dict() for n, r in results.items()}, baseline, args.threshold)
+    if regressions:
+        print(f"\n  {len(regressions)} case(s) regressed by more than {args.threshold:.0%}:")
+        for reg in regressions:
+            print(f"    {reg.name}: {reg.change:+.0%}")
+        return 1
+    print(f"\n  No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+"""
+Consolidated, memory-mapped chain store for the backtest engine.
+
+backtest/downloader.py caches one parquet file per day per resolution
+(options/, options_1min/, options_5sec/, greeks/, greeks_1min/).  Opening a
+multi-year range means thousands of file opens and full parquet decodes,
+even when a sweep only needs a few columns of a few days.
+
+Here each dataset is a directory of column blocks: one .npy file per column
+holding every day's rows back-to-back, plus a manifest.json with a
+day → [start, stop) row index.  Columns are opened with np.load(mmap_mode="r"),
+so opening a store is a JSON parse and a handful of mmaps (milliseconds for
+any date range) and a day read only pages in the rows — and columns — it
+touches.  String columns ("right") are stored as uint8 codes and decoded on
+read, so frames come back exactly as the parquet files would.
+
+Layout:
+    <cache_dir>/store/<dataset>/manifest.json
+    <cache_dir>/store/<dataset>/<column>.npy
+
+The manifest records each source parquet's (size, mtime_ns).  The engine
+serves a day from the store only while that parquet is unchanged (or has
+been deleted), so a re-downloaded day is read from parquet until the store
+is rebuilt — never silently stale.  A rebuild copies stored days whose
+parquet has been deleted over from the old store, so the per-day files can
+be removed once converted.  Zero-row placeholder files are not stored.  Index (SPX/VIX) data stays in the monthly parquet files.
+
+Usage:
+    python -m backtest.chain_store                       # convert every dataset
+    python -m backtest.chain_store --dataset options_1min
+    store = open_chain_store(cache_dir, "options_1min")
+    df = store.day(date(2025, 3, 3), columns=["strike", "right", "ms_of_day", "mid"])
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+STORE_DIR = "store"
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+# dataset folder → parquet file-name suffix
+DATASETS = {
+    "options": "",
+    "options_1min": "",
+    "options_5sec": "",
+    "greeks": "_greeks",
+    "greeks_1min": "_greeks",
+}
+
+
+def _date_str(d: date) -> str:
+    return d.strftime("%Y%m%d")
+
+
+def _parse_day(s: str) -> date:
+    return date(int(s[:4]), int(s[4:6]), int(s[6:8]))
+
+
+def store_path(cache_dir: Path, dataset: str) -> Path:
+    return Path(cache_dir) / STORE_DIR / dataset
+
+
+def day_parquet_path(cache_dir: Path, dataset: str, d: date) -> Path:
+    return Path(cache_dir) / dataset / f"SPXW_{_date_str(d)}{DATASETS[dataset]}.parquet"
+
+
+def _source_files(cache_dir: Path, dataset: str) -> List[Tuple[date, Path]]:
+    suffix = DATASETS[dataset]
+    out = []
+    src = Path(cache_dir) / dataset
+    if not src.exists():
+        return out
+    for f in src.glob(f"SPXW_*{suffix}.parquet"):
+        s = f.stem[len("SPXW_"):len(f.stem) - len(suffix)]
+        try:
+            out.append((_parse_day(s), f))
+        except (ValueError, IndexError):
+            pass
+    return sorted(out)
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+# ── Reading ────────────────────────────────────────────────────────────────
+
+class ChainStore:
+    """Read-only view of one consolidated dataset."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / MANIFEST) as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported chain store format {meta.get('format')!r}")
+        self.dataset = meta["dataset"]
+        self.rows = meta["rows"]
+        self._columns = meta["columns"]           # [[name, dtype, categories-or-null], ...]
+        self._index: Dict[date, Tuple[int, int]] = {}
+        self._sources: Dict[date, Tuple[int, int]] = {}
+        for s, (start, stop, size, mtime_ns) in meta["days"].items():
+            d = _parse_day(s)
+            self._index[d] = (start, stop)
+            self._sources[d] = (size, mtime_ns)
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def columns(self) -> List[str]:
+        return [c[0] for c in self._columns]
+
+    @property
+    def days(self) -> List[date]:
+        return sorted(self._index)
+
+    def __contains__(self, d: date) -> bool:
+        return d in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def days_between(self, start: date, end: date) -> List[date]:
+        return [d for d in self.days if start <= d <= end]
+
+    def is_fresh(self, d: date, source: Path) -> bool:
+        """True if the stored copy of d still matches its parquet (or the parquet is gone)."""
+        st = _stat(source)
+        return st is None or st == self._sources.get(d)
+
+    def _column(self, name: str) -> np.ndarray:
+        a = self._arrays.get(name)
+        if a is None:
+            with self._lock:
+                a = self._arrays.get(name)
+                if a is None:
+                    a = np.load(self.path / f"{name}.npy", mmap_mode="r")
+                    self._arrays[name] = a
+        return a
+
+    def day(self, d: date, columns: Optional[Sequence[str]] = None,
+            ms_range: Optional[Tuple[int, int]] = None,
+            strike_range: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
+        """One day's rows as a DataFrame (empty if the day is not stored).
+
+        columns selects which column blocks are paged in.  ms_range /
+        strike_range (inclusive bounds) filter rows using only the
+        ms_of_day / strike blocks; the other columns are then gathered for
+        the matching rows alone.
+        """
+        specs = self._columns if columns is None else [c for c in self._columns if c[0] in columns]
+        span = self._index.get(d)
+        if span is None:
+            return pd.DataFrame({c[0]: np.empty(0, dtype=c[1]) if c[2] is None
+                                 else np.empty(0, dtype=object) for c in specs})
+        start, stop = span
+        rows: Optional[np.ndarray] = None
+        for col, bounds in (("ms_of_day", ms_range), ("strike", strike_range)):
+            if bounds is None:
+                continue
+            v = self._column(col)[start:stop]
+            keep = (v >= bounds[0]) & (v <= bounds[1])
+            rows = keep if rows is None else rows & keep
+        if rows is not None:
+            rows = np.flatnonzero(rows) + start
+
+        data = {}
+        for name, _, categories in specs:
+            block = self._column(name)
+            v = block[start:stop] if rows is None else block[rows]
+            if categories is not None:
+                v = _decoder(categories)[v]
+            else:
+                v = np.array(v)      # detach from the mmap (parquet reads are owned arrays)
+            data[name] = v
+        return pd.DataFrame(data)
+
+
+def _decoder(categories: List) -> np.ndarray:
+    lut = np.full(256, None, dtype=object)       # code 255 (and unused codes) → None
+    lut[:len(categories)] = categories
+    return lut
+
+
+_OPEN: Dict[Path, Tuple[Tuple[int, int], ChainStore]] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+def open_chain_store(cache_dir: Path, dataset: str) -> Optional[ChainStore]:
+    """Process-wide ChainStore for a dataset, or None if it was never converted.
+
+    Re-opened automatically when the manifest changes (a rebuild).
+    """
+    path = store_path(cache_dir, dataset).resolve()
+    st = _stat(path / MANIFEST)
+    with _OPEN_LOCK:
+        if st is None:
+            _OPEN.pop(path, None)
+            return None
+        cached = _OPEN.get(path)
+        if cached is not None and cached[0] == st:
+            return cached[1]
+        store = ChainStore(path)
+        _OPEN[path] = (st, store)
+        return store
+
+
+def load_stored_day(cache_dir: Path, dataset: str, d: date,
+                    strike_range: Optional[Tuple[float, float]] = None) -> Optional[pd.DataFrame]:
+    """d's frame from the store, or None → read the parquet file instead."""
+    if dataset not in DATASETS:
+        return None
+    store = open_chain_store(cache_dir, dataset)
+    if store is None or d not in store:
+        return None
+    if not store.is_fresh(d, day_parquet_path(cache_dir, dataset, d)):
+        return None
+    return store.day(d, strike_range=strike_range)
+
+
+def stored_days(cache_dir: Path, dataset: str) -> List[date]:
+    store = open_chain_store(cache_dir, dataset) if dataset in DATASETS else None
+    return store.days if store is not None else []
+
+
+# ── Converting ─────────────────────────────────────────────────────────────
+
+def _column_specs(df: pd.DataFrame) -> List[list]:
+    specs = []
+    for name in df.columns:
+        dt = df[name].dtype
+        if isinstance(dt, np.dtype) and dt.kind in "biufmM":
+            specs.append([name, dt.str, None])
+        else:
+            specs.append([name, "|u1", []])
+    return specs
+
+
+def _up_to_date(cache_dir: Path, dataset: str, sources: List[Tuple[date, Path]]) -> bool:
+    store = open_chain_store(cache_dir, dataset)
+    if store is None:
+        return False
+    stored = store._sources
+    for d, p in sources:
+        st = _stat(p)
+        if d in stored:
+            if st != stored[d]:
+                return False
+        elif st is not None and _row_count(p) > 0:
+            return False
+    return True
+
+
+def _row_count(path: Path) -> int:
+    try:
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    except ImportError:
+        return len(pd.read_parquet(path))
+
+
+def convert_dataset(cache_dir: Path, dataset: str, rebuild: bool = False,
+                    verbose: bool = True) -> Optional[ChainStore]:
+    """Build <cache_dir>/store/<dataset> from its per-day parquet files.
+
+    Two passes: row counts first (parquet metadata only), then each day is
+    read once and written straight into preallocated memory-mapped column
+    blocks, so peak memory is one day regardless of the range.  The new
+    store is written beside the old one and swapped in at the end.
+    Returns the opened store (None if the dataset has no data).
+    """
+    cache_dir = Path(cache_dir)
+    sources = _source_files(cache_dir, dataset)
+    old = open_chain_store(cache_dir, dataset)
+    if not sources:
+        return old
+    if not rebuild and _up_to_date(cache_dir, dataset, sources):
+        if verbose:
+            print(f"  {dataset}: up to date ({len(sources)} files)")
+        return old
+
+    # (day, parquet path or None → carried over from the old store, rows)
+    counts: List[Tuple[date, Optional[Path], int]] = [(d, p, _row_count(p)) for d, p in sources]
+    if old is not None:
+        on_disk = {d for d, _ in sources}
+        counts += [(d, None, stop - start) for d, (start, stop) in old._index.items()
+                   if d not in on_disk]
+        counts.sort(key=lambda c: c[0])
+    counts = [c for c in counts if c[2] > 0]
+    if not counts:
+        return None
+    total = sum(n for _, _, n in counts)
+
+    final = store_path(cache_dir, dataset)
+    tmp = final.with_name(final.name + ".tmp")
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir(parents=True)
+
+    specs: Optional[List[list]] = None
+    blocks: Dict[str, np.ndarray] = {}
+    days: Dict[str, list] = {}
+    pos = 0
+    for i, (d, p, n) in enumerate(counts):
+        df = pd.read_parquet(p) if p is not None else old.day(d)
+        if specs is None:
+            specs = _column_specs(df)
+            for name, dtype, _ in specs:
+                blocks[name] = np.lib.format.open_memmap(
+                    tmp / f"{name}.npy", mode="w+", dtype=np.dtype(dtype), shape=(total,))
+        for name, dtype, categories in specs:
+            if name not in df.columns:
+                raise ValueError(f"{p or d}: missing column {name!r} (columns differ between days)")
+            s = df[name]
+            if categories is None:
+                blocks[name][pos:pos + n] = s.to_numpy(dtype=np.dtype(dtype))
+            else:
+                codes = np.full(n, 255, dtype=np.uint8)   # 255 → None (missing)
+                values = s.to_numpy(dtype=object)
+                for v in pd.unique(values):
+                    if v is None or (isinstance(v, float) and v != v):
+                        continue
+                    if v not in categories:
+                        if len(categories) >= 255:   # 255 is the missing-value code
+                            raise ValueError(f"{dataset}.{name}: too many distinct values to store")
+                        categories.append(v)
+                    codes[values == v] = categories.index(v)
+                blocks[name][pos:pos + n] = codes
+        size, mtime_ns = _stat(p) if p is not None else old._sources[d]
+        days[_date_str(d)] = [pos, pos + n, size, mtime_ns]
+        pos += n
+        if verbose and (i + 1) % 100 == 0:
+            print(f"  {dataset}: {i + 1}/{len(counts)} days", flush=True)
+
+    for block in blocks.values():
+        block.flush()
+    blocks.clear()
+
+    with open(tmp / MANIFEST, "w") as f:
+        json.dump({"format": FORMAT_VERSION, "dataset": dataset, "rows": total,
+                   "columns": specs, "days": days}, f)
+
+    if final.exists():
+        shutil.rmtree(final)
+    os.replace(tmp, final)
+    if verbose:
+        print(f"  {dataset}: {len(days)} days, {total:,} rows → {final}")
+    return open_chain_store(cache_dir, dataset)
+
+
+def convert_cache(cache_dir: Path, datasets: Optional[Iterable[str]] = None,
+                  rebuild: bool = False, verbose: bool = True) -> Dict[str, int]:
+    """Convert every (or the given) dataset.  Returns {dataset: days stored}."""
+    out = {}
+    for dataset in (datasets or DATASETS):
+        store = convert_dataset(cache_dir, dataset, rebuild=rebuild, verbose=verbose)
+        if store is not None:
+            out[dataset] = len(store)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Consolidate per-day parquet chains into a memory-mapped store")
+    ap.add_argument("--cache-dir", default="backtest/data/cache")
+    ap.add_argument("--dataset", action="append", choices=sorted(DATASETS),
+                    help="dataset folder to convert (repeatable; default: all)")
+    ap.add_argument("--rebuild", action="store_true", help="rebuild even if up to date")
+    args = ap.parse_args()
+    convert_cache(Path(args.cache_dir), args.dataset, rebuild=args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -325,6 +325,18 @@ class BacktestConfig:
     # Interval (ms) between stop checks. 0 = use every data point (default).
     # Set to e.g. 120000 for 2-min, 300000 for 5-min (sweep_monitor_interval.py).
     monitor_interval_ms: int = 0
+    # Find stop breaches with array ops over all bars at once instead of the
+    # per-bar Python loop.  Identical results; trailing stops, cushion recovery
+    # and per-entry time-scaled exits always use the per-bar loop.
+    vectorized_stop_monitoring: bool = True
+    # Load only strikes within reach of the day's SPX range (max starting OTM
+    # + max_spread_width) — far wings are never quoted.  Identical results;
+    # less load time and memory on 1-min / 5-sec days.
+    strike_band_pruning: bool = True
+    # Persistent DayResult cache (backtest/result_cache.py).  None = off.
+    # Set to e.g. "backtest/data/result_cache" so re-runs and overlapping
+    # sweeps skip (config, day) pairs already simulated by this engine version.
+    result_cache_dir: Optional[str] = None
 
     # ── FOMC dates (for MKT-038) ─────────────────────────────────────────────
     # The engine will auto-load from shared/event_calendar.py if available,
@@ -0,0 +1,207 @@
+"""
+Per-process day-data cache for the backtest engine.
+
+Every sweep calls run_backtest() once per combo, and simulate_day() used to
+re-read the same chain/Greeks/index parquet files and rebuild the chain lookup
+for every single config.  This module keeps each day's loaded data in memory
+so a worker loads a day exactly once and reuses it for every combo it runs.
+
+Two tiers:
+  - LRU tier: bounded by number of days AND approximate size in MB.  Loaded
+    lazily on first access, evicted least-recently-used.
+  - Shared tier: days published explicitly via prewarm() / publish().  Never
+    evicted.  When the parent process pre-warms before creating a fork-based
+    multiprocessing pool, every worker inherits the shared tier copy-on-write
+    and starts with a 100% hit rate.
+
+Cached values MUST be treated as read-only by callers — the same object is
+handed to every combo.
+
+Usage:
+    from backtest.day_cache import DAY_CACHE, configure_day_cache
+    configure_day_cache(max_days=1200, max_mb=8000)   # before starting a sweep
+    ...
+    print(DAY_CACHE.stats())  # {"hits": ..., "misses": ..., "hit_rate": ...}
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+# Defaults sized for a full 2022–2026 history at 5-min / 1-min resolution.
+# A 1,000-combo sweep only gets "one load per day per worker" when the whole
+# date range fits — if it doesn't, a sequential all-days scan evicts every day
+# before it is reused.  Raise max_mb (or lower worker count) for 5-sec data.
+DEFAULT_MAX_DAYS = 1200
+DEFAULT_MAX_MB = 6000.0
+
+# Returned by an attached source for keys it does not hold
+SOURCE_MISS = object()
+
+
+class DayDataCache:
+    """LRU + pinned shared store for per-day simulation inputs."""
+
+    def __init__(self, max_days: int = DEFAULT_MAX_DAYS, max_mb: float = DEFAULT_MAX_MB):
+        self.max_days = max_days
+        self.max_mb = max_mb
+        self._lru: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._shared: Dict[Hashable, Any] = {}
+        self._sources: List[Callable[[Hashable], Any]] = []
+        self._lru_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+
+    # ── Lookup ─────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, loader: Callable[[], Any],
+            sizer: Optional[Callable[[Any], int]] = None) -> Any:
+        """Return the cached value for key, calling loader() on a miss.
+
+        loader may return None (e.g. no data file for that day) — None is
+        cached too so missing days are not re-probed by every combo.
+        """
+        with self._lock:
+            if key in self._shared:
+                self.shared_hits += 1
+                return self._shared[key]
+            for source in self._sources:
+                value = source(key)
+                if value is not SOURCE_MISS:
+                    self._shared[key] = value
+                    self.shared_hits += 1
+                    return value
+            if key in self._lru:
+                self.hits += 1
+                self._lru.move_to_end(key)
+                return self._lru[key]
+            self.misses += 1
+
+        t0 = time.perf_counter()
+        value = loader()
+        elapsed = time.perf_counter() - t0
+        size = sizer(value) if (sizer is not None and value is not None) else 0
+
+        with self._lock:
+            self.load_seconds += elapsed
+            if self.max_days <= 0:
+                return value  # caching disabled
+            if key not in self._lru:
+                self._lru[key] = value
+                self._sizes[key] = size
+                self._lru_bytes += size
+            self._evict()
+        return value
+
+    def _evict(self):
+        max_bytes = self.max_mb * 1024 * 1024
+        while self._lru and (len(self._lru) > self.max_days or self._lru_bytes > max_bytes):
+            if len(self._lru) == 1:
+                break  # always keep the day currently being simulated
+            old_key, _ = self._lru.popitem(last=False)
+            self._lru_bytes -= self._sizes.pop(old_key, 0)
+            self.evictions += 1
+
+    # ── Shared (pre-warmed) tier ───────────────────────────────────────────
+
+    def publish(self, key: Hashable, value: Any):
+        """Pin a value in the shared tier (never evicted)."""
+        with self._lock:
+            self._shared[key] = value
+            if key in self._lru:
+                del self._lru[key]
+                self._lru_bytes -= self._sizes.pop(key, 0)
+
+    def prewarm(self, items: Iterable[tuple]) -> int:
+        """Load and pin (key, loader) pairs.  Returns the number of days loaded.
+
+        Call in the parent process BEFORE creating a fork-based pool so the
+        workers inherit the loaded days instead of each re-reading them.
+        """
+        n = 0
+        for key, loader in items:
+            if key in self._shared:
+                continue
+            self.publish(key, loader())
+            n += 1
+        return n
+
+    def attach_source(self, source: Callable[[Hashable], Any]):
+        """Consult source(key) before the LRU tier on every shared-tier miss.
+
+        source returns SOURCE_MISS for keys it doesn't hold; anything else
+        (including None) is pinned in the shared tier.  Used by
+        backtest.shared_day_data to serve days published by the parent
+        process in shared memory.
+        """
+        with self._lock:
+            if source not in self._sources:
+                self._sources.append(source)
+
+    def detach_source(self, source: Callable[[Hashable], Any], keys: Iterable[Hashable] = ()):
+        """Stop consulting source and unpin the `keys` it served."""
+        with self._lock:
+            if source in self._sources:
+                self._sources.remove(source)
+            for key in keys:
+                self._shared.pop(key, None)
+
+    # ── Housekeeping ───────────────────────────────────────────────────────
+
+    def clear(self, shared: bool = False):
+        with self._lock:
+            self._lru.clear()
+            self._sizes.clear()
+            self._lru_bytes = 0
+            if shared:
+                self._shared.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.shared_hits = self.misses = self.evictions = 0
+            self.load_seconds = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+                "lru_days": len(self._lru),
+                "shared_days": len(self._shared),
+                "lru_mb": self._lru_bytes / (1024 * 1024),
+                "load_seconds": self.load_seconds,
+            }
+
+
+# Process-wide singleton used by backtest.engine.simulate_day()
+DAY_CACHE = DayDataCache()
+
+
+def configure_day_cache(max_days: Optional[int] = None, max_mb: Optional[float] = None):
+    """Resize the process-wide cache (max_days=0 disables caching)."""
+    if max_days is not None:
+        DAY_CACHE.max_days = max_days
+    if max_mb is not None:
+        DAY_CACHE.max_mb = max_mb
+    if DAY_CACHE.max_days <= 0:
+        DAY_CACHE.clear()
+        return
+    with DAY_CACHE._lock:
+        DAY_CACHE._evict()
+
+
+def day_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the process-wide cache."""
+    return DAY_CACHE.stats()
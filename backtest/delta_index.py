@@ -0,0 +1,110 @@
+"""
+Per-day delta → strike index for real-Greeks mode.
+
+With use_real_greeks the engine picks each entry's starting OTM distance
+from the strike whose |delta| is closest to target_delta.  Doing that on
+the Greeks DataFrame meant a unique() over every timestamp, a boolean mask,
+a copy and an idxmin — on every entry and every replacement entry.
+
+DeltaIndex is built once when the day is loaded: rows with a usable delta
+are grouped by (timestamp, side) and sorted by |delta|, so "strike nearest
+the target delta" is a binary search plus a short walk past any ITM rows.
+
+Results match the DataFrame search exactly, ties included: |delta| and its
+distance to the target are compared in the Greeks file's own dtype, and
+equal distances go to the row that comes first in the file.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+_SIDE_IDX = {"call": 0, "put": 1}
+
+
+class DeltaIndex:
+    """(timestamp, side) → strikes sorted by |delta|.  Read-only.
+
+    times:     sorted unique ms_of_day of the Greeks file (every row)
+    offsets:   group g = time_idx * 2 + side occupies rows offsets[g]:offsets[g+1]
+    abs_delta: |delta| per row, ascending within a group
+    strike:    strike per row
+    rank:      row's position in the Greeks file (tie-break)
+    """
+
+    __slots__ = ("times", "offsets", "abs_delta", "strike", "rank")
+
+    def __init__(self, times: np.ndarray, offsets: np.ndarray, abs_delta: np.ndarray,
+                 strike: np.ndarray, rank: np.ndarray):
+        self.times = times
+        self.offsets = offsets
+        self.abs_delta = abs_delta
+        self.strike = strike
+        self.rank = rank
+
+    @classmethod
+    def from_frame(cls, greeks_df: pd.DataFrame) -> "DeltaIndex":
+        ms = greeks_df["ms_of_day"].to_numpy().astype(np.int64)
+        times = np.unique(ms)
+        right = np.asarray(greeks_df["right"].astype(str).to_numpy())
+        side = np.select([right == "C", right == "P"], [0, 1], -1)
+        delta = greeks_df["delta"].to_numpy()
+        keep = (side >= 0) & ~np.isnan(delta) & (delta != 0)
+
+        rank = np.flatnonzero(keep)
+        ti = np.searchsorted(times, ms[keep])
+        group = ti * 2 + side[keep]
+        abs_delta = np.abs(delta[keep])
+        order = np.lexsort((rank, abs_delta, group))
+        offsets = np.searchsorted(group[order], np.arange(len(times) * 2 + 1))
+        strike = greeks_df["strike"].to_numpy().astype(np.float64)[keep]
+        return cls(times, offsets.astype(np.int64), abs_delta[order], strike[order], rank[order])
+
+    @property
+    def nbytes(self) -> int:
+        return int(sum(getattr(self, name).nbytes for name in self.__slots__))
+
+    def nearest_time(self, ms: int) -> Optional[int]:
+        """Index into times of the timestamp nearest ms (earlier one on a tie)."""
+        n = len(self.times)
+        if n == 0:
+            return None
+        pos = int(np.searchsorted(self.times, ms))
+        if pos == n or (pos > 0 and ms - self.times[pos - 1] <= self.times[pos] - ms):
+            return pos - 1
+        return pos
+
+    def nearest_strike(self, spx: float, ms: int, side: str, target: float) -> Optional[float]:
+        """OTM strike whose |delta| is closest to target at the timestamp nearest ms.
+
+        OTM means strike > spx for calls, < spx for puts.  None if that
+        side has no usable delta there.
+        """
+        ti = self.nearest_time(ms)
+        if ti is None:
+            return None
+        g = ti * 2 + _SIDE_IDX[side]
+        lo, hi = int(self.offsets[g]), int(self.offsets[g + 1])
+        if lo == hi:
+            return None
+
+        a, strikes, rank = self.abs_delta, self.strike, self.rank
+        t = a.dtype.type(target)
+        is_call = side == "call"
+        start = lo + int(np.searchsorted(a[lo:hi], t))
+        best = None   # (distance, rank, row)
+        # Distance grows walking away from the insertion point in either
+        # direction, so each walk stops at the first OTM row worse than best.
+        for i, step in ((start, 1), (start - 1, -1)):
+            while lo <= i < hi:
+                k = strikes[i]
+                if (k > spx) if is_call else (k < spx):
+                    d = abs(a[i] - t)
+                    if best is not None and d > best[0]:
+                        break
+                    if best is None or (d, rank[i]) < best[:2]:
+                        best = (d, rank[i], i)
+                i += step
+        return None if best is None else float(strikes[best[2]])
@@ -22,11 +22,9 @@ from datetime import date, timedelta
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import pandas as pd
-
+from backtest.download_manifest import open_manifest
 from backtest.downloader import (
-    RTH_START_MS, RTH_END_MS,
-    _date_str, _get, get_spxw_trading_days,
+    THETA_LIMITER, download_bulk_day, get_spxw_trading_days, greeks_extractor, quote_extractor,
 )
 
 try:
@@ -47,120 +45,27 @@ OPTIONS_1MIN_DIR = CACHE_DIR / "options_1min"
 GREEKS_1MIN_DIR  = CACHE_DIR / "greeks_1min"
 START_DATE       = date(2022, 5, 16)
 END_DATE         = date(2026, 3, 27)
-MAX_WORKERS      = 2  # 1-min data is ~6× heavier; 2 workers avoids overwhelming ThetaData
+MAX_WORKERS      = THETA_LIMITER.hi  # THETA_LIMITER throttles to what the terminal sustains
 
 
 def download_chain_1min(expiry: date) -> bool:
     """Download 1-min option chain quotes for a single expiry date."""
-    out_path = OPTIONS_1MIN_DIR / f"SPXW_{_date_str(expiry)}.parquet"
-    if out_path.exists():
-        try:
-            if pd.read_parquet(out_path).shape[0] > 0:
-                return True
-        except Exception:
-            pass
-
-    exp_str = _date_str(expiry)
-    data = _get("/v2/bulk_hist/option/quote", {
-        "root": "SPXW",
-        "exp": exp_str,
-        "start_date": exp_str,
-        "end_date": exp_str,
-        "ivl": 60000,   # 1-minute
-    }, retries=3, read_timeout=600)
-
-    if not data or "response" not in data:
-        return False
-
-    rows_raw = data["response"]
-    if not rows_raw:
-        return False
-
-    fmt = data["header"]["format"]
-    idx_ms  = fmt.index("ms_of_day")
-    idx_bid = fmt.index("bid")
-    idx_ask = fmt.index("ask")
-
-    records = []
-    for item in rows_raw:
-        contract = item["contract"]
-        strike = contract["strike"] / 1000
-        right = contract["right"]
-        for tick in item["ticks"]:
-            ms = tick[idx_ms]
-            if ms < RTH_START_MS or ms > RTH_END_MS:
-                continue
-            bid = tick[idx_bid]
-            ask = tick[idx_ask]
-            mid = (bid + ask) / 2 if (bid + ask) > 0 else 0
-            records.append({
-                "strike": strike, "right": right,
-                "ms_of_day": ms, "bid": bid, "ask": ask, "mid": mid,
-            })
-
-    if not records:
-        return False
-
-    df = pd.DataFrame(records)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(out_path, index=False)
-    return True
+    if open_manifest(CACHE_DIR).is_cached("options_1min", expiry):
+        return True
+    got = download_bulk_day(CACHE_DIR, "options_1min", expiry, "/v2/bulk_hist/option/quote",
+                            60000,   # 1-minute
+                            quote_extractor(both_sided_mid=False), retries=3, read_timeout=600)
+    return bool(got and got[0])
 
 
 def download_greeks_1min(expiry: date) -> bool:
     """Download 1-min Greeks for a single expiry date."""
-    out_path = GREEKS_1MIN_DIR / f"SPXW_{_date_str(expiry)}_greeks.parquet"
-    if out_path.exists():
-        try:
-            if pd.read_parquet(out_path).shape[0] > 0:
-                return True
-        except Exception:
-            pass
-
-    exp_str = _date_str(expiry)
-    data = _get("/v2/bulk_hist/option/greeks", {
-        "root": "SPXW",
-        "exp": exp_str,
-        "start_date": exp_str,
-        "end_date": exp_str,
-        "ivl": 60000,   # 1-minute
-    }, retries=3, read_timeout=600)
-
-    if not data or "response" not in data:
-        return False
-
-    rows_raw = data["response"]
-    if not rows_raw:
-        return False
-
-    fmt = data["header"]["format"]
-    idx_ms    = fmt.index("ms_of_day")
-    idx_delta = fmt.index("delta")
-    idx_iv    = fmt.index("implied_vol")
-
-    records = []
-    for item in rows_raw:
-        contract = item["contract"]
-        strike = contract["strike"] / 1000
-        right = contract["right"]
-        for tick in item["ticks"]:
-            ms = tick[idx_ms]
-            if ms < RTH_START_MS or ms > RTH_END_MS:
-                continue
-            delta = tick[idx_delta]
-            iv = tick[idx_iv]
-            records.append({
-                "strike": strike, "right": right,
-                "ms_of_day": ms, "delta": delta, "implied_vol": iv,
-            })
-
-    if not records:
-        return False
-
-    df = pd.DataFrame(records)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(out_path, index=False)
-    return True
+    if open_manifest(CACHE_DIR).is_cached("greeks_1min", expiry):
+        return True
+    got = download_bulk_day(CACHE_DIR, "greeks_1min", expiry, "/v2/bulk_hist/option/greeks",
+                            60000,   # 1-minute
+                            greeks_extractor(drop_empty=False), retries=3, read_timeout=600)
+    return bool(got and got[0])
 
 
 if __name__ == "__main__":
@@ -179,35 +84,12 @@ if __name__ == "__main__":
     # Use 5-min options cache to get trading days list
     trading_days = get_spxw_trading_days(START_DATE, END_DATE, CACHE_DIR)
 
-    # Count cached
-    opts_cached = 0
-    grk_cached  = 0
-    opts_needed = []
-    grk_needed  = []
-
-    for d in trading_days:
-        op = OPTIONS_1MIN_DIR / f"SPXW_{_date_str(d)}.parquet"
-        gp = GREEKS_1MIN_DIR / f"SPXW_{_date_str(d)}_greeks.parquet"
-        if op.exists():
-            try:
-                if pd.read_parquet(op).shape[0] > 0:
-                    opts_cached += 1
-                else:
-                    opts_needed.append(d)
-            except Exception:
-                opts_needed.append(d)
-        else:
-            opts_needed.append(d)
-        if gp.exists():
-            try:
-                if pd.read_parquet(gp).shape[0] > 0:
-                    grk_cached += 1
-                else:
-                    grk_needed.append(d)
-            except Exception:
-                grk_needed.append(d)
-        else:
-            grk_needed.append(d)
+    # Count cached (download manifest: no parquet reads)
+    manifest = open_manifest(CACHE_DIR)
+    opts_needed = manifest.missing("options_1min", trading_days, retry_empty=True)
+    grk_needed  = manifest.missing("greeks_1min", trading_days, retry_empty=True)
+    opts_cached = len(trading_days) - len(opts_needed)
+    grk_cached  = len(trading_days) - len(grk_needed)
 
     opts_needed.sort(reverse=True)  # newest first
     grk_needed.sort(reverse=True)
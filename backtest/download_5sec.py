@@ -9,6 +9,9 @@ Stores in separate folder — does NOT touch 1-min or 5-min data.
 No Greeks at 5-sec (not needed for stop monitoring — stop checks
 use bid/ask prices, not delta/IV).
 
+Each day's response is streamed straight into parquet row groups (see
+downloader.ingest_bulk), so several days can download in parallel.
+
 Usage:
   python -m backtest.download_5sec 2026-04-06 2026-04-08
 """
@@ -17,11 +20,9 @@ from datetime import date, timedelta
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import pandas as pd
-
+from backtest.download_manifest import open_manifest
 from backtest.downloader import (
-    RTH_START_MS, RTH_END_MS,
-    _date_str, _get, get_spxw_trading_days,
+    THETA_LIMITER, _date_str, download_bulk_day, quote_extractor,
 )
 
 try:
@@ -37,64 +38,18 @@ except ImportError:
 
 CACHE_DIR = Path("backtest/data/cache")
 OPTIONS_5SEC_DIR = CACHE_DIR / "options_5sec"
-MAX_WORKERS = 1  # 5-sec data is ~12x heavier than 1-min; be gentle on ThetaData
+MAX_WORKERS = THETA_LIMITER.hi  # streamed to disk; THETA_LIMITER sets the actual pace
 
 
 def download_chain_5sec(expiry: date) -> bool:
     """Download 5-sec option chain quotes for a single expiry date."""
-    out_path = OPTIONS_5SEC_DIR / f"SPXW_{_date_str(expiry)}.parquet"
-    if out_path.exists():
-        try:
-            if pd.read_parquet(out_path).shape[0] > 0:
-                return True
-        except Exception:
-            pass
-
-    exp_str = _date_str(expiry)
-    data = _get("/v2/bulk_hist/option/quote", {
-        "root": "SPXW",
-        "exp": exp_str,
-        "start_date": exp_str,
-        "end_date": exp_str,
-        "ivl": 5000,   # 5-second intervals
-    }, retries=3, read_timeout=1200)  # Longer timeout for larger data
-
-    if not data or "response" not in data:
-        return False
-
-    rows_raw = data["response"]
-    if not rows_raw:
-        return False
-
-    fmt = data["header"]["format"]
-    idx_ms  = fmt.index("ms_of_day")
-    idx_bid = fmt.index("bid")
-    idx_ask = fmt.index("ask")
-
-    records = []
-    for item in rows_raw:
-        contract = item["contract"]
-        strike = contract["strike"] / 1000
-        right = contract["right"]
-        for tick in item["ticks"]:
-            ms = tick[idx_ms]
-            if ms < RTH_START_MS or ms > RTH_END_MS:
-                continue
-            bid = tick[idx_bid]
-            ask = tick[idx_ask]
-            mid = (bid + ask) / 2 if (bid + ask) > 0 else 0
-            records.append({
-                "strike": strike, "right": right,
-                "ms_of_day": ms, "bid": bid, "ask": ask, "mid": mid,
-            })
-
-    if not records:
-        return False
-
-    df = pd.DataFrame(records)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(out_path, index=False)
-    return True
+    if open_manifest(CACHE_DIR).is_cached("options_5sec", expiry):
+        return True
+    got = download_bulk_day(CACHE_DIR, "options_5sec", expiry, "/v2/bulk_hist/option/quote",
+                            5000,   # 5-second intervals
+                            quote_extractor(both_sided_mid=False),
+                            retries=3, read_timeout=1200)  # Longer timeout for larger data
+    return bool(got and got[0])
 
 
 def get_trading_days(start: date, end: date) -> list:
@@ -120,15 +75,9 @@ if __name__ == "__main__":
     days = get_trading_days(start, end)
     OPTIONS_5SEC_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Check which days need downloading
-    to_fetch = []
-    cached = 0
-    for d in days:
-        path = OPTIONS_5SEC_DIR / f"SPXW_{_date_str(d)}.parquet"
-        if path.exists():
-            cached += 1
-        else:
-            to_fetch.append(d)
+    # Check which days need downloading (download manifest: no parquet reads)
+    to_fetch = open_manifest(CACHE_DIR).missing("options_5sec", days)
+    cached = len(days) - len(to_fetch)
 
     print(f"\nSPXW 5-Second Data Downloader")
     print(f"Period: {start} -> {end} ({len(days)} trading days)")
@@ -141,15 +90,17 @@ if __name__ == "__main__":
 
     ok = 0
     fail = 0
-    for i, d in enumerate(to_fetch, 1):
-        print(f"  [{i}/{len(to_fetch)}] Downloading {d}...", end=" ", flush=True)
-        if download_chain_5sec(d):
-            size = (OPTIONS_5SEC_DIR / f"SPXW_{_date_str(d)}.parquet").stat().st_size / 1024 / 1024
-            print(f"OK ({size:.1f} MB)")
-            ok += 1
-        else:
-            print("FAILED")
-            fail += 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(download_chain_5sec, d): d for d in to_fetch}
+        for i, future in enumerate(as_completed(futures), 1):
+            d = futures[future]
+            if future.result():
+                size = (OPTIONS_5SEC_DIR / f"SPXW_{_date_str(d)}.parquet").stat().st_size / 1024 / 1024
+                print(f"  [{i}/{len(to_fetch)}] {d} OK ({size:.1f} MB)")
+                ok += 1
+            else:
+                print(f"  [{i}/{len(to_fetch)}] {d} FAILED")
+                fail += 1
 
     print(f"\nDone: {ok} downloaded, {fail} failed")
     total_size = sum(f.stat().st_size for f in OPTIONS_5SEC_DIR.glob("*.parquet")) / 1024 / 1024
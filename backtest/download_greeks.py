@@ -15,12 +15,11 @@ from datetime import date
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import pandas as pd
-
+from backtest.download_manifest import open_manifest
 from backtest.downloader import (
+    THETA_LIMITER,
     get_spxw_trading_days,
     download_greeks_day,
-    _date_str,
 )
 
 try:
@@ -40,7 +39,7 @@ except ImportError:
 CACHE_DIR   = Path("backtest/data/cache")
 START_DATE  = date(2022, 5, 16)
 END_DATE    = date(2026, 3, 26)   # last confirmed available date
-MAX_WORKERS = 4
+MAX_WORKERS = THETA_LIMITER.hi  # THETA_LIMITER throttles to what the terminal sustains
 
 
 if __name__ == "__main__":
@@ -53,15 +52,9 @@ if __name__ == "__main__":
 
     trading_days = get_spxw_trading_days(START_DATE, END_DATE, CACHE_DIR)
 
-    # Split into cached vs needed
-    to_download = []
-    already_cached = []
-    for d in trading_days:
-        path = greeks_dir / f"SPXW_{_date_str(d)}_greeks.parquet"
-        if path.exists() and pd.read_parquet(path).shape[0] > 0:
-            already_cached.append(d)
-        else:
-            to_download.append(d)
+    # Split into cached vs needed (download manifest: no parquet reads)
+    to_download = open_manifest(CACHE_DIR).missing("greeks", trading_days, retry_empty=True)
+    already_cached = sorted(set(trading_days) - set(to_download))
 
     to_download.sort(reverse=True)  # newest first
     total      = len(trading_days)
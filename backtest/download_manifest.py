@@ -0,0 +1,269 @@
+"""
+Download manifest for the ThetaData cache.
+
+Every "is this day cached?" check used to be pd.read_parquet(path).shape[0],
+which decodes the whole file just to count its rows — across thousands of
+per-day files that made every resume minutes of I/O before the first
+request.
+
+The manifest is one SQLite table in <cache_dir>/download_manifest.sqlite
+with a row per (dataset, day): status, row count, file size/mtime and a
+SHA-256 of the file.  A day is cached when its entry is "ok" and the file's
+(size, mtime_ns) still match — one stat, no parquet read.  Files that
+predate the manifest (or were changed behind its back) are adopted on first
+sight from parquet metadata only; their checksum is filled in by verify().
+
+Statuses:
+    ok      file has rows
+    empty   terminal had no data for the day (zero-row placeholder or none)
+    failed  last attempt errored; retried on the next run
+
+Usage:
+    python -m backtest.download_manifest                    # summary + gaps
+    python -m backtest.download_manifest --verify greeks    # re-hash files
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .chain_store import DATASETS, _row_count, _stat, day_parquet_path
+
+MANIFEST_NAME = "download_manifest.sqlite"
+
+OK, EMPTY, FAILED = "ok", "empty", "failed"
+
+
+@dataclass
+class ManifestEntry:
+    status: str
+    rows: int
+    size: Optional[int]
+    mtime_ns: Optional[int]
+    sha256: Optional[str]
+    attempts: int
+    updated: float
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _day_str(d: date) -> str:
+    return d.strftime("%Y%m%d")
+
+
+class DownloadManifest:
+    """SQLite-backed per-(dataset, day) download status.  Thread-safe."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / MANIFEST_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS days ("
+                " dataset TEXT NOT NULL, day TEXT NOT NULL, status TEXT NOT NULL,"
+                " rows INTEGER NOT NULL DEFAULT 0, size INTEGER, mtime_ns INTEGER,"
+                " sha256 TEXT, attempts INTEGER NOT NULL DEFAULT 0, updated REAL NOT NULL,"
+                " PRIMARY KEY (dataset, day))")
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    # ── Reading ────────────────────────────────────────────────────────────
+
+    def entry(self, dataset: str, d: date) -> Optional[ManifestEntry]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT status, rows, size, mtime_ns, sha256, attempts, updated FROM days "
+                "WHERE dataset = ? AND day = ?", (dataset, _day_str(d))).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def entries(self, dataset: str) -> Dict[date, ManifestEntry]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT day, status, rows, size, mtime_ns, sha256, attempts, updated FROM days "
+                "WHERE dataset = ?", (dataset,)).fetchall()
+        return {date(int(r[0][:4]), int(r[0][4:6]), int(r[0][6:8])): ManifestEntry(*r[1:])
+                for r in rows}
+
+    def _current(self, dataset: str, d: date, e: Optional[ManifestEntry]) -> Optional[ManifestEntry]:
+        """e if it still describes the file on disk, else a freshly adopted entry."""
+        path = day_parquet_path(self.cache_dir, dataset, d)
+        st = _stat(path)
+        if e is not None and e.status in (OK, EMPTY) and (e.size, e.mtime_ns) == (st or (None, None)):
+            return e
+        if e is not None and e.status == EMPTY and e.size is None and st is None:
+            return e   # record_empty() with no placeholder written
+        if st is None:
+            # A recorded file that has since been deleted counts as absent
+            return e if e is not None and e.status == FAILED else None
+        self.record_file(dataset, d, checksum=False)   # predates the manifest, or changed
+        return self.entry(dataset, d)
+
+    def is_cached(self, dataset: str, d: date) -> bool:
+        """True when the day's file is on disk with rows (one stat on a manifest hit)."""
+        e = self._current(dataset, d, self.entry(dataset, d))
+        return e is not None and e.status == OK
+
+    def status(self, dataset: str, d: date) -> Optional[str]:
+        e = self._current(dataset, d, self.entry(dataset, d))
+        return None if e is None else e.status
+
+    def missing(self, dataset: str, days: Iterable[date], retry_empty: bool = False) -> List[date]:
+        """Days still to download (failed, absent, or — with retry_empty — empty)."""
+        known = self.entries(dataset)
+        out = []
+        for d in days:
+            e = self._current(dataset, d, known.get(d))
+            if e is None or e.status == FAILED or (retry_empty and e.status == EMPTY):
+                out.append(d)
+        return out
+
+    # ── Writing ────────────────────────────────────────────────────────────
+
+    def _upsert(self, dataset: str, d: date, status: str, rows: int = 0,
+                size: Optional[int] = None, mtime_ns: Optional[int] = None,
+                sha256: Optional[str] = None, failed: bool = False):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO days (dataset, day, status, rows, size, mtime_ns, sha256,"
+                    " attempts, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (dataset, day) DO UPDATE SET status = excluded.status,"
+                    " rows = excluded.rows, size = excluded.size, mtime_ns = excluded.mtime_ns,"
+                    " sha256 = excluded.sha256, attempts = days.attempts + excluded.attempts,"
+                    " updated = excluded.updated",
+                    (dataset, _day_str(d), status, rows, size, mtime_ns, sha256,
+                     int(failed), time.time()))
+
+    def record_file(self, dataset: str, d: date, rows: Optional[int] = None,
+                    checksum: bool = True):
+        """Record the day's file as it is on disk (rows from parquet metadata if not given)."""
+        path = day_parquet_path(self.cache_dir, dataset, d)
+        st = _stat(path)
+        if st is None:
+            self.record_empty(dataset, d)
+            return
+        if rows is None:
+            try:
+                rows = _row_count(path)
+            except Exception:
+                self._upsert(dataset, d, FAILED)   # unreadable (truncated) file: re-download
+                return
+        sha = file_sha256(path) if checksum else None
+        self._upsert(dataset, d, OK if rows > 0 else EMPTY, rows, st[0], st[1], sha)
+
+    def record_empty(self, dataset: str, d: date):
+        """The terminal has no data for this day; a placeholder file may exist."""
+        st = _stat(day_parquet_path(self.cache_dir, dataset, d))
+        self._upsert(dataset, d, EMPTY, 0, *(st or (None, None)))
+
+    def record_failure(self, dataset: str, d: date):
+        self._upsert(dataset, d, FAILED, failed=True)
+
+    # ── Maintenance ────────────────────────────────────────────────────────
+
+    def verify(self, dataset: str, days: Optional[Iterable[date]] = None) -> List[date]:
+        """
+        Re-hash files: fills in missing checksums.  A mismatching file is
+        renamed to *.corrupt and its day marked failed, so the next run
+        downloads it again.  Returns the mismatching days.
+        """
+        known = self.entries(dataset)
+        bad = []
+        for d in (sorted(known) if days is None else days):
+            e = self._current(dataset, d, known.get(d))
+            if e is None or e.status != OK:
+                continue
+            path = day_parquet_path(self.cache_dir, dataset, d)
+            sha = file_sha256(path)
+            if e.sha256 is None:
+                self._upsert(dataset, d, OK, e.rows, e.size, e.mtime_ns, sha)
+            elif sha != e.sha256:
+                os.replace(path, path.with_name(path.name + ".corrupt"))
+                self.record_failure(dataset, d)
+                bad.append(d)
+        return bad
+
+    def summary(self, dataset: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT status, COUNT(*), COALESCE(SUM(rows), 0) FROM days "
+                "WHERE dataset = ? GROUP BY status", (dataset,)).fetchall()
+        out = {OK: 0, EMPTY: 0, FAILED: 0, "rows": 0}
+        for status, n, r in rows:
+            out[status] = n
+            out["rows"] += r
+        return out
+
+
+_OPEN: Dict[str, DownloadManifest] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+def open_manifest(cache_dir) -> DownloadManifest:
+    """Process-wide DownloadManifest for a cache directory."""
+    key = str(Path(cache_dir).resolve())
+    with _OPEN_LOCK:
+        m = _OPEN.get(key)
+        if m is None:
+            m = _OPEN[key] = DownloadManifest(cache_dir)
+        return m
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Summarize / verify the download manifest")
+    ap.add_argument("dataset", nargs="*", help=f"dataset folders {sorted(DATASETS)} (default: all)")
+    ap.add_argument("--cache-dir", default="backtest/data/cache")
+    ap.add_argument("--start", type=date.fromisoformat, default=date(2022, 5, 16))
+    ap.add_argument("--end", type=date.fromisoformat, default=date.today())
+    ap.add_argument("--verify", action="store_true", help="re-hash every ok file")
+    args = ap.parse_args()
+    unknown = set(args.dataset) - set(DATASETS)
+    if unknown:
+        ap.error(f"unknown dataset(s): {', '.join(sorted(unknown))}")
+
+    from .downloader import get_trading_days
+    cache_dir = Path(args.cache_dir)
+    m = open_manifest(cache_dir)
+    days = get_trading_days(args.start, args.end, cache_dir)
+    for dataset in args.dataset or sorted(DATASETS):
+        if not (cache_dir / dataset).exists():
+            continue
+        gaps = m.missing(dataset, days)
+        s = m.summary(dataset)
+        print(f"{dataset:14s} ok {s[OK]:5d}  empty {s[EMPTY]:4d}  failed {s[FAILED]:4d}  "
+              f"rows {s['rows']:>13,d}  gaps {len(gaps)}")
+        if gaps:
+            print(f"  first gaps: {', '.join(str(d) for d in gaps[:10])}")
+        if args.verify:
+            bad = m.verify(dataset)
+            print(f"  verify: {len(bad)} checksum mismatch(es)"
+                  + (f" — {', '.join(map(str, bad[:10]))}" if bad else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,19 +8,27 @@ Downloads and caches:
   - SPXW 0DTE option Greeks at 5-min intervals (cache/greeks/ — separate folder)
 
 Data is stored as parquet files in the cache directory.
-Re-running will skip already-cached dates.
+Re-running will skip already-cached dates: per-day status, row counts and
+checksums live in the download manifest (backtest.download_manifest), so
+resuming never re-reads the parquet files.  All requests share one pooled
+HTTP session, and THETA_LIMITER adapts how many run at once.
 """
 import os
+import codecs
 import json
 import time
 import requests
+import numpy as np
 import pandas as pd
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+from .chain_store import day_parquet_path
+from .download_manifest import open_manifest
+
 
 THETA_HOST = "http://127.0.0.1:25510"
 
@@ -31,11 +39,74 @@ RTH_END_MS   = 57_600_000   # 4:00 PM ET
 
 # ── Low-level API helpers ──────────────────────────────────────────────────
 
+class AdaptiveLimiter:
+    """
+    AIMD cap on concurrent requests to the ThetaData terminal.
+
+    The cap grows by one after `grow_after` consecutive healthy responses
+    (200 / 472) and halves on a timeout, connection error or any other
+    status.  Download loops can submit days with a pool of `hi` threads and
+    let the terminal set the pace instead of hand-tuning MAX_WORKERS.
+    """
+
+    def __init__(self, start: int = 4, lo: int = 1, hi: int = 8, grow_after: int = 4):
+        self.limit = start
+        self.lo = lo
+        self.hi = hi
+        self.grow_after = grow_after
+        self.active = 0
+        self._streak = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.active >= self.limit:
+                self._cond.wait()
+            self.active += 1
+
+    def release(self, healthy: bool):
+        with self._cond:
+            self.active -= 1
+            if healthy:
+                self._streak += 1
+                if self._streak >= self.grow_after and self.limit < self.hi:
+                    self.limit += 1
+                    self._streak = 0
+            else:
+                self._streak = 0
+                self.limit = max(self.lo, self.limit // 2)
+            self._cond.notify_all()
+
+
+THETA_LIMITER = AdaptiveLimiter()
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """Shared keep-alive session (one pooled connection per concurrent request)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            s = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=THETA_LIMITER.hi, max_retries=0)
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _SESSION = s
+        return _SESSION
+
+
 def _get(endpoint: str, params: dict, retries: int = 3, read_timeout: int = 60) -> Optional[dict]:
     url = f"{THETA_HOST}{endpoint}"
     for attempt in range(retries):
+        healthy = False
+        backoff = 2 ** attempt
+        THETA_LIMITER.acquire()
         try:
-            r = requests.get(url, params=params, timeout=(10, read_timeout))
+            r = _session().get(url, params=params, timeout=(10, read_timeout))
+            healthy = r.status_code in (200, 472)
             if r.status_code == 200:
                 return r.json()
             elif r.status_code == 472:
@@ -43,13 +114,14 @@ def _get(endpoint: str, params: dict, retries: int = 3, read_timeout: int = 60)
                 return None
             else:
                 print(f"  HTTP {r.status_code} for {endpoint} {params} — retrying...")
-                time.sleep(2 ** attempt)
         except requests.exceptions.Timeout:
             print(f"  Timeout on attempt {attempt+1}/{retries}")
-            time.sleep(5)
+            backoff = 5
         except Exception as e:
             print(f"  Error: {e}")
-            time.sleep(2 ** attempt)
+        finally:
+            THETA_LIMITER.release(healthy)
+        time.sleep(backoff)
     return None
 
 
@@ -57,6 +129,328 @@ def _date_str(d: date) -> str:
     return d.strftime("%Y%m%d")
 
 
+# ── Streaming bulk ingestion ───────────────────────────────────────────────
+#
+# bulk_hist responses are one JSON document per expiry:
+#   {"header": {"format": [...], ...},
+#    "response": [{"ticks": [[...], ...], "contract": {"strike", "right", ...}}, ...]}
+# A busy 5-sec day is several GB as text and far more as Python objects.
+# Instead of r.json(), the body is read in chunks and decoded one contract at
+# a time; each contract's ticks go straight into typed column buffers
+# (float32 / int32, right as codes) that are flushed to parquet row groups,
+# so peak memory is one row group plus one contract whatever the day size.
+
+INGEST_CHUNK_BYTES = 1 << 20       # HTTP read size
+INGEST_ROW_GROUP = 500_000         # rows buffered before a row group is written
+
+
+class _JsonStream:
+    """Incremental reader over a chunked JSON body: one value at a time."""
+
+    _WS = " \t\r\n"
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _more(self) -> bool:
+        """Append the next chunk (dropping consumed text).  False at end of body."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos:] + text
+                self.pos = 0
+                return True
+        self.buf = self.buf[self.pos:] + self._utf8.decode(b"", final=True)
+        self.pos = 0
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it ('' at end)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                return ""
+
+    def expect(self, ch: str):
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"bulk response: expected {ch!r}, got {got[:1]!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more of the body as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self.buf, self.pos)
+                # A value ending exactly at the buffer edge may be a truncated number
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._more()
+
+
+def _iter_bulk(chunks: Iterable[bytes]) -> Iterator[Tuple[Optional[str], Any]]:
+    """
+    Yield (key, value) for top-level fields of a bulk_hist body, and
+    (None, item) for each element of its "response" array as soon as it
+    has been read.
+    """
+    s = _JsonStream(chunks)
+    s.expect("{")
+    while True:
+        c = s.peek()
+        if c in ("}", ""):
+            return
+        if c == ",":
+            s.pos += 1
+            continue
+        key = s.value()
+        s.expect(":")
+        if key != "response" or s.peek() != "[":
+            yield key, s.value()
+            continue
+        s.expect("[")
+        while True:
+            c = s.peek()
+            if c == "]":
+                s.pos += 1
+                break
+            if c == ",":
+                s.pos += 1
+                continue
+            if c == "":
+                raise ValueError("bulk response: truncated response array")
+            yield None, s.value()
+
+
+# An extractor turns one contract's ticks (float64 array, one row per tick)
+# into (keep_mask, {column: values}) given the header's format list.
+Extractor = Callable[[np.ndarray], Tuple[np.ndarray, Dict[str, np.ndarray]]]
+
+
+def quote_extractor(both_sided_mid: bool = True) -> Callable[[List[str]], Extractor]:
+    """bid / ask / mid columns.  mid is 0 unless both sides quote (or, with
+    both_sided_mid=False, unless bid + ask > 0)."""
+    def make(fmt: List[str]) -> Extractor:
+        i_bid, i_ask = fmt.index("bid"), fmt.index("ask")
+
+        def extract(ticks: np.ndarray):
+            bid, ask = ticks[:, i_bid], ticks[:, i_ask]
+            quoted = (bid > 0) & (ask > 0) if both_sided_mid else (bid + ask) > 0
+            mid = np.where(quoted, (bid + ask) / 2, 0.0)
+            keep = np.ones(len(ticks), dtype=bool)
+            return keep, {"bid": bid, "ask": ask, "mid": mid}
+        return extract
+    return make
+
+
+def greeks_extractor(drop_empty: bool = True) -> Callable[[List[str]], Extractor]:
+    """delta / implied_vol columns.  drop_empty skips rows where both are 0."""
+    def make(fmt: List[str]) -> Extractor:
+        i_delta, i_iv = fmt.index("delta"), fmt.index("implied_vol")
+
+        def extract(ticks: np.ndarray):
+            delta, iv = ticks[:, i_delta], ticks[:, i_iv]
+            keep = ~((delta == 0.0) & (iv == 0.0)) if drop_empty else np.ones(len(ticks), dtype=bool)
+            return keep, {"delta": delta, "implied_vol": iv}
+        return extract
+    return make
+
+
+class _ColumnSink:
+    """Typed column buffers written to a parquet file one row group at a time."""
+
+    def __init__(self, out_path: Path, row_group: int):
+        self.out_path = out_path
+        self.row_group = row_group
+        self.rows = 0
+        self.strikes: set = set()
+        self._rights: Dict[str, int] = {}
+        self._parts: Dict[str, List[np.ndarray]] = {}
+        self._buffered = 0
+        self._writer = None
+        self._frames: List[pd.DataFrame] = []   # no pyarrow: concatenated at close
+
+    def add(self, strike: float, right: str, ms: np.ndarray, values: Dict[str, np.ndarray]):
+        n = len(ms)
+        if n == 0:
+            return
+        code = self._rights.setdefault(right, len(self._rights))
+        cols = {
+            "strike": np.full(n, strike, dtype=np.float32),
+            "right": np.full(n, code, dtype=np.int8),
+            "ms_of_day": ms.astype(np.int32),
+        }
+        cols.update({k: v.astype(np.float32) for k, v in values.items()})
+        for k, v in cols.items():
+            self._parts.setdefault(k, []).append(v)
+        self.strikes.add(strike)
+        self._buffered += n
+        if self._buffered >= self.row_group:
+            self.flush()
+
+    def flush(self):
+        if not self._buffered:
+            return
+        cols = {k: np.concatenate(v) for k, v in self._parts.items()}
+        names = np.array(list(self._rights), dtype=object)
+        cols["right"] = names[cols["right"]]
+        df = pd.DataFrame(cols)
+        self._parts = {}
+        self.rows += self._buffered
+        self._buffered = 0
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            self._frames.append(df)
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.out_path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> int:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self._frames:
+            pd.concat(self._frames, ignore_index=True).to_parquet(self.out_path, index=False)
+        return self.rows
+
+
+def ingest_bulk(chunks: Iterable[bytes], out_path: Path,
+                extractor: Callable[[List[str]], Extractor],
+                row_group: int = INGEST_ROW_GROUP) -> Tuple[int, int]:
+    """
+    Stream a bulk_hist body into out_path as parquet: strike, right,
+    ms_of_day plus the extractor's columns, RTH ticks only.
+
+    Writes to a .part file that replaces out_path only when the whole body
+    has been read, so an interrupted download never looks cached.  Nothing
+    is written when no row survives.  Returns (rows, distinct strikes).
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(out_path.name + ".part")
+    sink = _ColumnSink(tmp, row_group)
+    extract: Optional[Extractor] = None
+    pending: List[dict] = []   # contracts seen before the header (not ThetaData's order)
+    idx_ms = 0
+
+    def _add(item: dict):
+        ticks = item.get("ticks")
+        if not ticks:
+            return
+        arr = np.asarray(ticks, dtype=np.float64)
+        ms = arr[:, idx_ms]
+        keep, cols = extract(arr)
+        keep &= (ms >= RTH_START_MS) & (ms <= RTH_END_MS)
+        contract = item["contract"]
+        sink.add(contract["strike"] / 1000, contract["right"], ms[keep],
+                 {k: v[keep] for k, v in cols.items()})
+
+    try:
+        for key, value in _iter_bulk(chunks):
+            if key is None:
+                if extract is None:
+                    pending.append(value)
+                else:
+                    _add(value)
+            elif key == "header" and isinstance(value, dict) and value.get("format"):
+                fmt = list(value["format"])
+                idx_ms = fmt.index("ms_of_day")
+                extract = extractor(fmt)
+                for item in pending:
+                    _add(item)
+                pending = []
+        rows = sink.close()
+        if rows:
+            os.replace(tmp, out_path)
+        return rows, len(sink.strikes)
+    finally:
+        if sink._writer is not None:
+            sink._writer.close()
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _stream_bulk(endpoint: str, params: dict, out_path: Path,
+                 extractor: Callable[[List[str]], Extractor],
+                 retries: int = 3, read_timeout: int = 60) -> Optional[Tuple[int, int]]:
+    """
+    _get for bulk_hist endpoints: stream the response into out_path via
+    ingest_bulk.  Returns (rows, strikes) — (0, 0) when the terminal has
+    no data — or None when every attempt failed.  read_timeout applies per
+    socket read, so long downloads that keep making progress are not cut off.
+    """
+    url = f"{THETA_HOST}{endpoint}"
+    for attempt in range(retries):
+        healthy = False
+        backoff = 2 ** attempt
+        THETA_LIMITER.acquire()
+        try:
+            with _session().get(url, params=params, timeout=(10, read_timeout), stream=True) as r:
+                healthy = r.status_code in (200, 472)
+                if r.status_code == 472:
+                    return 0, 0   # no data for this contract/date
+                if r.status_code == 200:
+                    return ingest_bulk(r.iter_content(INGEST_CHUNK_BYTES), out_path, extractor)
+                print(f"  HTTP {r.status_code} for {endpoint} {params} — retrying...")
+        except requests.exceptions.Timeout:
+            print(f"  Timeout on attempt {attempt+1}/{retries}")
+            healthy, backoff = False, 5
+        except Exception as e:
+            print(f"  Error: {e}")
+            healthy = False
+        finally:
+            THETA_LIMITER.release(healthy)
+        time.sleep(backoff)
+    return None
+
+
+def download_bulk_day(cache_dir: Path, dataset: str, expiry: date, endpoint: str, ivl: int,
+                      extractor: Callable[[List[str]], Extractor], retries: int = 3,
+                      read_timeout: int = 60) -> Optional[Tuple[int, int]]:
+    """
+    Stream one expiry's bulk_hist data into <cache_dir>/<dataset>/ and record
+    the outcome in the download manifest.  Returns _stream_bulk's result.
+    """
+    exp_str = _date_str(expiry)
+    got = _stream_bulk(endpoint, {
+        "root": "SPXW",
+        "exp": exp_str,
+        "start_date": exp_str,
+        "end_date": exp_str,
+        "ivl": ivl,
+    }, day_parquet_path(cache_dir, dataset, expiry), extractor,
+        retries=retries, read_timeout=read_timeout)
+    manifest = open_manifest(cache_dir)
+    if got is None:
+        manifest.record_failure(dataset, expiry)
+    elif got[0]:
+        manifest.record_file(dataset, expiry, rows=got[0])
+    else:
+        manifest.record_empty(dataset, expiry)
+    return got
+
+
 # ── Index data ─────────────────────────────────────────────────────────────
 
 def download_index_month(symbol: str, year: int, month: int, cache_dir: Path) -> bool:
@@ -127,72 +521,35 @@ def download_chain_day(expiry: date, cache_dir: Path, fast_mode: bool = False) -
     fast_mode: use 30s timeout and 1 retry — skips slow/hanging dates immediately
                without creating a placeholder (so they can be retried later).
     """
-    out_path = cache_dir / "options" / f"SPXW_{_date_str(expiry)}.parquet"
+    if open_manifest(cache_dir).is_cached("options", expiry):
+        return True
+    out_path = day_parquet_path(cache_dir, "options", expiry)
     if out_path.exists():
         # Empty placeholder = 0 rows (parquet still has non-zero file size due to format overhead).
         # In fast mode: treat as cached (skip it, slow pass will retry).
         # In slow mode: delete and re-attempt so we actually get the data.
-        if pd.read_parquet(out_path).shape[0] > 0:
-            return True
         if fast_mode:
             return True
         out_path.unlink()  # delete empty placeholder and try again
 
-    exp_str = _date_str(expiry)
     print(f"  Downloading SPXW chain {expiry}...", end=" ", flush=True)
 
     retries = 1 if fast_mode else 3
     read_timeout = 30 if fast_mode else 300  # 5min for slow pass — large chains need up to 3min
 
-    data = _get("/v2/bulk_hist/option/quote", {
-        "root": "SPXW",
-        "exp": exp_str,
-        "start_date": exp_str,
-        "end_date": exp_str,
-        "ivl": 300000,   # 5-minute intervals
-    }, retries=retries, read_timeout=read_timeout)
-
-    if not data or "response" not in data:
-        print("no data")
-        return False
-
-    rows_raw = data["response"]
-    if not rows_raw:
-        print("empty")
+    got = download_bulk_day(cache_dir, "options", expiry, "/v2/bulk_hist/option/quote",
+                            300000,   # 5-minute intervals
+                            quote_extractor(both_sided_mid=True),
+                            retries=retries, read_timeout=read_timeout)
+    if got is None:
+        print("failed")
         return False
-
-    # Each element: {"ticks": [...], "contract": {"root", "expiration", "strike", "right"}}
-    records = []
-    for item in rows_raw:
-        contract = item["contract"]
-        strike = contract["strike"] / 1000  # millionths → actual (e.g. 4550000 → 4550)
-        right = contract["right"]           # "C" or "P"
-        for tick in item["ticks"]:
-            ms = tick[0]
-            bid = tick[3]
-            ask = tick[7]
-            # Only keep RTH ticks with valid quotes
-            if ms < RTH_START_MS or ms > RTH_END_MS:
-                continue
-            mid = (bid + ask) / 2 if (bid > 0 and ask > 0) else 0.0
-            records.append((strike, right, ms, bid, ask, mid))
-
-    if not records:
+    rows, n_strikes = got
+    if not rows:
         print("no RTH data")
         return False
 
-    df = pd.DataFrame(records, columns=["strike", "right", "ms_of_day", "bid", "ask", "mid"])
-    df = df.astype({
-        "strike": "float32",
-        "ms_of_day": "int32",
-        "bid": "float32",
-        "ask": "float32",
-        "mid": "float32",
-    })
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(out_path, index=False)
-    print(f"✓ {len(df)} rows ({len(df['strike'].unique())} strikes)")
+    print(f"✓ {rows} rows ({n_strikes} strikes)")
     return True
 
 
@@ -304,6 +661,10 @@ def get_spxw_trading_days(start: date, end: date, cache_dir: Path, data_resoluti
             except (ValueError, IndexError):
                 pass
 
+    # Days kept only in the consolidated chain store (parquet deleted after conversion)
+    from .chain_store import stored_days
+    cached_dates.update(d for d in stored_days(cache_dir, options_dir.name) if start <= d <= end)
+
     if cached_dates:
         return sorted(cached_dates)
 
@@ -329,65 +690,17 @@ def download_greeks_day(expiry: date, cache_dir: Path, fast_mode: bool = False)
     Cached to greeks/SPXW_YYYYMMDD_greeks.parquet — separate from chain quotes.
     Nothing in cache/options/ is touched.
     """
-    out_path = cache_dir / "greeks" / f"SPXW_{_date_str(expiry)}_greeks.parquet"
-    if out_path.exists() and pd.read_parquet(out_path).shape[0] > 0:
+    if open_manifest(cache_dir).is_cached("greeks", expiry):
         return True
 
-    exp_str = _date_str(expiry)
     retries = 1 if fast_mode else 3
     read_timeout = 30 if fast_mode else 300
 
-    data = _get("/v2/bulk_hist/option/greeks", {
-        "root": "SPXW",
-        "exp": exp_str,
-        "start_date": exp_str,
-        "end_date": exp_str,
-        "ivl": 300000,   # 5-minute intervals — matches chain quote resolution
-    }, retries=retries, read_timeout=read_timeout)
-
-    if not data or "response" not in data:
-        return False
-
-    rows_raw = data["response"]
-    if not rows_raw:
-        return False
-
-    # Format: [ms_of_day, bid, ask, delta, theta, vega, rho, epsilon,
-    #          lambda, implied_vol, iv_error, ms_of_day2, underlying_price, date]
-    fmt = data["header"]["format"]
-    idx_ms    = fmt.index("ms_of_day")
-    idx_delta = fmt.index("delta")
-    idx_iv    = fmt.index("implied_vol")
-
-    records = []
-    for item in rows_raw:
-        contract = item["contract"]
-        strike = contract["strike"] / 1000  # millionths → points
-        right  = contract["right"]          # "C" or "P"
-        for tick in item["ticks"]:
-            ms    = tick[idx_ms]
-            delta = tick[idx_delta]
-            iv    = tick[idx_iv]
-            if ms < RTH_START_MS or ms > RTH_END_MS:
-                continue
-            if delta == 0.0 and iv == 0.0:
-                continue  # skip empty rows
-            records.append((strike, right, ms, delta, iv))
-
-    if not records:
-        return False
-
-    df = pd.DataFrame(records, columns=["strike", "right", "ms_of_day", "delta", "implied_vol"])
-    df = df.astype({
-        "strike":      "float32",
-        "ms_of_day":   "int32",
-        "delta":       "float32",
-        "implied_vol": "float32",
-    })
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(out_path, index=False)
-    return True
+    got = download_bulk_day(cache_dir, "greeks", expiry, "/v2/bulk_hist/option/greeks",
+                            300000,   # 5-minute intervals — matches chain quote resolution
+                            greeks_extractor(drop_empty=True),
+                            retries=retries, read_timeout=read_timeout)
+    return bool(got and got[0])
 
 
 def load_greeks_day(expiry: date, cache_dir: Path) -> pd.DataFrame:
@@ -440,17 +753,11 @@ def download_all(start: date, end: date, cache_dir_str: str = "backtest/data/cac
     if fast_mode and slow_dates_file.exists():
         slow_dates = {line.strip() for line in slow_dates_file.read_text().splitlines() if line.strip()}
 
-    days_to_download = []
-    n_cached = 0
-    n_slow = 0
-    for d in trading_days:
-        path = cache_dir / "options" / f"SPXW_{_date_str(d)}.parquet"
-        if path.exists() and pd.read_parquet(path).shape[0] > 0:
-            n_cached += 1
-        elif fast_mode and _date_str(d) in slow_dates:
-            n_slow += 1  # skip in fast mode — will retry in slow pass
-        else:
-            days_to_download.append(d)
+    # Manifest lookup: one stat per day, no parquet reads
+    missing = open_manifest(cache_dir).missing("options", trading_days, retry_empty=True)
+    n_cached = len(trading_days) - len(missing)
+    days_to_download = [d for d in missing if not (fast_mode and _date_str(d) in slow_dates)]
+    n_slow = len(missing) - len(days_to_download)  # skipped in fast mode — retried in slow pass
 
     days_to_download.sort(reverse=True)  # newest first
     slow_note = f", {n_slow} deferred to slow pass" if n_slow else ""
@@ -474,11 +781,12 @@ def download_all(start: date, end: date, cache_dir_str: str = "backtest/data/cac
                 # Normal mode: create empty placeholder for permanent skip.
                 placeholder = cache_dir / "options" / f"SPXW_{_date_str(d)}.parquet"
                 if not placeholder.exists():
-                    import pandas as pd
                     pd.DataFrame(columns=["strike", "right", "ms_of_day", "bid", "ask", "mid"]).to_parquet(placeholder, index=False)
+                    open_manifest(cache_dir).record_empty("options", d)
         return d, ok
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    # THETA_LIMITER decides how many of these actually hit the terminal at once
+    with ThreadPoolExecutor(max_workers=THETA_LIMITER.hi) as executor:
         futures = {executor.submit(_download_one, d): d for d in days_to_download}
         for future in as_completed(futures):
             d, ok = future.result()
@@ -16,31 +16,53 @@ Simulates HYDRA's exact entry logic against historical ThetaData:
 from __future__ import annotations
 
 import math
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .chain_store import MANIFEST, load_stored_day, store_path
 from .config import BacktestConfig
-from .downloader import load_index_day, get_spxw_trading_days
-
-
-def _load_chain(expiry: date, opts_dir: Path) -> pd.DataFrame:
-    """Load chain data from a specific directory (supports 5min/1min folders)."""
+from .day_cache import DAY_CACHE
+from .result_cache import ResultCache, config_hash, day_key, open_result_cache
+from .downloader import get_spxw_trading_days
+from .delta_index import DeltaIndex
+from .index_series import IndexSeries, load_index_series
+from .pnl_curve import PnLCurve
+from .profiler import PROFILER
+
+
+def _load_chain(expiry: date, opts_dir: Path,
+                strike_band: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
+    """Load chain data from a specific directory (supports 5min/1min folders).
+
+    Served from the consolidated chain store when it holds a fresh copy.
+    strike_band=(lo, hi) keeps only strikes in [lo, hi], filtered before the
+    rows are materialized (store strike block / parquet predicate pushdown).
+    """
     from .downloader import _date_str
+    stored = load_stored_day(opts_dir.parent, opts_dir.name, expiry, strike_range=strike_band)
+    if stored is not None:
+        return stored
     path = opts_dir / f"SPXW_{_date_str(expiry)}.parquet"
     if not path.exists():
         return pd.DataFrame()
-    return pd.read_parquet(path)
+    if strike_band is None:
+        return pd.read_parquet(path)
+    lo, hi = strike_band
+    return pd.read_parquet(path, filters=[("strike", ">=", lo), ("strike", "<=", hi)])
 
 
 def _load_greeks(expiry: date, grk_dir: Path) -> pd.DataFrame:
     """Load Greeks data from a specific directory (supports 5min/1min folders)."""
     from .downloader import _date_str
+    stored = load_stored_day(grk_dir.parent, grk_dir.name, expiry)
+    if stored is not None:
+        return stored
     path = grk_dir / f"SPXW_{_date_str(expiry)}_greeks.parquet"
     if not path.exists():
         return pd.DataFrame()
@@ -49,6 +71,41 @@ def _load_greeks(expiry: date, grk_dir: Path) -> pd.DataFrame:
 
 # ── Data structures ────────────────────────────────────────────────────────
 
+@dataclass
+class DayData:
+    """Everything simulate_day() reads from disk for one trading day.
+
+    Shared across every combo a worker runs via backtest.day_cache — treat
+    as read-only.
+    """
+    chain_df: pd.DataFrame
+    lookup: "ChainLookup"
+    all_times: List[int]
+    spx: IndexSeries
+    vix: IndexSeries
+    greeks_df: Optional[pd.DataFrame] = None
+    deltas: Optional[DeltaIndex] = None   # built from greeks_df at load time
+
+    @property
+    def spx_df(self) -> pd.DataFrame:
+        """SPX series as a (ms_of_day, price) DataFrame — for analysis scripts."""
+        return self.spx.to_frame()
+
+    @property
+    def vix_df(self) -> pd.DataFrame:
+        return self.vix.to_frame()
+
+    def approx_bytes(self) -> int:
+        """Rough in-memory footprint (DataFrames + lookup arrays + index series)."""
+        n = int(self.chain_df.memory_usage(index=False).sum())
+        n += self.lookup.nbytes + self.spx.nbytes + self.vix.nbytes
+        if self.greeks_df is not None:
+            n += int(self.greeks_df.memory_usage(index=False).sum())
+        if self.deltas is not None:
+            n += self.deltas.nbytes
+        return n
+
+
 @dataclass
 class EntryResult:
     entry_num: int
@@ -126,42 +183,179 @@ class DayResult:
 
 # ── Chain lookup helpers ────────────────────────────────────────────────────
 
-def _build_chain_lookup(chain_df: pd.DataFrame) -> Dict:
+_RIGHT_IDX = {"C": 0, "P": 1}
+
+
+class ChainLookup:
     """
-    Build a fast lookup: {(strike, right, ms_of_day): (bid, ask, mid)}
+    Dense array view of one day's chain: bid/ask/mid[time_idx, strike_idx, right].
+
+    Replaces the old {(strike, right, ms_of_day): (bid, ask, mid)} dict, which
+    boxed every quote into Python tuples (seconds to build and hundreds of MB
+    on 1-min / 5-sec days).  strike_idx / time_idx are plain dicts, so every
+    quote read is two hash lookups plus one array read — O(1).
+
+    `present` marks quotes that exist in the chain: a missing strike is NOT
+    the same as a zero quote (see _get_spread_open_credit gappy-strike guard).
+
+    Still supports the old mapping protocol (`key in lookup`, `lookup[key]`,
+    `lookup.get(key)`, `len(lookup)`) for ad-hoc analysis scripts.
     """
-    if chain_df.empty:
-        return {}
-    lookup = {}
-    for row in chain_df.itertuples(index=False):
-        lookup[(row.strike, row.right, row.ms_of_day)] = (row.bid, row.ask, row.mid)
-    return lookup
 
+    __slots__ = ("strikes", "times", "strike_idx", "time_idx",
+                 "bid", "ask", "mid", "present")
+
+    def __init__(self, strikes: np.ndarray, times: np.ndarray,
+                 bid: np.ndarray, ask: np.ndarray, mid: np.ndarray, present: np.ndarray):
+        self.strikes = strikes
+        self.times = times
+        self.strike_idx = {float(k): i for i, k in enumerate(strikes.tolist())}
+        self.time_idx = {int(t): i for i, t in enumerate(times.tolist())}
+        self.bid = bid
+        self.ask = ask
+        self.mid = mid
+        self.present = present
+
+    @classmethod
+    def empty(cls) -> "ChainLookup":
+        z = np.zeros((0, 0, 2), dtype=np.float32)
+        return cls(np.zeros(0), np.zeros(0, dtype=np.int64), z, z, z, z.astype(bool))
+
+    @classmethod
+    def from_arrays(cls, strike: np.ndarray, right: np.ndarray, ms: np.ndarray,
+                    bid: np.ndarray, ask: np.ndarray, mid: np.ndarray) -> "ChainLookup":
+        """Build from flat per-quote columns (same rows as a chain DataFrame)."""
+        right = np.asarray(right)
+        is_call = right == "C"
+        keep = is_call | (right == "P")
+        if not keep.all():
+            strike, ms, bid, ask, mid, is_call = (
+                a[keep] for a in (strike, ms, bid, ask, mid, is_call))
+        if len(strike) == 0:
+            return cls.empty()
+
+        strikes = np.unique(strike)
+        times = np.unique(ms)
+        si = np.searchsorted(strikes, strike)
+        ti = np.searchsorted(times, ms)
+        ri = np.where(is_call, 0, 1)
+
+        # Duplicate (strike, right, ms) rows: last one wins, as with the dict
+        flat = (ti * len(strikes) + si) * 2 + ri
+        _, first_rev = np.unique(flat[::-1], return_index=True)
+        rows = len(flat) - 1 - first_rev
+
+        shape = (len(times), len(strikes), 2)
+        arrays = []
+        for col in (bid, ask, mid):
+            col = np.asarray(col)
+            out = np.zeros(shape, dtype=col.dtype if col.dtype.kind == "f" else np.float64)
+            out[ti[rows], si[rows], ri[rows]] = col[rows]
+            arrays.append(out)
+        present = np.zeros(shape, dtype=bool)
+        present[ti[rows], si[rows], ri[rows]] = True
+        return cls(strikes, times, *arrays, present)
+
+    @classmethod
+    def from_frame(cls, chain_df: pd.DataFrame) -> "ChainLookup":
+        if chain_df.empty:
+            return cls.empty()
+        return cls.from_arrays(
+            chain_df["strike"].to_numpy(), chain_df["right"].to_numpy(),
+            chain_df["ms_of_day"].to_numpy(), chain_df["bid"].to_numpy(),
+            chain_df["ask"].to_numpy(), chain_df["mid"].to_numpy(),
+        )
+
+    def locate(self, strike: float, right: str, ms: int) -> Optional[Tuple[int, int, int]]:
+        """(time_idx, strike_idx, right_idx) of a quote, or None if not in the chain."""
+        ti = self.time_idx.get(ms)
+        if ti is None:
+            return None
+        si = self.strike_idx.get(strike)
+        if si is None:
+            return None
+        ri = _RIGHT_IDX.get(right)
+        if ri is None or not self.present[ti, si, ri]:
+            return None
+        return ti, si, ri
 
-def _get_bid(lookup: Dict, strike: float, right: str, ms: int) -> float:
+    @property
+    def nbytes(self) -> int:
+        return int(self.bid.nbytes + self.ask.nbytes + self.mid.nbytes + self.present.nbytes)
+
+    def close_cost_series(self, short_strike: float, long_strike: float, right: str,
+                          times: np.ndarray, broker_spread_markup: float = 0.0) -> np.ndarray:
+        """_get_spread_close_cost for every ms_of_day in `times` (float64 array)."""
+        times = np.asarray(times)
+        short_ask = np.zeros(len(times))
+        long_bid = np.zeros(len(times))
+        ri = _RIGHT_IDX.get(right)
+        if ri is not None and len(self.times):
+            ti = np.minimum(np.searchsorted(self.times, times), len(self.times) - 1)
+            ok = self.times[ti] == times
+            si = self.strike_idx.get(short_strike)
+            li = self.strike_idx.get(long_strike)
+            # Missing quotes are zero in the arrays, matching _get_ask/_get_bid
+            if si is not None:
+                short_ask[ok] = self.ask[ti[ok], si, ri]
+            if li is not None:
+                long_bid[ok] = self.bid[ti[ok], li, ri]
+        short_ask_adj = short_ask + broker_spread_markup
+        long_bid_adj = np.maximum(0.0, long_bid - broker_spread_markup)
+        cost = np.maximum(0.0, (short_ask_adj - long_bid_adj) * 100)
+        cost[short_ask == 0] = 0.0
+        return cost
+
+    # ── Mapping protocol (backwards compatible with the old dict lookup) ──
+
+    def __contains__(self, key) -> bool:
+        return self.locate(*key) is not None
+
+    def __getitem__(self, key) -> Tuple[float, float, float]:
+        loc = self.locate(*key)
+        if loc is None:
+            raise KeyError(key)
+        return float(self.bid[loc]), float(self.ask[loc]), float(self.mid[loc])
+
+    def get(self, key, default=None):
+        loc = self.locate(*key)
+        if loc is None:
+            return default
+        return float(self.bid[loc]), float(self.ask[loc]), float(self.mid[loc])
+
+    def __len__(self) -> int:
+        return int(self.present.sum())
+
+
+def _build_chain_lookup(chain_df: pd.DataFrame) -> ChainLookup:
+    """
+    Build a fast lookup over (strike, right, ms_of_day) → (bid, ask, mid).
+    """
+    return ChainLookup.from_frame(chain_df)
+
+
+def _get_bid(lookup: ChainLookup, strike: float, right: str, ms: int) -> float:
     """Get bid price for a specific strike/right/time. Returns 0 if not found."""
-    val = lookup.get((strike, right, ms))
-    if val is None:
+    loc = lookup.locate(strike, right, ms)
+    if loc is None:
         return 0.0
-    bid, ask, mid = val
-    return bid
+    return float(lookup.bid[loc])
 
 
-def _get_ask(lookup: Dict, strike: float, right: str, ms: int) -> float:
+def _get_ask(lookup: ChainLookup, strike: float, right: str, ms: int) -> float:
     """Get ask price for a specific strike/right/time. Returns 0 if not found."""
-    val = lookup.get((strike, right, ms))
-    if val is None:
+    loc = lookup.locate(strike, right, ms)
+    if loc is None:
         return 0.0
-    bid, ask, mid = val
-    return ask
+    return float(lookup.ask[loc])
 
 
-def _strike_exists(lookup: Dict, strike: float, right: str, ms: int) -> bool:
+def _strike_exists(lookup: ChainLookup, strike: float, right: str, ms: int) -> bool:
     """Check if a strike actually has a quote entry in the chain (not just missing)."""
-    return (strike, right, ms) in lookup
+    return lookup.locate(strike, right, ms) is not None
 
 
-def _get_spread_open_credit(lookup: Dict, short_strike: float, long_strike: float,
+def _get_spread_open_credit(lookup: ChainLookup, short_strike: float, long_strike: float,
                              right: str, ms: int) -> float:
     """
     Credit received when opening a spread (selling short, buying long).
@@ -175,10 +369,11 @@ def _get_spread_open_credit(lookup: Dict, short_strike: float, long_strike: floa
     - Short leg bid-ask spread must be reasonable (tight spread = real market)
     """
     # Short leg validation
-    if not _strike_exists(lookup, short_strike, right, ms):
+    short_loc = lookup.locate(short_strike, right, ms)
+    if short_loc is None:
         return 0.0
-    short_val = lookup[(short_strike, right, ms)]
-    short_bid, short_ask, _ = short_val
+    short_bid = float(lookup.bid[short_loc])
+    short_ask = float(lookup.ask[short_loc])
     if short_bid == 0:
         return 0.0  # no bid on short → can't collect credit
 
@@ -189,14 +384,15 @@ def _get_spread_open_credit(lookup: Dict, short_strike: float, long_strike: floa
 
     # Long leg validation: strike MUST exist in chain
     # (Prevents "gappy strike" bug where missing strike = free long)
-    if not _strike_exists(lookup, long_strike, right, ms):
+    long_loc = lookup.locate(long_strike, right, ms)
+    if long_loc is None:
         return 0.0
-    long_ask = _get_ask(lookup, long_strike, right, ms)
+    long_ask = float(lookup.ask[long_loc])
 
     return max(0.0, (short_bid - long_ask) * 100)
 
 
-def _get_spread_close_cost(lookup: Dict, short_strike: float, long_strike: float,
+def _get_spread_close_cost(lookup: ChainLookup, short_strike: float, long_strike: float,
                             right: str, ms: int,
                             broker_spread_markup: float = 0.0) -> float:
     """
@@ -235,23 +431,17 @@ def _nearest_ms(chain_df: pd.DataFrame, target_ms: int) -> int:
     return int(avail[idx])
 
 
-def _get_index_price(index_df: pd.DataFrame, target_ms: int) -> float:
-    """Get the index price at or just before target_ms."""
-    if index_df.empty:
-        return 0.0
-    before = index_df[index_df["ms_of_day"] <= target_ms]
-    if before.empty:
-        return float(index_df.iloc[0]["price"])
-    row = before.iloc[-1]
-    return float(row["price"])
-
-
 def _compute_ema(prices: pd.Series, period: int) -> pd.Series:
     return prices.ewm(span=period, adjust=False).mean()
 
 
 # ── Strike selection ────────────────────────────────────────────────────────
 
+# Cap on the scan's starting OTM distance — also bounds the strike band a
+# day is loaded with (_strike_reach).
+_MAX_STARTING_OTM = 240
+
+
 def _calc_otm_distance(vix: float, target_delta: float) -> int:
     """
     VIX-adjusted OTM distance for ~target_delta options.
@@ -266,7 +456,7 @@ def _calc_otm_distance(vix: float, target_delta: float) -> int:
 
 
 def _find_target_delta_otm(
-    greeks_df: pd.DataFrame,
+    deltas: DeltaIndex,
     spx: float,
     ms: int,
     side: str,          # "call" or "put"
@@ -274,40 +464,15 @@ def _find_target_delta_otm(
 ) -> Optional[int]:
     """
     Find OTM distance (in points) for the strike whose |delta| is closest
-    to target_delta/100 at the given entry timestamp.
+    to target_delta/100 at the Greeks timestamp nearest ms.
 
     Returns None if Greeks data is missing or unusable for this side/time.
     Caller falls back to _calc_otm_distance when None is returned.
     """
-    right = "C" if side == "call" else "P"
-    target = target_delta / 100.0
-
-    # Find nearest available timestamp in Greeks data
-    available_ms = greeks_df["ms_of_day"].unique()
-    if len(available_ms) == 0:
-        return None
-    nearest_ms = int(available_ms[np.argmin(np.abs(available_ms - ms))])
-
-    # Filter: right side, correct timestamp, OTM strikes only
-    mask = (greeks_df["right"] == right) & (greeks_df["ms_of_day"] == nearest_ms)
-    if side == "call":
-        mask &= greeks_df["strike"] > spx
-    else:
-        mask &= greeks_df["strike"] < spx
-    sub = greeks_df.loc[mask].copy()
-
-    if sub.empty:
+    strike = deltas.nearest_strike(spx, ms, side, target_delta / 100.0)
+    if strike is None:
         return None
-
-    # Drop rows with missing/zero delta
-    sub = sub[sub["delta"].notna() & (sub["delta"] != 0)]
-    if sub.empty:
-        return None
-
-    # Find strike with |delta| closest to target
-    sub["delta_dist"] = (sub["delta"].abs() - target).abs()
-    best = sub.loc[sub["delta_dist"].idxmin()]
-    otm = int(round(abs(float(best["strike"]) - spx) / 5) * 5)
+    otm = int(round(abs(strike - spx) / 5) * 5)
     return max(25, min(120, otm))
 
 
@@ -322,7 +487,7 @@ def _calc_spread_width(vix: float, side: str, cfg: BacktestConfig) -> int:
 
 
 def _scan_for_viable_strike(
-    lookup: Dict,
+    lookup: ChainLookup,
     spx_rounded: float,
     side: str,           # "call" or "put"
     spread_width: int,
@@ -363,6 +528,419 @@ def _scan_for_viable_strike(
     return None, None, 0.0
 
 
+# ── Stop monitoring ─────────────────────────────────────────────────────────
+
+def _buffer_decay_params(cfg: BacktestConfig) -> Tuple[tuple, tuple]:
+    """
+    Time-decaying stop buffer constants per side: (enabled, extra $, hours).
+    Per-side buffer_decay_call_* / buffer_decay_put_* override the shared
+    buffer_decay_start_mult / buffer_decay_hours.
+    """
+    sides = []
+    for side, buffer in (("call", cfg.call_stop_buffer), ("put", cfg.put_stop_buffer)):
+        mult = getattr(cfg, f"buffer_decay_{side}_mult", None)
+        if mult is None:
+            mult = getattr(cfg, "buffer_decay_start_mult", None)
+        hours = getattr(cfg, f"buffer_decay_{side}_hours", None)
+        if hours is None:
+            hours = getattr(cfg, "buffer_decay_hours", None)
+        enabled = mult is not None and hours is not None and hours > 0 and mult > 1.0
+        extra = buffer * (mult - 1) if enabled else 0
+        sides.append((enabled, extra, hours))
+    return sides[0], sides[1]
+
+
+def _stop_kernel_eligible(cfg: BacktestConfig) -> bool:
+    """True when cfg's exit rules can be evaluated by _monitor_stops_vectorized."""
+    if not getattr(cfg, "vectorized_stop_monitoring", True):
+        return False
+    trailing = (getattr(cfg, "trailing_stop_enabled", False)
+                and getattr(cfg, "price_based_stop_points", None) is None)
+    cushion = (getattr(cfg, "cushion_nearstop_pct", None) is not None
+               and getattr(cfg, "cushion_recovery_pct", None) is not None)
+    time_scaled = (getattr(cfg, "entry_exit_time_to_close_base", None) is not None
+                   or getattr(cfg, "entry_exit_time_since_open_base", None) is not None)
+    return not (trailing or cushion or time_scaled)
+
+
+def _monitor_stops(
+    result: EntryResult,
+    entry_ms: int,
+    early_ms: Optional[int],
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    cfg: BacktestConfig,
+    monitor_times: List[int],
+) -> Tuple[bool, bool]:
+    """
+    Walk the bars after entry: stops, cushion recovery, per-entry time-scaled
+    exits and the day's early exit.  Fills the outcome / exit_ms / close_cost
+    fields of `result` for every side that closed before expiry.
+
+    Returns (call_stopped, put_stopped) — True when that side was closed
+    (stopped or early exit) and must not be settled at 4 PM.
+    """
+    # Path-dependent rules (trailing re-levels, cushion danger latch,
+    # per-entry time-scaled exits) need the per-bar loop below; plain
+    # credit/price stops with buffer decay are evaluated over all bars at once.
+    if _stop_kernel_eligible(cfg):
+        return _monitor_stops_vectorized(
+            [result], [cfg], entry_ms, early_ms, lookup, spx_series, monitor_times)[0]
+
+    call_stopped = False
+    put_stopped = False
+    call_active = result.entry_type in ("full_ic", "call_only")
+    put_active = result.entry_type in ("full_ic", "put_only")
+
+    price_stop_pts = getattr(cfg, "price_based_stop_points", None)
+    price_stop_inward = getattr(cfg, "price_stop_inward", True)
+
+    # Trailing stop state (only for credit-based stops)
+    _trailing_en = getattr(cfg, "trailing_stop_enabled", False) and price_stop_pts is None
+    _trailing_trig = getattr(cfg, "trailing_stop_trigger_decay", 0.50)
+    _trail_call_buf = getattr(cfg, "trailing_stop_call_buffer", 10.0)
+    _trail_put_buf = getattr(cfg, "trailing_stop_put_buffer", 50.0)
+    _call_trail = False  # has call trailing been triggered?
+    _put_trail = False   # has put trailing been triggered?
+
+    # Cushion recovery tracking
+    _cush_near = getattr(cfg, "cushion_nearstop_pct", None)
+    _cush_recv = getattr(cfg, "cushion_recovery_pct", None)
+    _call_hit_danger = False
+    _put_hit_danger = False
+
+    # Per-entry time-scaled exit config (read once, not per bar)
+    _etc_base = getattr(cfg, "entry_exit_time_to_close_base", None)
+    _eso_base = getattr(cfg, "entry_exit_time_since_open_base", None)
+
+    # Time-decaying buffer: pre-compute constants outside loop (per-side overrides)
+    (_buf_call_decay_en, _buf_call_extra, _buf_call_hours), \
+        (_buf_put_decay_en, _buf_put_extra, _buf_put_hours) = _buffer_decay_params(cfg)
+    _buf_decay_enabled = _buf_call_decay_en or _buf_put_decay_en
+    _orig_call_stop = result.call_stop
+    _orig_put_stop = result.put_stop
+
+    for monitor_ms in monitor_times:
+        if monitor_ms <= entry_ms:
+            continue  # don't check before entry
+
+        # Get SPX price once per bar when using price-based stops
+        spx_now = spx_series.at(monitor_ms) if price_stop_pts is not None else 0.0
+
+        # Stop checks: use ask-based close cost (realistic fill price)
+        slip = getattr(cfg, "stop_slippage_per_leg", 0.0) * 2  # 2 legs, value already in dollars
+        # Saxo spread markup: Saxo's ask is wider than NBBO during fast moves,
+        # causing stops to trigger earlier than ThetaData data shows.
+        # Multiply spread value by (1 + markup) before comparing to stop level.
+        _spread_markup = 1.0 + getattr(cfg, "stop_spread_markup_pct", 0.0)
+
+        # ── Time-decaying buffer: widen stop early in position's life ──────
+        if _buf_decay_enabled:
+            elapsed_h = (monitor_ms - entry_ms) / 3600000
+            # Per-side decay factors (different hours allowed)
+            if not _call_trail and _buf_call_decay_en:
+                call_decay = max(0.0, min(1.0, 1.0 - elapsed_h / _buf_call_hours))
+                result.call_stop = _orig_call_stop + _buf_call_extra * call_decay
+            if not _put_trail and _buf_put_decay_en:
+                put_decay = max(0.0, min(1.0, 1.0 - elapsed_h / _buf_put_hours))
+                result.put_stop = _orig_put_stop + _buf_put_extra * put_decay
+
+        # Spread value cap: close cost can't exceed spread width × 100
+        cap_at_stop = getattr(cfg, "spread_value_cap_at_stop", False)
+        call_cap = result.call_spread_width * 100 if cap_at_stop else float('inf')
+        put_cap = result.put_spread_width * 100 if cap_at_stop else float('inf')
+        if call_active and not call_stopped:
+            if price_stop_pts is not None:
+                if spx_now > 0 and spx_now >= result.short_call - (price_stop_pts if price_stop_inward else -price_stop_pts):
+                    cv = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
+                    if cv > 0:
+                        call_stopped = True
+                        result.call_outcome = "stopped"
+                        result.call_exit_ms = monitor_ms
+                        result.call_close_cost = min(cv + slip, call_cap)
+            else:
+                # broker_spread_markup adjusts bid/ask additively (matches all 17 other call sites);
+                # _spread_markup (= 1 + cfg.stop_spread_markup_pct, computed at line 806) adds a
+                # multiplicative safety factor on the stop-trigger comparison so Saxo's dynamic
+                # spread widening during fast moves doesn't miss stops the additive markup alone
+                # would have caught. Both default to 0/1.0 (no markup) and compose without overlap.
+                cv = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
+                cv_check = cv * _spread_markup
+                # ── Trailing stop: tighten call side when decay threshold reached
+                if _trailing_en and not _call_trail and cv > 0 and result.call_credit > 0:
+                    if cv <= result.call_credit * _trailing_trig:
+                        _call_trail = True
+                        if result.entry_type == "full_ic":
+                            result.call_stop = (result.call_credit + result.put_credit) + _trail_call_buf
+                        else:  # call_only
+                            result.call_stop = result.call_credit + cfg.downday_theoretical_put_credit + _trail_call_buf
+                        result.call_stop = max(result.call_stop, cfg.min_stop_level)
+                # ── Stop check (may use tightened level)
+                if cv_check > 0 and cv_check >= result.call_stop:
+                    call_stopped = True
+                    result.call_outcome = "stopped"
+                    result.call_exit_ms = monitor_ms
+                    result.call_close_cost = min(cv + slip, call_cap)
+
+        if put_active and not put_stopped:
+            if price_stop_pts is not None:
+                if spx_now > 0 and spx_now <= result.short_put + (price_stop_pts if price_stop_inward else -price_stop_pts):
+                    pv = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
+                    if pv > 0:
+                        put_stopped = True
+                        result.put_outcome = "stopped"
+                        result.put_exit_ms = monitor_ms
+                        result.put_close_cost = min(pv + slip, put_cap)
+            else:
+                # Symmetric to call side: additive bid/ask via broker_spread_markup +
+                # multiplicative stop-trigger safety via _spread_markup. See call-side
+                # comment ~30 lines above for rationale.
+                pv = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
+                pv_check = pv * _spread_markup
+                # ── Trailing stop: tighten put side when decay threshold reached
+                if _trailing_en and not _put_trail and pv > 0 and result.put_credit > 0:
+                    if pv <= result.put_credit * _trailing_trig:
+                        _put_trail = True
+                        if result.entry_type == "full_ic":
+                            result.put_stop = (result.call_credit + result.put_credit) + _trail_put_buf
+                        else:  # put_only
+                            result.put_stop = result.put_credit + getattr(cfg, "upday_theoretical_call_credit", 0.0) + _trail_put_buf
+                        result.put_stop = max(result.put_stop, cfg.min_stop_level)
+                # ── Stop check (may use tightened level)
+                if pv_check > 0 and pv_check >= result.put_stop:
+                    put_stopped = True
+                    result.put_outcome = "stopped"
+                    result.put_exit_ms = monitor_ms
+                    result.put_close_cost = min(pv + slip, put_cap)
+
+        # ── Cushion recovery exit: close side that nearly stopped then recovered
+        if _cush_near is not None and _cush_recv is not None:
+            # Call side
+            if call_active and not call_stopped and result.call_stop > 0:
+                _cv_cush = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
+                if _cv_cush > 0:
+                    _call_ratio = _cv_cush / result.call_stop
+                    if _call_ratio >= _cush_near:
+                        _call_hit_danger = True
+                    if _call_hit_danger and _call_ratio <= _cush_recv:
+                        call_stopped = True
+                        result.call_outcome = "early_exit"
+                        result.call_exit_ms = monitor_ms
+                        result.call_close_cost = _cv_cush + slip
+            # Put side
+            if put_active and not put_stopped and result.put_stop > 0:
+                _pv_cush = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
+                if _pv_cush > 0:
+                    _put_ratio = _pv_cush / result.put_stop
+                    if _put_ratio >= _cush_near:
+                        _put_hit_danger = True
+                    if _put_hit_danger and _put_ratio <= _cush_recv:
+                        put_stopped = True
+                        result.put_outcome = "early_exit"
+                        result.put_exit_ms = monitor_ms
+                        result.put_close_cost = _pv_cush + slip
+
+        # ── Per-entry time-scaled exit: close this entry's sides if captured
+        #    enough credit relative to time remaining (or time open) ──────
+        if (_etc_base is not None or _eso_base is not None):
+            _mkt_close_ms = 16 * 3600 * 1000
+            for _side, _credit, _stopped, _cv_func, _strike_s, _strike_l, _right in [
+                ("call", result.call_credit, call_stopped,
+                 lambda ms: _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", ms, cfg.broker_spread_markup),
+                 result.short_call, result.long_call, "C"),
+                ("put", result.put_credit, put_stopped,
+                 lambda ms: _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", ms, cfg.broker_spread_markup),
+                 result.short_put, result.long_put, "P"),
+            ]:
+                _side_active = (_side == "call" and call_active) or (_side == "put" and put_active)
+                if not _side_active or _stopped or _credit <= 0:
+                    continue
+                _sv = _cv_func(monitor_ms)
+                if _sv <= 0:
+                    continue
+                _captured = (_credit - _sv) / _credit
+                _should_exit = False
+                if _etc_base is not None:
+                    _hrs_left = max(0.25, (_mkt_close_ms - monitor_ms) / 3600000)
+                    _thresh = _etc_base / math.sqrt(_hrs_left / 6.5)
+                    if _captured >= _thresh:
+                        _should_exit = True
+                if not _should_exit and _eso_base is not None:
+                    _hrs_open = max(0.0167, (monitor_ms - entry_ms) / 3600000)  # min 1 min
+                    _thresh = _eso_base * math.sqrt(_hrs_open / 6.5)
+                    if _captured >= _thresh:
+                        _should_exit = True
+                if _should_exit:
+                    if _side == "call":
+                        call_stopped = True
+                        result.call_outcome = "early_exit"
+                        result.call_exit_ms = monitor_ms
+                        result.call_close_cost = _sv + slip
+                    else:
+                        put_stopped = True
+                        result.put_outcome = "early_exit"
+                        result.put_exit_ms = monitor_ms
+                        result.put_close_cost = _sv + slip
+
+        # Early exit: close any remaining open sides at this bar
+        if early_ms and monitor_ms >= early_ms:
+            if call_active and not call_stopped:
+                cv = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
+                result.call_outcome = "early_exit"
+                result.call_exit_ms = monitor_ms
+                result.call_close_cost = cv  # 0.0 if quote missing (treated as worthless)
+                call_stopped = True
+            if put_active and not put_stopped:
+                pv = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
+                result.put_outcome = "early_exit"
+                result.put_exit_ms = monitor_ms
+                result.put_close_cost = pv
+                put_stopped = True
+            break  # don't monitor past early exit time
+
+        if (not call_active or call_stopped) and (not put_active or put_stopped):
+            break  # both sides resolved
+
+    return call_stopped, put_stopped
+
+
+def _monitor_stops_vectorized(
+    results: List[EntryResult],
+    cfgs: List[BacktestConfig],
+    entry_ms: int,
+    early_ms: Optional[int],
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    monitor_times: List[int],
+) -> List[Tuple[bool, bool]]:
+    """
+    Array version of the per-bar loop in _monitor_stops.
+
+    `results` are copies of ONE selected entry (same strikes and credits),
+    one per config, with each config's stop levels already set.  Each side's
+    close-cost series is built once over every bar after entry; stop levels
+    form a (variant × bar) matrix and the first breaching bar per variant is
+    found with array ops.  Same float64 arithmetic as the scalar loop, so
+    results are bit-identical.  Every cfg must pass _stop_kernel_eligible.
+    """
+    flags = [(False, False)] * len(results)
+    bars = np.asarray(monitor_times, dtype=np.int64)
+    bars = bars[bars > entry_ms]  # don't check before entry
+    n = len(bars)
+    if n == 0 or not results:
+        return flags
+
+    # The loop breaks at the first bar at/after the early exit time — nothing
+    # past it can fire.
+    exit_i = n
+    if early_ms:
+        at_exit = np.flatnonzero(bars >= early_ms)
+        if len(at_exit):
+            exit_i = int(at_exit[0])
+    bars = bars[:min(exit_i + 1, n)]
+    elapsed_h = (bars - entry_ms) / 3600000
+
+    base = results[0]
+    decay = [_buffer_decay_params(c) for c in cfgs]
+    price_pts = [getattr(c, "price_based_stop_points", None) for c in cfgs]
+    spx_now = (spx_series.at_many(bars)
+               if any(p is not None for p in price_pts) else None)
+    cv_cache: Dict[Tuple[str, float], np.ndarray] = {}
+
+    def close_costs(right: str, markup: float) -> np.ndarray:
+        key = (right, markup)
+        if key not in cv_cache:
+            if right == "C":
+                cv_cache[key] = lookup.close_cost_series(
+                    base.short_call, base.long_call, "C", bars, markup)
+            else:
+                cv_cache[key] = lookup.close_cost_series(
+                    base.short_put, base.long_put, "P", bars, markup)
+        return cv_cache[key]
+
+    def first_hits(right: str) -> List[Optional[Tuple[int, str, float]]]:
+        """Per variant: (bar index, outcome, close cost) of the side's exit, or None."""
+        side = 0 if right == "C" else 1
+        cv = np.stack([close_costs(right, c.broker_spread_markup) for c in cfgs])
+        hit = np.zeros(cv.shape, dtype=bool)
+
+        # Credit-based stops: level may decay with time since entry
+        credit_rows = [v for v, p in enumerate(price_pts) if p is None]
+        if credit_rows:
+            stop = np.array([(r.call_stop if side == 0 else r.put_stop)
+                             for r in (results[v] for v in credit_rows)])[:, None]
+            stop = np.broadcast_to(stop, (len(credit_rows), len(bars)))
+            en, extra, hours = zip(*(decay[v][side] for v in credit_rows))
+            en = np.array(en)
+            if en.any():
+                hours = np.array([h if e else 1.0 for e, h in zip(en, hours)], dtype=np.float64)[:, None]
+                extra = np.array([x if e else 0.0 for e, x in zip(en, extra)], dtype=np.float64)[:, None]
+                factor = np.clip(1.0 - elapsed_h[None, :] / hours, 0.0, 1.0)
+                stop = np.where(en[:, None], stop + extra * factor, stop)
+            markup = np.array([1.0 + getattr(cfgs[v], "stop_spread_markup_pct", 0.0)
+                               for v in credit_rows])[:, None]
+            cv_check = cv[credit_rows] * markup
+            hit[credit_rows] = (cv_check > 0) & (cv_check >= stop)
+
+        # Price-based stops: SPX within N pts of the short strike
+        for v, pts in enumerate(price_pts):
+            if pts is None:
+                continue
+            off = pts if getattr(cfgs[v], "price_stop_inward", True) else -pts
+            if side == 0:
+                hit[v] = (spx_now > 0) & (spx_now >= base.short_call - off) & (cv[v] > 0)
+            else:
+                hit[v] = (spx_now > 0) & (spx_now <= base.short_put + off) & (cv[v] > 0)
+
+        any_hit = hit.any(axis=1)
+        first = hit.argmax(axis=1)
+        out: List[Optional[Tuple[int, str, float]]] = []
+        for v, c in enumerate(cfgs):
+            if any_hit[v]:
+                i = int(first[v])
+                slip = getattr(c, "stop_slippage_per_leg", 0.0) * 2
+                width = base.call_spread_width if side == 0 else base.put_spread_width
+                cap = width * 100 if getattr(c, "spread_value_cap_at_stop", False) else float('inf')
+                out.append((i, "stopped", min(float(cv[v, i]) + slip, cap)))
+            elif exit_i < n:
+                # Early exit: close at this bar, 0.0 if quote missing (worthless)
+                out.append((exit_i, "early_exit", float(cv[v, exit_i])))
+            else:
+                out.append(None)
+        return out
+
+    call_active = base.entry_type in ("full_ic", "call_only")
+    put_active = base.entry_type in ("full_ic", "put_only")
+    call_closes = first_hits("C") if call_active else [None] * len(results)
+    put_closes = first_hits("P") if put_active else [None] * len(results)
+
+    for v, r in enumerate(results):
+        call_close, put_close = call_closes[v], put_closes[v]
+        if call_close is not None:
+            r.call_exit_ms = int(bars[call_close[0]])
+            r.call_outcome, r.call_close_cost = call_close[1], call_close[2]
+        if put_close is not None:
+            r.put_exit_ms = int(bars[put_close[0]])
+            r.put_outcome, r.put_close_cost = put_close[1], put_close[2]
+
+        # The scalar loop leaves call_stop / put_stop at the decayed level of
+        # the last bar it processed (used for the settlement cap) — reproduce that.
+        (call_en, call_extra, call_hours), (put_en, put_extra, put_hours) = decay[v]
+        if call_en or put_en:
+            if ((not call_active or call_close is not None)
+                    and (not put_active or put_close is not None)):
+                last = max(c[0] for c in (call_close, put_close) if c is not None)
+            else:
+                last = len(bars) - 1
+            last_h = (int(bars[last]) - entry_ms) / 3600000
+            if call_en:
+                r.call_stop = r.call_stop + call_extra * max(0.0, min(1.0, 1.0 - last_h / call_hours))
+            if put_en:
+                r.put_stop = r.put_stop + put_extra * max(0.0, min(1.0, 1.0 - last_h / put_hours))
+        flags[v] = (call_close is not None, put_close is not None)
+    return flags
+
+
 # ── Per-entry simulation ────────────────────────────────────────────────────
 
 _USE_CFG_EARLY_EXIT = object()  # sentinel: "use cfg.early_exit_time_ms()"
@@ -375,26 +953,65 @@ def _simulate_entry(
     is_fomc_t1: bool,
     spx_open: float,        # session open price (for conditional threshold)
     chain_df: pd.DataFrame,
-    lookup: Dict,
-    spx_df: pd.DataFrame,
-    vix_df: pd.DataFrame,
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    vix_series: IndexSeries,
     cfg: BacktestConfig,
     monitor_times: List[int],
     is_upday_conditional: bool = False,  # upday put-only trigger enabled for this slot
     day_early_exit_ms=_USE_CFG_EARLY_EXIT,  # override from simulate_day for VIX-gated exit
-    greeks_df: Optional[pd.DataFrame] = None,  # real Greeks data (None = use VIX formula)
+    deltas: Optional[DeltaIndex] = None,  # real Greeks data (None = use VIX formula)
     force_entry_type: Optional[str] = None,  # "call_only"|"put_only" for replacement entries
     extra_min_otm: int = 0,  # added to min OTM distances (replacement entries)
 ) -> EntryResult:
 
+    # day_early_exit_ms overrides cfg when simulate_day applies VIX-gated logic.
+    # _USE_CFG_EARLY_EXIT sentinel means "fall back to config value".
+    early_ms = _resolve_early_exit_ms(cfg, day_early_exit_ms)
+    result = _select_entry(
+        entry_num, entry_ms, is_conditional, is_fomc_t1, spx_open, chain_df,
+        lookup, spx_series, vix_series, cfg, early_ms,
+        is_upday_conditional=is_upday_conditional, deltas=deltas,
+        force_entry_type=force_entry_type, extra_min_otm=extra_min_otm,
+    )
+    if result.entry_type == "skipped":
+        return result
+    return _finish_entry(result, entry_ms, early_ms, lookup, spx_series, cfg, monitor_times)
+
+
+def _resolve_early_exit_ms(cfg: BacktestConfig, day_early_exit_ms) -> Optional[int]:
+    if day_early_exit_ms is _USE_CFG_EARLY_EXIT:
+        return cfg.early_exit_time_ms()
+    return day_early_exit_ms
+
+
+def _select_entry(
+    entry_num: int,
+    entry_ms: int,
+    is_conditional: bool,
+    is_fomc_t1: bool,
+    spx_open: float,
+    chain_df: pd.DataFrame,
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    vix_series: IndexSeries,
+    cfg: BacktestConfig,
+    early_ms: Optional[int],
+    is_upday_conditional: bool = False,
+    deltas: Optional[DeltaIndex] = None,
+    force_entry_type: Optional[str] = None,
+    extra_min_otm: int = 0,
+) -> EntryResult:
+    """
+    Entry decision and strike selection: everything before the first
+    monitored bar.  Returns a skipped result, or one with strikes, credits
+    and stop levels set.  Only reads stop-level fields of cfg through
+    _set_stop_levels, so one selection can be shared by configs that differ
+    only in stop / exit parameters (see _EXIT_ONLY_FIELDS).
+    """
     result = EntryResult(entry_num=entry_num, entry_time_ms=entry_ms)
 
     # ── Skip if entry fires at or after early exit time ──────────────────
-    # day_early_exit_ms overrides cfg when simulate_day applies VIX-gated logic.
-    # _USE_CFG_EARLY_EXIT sentinel means "fall back to config value".
-    early_ms = (cfg.early_exit_time_ms()
-                if day_early_exit_ms is _USE_CFG_EARLY_EXIT
-                else day_early_exit_ms)
     if early_ms and entry_ms >= early_ms:
         result.entry_type = "skipped"
         result.skip_reason = "entry_at_or_after_early_exit"
@@ -402,8 +1019,8 @@ def _simulate_entry(
 
     # ── Get market data at entry time ────────────────────────────────────
     actual_ms = _nearest_ms(chain_df, entry_ms)
-    spx = _get_index_price(spx_df, entry_ms)
-    vix = _get_index_price(vix_df, entry_ms)
+    spx = spx_series.at(entry_ms)
+    vix = vix_series.at(entry_ms)
 
     if spx <= 0 or vix <= 0:
         result.entry_type = "skipped"
@@ -448,12 +1065,9 @@ def _simulate_entry(
         # ── Down-day reference (open or intraday high) ────────────────────
         if is_conditional:
             if getattr(cfg, "downday_reference", "open") == "high":
-                mask = (
-                    (spx_df["ms_of_day"] >= market_open_ms) &
-                    (spx_df["ms_of_day"] <= entry_ms) &
-                    (spx_df["price"] > 0)
-                )
-                down_ref = float(spx_df.loc[mask, "price"].max()) if mask.any() else spx_open
+                down_ref = spx_series.high(market_open_ms, entry_ms)
+                if down_ref is None:
+                    down_ref = spx_open
                 if down_ref <= 0:
                     down_ref = spx_open
             else:
@@ -465,12 +1079,9 @@ def _simulate_entry(
         # ── Up-day reference (open or intraday low) ───────────────────────
         if is_upday_conditional:
             if getattr(cfg, "upday_reference", "open") == "low":
-                mask = (
-                    (spx_df["ms_of_day"] >= market_open_ms) &
-                    (spx_df["ms_of_day"] <= entry_ms) &
-                    (spx_df["price"] > 0)
-                )
-                up_ref = float(spx_df.loc[mask, "price"].min()) if mask.any() else spx_open
+                up_ref = spx_series.low(market_open_ms, entry_ms)
+                if up_ref is None:
+                    up_ref = spx_open
                 if up_ref <= 0:
                     up_ref = spx_open
             else:
@@ -509,12 +1120,9 @@ def _simulate_entry(
         # Base entry reference: "open" (default) or "high" (intraday high from open to entry)
         base_ref = getattr(cfg, "base_entry_downday_reference", "open")
         if base_ref == "high":
-            mask = (
-                (spx_df["ms_of_day"] >= market_open_ms) &
-                (spx_df["ms_of_day"] <= entry_ms) &
-                (spx_df["price"] > 0)
-            )
-            base_ref_price = float(spx_df.loc[mask, "price"].max()) if mask.any() else spx_open
+            base_ref_price = spx_series.high(market_open_ms, entry_ms)
+            if base_ref_price is None:
+                base_ref_price = spx_open
             if base_ref_price <= 0:
                 base_ref_price = spx_open
         else:
@@ -539,9 +1147,9 @@ def _simulate_entry(
     put_spread_width = _calc_spread_width(vix, "put", cfg)
 
     # OTM base distance: real delta lookup when Greeks available, else VIX formula
-    if greeks_df is not None and not greeks_df.empty:
-        call_otm_base = _find_target_delta_otm(greeks_df, spx, actual_ms, "call", cfg.target_delta)
-        put_otm_base  = _find_target_delta_otm(greeks_df, spx, actual_ms, "put",  cfg.target_delta)
+    if deltas is not None and len(deltas.times):
+        call_otm_base = _find_target_delta_otm(deltas, spx, actual_ms, "call", cfg.target_delta)
+        put_otm_base  = _find_target_delta_otm(deltas, spx, actual_ms, "put",  cfg.target_delta)
         # Fall back to VIX formula per-side if Greeks lookup returned None
         vix_otm = _calc_otm_distance(vix, cfg.target_delta)
         if call_otm_base is None:
@@ -554,9 +1162,9 @@ def _simulate_entry(
         put_otm_base  = vix_otm
 
     call_starting_otm = int(round((call_otm_base * cfg.call_starting_otm_multiplier) / 5) * 5)
-    call_starting_otm = max(25, min(240, call_starting_otm))
+    call_starting_otm = max(25, min(_MAX_STARTING_OTM, call_starting_otm))
     put_starting_otm = int(round((put_otm_base * cfg.put_starting_otm_multiplier) / 5) * 5)
-    put_starting_otm = max(25, min(240, put_starting_otm))
+    put_starting_otm = max(25, min(_MAX_STARTING_OTM, put_starting_otm))
 
     result.call_spread_width = call_spread_width
     result.put_spread_width = put_spread_width
@@ -661,14 +1269,10 @@ def _simulate_entry(
             result.entry_type = "skipped"
             result.skip_reason = "upday-035_no_put_credit"
             return result
-        # For put-only stop: put_credit + theoretical_call + buffer (mirrors call-only formula)
-        put_stop = put_credit + getattr(cfg, "upday_theoretical_call_credit", 0.0) + cfg.put_stop_buffer
-        put_stop = max(put_stop, cfg.min_stop_level)
         result.entry_type = "put_only"
         result.short_put = put_short
         result.long_put = put_long
         result.put_credit = put_credit
-        result.put_stop = put_stop
         result.call_outcome = "skipped"
 
     elif force_call_only:
@@ -677,30 +1281,19 @@ def _simulate_entry(
             result.skip_reason = f"mkt-011_call_only_no_credit (forced: {result.skip_reason})"
             return result
         result.entry_type = "call_only"
-        # For call-only stop: call_credit + theoretical_put + buffer
-        call_stop = call_credit + cfg.downday_theoretical_put_credit + cfg.call_stop_buffer
-        call_stop = max(call_stop, cfg.min_stop_level)
         result.short_call = call_short
         result.long_call = call_long
         result.call_credit = call_credit
-        result.call_stop = call_stop
         result.put_outcome = "skipped"
 
     elif call_short is not None and put_short is not None:
         result.entry_type = "full_ic"
-        total_credit = call_credit + put_credit
-        call_stop = total_credit + cfg.call_stop_buffer
-        put_stop = total_credit + cfg.put_stop_buffer
-        call_stop = max(call_stop, cfg.min_stop_level)
-        put_stop = max(put_stop, cfg.min_stop_level)
         result.short_call = call_short
         result.long_call = call_long
         result.short_put = put_short
         result.long_put = put_long
         result.call_credit = call_credit
         result.put_credit = put_credit
-        result.call_stop = call_stop
-        result.put_stop = put_stop
 
     elif call_short is None and put_short is not None:
         # MKT-032/039: put-only if VIX < threshold and one-sided entries enabled
@@ -709,13 +1302,9 @@ def _simulate_entry(
             result.skip_reason = f"mkt-011_call_non_viable_vix_too_high ({vix:.1f} >= {cfg.put_only_max_vix})"
             return result
         result.entry_type = "put_only"
-        # For put-only stop: put_credit + theoretical_call + buffer (mirrors call-only formula)
-        put_stop = put_credit + getattr(cfg, "upday_theoretical_call_credit", 0.0) + cfg.put_stop_buffer
-        put_stop = max(put_stop, cfg.min_stop_level)
         result.short_put = put_short
         result.long_put = put_long
         result.put_credit = put_credit
-        result.put_stop = put_stop
         result.call_outcome = "skipped"
 
     elif call_short is not None and put_short is None:
@@ -724,14 +1313,11 @@ def _simulate_entry(
             result.entry_type = "skipped"
             result.skip_reason = "one_sided_disabled_put_non_viable"
             return result
-        call_stop = call_credit + cfg.downday_theoretical_put_credit + cfg.call_stop_buffer
-        call_stop = max(call_stop, cfg.min_stop_level)
         result.entry_type = "call_only"
         result.skip_reason = "mkt-040"
         result.short_call = call_short
         result.long_call = call_long
         result.call_credit = call_credit
-        result.call_stop = call_stop
         result.put_outcome = "skipped"
 
     else:
@@ -739,246 +1325,95 @@ def _simulate_entry(
         result.skip_reason = "mkt-011_both_non_viable"
         return result
 
-    # ── Stop monitoring + early exit ──────────────────────────────────────
-    call_stopped = False
-    put_stopped = False
-    # Track which sides are active
-    call_active = result.entry_type in ("full_ic", "call_only")
-    put_active = result.entry_type in ("full_ic", "put_only")
-
-    price_stop_pts = getattr(cfg, "price_based_stop_points", None)
-    price_stop_inward = getattr(cfg, "price_stop_inward", True)
-
-    # Trailing stop state (only for credit-based stops)
-    _trailing_en = getattr(cfg, "trailing_stop_enabled", False) and price_stop_pts is None
-    _trailing_trig = getattr(cfg, "trailing_stop_trigger_decay", 0.50)
-    _trail_call_buf = getattr(cfg, "trailing_stop_call_buffer", 10.0)
-    _trail_put_buf = getattr(cfg, "trailing_stop_put_buffer", 50.0)
-    _call_trail = False  # has call trailing been triggered?
-    _put_trail = False   # has put trailing been triggered?
-
-    # Cushion recovery tracking
-    _cush_near = getattr(cfg, "cushion_nearstop_pct", None)
-    _cush_recv = getattr(cfg, "cushion_recovery_pct", None)
-    _call_hit_danger = False
-    _put_hit_danger = False
-
-    # Per-entry time-scaled exit config (read once, not per bar)
-    _etc_base = getattr(cfg, "entry_exit_time_to_close_base", None)
-    _eso_base = getattr(cfg, "entry_exit_time_since_open_base", None)
-
-    # Time-decaying buffer: pre-compute constants outside loop (per-side overrides)
-    _buf_call_mult = getattr(cfg, "buffer_decay_call_mult", None)
-    if _buf_call_mult is None:
-        _buf_call_mult = getattr(cfg, "buffer_decay_start_mult", None)
-    _buf_call_hours = getattr(cfg, "buffer_decay_call_hours", None)
-    if _buf_call_hours is None:
-        _buf_call_hours = getattr(cfg, "buffer_decay_hours", None)
-    _buf_put_mult = getattr(cfg, "buffer_decay_put_mult", None)
-    if _buf_put_mult is None:
-        _buf_put_mult = getattr(cfg, "buffer_decay_start_mult", None)
-    _buf_put_hours = getattr(cfg, "buffer_decay_put_hours", None)
-    if _buf_put_hours is None:
-        _buf_put_hours = getattr(cfg, "buffer_decay_hours", None)
-    _buf_call_decay_en = (_buf_call_mult is not None and _buf_call_hours is not None
-                          and _buf_call_hours > 0 and _buf_call_mult > 1.0)
-    _buf_put_decay_en = (_buf_put_mult is not None and _buf_put_hours is not None
-                         and _buf_put_hours > 0 and _buf_put_mult > 1.0)
-    _buf_decay_enabled = _buf_call_decay_en or _buf_put_decay_en
-    _orig_call_stop = result.call_stop
-    _orig_put_stop = result.put_stop
-    _buf_call_extra = cfg.call_stop_buffer * (_buf_call_mult - 1) if _buf_call_decay_en else 0
-    _buf_put_extra = cfg.put_stop_buffer * (_buf_put_mult - 1) if _buf_put_decay_en else 0
-
-    # early_ms already computed above (used to skip entries at/after exit time)
-    for monitor_ms in monitor_times:
-        if monitor_ms <= entry_ms:
-            continue  # don't check before entry
-
-        # Get SPX price once per bar when using price-based stops
-        spx_now = _get_index_price(spx_df, monitor_ms) if price_stop_pts is not None else 0.0
-
-        # Stop checks: use ask-based close cost (realistic fill price)
-        slip = getattr(cfg, "stop_slippage_per_leg", 0.0) * 2  # 2 legs, value already in dollars
-        # Saxo spread markup: Saxo's ask is wider than NBBO during fast moves,
-        # causing stops to trigger earlier than ThetaData data shows.
-        # Multiply spread value by (1 + markup) before comparing to stop level.
-        _spread_markup = 1.0 + getattr(cfg, "stop_spread_markup_pct", 0.0)
+    _set_stop_levels(result, cfg)
+    return result
 
-        # ── Time-decaying buffer: widen stop early in position's life ──────
-        if _buf_decay_enabled:
-            elapsed_h = (monitor_ms - entry_ms) / 3600000
-            # Per-side decay factors (different hours allowed)
-            if not _call_trail and _buf_call_decay_en:
-                call_decay = max(0.0, min(1.0, 1.0 - elapsed_h / _buf_call_hours))
-                result.call_stop = _orig_call_stop + _buf_call_extra * call_decay
-            if not _put_trail and _buf_put_decay_en:
-                put_decay = max(0.0, min(1.0, 1.0 - elapsed_h / _buf_put_hours))
-                result.put_stop = _orig_put_stop + _buf_put_extra * put_decay
 
-        # Spread value cap: close cost can't exceed spread width × 100
-        cap_at_stop = getattr(cfg, "spread_value_cap_at_stop", False)
-        call_cap = result.call_spread_width * 100 if cap_at_stop else float('inf')
-        put_cap = result.put_spread_width * 100 if cap_at_stop else float('inf')
-        if call_active and not call_stopped:
-            if price_stop_pts is not None:
-                if spx_now > 0 and spx_now >= result.short_call - (price_stop_pts if price_stop_inward else -price_stop_pts):
-                    cv = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
-                    if cv > 0:
-                        call_stopped = True
-                        result.call_outcome = "stopped"
-                        result.call_exit_ms = monitor_ms
-                        result.call_close_cost = min(cv + slip, call_cap)
-            else:
-                # broker_spread_markup adjusts bid/ask additively (matches all 17 other call sites);
-                # _spread_markup (= 1 + cfg.stop_spread_markup_pct, computed at line 806) adds a
-                # multiplicative safety factor on the stop-trigger comparison so Saxo's dynamic
-                # spread widening during fast moves doesn't miss stops the additive markup alone
-                # would have caught. Both default to 0/1.0 (no markup) and compose without overlap.
-                cv = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
-                cv_check = cv * _spread_markup
-                # ── Trailing stop: tighten call side when decay threshold reached
-                if _trailing_en and not _call_trail and cv > 0 and result.call_credit > 0:
-                    if cv <= result.call_credit * _trailing_trig:
-                        _call_trail = True
-                        if result.entry_type == "full_ic":
-                            result.call_stop = (result.call_credit + result.put_credit) + _trail_call_buf
-                        else:  # call_only
-                            result.call_stop = result.call_credit + cfg.downday_theoretical_put_credit + _trail_call_buf
-                        result.call_stop = max(result.call_stop, cfg.min_stop_level)
-                # ── Stop check (may use tightened level)
-                if cv_check > 0 and cv_check >= result.call_stop:
-                    call_stopped = True
-                    result.call_outcome = "stopped"
-                    result.call_exit_ms = monitor_ms
-                    result.call_close_cost = min(cv + slip, call_cap)
-
-        if put_active and not put_stopped:
-            if price_stop_pts is not None:
-                if spx_now > 0 and spx_now <= result.short_put + (price_stop_pts if price_stop_inward else -price_stop_pts):
-                    pv = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
-                    if pv > 0:
-                        put_stopped = True
-                        result.put_outcome = "stopped"
-                        result.put_exit_ms = monitor_ms
-                        result.put_close_cost = min(pv + slip, put_cap)
-            else:
-                # Symmetric to call side: additive bid/ask via broker_spread_markup +
-                # multiplicative stop-trigger safety via _spread_markup. See call-side
-                # comment ~30 lines above for rationale.
-                pv = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
-                pv_check = pv * _spread_markup
-                # ── Trailing stop: tighten put side when decay threshold reached
-                if _trailing_en and not _put_trail and pv > 0 and result.put_credit > 0:
-                    if pv <= result.put_credit * _trailing_trig:
-                        _put_trail = True
-                        if result.entry_type == "full_ic":
-                            result.put_stop = (result.call_credit + result.put_credit) + _trail_put_buf
-                        else:  # put_only
-                            result.put_stop = result.put_credit + getattr(cfg, "upday_theoretical_call_credit", 0.0) + _trail_put_buf
-                        result.put_stop = max(result.put_stop, cfg.min_stop_level)
-                # ── Stop check (may use tightened level)
-                if pv_check > 0 and pv_check >= result.put_stop:
-                    put_stopped = True
-                    result.put_outcome = "stopped"
-                    result.put_exit_ms = monitor_ms
-                    result.put_close_cost = min(pv + slip, put_cap)
-
-        # ── Cushion recovery exit: close side that nearly stopped then recovered
-        if _cush_near is not None and _cush_recv is not None:
-            # Call side
-            if call_active and not call_stopped and result.call_stop > 0:
-                _cv_cush = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
-                if _cv_cush > 0:
-                    _call_ratio = _cv_cush / result.call_stop
-                    if _call_ratio >= _cush_near:
-                        _call_hit_danger = True
-                    if _call_hit_danger and _call_ratio <= _cush_recv:
-                        call_stopped = True
-                        result.call_outcome = "early_exit"
-                        result.call_exit_ms = monitor_ms
-                        result.call_close_cost = _cv_cush + slip
-            # Put side
-            if put_active and not put_stopped and result.put_stop > 0:
-                _pv_cush = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
-                if _pv_cush > 0:
-                    _put_ratio = _pv_cush / result.put_stop
-                    if _put_ratio >= _cush_near:
-                        _put_hit_danger = True
-                    if _put_hit_danger and _put_ratio <= _cush_recv:
-                        put_stopped = True
-                        result.put_outcome = "early_exit"
-                        result.put_exit_ms = monitor_ms
-                        result.put_close_cost = _pv_cush + slip
+def _set_stop_levels(result: EntryResult, cfg: BacktestConfig):
+    """Credit-based stop level per active side (before any buffer decay)."""
+    if result.entry_type == "full_ic":
+        total_credit = result.call_credit + result.put_credit
+        result.call_stop = max(total_credit + cfg.call_stop_buffer, cfg.min_stop_level)
+        result.put_stop = max(total_credit + cfg.put_stop_buffer, cfg.min_stop_level)
+    elif result.entry_type == "call_only":
+        # For call-only stop: call_credit + theoretical_put + buffer
+        call_stop = result.call_credit + cfg.downday_theoretical_put_credit + cfg.call_stop_buffer
+        result.call_stop = max(call_stop, cfg.min_stop_level)
+    elif result.entry_type == "put_only":
+        # For put-only stop: put_credit + theoretical_call + buffer (mirrors call-only formula)
+        put_stop = result.put_credit + getattr(cfg, "upday_theoretical_call_credit", 0.0) + cfg.put_stop_buffer
+        result.put_stop = max(put_stop, cfg.min_stop_level)
 
-        # ── Per-entry time-scaled exit: close this entry's sides if captured
-        #    enough credit relative to time remaining (or time open) ──────
-        if (_etc_base is not None or _eso_base is not None):
-            _mkt_close_ms = 16 * 3600 * 1000
-            for _side, _credit, _stopped, _cv_func, _strike_s, _strike_l, _right in [
-                ("call", result.call_credit, call_stopped,
-                 lambda ms: _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", ms, cfg.broker_spread_markup),
-                 result.short_call, result.long_call, "C"),
-                ("put", result.put_credit, put_stopped,
-                 lambda ms: _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", ms, cfg.broker_spread_markup),
-                 result.short_put, result.long_put, "P"),
-            ]:
-                _side_active = (_side == "call" and call_active) or (_side == "put" and put_active)
-                if not _side_active or _stopped or _credit <= 0:
-                    continue
-                _sv = _cv_func(monitor_ms)
-                if _sv <= 0:
-                    continue
-                _captured = (_credit - _sv) / _credit
-                _should_exit = False
-                if _etc_base is not None:
-                    _hrs_left = max(0.25, (_mkt_close_ms - monitor_ms) / 3600000)
-                    _thresh = _etc_base / math.sqrt(_hrs_left / 6.5)
-                    if _captured >= _thresh:
-                        _should_exit = True
-                if not _should_exit and _eso_base is not None:
-                    _hrs_open = max(0.0167, (monitor_ms - entry_ms) / 3600000)  # min 1 min
-                    _thresh = _eso_base * math.sqrt(_hrs_open / 6.5)
-                    if _captured >= _thresh:
-                        _should_exit = True
-                if _should_exit:
-                    if _side == "call":
-                        call_stopped = True
-                        result.call_outcome = "early_exit"
-                        result.call_exit_ms = monitor_ms
-                        result.call_close_cost = _sv + slip
-                    else:
-                        put_stopped = True
-                        result.put_outcome = "early_exit"
-                        result.put_exit_ms = monitor_ms
-                        result.put_close_cost = _sv + slip
 
-        # Early exit: close any remaining open sides at this bar
-        if early_ms and monitor_ms >= early_ms:
-            if call_active and not call_stopped:
-                cv = _get_spread_close_cost(lookup, result.short_call, result.long_call, "C", monitor_ms, cfg.broker_spread_markup)
-                result.call_outcome = "early_exit"
-                result.call_exit_ms = monitor_ms
-                result.call_close_cost = cv  # 0.0 if quote missing (treated as worthless)
-                call_stopped = True
-            if put_active and not put_stopped:
-                pv = _get_spread_close_cost(lookup, result.short_put, result.long_put, "P", monitor_ms, cfg.broker_spread_markup)
-                result.put_outcome = "early_exit"
-                result.put_exit_ms = monitor_ms
-                result.put_close_cost = pv
-                put_stopped = True
-            break  # don't monitor past early exit time
+def _finish_entry(
+    result: EntryResult,
+    entry_ms: int,
+    early_ms: Optional[int],
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    cfg: BacktestConfig,
+    monitor_times: List[int],
+) -> EntryResult:
+    """Monitor, settle and price a selected (non-skipped) entry in place."""
+    call_stopped, put_stopped = _monitor_stops(
+        result, entry_ms, early_ms, lookup, spx_series, cfg, monitor_times)
+    spx_settle = spx_series.at(monitor_times[-1]) if monitor_times else 0.0
+    _settle_entry(result, cfg, spx_settle, call_stopped, put_stopped)
+    return result
 
-        if (not call_active or call_stopped) and (not put_active or put_stopped):
-            break  # both sides resolved
+
+def _finish_entry_variants(
+    selected: EntryResult,
+    entry_ms: int,
+    early_ms: Optional[int],
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    cfgs: List[BacktestConfig],
+    monitor_times: List[int],
+) -> List[EntryResult]:
+    """
+    _finish_entry for several configs sharing one selection.
+
+    Each variant gets its own copy with its own stop levels.  Variants the
+    array kernel can handle are monitored together as a (variant × bar)
+    matrix; the rest take the per-variant path.
+    """
+    results = []
+    for c in cfgs:
+        r = copy(selected)
+        _set_stop_levels(r, c)
+        results.append(r)
+
+    stopped: List[Optional[Tuple[bool, bool]]] = [None] * len(cfgs)
+    vec = [i for i, c in enumerate(cfgs) if _stop_kernel_eligible(c)]
+    if vec:
+        flags = _monitor_stops_vectorized(
+            [results[i] for i in vec], [cfgs[i] for i in vec],
+            entry_ms, early_ms, lookup, spx_series, monitor_times)
+        for i, f in zip(vec, flags):
+            stopped[i] = f
+    for i, c in enumerate(cfgs):
+        if stopped[i] is None:
+            stopped[i] = _monitor_stops(results[i], entry_ms, early_ms, lookup, spx_series, c, monitor_times)
+
+    spx_settle = spx_series.at(monitor_times[-1]) if monitor_times else 0.0
+    for r, c, (call_stopped, put_stopped) in zip(results, cfgs, stopped):
+        _settle_entry(r, c, spx_settle, call_stopped, put_stopped)
+    return results
+
+
+def _settle_entry(result: EntryResult, cfg: BacktestConfig, spx_settle: float,
+                  call_stopped: bool, put_stopped: bool):
+    """Expire still-open sides at 4 PM and compute the entry's P&L."""
+    call_active = result.entry_type in ("full_ic", "call_only")
+    put_active = result.entry_type in ("full_ic", "put_only")
+    price_stop_pts = getattr(cfg, "price_based_stop_points", None)
 
     # ── Settlement (4 PM) ─────────────────────────────────────────────────
     # Get SPX settlement price from last available bar (represents 4 PM close).
     # SPX options (0DTE) settle to the closing price of the index.
     # If spread expires ITM, the intrinsic value is the settlement cost.
     # No commission at expiry — cash settlement is automatic, no transaction.
-    spx_settle = _get_index_price(spx_df, monitor_times[-1]) if monitor_times else 0.0
-
     if call_active and not call_stopped:
         result.call_outcome = "expired"
         if spx_settle > 0 and result.short_call > 0 and spx_settle > result.short_call:
@@ -1032,16 +1467,15 @@ def _simulate_entry(
     result.commission = commission
     result.net_pnl = result.gross_pnl - commission
 
-    return result
-
 
 # ── Net-return threshold exit ───────────────────────────────────────────────
 
 def _apply_return_threshold(
     entries: List[EntryResult],
-    lookup: Dict,
+    lookup: ChainLookup,
     monitor_times: List[int],
     cfg: BacktestConfig,
+    curve: Optional[PnLCurve] = None,
 ) -> List[EntryResult]:
     """
     Post-process entries to apply net-return-threshold early exit.
@@ -1063,6 +1497,8 @@ def _apply_return_threshold(
     Commission rules (unchanged):
       - Opening legs: always charged
       - Closing legs: charged for "stopped" and "early_exit", not for expiry
+
+    The per-bar marks come from `curve` (built here if not given).
     """
     threshold = getattr(cfg, "net_return_exit_pct", None)
     dollar_target = getattr(cfg, "net_pnl_exit_dollars", None)
@@ -1072,187 +1508,61 @@ def _apply_return_threshold(
             and time_scaled_base is None):
         return entries
 
-    placed = [e for e in entries if e.entry_type != "skipped"]
-    if not placed:
+    if not any(e.entry_type != "skipped" for e in entries):
         return entries
-
-    exit_ms: Optional[int] = None
+    if curve is None:
+        curve = PnLCurve.build(entries, lookup, monitor_times, cfg)
 
     # ── Phase 1: find the first bar where the return threshold is crossed ──
-    for bar_ms in monitor_times:
-        # Only entries already placed before this bar
-        active = [e for e in placed if e.entry_time_ms < bar_ms]
-        if not active:
-            continue
-
-        total_credit = 0.0
-        total_net_pnl = 0.0
-
-        for e in active:
-            call_active = e.entry_type in ("full_ic", "call_only")
-            put_active  = e.entry_type in ("full_ic", "put_only")
-
-            legs_placed = (2 if call_active else 0) + (2 if put_active else 0)
-            entry_credit = (
-                (e.call_credit if call_active else 0.0) +
-                (e.put_credit  if put_active  else 0.0)
-            ) * cfg.contracts
-            total_credit += entry_credit
-
-            gross = 0.0
-            hyp_close_legs = 0
-
-            if call_active:
-                already_closed = (
-                    e.call_outcome in ("stopped", "early_exit")
-                    and e.call_exit_ms > 0
-                    and e.call_exit_ms <= bar_ms
-                )
-                if already_closed:
-                    gross += e.call_credit - e.call_close_cost
-                    hyp_close_legs += 2
-                else:
-                    # Still open (outcome may be "expired" — that's at 4 PM, not yet)
-                    cv = _get_spread_close_cost(
-                        lookup, e.short_call, e.long_call, "C", bar_ms, cfg.broker_spread_markup
-                    )
-                    gross += e.call_credit - cv
-                    hyp_close_legs += 2
-
-            if put_active:
-                already_closed = (
-                    e.put_outcome in ("stopped", "early_exit")
-                    and e.put_exit_ms > 0
-                    and e.put_exit_ms <= bar_ms
-                )
-                if already_closed:
-                    gross += e.put_credit - e.put_close_cost
-                    hyp_close_legs += 2
-                else:
-                    pv = _get_spread_close_cost(
-                        lookup, e.short_put, e.long_put, "P", bar_ms, cfg.broker_spread_markup
-                    )
-                    gross += e.put_credit - pv
-                    hyp_close_legs += 2
-
-            commission = (
-                cfg.commission_per_leg * (legs_placed + hyp_close_legs) * cfg.contracts
-            )
-            total_net_pnl += gross * cfg.contracts - commission
-
-        # Check percentage threshold
-        pct_hit = (threshold is not None and threshold > 0
-                   and total_credit > 0
-                   and total_net_pnl / total_credit >= threshold)
-        # Check fixed-dollar threshold
-        dollar_hit = (dollar_target is not None
-                      and total_net_pnl >= dollar_target)
-        # Check time-scaled return threshold (uses time_scaled_base from outer scope)
-        time_scaled_hit = False
-        if (time_scaled_base is not None and total_credit > 0):
-            market_close_ms = 16 * 3600 * 1000  # 4:00 PM
-            hours_left = max(0.25, (market_close_ms - bar_ms) / 3600000)
-            # base / sqrt(hours_left / 6.5) → lower early, higher late
-            dynamic_threshold = time_scaled_base / math.sqrt(hours_left / 6.5)
-            captured_pct = total_net_pnl / total_credit
-            if captured_pct >= dynamic_threshold:
-                time_scaled_hit = True
-        if pct_hit or dollar_hit or time_scaled_hit:
-            # Track which condition triggered for skip_reason
-            if pct_hit:
-                _exit_reason = f"net_return_threshold_{threshold:.0%}"
-            elif dollar_hit:
-                _exit_reason = f"net_pnl_target_${dollar_target:.0f}"
-            else:
-                _exit_reason = "time_scaled_exit"
-            exit_ms = bar_ms
-            break
-
-    if exit_ms is None:
+    # Only bars with at least one entry placed before them count
+    total_net_pnl, total_credit, any_active = curve.portfolio()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        captured_pct = np.where(total_credit > 0, total_net_pnl / total_credit, -np.inf)
+
+    # Percentage threshold
+    pct_hit = np.zeros(len(curve.times), dtype=bool)
+    if threshold is not None and threshold > 0:
+        pct_hit = captured_pct >= threshold
+    # Fixed-dollar threshold
+    dollar_hit = np.zeros(len(curve.times), dtype=bool)
+    if dollar_target is not None:
+        dollar_hit = total_net_pnl >= dollar_target
+    # Time-scaled return threshold: base / sqrt(hours_left / 6.5) → lower early, higher late
+    time_scaled_hit = np.zeros(len(curve.times), dtype=bool)
+    if time_scaled_base is not None:
+        market_close_ms = 16 * 3600 * 1000  # 4:00 PM
+        hours_left = np.maximum(0.25, (market_close_ms - curve.times) / 3600000)
+        dynamic_threshold = time_scaled_base / np.sqrt(hours_left / 6.5)
+        time_scaled_hit = captured_pct >= dynamic_threshold
+
+    hits = np.flatnonzero(any_active & (pct_hit | dollar_hit | time_scaled_hit))
+    if len(hits) == 0:
         return entries  # threshold never reached; hold everything to expiry/stop
+    bar = int(hits[0])
 
-    # ── Phase 2: post-process — apply the exit at exit_ms ─────────────────
-    for e in entries:
-        if e.entry_type == "skipped":
-            continue
-
-        call_active = e.entry_type in ("full_ic", "call_only")
-        put_active  = e.entry_type in ("full_ic", "put_only")
-
-        # Entries that would have been placed at or after exit_ms: skip them
-        if e.entry_time_ms >= exit_ms:
-            e.entry_type      = "skipped"
-            e.skip_reason     = _exit_reason
-            e.short_call      = e.long_call = e.short_put = e.long_put = 0.0
-            e.call_credit     = e.put_credit  = 0.0
-            e.call_stop       = e.put_stop    = 0.0
-            e.call_outcome    = e.put_outcome = ""
-            e.call_close_cost = e.put_close_cost = 0.0
-            e.gross_pnl = e.commission = e.net_pnl = 0.0
-            continue
-
-        # Entries placed before exit_ms: fix outcomes for sides still open
-        legs_placed = (2 if call_active else 0) + (2 if put_active else 0)
-        gross       = 0.0
-        legs_closed = 0
-
-        if call_active:
-            resolved_before = (
-                e.call_outcome in ("stopped", "early_exit")
-                and e.call_exit_ms > 0
-                and e.call_exit_ms <= exit_ms
-            )
-            if resolved_before:
-                gross += e.call_credit - e.call_close_cost
-                legs_closed += 2
-            else:
-                cv = _get_spread_close_cost(
-                    lookup, e.short_call, e.long_call, "C", exit_ms, cfg.broker_spread_markup
-                )
-                e.call_outcome    = "early_exit"
-                e.call_exit_ms    = exit_ms
-                e.call_close_cost = cv
-                gross += e.call_credit - cv
-                legs_closed += 2
-
-        if put_active:
-            resolved_before = (
-                e.put_outcome in ("stopped", "early_exit")
-                and e.put_exit_ms > 0
-                and e.put_exit_ms <= exit_ms
-            )
-            if resolved_before:
-                gross += e.put_credit - e.put_close_cost
-                legs_closed += 2
-            else:
-                pv = _get_spread_close_cost(
-                    lookup, e.short_put, e.long_put, "P", exit_ms, cfg.broker_spread_markup
-                )
-                e.put_outcome    = "early_exit"
-                e.put_exit_ms    = exit_ms
-                e.put_close_cost = pv
-                gross += e.put_credit - pv
-                legs_closed += 2
-
-        commission  = (
-            cfg.commission_per_leg * (legs_placed + legs_closed) * cfg.contracts
-        )
-        e.gross_pnl = gross * cfg.contracts
-        e.commission = commission
-        e.net_pnl   = e.gross_pnl - commission
+    # Track which condition triggered for skip_reason
+    if pct_hit[bar]:
+        exit_reason = f"net_return_threshold_{threshold:.0%}"
+    elif dollar_hit[bar]:
+        exit_reason = f"net_pnl_target_${dollar_target:.0f}"
+    else:
+        exit_reason = "time_scaled_exit"
 
+    # ── Phase 2: post-process — apply the exit at the exit bar ────────────
+    curve.exit_at(bar, exit_reason)
     return entries
 
 
-# ── Range-consumption exit (post-processing) ─��────────────────────────────
+# ── Range-consumption exit (post-processing) ──────────────────────────────
 
 def _apply_range_exit(
     entries: List[EntryResult],
-    lookup: Dict,
+    lookup: ChainLookup,
     monitor_times: List[int],
     cfg: "BacktestConfig",
-    spx_df: pd.DataFrame,
+    spx_series: IndexSeries,
     expected_move: float,
+    curve: Optional[PnLCurve] = None,
 ) -> List[EntryResult]:
     """Close all surviving positions when SPX intraday range exceeds a
     fraction of the daily expected move.
@@ -1264,9 +1574,10 @@ def _apply_range_exit(
     if range_pct is None or range_pct <= 0 or expected_move <= 0:
         return entries
 
-    placed = [e for e in entries if e.entry_type != "skipped"]
-    if not placed:
+    if not any(e.entry_type != "skipped" for e in entries):
         return entries
+    if curve is None:
+        curve = PnLCurve.build(entries, lookup, monitor_times, cfg)
 
     market_open_ms = 9 * 3600000 + 30 * 60000  # 9:30 AM
 
@@ -1277,106 +1588,32 @@ def _apply_range_exit(
         h, m = map(int, range_after_str.split(":"))
         range_after_ms = (h * 3600 + m * 60) * 1000
 
-    exit_ms: Optional[int] = None
+    exit_bar: Optional[int] = None
 
     # Phase 1: find first bar where range exceeds threshold
-    for bar_ms in monitor_times:
+    # (must have at least one entry placed before the bar)
+    any_active = curve.active().any(axis=0)
+    for bar in np.flatnonzero(any_active).tolist():
+        bar_ms = int(curve.times[bar])
         if range_after_ms is not None and bar_ms < range_after_ms:
             continue
-        # Must have at least one entry placed before this bar
-        active = [e for e in placed if e.entry_time_ms < bar_ms]
-        if not active:
-            continue
 
         # Compute intraday range up to this bar
-        mask = (
-            (spx_df["ms_of_day"] >= market_open_ms) &
-            (spx_df["ms_of_day"] <= bar_ms) &
-            (spx_df["price"] > 0)
-        )
-        if not mask.any():
+        low_high = spx_series.range(market_open_ms, bar_ms)
+        if low_high is None:
             continue
-        prices = spx_df.loc[mask, "price"]
-        intraday_range = float(prices.max()) - float(prices.min())
+        intraday_range = low_high[1] - low_high[0]
         range_ratio = intraday_range / expected_move
 
         if range_ratio >= range_pct:
-            exit_ms = bar_ms
+            exit_bar = bar
             break
 
-    if exit_ms is None:
+    if exit_bar is None:
         return entries  # threshold never reached
 
     # Phase 2: post-process — close surviving sides, skip future entries
-    for e in entries:
-        if e.entry_type == "skipped":
-            continue
-
-        call_active = e.entry_type in ("full_ic", "call_only")
-        put_active  = e.entry_type in ("full_ic", "put_only")
-
-        # Entries placed at or after exit_ms: skip
-        if e.entry_time_ms >= exit_ms:
-            e.entry_type      = "skipped"
-            e.skip_reason     = f"range_exit_{range_pct:.0%}"
-            e.short_call = e.long_call = e.short_put = e.long_put = 0.0
-            e.call_credit = e.put_credit = 0.0
-            e.call_stop = e.put_stop = 0.0
-            e.call_outcome = e.put_outcome = ""
-            e.call_close_cost = e.put_close_cost = 0.0
-            e.gross_pnl = e.commission = e.net_pnl = 0.0
-            continue
-
-        # Entries placed before exit_ms: close surviving sides
-        legs_placed = (2 if call_active else 0) + (2 if put_active else 0)
-        gross       = 0.0
-        legs_closed = 0
-
-        if call_active:
-            resolved_before = (
-                e.call_outcome in ("stopped", "early_exit")
-                and e.call_exit_ms > 0
-                and e.call_exit_ms <= exit_ms
-            )
-            if resolved_before:
-                gross += e.call_credit - e.call_close_cost
-                legs_closed += 2
-            else:
-                cv = _get_spread_close_cost(
-                    lookup, e.short_call, e.long_call, "C", exit_ms, cfg.broker_spread_markup
-                )
-                e.call_outcome    = "early_exit"
-                e.call_exit_ms    = exit_ms
-                e.call_close_cost = cv
-                gross += e.call_credit - cv
-                legs_closed += 2
-
-        if put_active:
-            resolved_before = (
-                e.put_outcome in ("stopped", "early_exit")
-                and e.put_exit_ms > 0
-                and e.put_exit_ms <= exit_ms
-            )
-            if resolved_before:
-                gross += e.put_credit - e.put_close_cost
-                legs_closed += 2
-            else:
-                pv = _get_spread_close_cost(
-                    lookup, e.short_put, e.long_put, "P", exit_ms, cfg.broker_spread_markup
-                )
-                e.put_outcome    = "early_exit"
-                e.put_exit_ms    = exit_ms
-                e.put_close_cost = pv
-                gross += e.put_credit - pv
-                legs_closed += 2
-
-        commission = (
-            cfg.commission_per_leg * (legs_placed + legs_closed) * cfg.contracts
-        )
-        e.gross_pnl  = gross * cfg.contracts
-        e.commission  = commission
-        e.net_pnl     = e.gross_pnl - commission
-
+    curve.exit_at(exit_bar, f"range_exit_{range_pct:.0%}")
     return entries
 
 
@@ -1418,14 +1655,14 @@ def _generate_replacements(
     entries: List[EntryResult],
     cfg: BacktestConfig,
     chain_df: pd.DataFrame,
-    lookup: Dict,
-    spx_df: pd.DataFrame,
-    vix_df: pd.DataFrame,
+    lookup: ChainLookup,
+    spx_series: IndexSeries,
+    vix_series: IndexSeries,
     monitor_times: List[int],
     spx_open: float,
     is_fomc_t1: bool,
     day_early_exit_ms,
-    greeks_df: Optional[pd.DataFrame],
+    deltas: Optional[DeltaIndex],
 ) -> List[EntryResult]:
     """Generate replacement entries for sides that were stopped before the cutoff."""
     max_repl = cfg.replacement_entry_max_per_day
@@ -1463,12 +1700,12 @@ def _generate_replacements(
             spx_open=spx_open,
             chain_df=chain_df,
             lookup=lookup,
-            spx_df=spx_df,
-            vix_df=vix_df,
+            spx_series=spx_series,
+            vix_series=vix_series,
             cfg=cfg,
             monitor_times=monitor_times,
             day_early_exit_ms=day_early_exit_ms,
-            greeks_df=greeks_df,
+            deltas=deltas,
             force_entry_type=force_type,
             extra_min_otm=extra_otm,
         )
@@ -1478,49 +1715,268 @@ def _generate_replacements(
     return replacements
 
 
-# ── Per-day simulation ─────────────────────────────────────────────────────
+# ── Per-day data loading (cached) ─────────────────────────────────────────
 
-def simulate_day(
-    trading_date: date,
-    cfg: BacktestConfig,
-    cache_dir: Path,
-    fomc_t1_dates: set,
-) -> Optional[DayResult]:
+def _day_dirs(cache_dir: Path, resolution: str) -> Tuple[Path, Path]:
+    """Options + Greeks folders for a data resolution (5sec / 1min / 5min)."""
+    if resolution == "5sec":
+        return cache_dir / "options_5sec", cache_dir / "greeks_1min"  # Greeks at 1-min is sufficient
+    if resolution == "1min":
+        return cache_dir / "options_1min", cache_dir / "greeks_1min"
+    return cache_dir / "options", cache_dir / "greeks"
 
-    # ── Day-of-week filter (skip before loading any data) ─────────────
-    if trading_date.weekday() in getattr(cfg, "skip_weekdays", []):
+
+def _strike_reach(cfg: BacktestConfig) -> Optional[int]:
+    """Points beyond the day's SPX range that strike selection can reach.
+
+    _select_entry caps the starting OTM distance at _MAX_STARTING_OTM and
+    _calc_spread_width caps the wing at max_spread_width, so no short or long
+    strike is ever further from spot than their sum (+5 for spot rounding).
+    Rounded up to 50 pts so combos with nearby spread caps share one cached
+    day.  None = strike_band_pruning off, load every strike.
+    """
+    if not getattr(cfg, "strike_band_pruning", True):
         return None
+    reach = _MAX_STARTING_OTM + int(cfg.max_spread_width) + 5
+    return -(-reach // 50) * 50
 
-    # Load data — use 5-sec, 1-min, or 5-min subfolder based on config
-    resolution = getattr(cfg, "data_resolution", "5min")
-    if resolution == "5sec":
-        opts_dir = cache_dir / "options_5sec"
-        grk_dir = cache_dir / "greeks_1min"  # Greeks at 1-min is sufficient
-    elif resolution == "1min":
-        opts_dir = cache_dir / "options_1min"
-        grk_dir = cache_dir / "greeks_1min"
-    else:
-        opts_dir = cache_dir / "options"
-        grk_dir = cache_dir / "greeks"
 
-    chain_df = _load_chain(trading_date, opts_dir)
+def _strike_band(spx_series: IndexSeries, strike_reach: int) -> Optional[Tuple[float, float]]:
+    """(lo, hi) strikes within strike_reach of the day's SPX range."""
+    prices = spx_series.valid_prices
+    if len(prices) == 0:
+        return None
+    return (math.floor(prices.min()) - strike_reach, math.ceil(prices.max()) + strike_reach)
+
+
+def _load_day_data(trading_date: date, cache_dir: Path, resolution: str,
+                   use_real_greeks: bool, strike_reach: Optional[int] = None) -> Optional[DayData]:
+    """Read one day's chain/Greeks/index data from disk and build the lookup.
+
+    With strike_reach set, only strikes within that many points of the
+    day's SPX range are loaded (see _strike_reach) — the rest are never
+    quoted by the simulation.  Greeks are always loaded in full: the
+    target-delta search scans every OTM strike.
+    """
+    opts_dir, grk_dir = _day_dirs(cache_dir, resolution)
+
+    with PROFILER.phase("load_index"):
+        spx_series = load_index_series("SPX", trading_date, cache_dir)
+        vix_series = load_index_series("VIX", trading_date, cache_dir)
+    if spx_series.empty or vix_series.empty:
+        return None
+
+    band = _strike_band(spx_series, strike_reach) if strike_reach is not None else None
+    with PROFILER.phase("load_parquet"):
+        chain_df = _load_chain(trading_date, opts_dir, band)
+        if chain_df.empty and band is not None:
+            chain_df = _load_chain(trading_date, opts_dir)  # nothing near spot: keep unpruned behaviour
     if chain_df.empty:
         return None
 
     # Real Greeks mode (strict): skip day entirely if no Greeks file cached
     greeks_df: Optional[pd.DataFrame] = None
-    if getattr(cfg, "use_real_greeks", False):
-        greeks_df = _load_greeks(trading_date, grk_dir)
+    if use_real_greeks:
+        with PROFILER.phase("load_parquet"):
+            greeks_df = _load_greeks(trading_date, grk_dir)
         if greeks_df.empty:
             return None  # strict mode — no approximation fallback
 
-    spx_df = load_index_day("SPX", trading_date, cache_dir)
-    vix_df = load_index_day("VIX", trading_date, cache_dir)
-    if spx_df.empty or vix_df.empty:
-        return None
+    with PROFILER.phase("build_lookup"):
+        lookup = _build_chain_lookup(chain_df)
+        all_times = sorted(chain_df["ms_of_day"].unique().tolist())
+    deltas = None
+    if greeks_df is not None:
+        with PROFILER.phase("delta_index"):
+            deltas = DeltaIndex.from_frame(greeks_df)
+
+    return DayData(
+        chain_df=chain_df,
+        lookup=lookup,
+        all_times=all_times,
+        spx=spx_series,
+        vix=vix_series,
+        greeks_df=greeks_df,
+        deltas=deltas,
+    )
+
+
+def _day_cache_key(trading_date: date, cache_dir: Path, resolution: str,
+                   use_real_greeks: bool, strike_reach: Optional[int] = None) -> tuple:
+    return (str(Path(cache_dir).resolve()), resolution, bool(use_real_greeks), strike_reach,
+            trading_date)
+
+
+def _day_data_files(trading_date: date, cfg: BacktestConfig, cache_dir: Path) -> List[Path]:
+    """Every file simulate_day reads for this day (for result-cache fingerprints)."""
+    from .downloader import _date_str
+    cache_dir = Path(cache_dir)
+    opts_dir, grk_dir = _day_dirs(cache_dir, getattr(cfg, "data_resolution", "5min"))
+    files = [opts_dir / f"SPXW_{_date_str(trading_date)}.parquet"]
+    if getattr(cfg, "use_real_greeks", False):
+        files.append(grk_dir / f"SPXW_{_date_str(trading_date)}_greeks.parquet")
+    # Parquet deleted after conversion: the day now comes from the chain store
+    files = [f if f.exists() else store_path(cache_dir, f.parent.name) / MANIFEST for f in files]
+    month = f"{trading_date.year}{trading_date.month:02d}"
+    files += [cache_dir / "index" / f"{sym}_{month}.parquet" for sym in ("SPX", "VIX")]
+    return files
+
+
+def get_day_data(trading_date: date, cfg: BacktestConfig, cache_dir: Path) -> Optional[DayData]:
+    """Day data for cfg's resolution/Greeks mode, loaded once per process."""
+    resolution = getattr(cfg, "data_resolution", "5min")
+    use_greeks = getattr(cfg, "use_real_greeks", False)
+    reach = _strike_reach(cfg)
+    key = _day_cache_key(trading_date, cache_dir, resolution, use_greeks, reach)
+    return DAY_CACHE.get(
+        key,
+        lambda: _load_day_data(trading_date, Path(cache_dir), resolution, use_greeks, reach),
+        sizer=DayData.approx_bytes,
+    )
+
+
+def prewarm_day_cache(cfg: BacktestConfig, days: Optional[List[date]] = None) -> int:
+    """Load every day of cfg's date range into the shared (never-evicted) tier.
+
+    Call in the sweep's parent process before creating a fork-based
+    multiprocessing pool: workers inherit the loaded days copy-on-write and
+    never touch parquet.  Returns the number of days loaded.
+    """
+    cache_dir = Path(cfg.cache_dir)
+    resolution = getattr(cfg, "data_resolution", "5min")
+    use_greeks = getattr(cfg, "use_real_greeks", False)
+    reach = _strike_reach(cfg)
+    if days is None:
+        days = get_spxw_trading_days(cfg.start_date, cfg.end_date, cache_dir, resolution)
+    return DAY_CACHE.prewarm(
+        (_day_cache_key(d, cache_dir, resolution, use_greeks, reach),
+         (lambda d=d: _load_day_data(d, cache_dir, resolution, use_greeks, reach)))
+        for d in days
+    )
+
+
+# ── Per-day simulation ─────────────────────────────────────────────────────
+
+# Config fields that never influence entry gating or strike selection — only
+# stop levels, exit rules, per-variant post-processing and P&L.  Configs that
+# differ ONLY in these share one selection pass in simulate_day_batch.
+# Anything not listed here (including attributes added ad hoc by sweep
+# scripts) is treated as selection-relevant, which is always safe.
+_EXIT_ONLY_FIELDS = frozenset({
+    "start_date", "end_date", "fomc_t1_dates", "theta_host",
+    "call_stop_buffer", "put_stop_buffer", "min_stop_level",
+    "downday_theoretical_put_credit", "upday_theoretical_call_credit",
+    "vix_regime_call_stop_buffer", "vix_regime_put_stop_buffer",
+    "buffer_decay_start_mult", "buffer_decay_hours",
+    "buffer_decay_call_mult", "buffer_decay_call_hours",
+    "buffer_decay_put_mult", "buffer_decay_put_hours",
+    "stop_slippage_per_leg", "stop_spread_markup_pct", "broker_spread_markup",
+    "spread_value_cap_at_stop", "price_based_stop_points", "price_stop_inward",
+    "trailing_stop_enabled", "trailing_stop_trigger_decay",
+    "trailing_stop_call_buffer", "trailing_stop_put_buffer",
+    "cushion_nearstop_pct", "cushion_recovery_pct",
+    "entry_exit_time_to_close_base", "entry_exit_time_since_open_base",
+    "net_return_exit_pct", "net_pnl_exit_dollars", "time_scaled_return_base",
+    "range_exit_pct", "range_exit_after",
+    "replacement_entry_enabled", "replacement_entry_max_per_day",
+    "replacement_entry_delay_minutes", "replacement_entry_extra_otm",
+    "replacement_entry_cutoff",
+    "commission_per_leg", "contracts", "vectorized_stop_monitoring",
+    "result_cache_dir",
+})
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    return value
+
+
+def _selection_key(cfg: BacktestConfig) -> tuple:
+    """Hashable key of every field that can change entry selection."""
+    return tuple(sorted((k, _freeze(v)) for k, v in vars(cfg).items()
+                        if k not in _EXIT_ONLY_FIELDS))
+
+
+def _group_by_selection(cfgs: List[BacktestConfig]) -> List[List[int]]:
+    """Indices of cfgs grouped by _selection_key (first-seen order)."""
+    groups: Dict[tuple, List[int]] = {}
+    singles: List[List[int]] = []
+    for i, c in enumerate(cfgs):
+        # Movement-triggered slots re-anchor on the last PLACED entry, so a
+        # per-variant loss-limit skip would fork the schedule — run alone.
+        if (getattr(c, "movement_entry_pct", None) is not None
+                and getattr(c, "daily_loss_limit", None) is not None):
+            singles.append([i])
+            continue
+        groups.setdefault(_selection_key(c), []).append(i)
+    return list(groups.values()) + singles
+
+
+def simulate_day(
+    trading_date: date,
+    cfg: BacktestConfig,
+    cache_dir: Path,
+    fomc_t1_dates: set,
+) -> Optional[DayResult]:
+    with PROFILER.day(trading_date):
+        return _simulate_day_group(trading_date, [cfg], cache_dir, fomc_t1_dates)[0]
+
+
+def simulate_day_batch(
+    trading_date: date,
+    cfgs: List[BacktestConfig],
+    cache_dir: Path,
+    fomc_t1_dates: set,
+) -> List[Optional[DayResult]]:
+    """
+    simulate_day for many config variants at once (results in cfgs order).
+
+    Variants that differ only in stop / exit parameters (_EXIT_ONLY_FIELDS:
+    stop buffers, buffer decay, slippage, commissions, post-processing exits…)
+    share entry gating and strike selection, and their stops are evaluated as
+    one (variant × bar) matrix per entry.  A 36-value call_stop_buffer sweep
+    costs about one simulate_day.  Results are identical to calling
+    simulate_day per config.
+    """
+    results: List[Optional[DayResult]] = [None] * len(cfgs)
+    with PROFILER.day(trading_date):
+        for idxs in _group_by_selection(cfgs):
+            days = _simulate_day_group(trading_date, [cfgs[i] for i in idxs], cache_dir,
+                                       fomc_t1_dates)
+            for i, day in zip(idxs, days):
+                results[i] = day
+    return results
+
+
+def _simulate_day_group(
+    trading_date: date,
+    cfgs: List[BacktestConfig],
+    cache_dir: Path,
+    fomc_t1_dates: set,
+) -> List[Optional[DayResult]]:
+    """One simulated day per cfg; all cfgs must share one _selection_key."""
+    cfg = cfgs[0]  # selection fields are identical across the group
 
-    lookup = _build_chain_lookup(chain_df)
-    all_times = sorted(chain_df["ms_of_day"].unique().tolist())
+    # ── Day-of-week filter (skip before loading any data) ─────────────
+    if trading_date.weekday() in getattr(cfg, "skip_weekdays", []):
+        return [None] * len(cfgs)
+
+    # Load data (5-sec, 1-min or 5-min folder per config) — cached per process
+    # so every combo a sweep worker runs reuses the same parsed day.
+    data = get_day_data(trading_date, cfg, cache_dir)
+    if data is None:
+        return [None] * len(cfgs)
+    chain_df = data.chain_df
+    deltas = data.deltas
+    spx_series = data.spx
+    vix_series = data.vix
+    lookup = data.lookup
+    all_times = data.all_times
 
     # Thin monitor times to configured interval (default: use all data points).
     # monitor_interval_ms=60000 = 1-min (every point), 120000 = 2-min, 300000 = 5-min.
@@ -1537,12 +1993,11 @@ def simulate_day(
         monitor_times = all_times
 
     # Session open price (first valid 1-min SPX bar at/after 9:30)
-    spx_open_row = spx_df[spx_df["price"] > 0]
-    spx_open = float(spx_open_row.iloc[0]["price"]) if not spx_open_row.empty else 0.0
+    spx_open = spx_series.first_valid()
 
     is_fomc_t1 = trading_date in fomc_t1_dates
 
-    day = DayResult(date=trading_date)
+    days = [DayResult(date=trading_date) for _ in cfgs]
 
     # ── VIX-conditional early exit: decide effective exit time for today ──
     # If vix_early_exit_threshold is set, only apply early_exit_time on days
@@ -1551,11 +2006,10 @@ def simulate_day(
     if vix_threshold is not None:
         # Use VIX at 9:45 AM (first bar after open volatility settles) as day VIX
         open_vix_ms = 9 * 3600000 + 45 * 60000  # 9:45 AM in ms
-        day_vix = _get_index_price(vix_df, open_vix_ms)
+        day_vix = vix_series.at(open_vix_ms)
         if day_vix <= 0:
             # Fallback: first valid VIX bar of the day
-            vix_rows = vix_df[vix_df["price"] > 0]
-            day_vix = float(vix_rows.iloc[0]["price"]) if not vix_rows.empty else 0.0
+            day_vix = vix_series.first_valid()
         day_early_exit_ms = cfg.early_exit_time_ms() if day_vix >= vix_threshold else None
     else:
         day_early_exit_ms = _USE_CFG_EARLY_EXIT  # use cfg as-is (no VIX gate)
@@ -1564,23 +2018,24 @@ def simulate_day(
     market_open_ms = 9 * 3600000 + 30 * 60000  # 9:30 AM
 
     # VIX at open for spike detection
-    vix_at_open = _get_index_price(vix_df, market_open_ms + 15 * 60000)  # 9:45 AM
+    vix_at_open = vix_series.at(market_open_ms + 15 * 60000)  # 9:45 AM
     if vix_at_open <= 0:
-        vix_rows = vix_df[vix_df["price"] > 0]
-        vix_at_open = float(vix_rows.iloc[0]["price"]) if not vix_rows.empty else 0.0
+        vix_at_open = vix_series.first_valid()
 
     # Expected daily move for whipsaw filter
     expected_move = spx_open * (vix_at_open / 100) / (252 ** 0.5) if spx_open > 0 and vix_at_open > 0 else 0
 
     # ── VIX regime: apply per-regime config overrides ─────────────────
-    cfg = _apply_vix_regime(cfg, vix_at_open)
+    day_cfgs = [_apply_vix_regime(c, vix_at_open) for c in cfgs]
+    cfg = day_cfgs[0]
     # Re-read protection params from (possibly overridden) cfg
     daily_loss_limit = getattr(cfg, "daily_loss_limit", None)
     vix_spike_pts = getattr(cfg, "vix_spike_skip_points", None)
     whipsaw_mult = getattr(cfg, "whipsaw_range_skip_mult", None)
+    early_ms = _resolve_early_exit_ms(cfg, day_early_exit_ms)
 
-    def _should_skip_entry(entry_ms: int) -> Optional[str]:
-        """Check protection gates. Returns skip reason or None."""
+    def _loss_limit_reason(entry_ms: int, day: DayResult, cfg: BacktestConfig) -> Optional[str]:
+        """Daily loss gate for one variant (depends on its own stop outcomes)."""
         # Daily loss limit — ONLY count REALIZED losses (entries stopped BEFORE this entry time).
         # Entries still open at entry_ms have unknown outcomes — no lookahead bias.
         if daily_loss_limit is not None:
@@ -1611,28 +2066,64 @@ def simulate_day(
 
             if realized_pnl <= daily_loss_limit:
                 return f"daily_loss_limit (realized {realized_pnl:.0f} <= {daily_loss_limit:.0f})"
+        return None
 
+    def _market_gate_reason(entry_ms: int) -> Optional[str]:
+        """VIX spike / whipsaw gates (same for every variant of the group)."""
         # VIX spike gate
         if vix_spike_pts is not None:
-            vix_now = _get_index_price(vix_df, entry_ms)
+            vix_now = vix_series.at(entry_ms)
             if vix_now > 0 and vix_at_open > 0 and (vix_now - vix_at_open) >= vix_spike_pts:
                 return f"vix_spike ({vix_now:.1f} vs open {vix_at_open:.1f}, +{vix_now-vix_at_open:.1f}pts)"
 
         # Anti-whipsaw filter
         if whipsaw_mult is not None and expected_move > 0:
-            mask = (
-                (spx_df["ms_of_day"] >= market_open_ms) &
-                (spx_df["ms_of_day"] <= entry_ms) &
-                (spx_df["price"] > 0)
-            )
-            if mask.any():
-                prices = spx_df.loc[mask, "price"]
-                intraday_range = float(prices.max()) - float(prices.min())
+            low_high = spx_series.range(market_open_ms, entry_ms)
+            if low_high is not None:
+                intraday_range = low_high[1] - low_high[0]
                 if intraday_range > whipsaw_mult * expected_move:
                     return f"whipsaw (range={intraday_range:.0f} > {whipsaw_mult}×EM={whipsaw_mult*expected_move:.0f})"
 
         return None
 
+    def _place_entry(entry_num: int, entry_ms: int, is_conditional: bool = False,
+                     is_upday_conditional: bool = False) -> bool:
+        """
+        Gate, select and finish one entry slot for every variant.  Selection
+        runs once for the group; stops are evaluated per variant.  Returns
+        False when the protection gates skipped the slot.
+        """
+        placed = []
+        market_reason = _market_gate_reason(entry_ms)
+        for v, (day, day_cfg) in enumerate(zip(days, day_cfgs)):
+            # Loss limit is checked first, as a single config always did
+            skip_reason = _loss_limit_reason(entry_ms, day, day_cfg) or market_reason
+            if skip_reason:
+                day.entries.append(EntryResult(entry_num=entry_num, entry_time_ms=entry_ms,
+                                               entry_type="skipped", skip_reason=skip_reason))
+            else:
+                placed.append(v)
+        if not placed:
+            return False
+        PROFILER.count("entry_slots")
+        with PROFILER.phase("select"):
+            res = _select_entry(
+                entry_num, entry_ms, is_conditional, is_fomc_t1, spx_open, chain_df, lookup,
+                spx_series, vix_series, cfg, early_ms,
+                is_upday_conditional=is_upday_conditional, deltas=deltas,
+            )
+        if res.entry_type == "skipped":
+            finished = [copy(res) for _ in placed]
+        else:
+            PROFILER.count("stop_variants", len(placed))
+            with PROFILER.phase("stops"):
+                finished = _finish_entry_variants(
+                    res, entry_ms, early_ms, lookup, spx_series,
+                    [day_cfgs[v] for v in placed], monitor_times)
+        for v, r in zip(placed, finished):
+            days[v].entries.append(r)
+        return True
+
     # ── Calm entry filter: delay entry if SPX moving too fast ────────────
     _calm_lookback = getattr(cfg, "calm_entry_lookback_min", None)
     _calm_thresh = getattr(cfg, "calm_entry_threshold_pts", None)
@@ -1647,8 +2138,8 @@ def simulate_day(
         for delay_min in range(_calm_max_delay + 1):
             check_ms = scheduled_ms + delay_min * one_min_ms
             past_ms = check_ms - lookback_ms
-            spx_now = _get_index_price(spx_df, check_ms)
-            spx_past = _get_index_price(spx_df, past_ms)
+            spx_now = spx_series.at(check_ms)
+            spx_past = spx_series.at(past_ms)
             if spx_now <= 0 or spx_past <= 0:
                 return check_ms  # no data, enter now
             move = abs(spx_now - spx_past)
@@ -1688,28 +2179,7 @@ def simulate_day(
         for i, entry_ms in enumerate(entry_ms_list, 1):
             # Apply calm entry delay if configured
             actual_entry_ms = _apply_calm_delay(entry_ms)
-            skip_reason = _should_skip_entry(actual_entry_ms)
-            if skip_reason:
-                skip_res = EntryResult(entry_num=i, entry_time_ms=actual_entry_ms,
-                                       entry_type="skipped", skip_reason=skip_reason)
-                day.entries.append(skip_res)
-                continue
-            res = _simulate_entry(
-                entry_num=i,
-                entry_ms=actual_entry_ms,
-                is_conditional=False,
-                is_fomc_t1=is_fomc_t1,
-                spx_open=spx_open,
-                chain_df=chain_df,
-                lookup=lookup,
-                spx_df=spx_df,
-                vix_df=vix_df,
-                cfg=cfg,
-                monitor_times=monitor_times,
-                day_early_exit_ms=day_early_exit_ms,
-                greeks_df=greeks_df,
-            )
-            day.entries.append(res)
+            _place_entry(i, actual_entry_ms)
     else:
         # Movement-triggered entries: each slot fires when SPX moves >= movement_pct
         # from the previous entry's SPX price.  Scheduled time is a hard fallback.
@@ -1720,37 +2190,16 @@ def simulate_day(
             if next_slot >= len(entry_ms_list):
                 break
             scheduled_ms = entry_ms_list[next_slot]
-            bar_spx = _get_index_price(spx_df, bar_ms)
+            bar_spx = spx_series.at(bar_ms)
             if bar_spx <= 0:
                 continue
             move_pct = (abs(bar_spx - last_ref_spx) / last_ref_spx * 100
                         if last_ref_spx > 0 else 0.0)
             if bar_ms >= scheduled_ms or move_pct >= movement_pct:
-                # Check protection gates (daily loss limit, VIX spike, whipsaw)
-                skip_reason = _should_skip_entry(bar_ms)
-                if skip_reason:
-                    skip_res = EntryResult(entry_num=next_slot + 1, entry_time_ms=bar_ms,
-                                           entry_type="skipped", skip_reason=skip_reason)
-                    day.entries.append(skip_res)
-                    next_slot += 1
-                    continue
-                res = _simulate_entry(
-                    entry_num=next_slot + 1,
-                    entry_ms=bar_ms,           # actual trigger time (may be earlier than scheduled)
-                    is_conditional=False,
-                    is_fomc_t1=is_fomc_t1,
-                    spx_open=spx_open,
-                    chain_df=chain_df,
-                    lookup=lookup,
-                    spx_df=spx_df,
-                    vix_df=vix_df,
-                    cfg=cfg,
-                    monitor_times=monitor_times,
-                    day_early_exit_ms=day_early_exit_ms,
-                    greeks_df=greeks_df,
-                )
-                day.entries.append(res)
-                last_ref_spx = bar_spx         # update reference for next slot
+                # Check protection gates (daily loss limit, VIX spike, whipsaw);
+                # bar_ms is the actual trigger time (may be earlier than scheduled)
+                if _place_entry(next_slot + 1, bar_ms):
+                    last_ref_spx = bar_spx     # update reference for next slot
                 next_slot += 1
 
     # ── Conditional entries (E6/E7) ─────────────────────────────────────
@@ -1770,63 +2219,51 @@ def simulate_day(
             continue
         # Apply calm entry delay to conditional entries too
         actual_cond_ms = _apply_calm_delay(cond_ms)
-        skip_reason = _should_skip_entry(actual_cond_ms)
-        if skip_reason:
-            skip_res = EntryResult(entry_num=i, entry_time_ms=actual_cond_ms,
-                                   entry_type="skipped", skip_reason=skip_reason)
-            day.entries.append(skip_res)
-            continue
-        res = _simulate_entry(
-            entry_num=i,
-            entry_ms=actual_cond_ms,
-            is_conditional=down_en,
-            is_upday_conditional=up_en,
-            is_fomc_t1=is_fomc_t1,
-            spx_open=spx_open,
-            chain_df=chain_df,
-            lookup=lookup,
-            spx_df=spx_df,
-            vix_df=vix_df,
-            cfg=cfg,
-            monitor_times=monitor_times,
-            day_early_exit_ms=day_early_exit_ms,
-            greeks_df=greeks_df,
-        )
-        day.entries.append(res)
+        _place_entry(i, actual_cond_ms, is_conditional=down_en, is_upday_conditional=up_en)
+
+    # ── Per-variant passes (depend on each variant's stop outcomes) ──────
+    for day, day_cfg in zip(days, day_cfgs):
+        # ── Replacement entries (re-enter after early stops) ──────────────
+        if getattr(day_cfg, "replacement_entry_enabled", False):
+            with PROFILER.phase("replacements"):
+                replacements = _generate_replacements(
+                    day.entries, day_cfg, chain_df, lookup, spx_series, vix_series,
+                    monitor_times, spx_open, is_fomc_t1, day_early_exit_ms, deltas,
+                )
+            day.entries.extend(replacements)
 
-    # ── Replacement entries (re-enter after early stops) ──────────────
-    if getattr(cfg, "replacement_entry_enabled", False):
-        replacements = _generate_replacements(
-            day.entries, cfg, chain_df, lookup, spx_df, vix_df,
-            monitor_times, spx_open, is_fomc_t1, day_early_exit_ms, greeks_df,
-        )
-        day.entries.extend(replacements)
-
-    # ── Net-return threshold exit (post-processing pass) ─────────────────
-    if (getattr(cfg, "net_return_exit_pct", None) is not None
-            or getattr(cfg, "net_pnl_exit_dollars", None) is not None
-            or getattr(cfg, "time_scaled_return_base", None) is not None):
-        day.entries = _apply_return_threshold(
-            day.entries, lookup, monitor_times, cfg
-        )
+        return_exit = (getattr(day_cfg, "net_return_exit_pct", None) is not None
+                       or getattr(day_cfg, "net_pnl_exit_dollars", None) is not None
+                       or getattr(day_cfg, "time_scaled_return_base", None) is not None)
+        range_exit = bool(getattr(day_cfg, "range_exit_pct", None))
+        if not (return_exit or range_exit):
+            continue
+        # One set of per-bar close costs for both exit passes
+        with PROFILER.phase("pnl_curve"):
+            curve = PnLCurve.build(day.entries, lookup, monitor_times, day_cfg)
+
+        # ── Net-return threshold exit (post-processing pass) ─────────────
+        if return_exit:
+            with PROFILER.phase("return_exit"):
+                day.entries = _apply_return_threshold(
+                    day.entries, lookup, monitor_times, day_cfg, curve
+                )
 
-    # ── Range-consumption exit (post-processing pass) ─────────────────
-    if getattr(cfg, "range_exit_pct", None):
-        day.entries = _apply_range_exit(
-            day.entries, lookup, monitor_times, cfg, spx_df, expected_move
-        )
+        # ── Range-consumption exit (post-processing pass) ─────────────────
+        if range_exit:
+            with PROFILER.phase("range_exit"):
+                day.entries = _apply_range_exit(
+                    day.entries, lookup, monitor_times, day_cfg, spx_series, expected_move,
+                    curve
+                )
 
-    return day
+    return days
 
 
 # ── Full backtest ───────────────────────────────────────────────────────────
 
-def run_backtest(cfg: BacktestConfig, verbose: bool = True) -> List[DayResult]:
-    cache_dir = Path(cfg.cache_dir)
-    resolution = getattr(cfg, "data_resolution", "5min")
-    trading_days = get_spxw_trading_days(cfg.start_date, cfg.end_date, cache_dir, resolution)
-
-    # Build FOMC date sets (announcement days + T+1 days)
+def _fomc_date_sets(cfg: BacktestConfig) -> Tuple[set, set]:
+    """(T+1 dates, announcement dates) for cfg's date range."""
     fomc_t1_dates = set(cfg.fomc_t1_dates)
     fomc_announcement_dates = set()
     try:
@@ -1844,6 +2281,29 @@ def run_backtest(cfg: BacktestConfig, verbose: bool = True) -> List[DayResult]:
                 fomc_t1_dates.add(t1)
     except ImportError:
         pass  # Use whatever was in cfg
+    return fomc_t1_dates, fomc_announcement_dates
+
+
+def _skip_fomc_day(cfg: BacktestConfig, d: date, fomc_t1_dates: set,
+                   fomc_announcement_dates: set) -> bool:
+    # FOMC announcement day skip (MKT-008)
+    if getattr(cfg, "fomc_announcement_skip", False) and d in fomc_announcement_dates:
+        return True
+    # FOMC T+1 blackout (added 2026-04-19): skip day after announcement entirely.
+    # A/B backtest showed +$900 vs trade-normal, +$1,325 vs MKT-038 call-only.
+    return bool(getattr(cfg, "fomc_t1_skip_enabled", False) and d in fomc_t1_dates)
+
+
+def run_backtest(cfg: BacktestConfig, verbose: bool = True) -> List[DayResult]:
+    cache_dir = Path(cfg.cache_dir)
+    resolution = getattr(cfg, "data_resolution", "5min")
+    trading_days = get_spxw_trading_days(cfg.start_date, cfg.end_date, cache_dir, resolution)
+
+    # Build FOMC date sets (announcement days + T+1 days)
+    fomc_t1_dates, fomc_announcement_dates = _fomc_date_sets(cfg)
+
+    rcache = _result_cache_for(cfg)
+    cfg_hash = config_hash(cfg) if rcache is not None else None
 
     results = []
     n_total = len(trading_days)
@@ -1851,14 +2311,16 @@ def run_backtest(cfg: BacktestConfig, verbose: bool = True) -> List[DayResult]:
         print(f"\nRunning backtest: {cfg.start_date} → {cfg.end_date} ({n_total} days)\n")
 
     for i, d in enumerate(trading_days, 1):
-        # FOMC announcement day skip (MKT-008)
-        if getattr(cfg, "fomc_announcement_skip", False) and d in fomc_announcement_dates:
-            continue
-        # FOMC T+1 blackout (added 2026-04-19): skip day after announcement entirely.
-        # A/B backtest showed +$900 vs trade-normal, +$1,325 vs MKT-038 call-only.
-        if getattr(cfg, "fomc_t1_skip_enabled", False) and d in fomc_t1_dates:
+        if _skip_fomc_day(cfg, d, fomc_t1_dates, fomc_announcement_dates):
             continue
-        day_result = simulate_day(d, cfg, cache_dir, fomc_t1_dates)
+        if rcache is not None:
+            key = day_key(cfg_hash, d, d in fomc_t1_dates, _day_data_files(d, cfg, cache_dir))
+            day_result = rcache.get(key, _RESULT_MISS)
+            if day_result is _RESULT_MISS:
+                day_result = simulate_day(d, cfg, cache_dir, fomc_t1_dates)
+                rcache.put(key, day_result)
+        else:
+            day_result = simulate_day(d, cfg, cache_dir, fomc_t1_dates)
         if day_result is None:
             continue
         results.append(day_result)
@@ -1867,13 +2329,118 @@ def run_backtest(cfg: BacktestConfig, verbose: bool = True) -> List[DayResult]:
             cum_net = sum(r.net_pnl for r in results)
             print(f"  [{i}/{n_total}] {d}  cumulative net P&L: ${cum_net:+.0f}")
 
+    if rcache is not None:
+        rcache.flush()
+    if verbose:
+        st = DAY_CACHE.stats()
+        print(f"  Day cache: {st['hits'] + st['shared_hits']} hits / {st['misses']} misses "
+              f"({st['hit_rate']:.0%}), {st['lru_days']} days held ({st['lru_mb']:.0f} MB)")
+        if rcache is not None:
+            rs = rcache.stats()
+            print(f"  Result cache: {rs['hits']} hits / {rs['misses']} misses ({rs['hit_rate']:.0%})")
+
+    return results
+
+
+_RESULT_MISS = object()
+
+
+def _result_cache_for(cfg: BacktestConfig) -> Optional[ResultCache]:
+    cache_dir = getattr(cfg, "result_cache_dir", None)
+    return open_result_cache(cache_dir) if cache_dir else None
+
+
+def run_backtest_batch(cfgs: List[BacktestConfig], verbose: bool = False,
+                       days: Optional[Iterable[date]] = None) -> List[List[DayResult]]:
+    """
+    run_backtest for many configs, one simulate_day_batch call per day.
+
+    Returns one result list per config (same order as cfgs), identical to
+    [run_backtest(c) for c in cfgs].  Pays off when configs share their
+    selection fields (see _EXIT_ONLY_FIELDS) — e.g. a stop-buffer sweep.
+
+    `days` restricts the run to a subset of the configs' trading days (a
+    sweep_runner day chunk); FOMC sets still come from each config's full
+    date range, so chunked results concatenate to the unchunked run.
+    """
+    results: List[List[DayResult]] = [[] for _ in cfgs]
+    if not cfgs:
+        return results
+
+    # FOMC sets and trading-day lists per distinct (dates, data source)
+    fomc = [_fomc_date_sets(c) for c in cfgs]
+    days_for: Dict[tuple, List[date]] = {}
+    cfg_days = []
+    for c in cfgs:
+        key = (c.start_date, c.end_date, str(c.cache_dir), getattr(c, "data_resolution", "5min"))
+        if key not in days_for:
+            days_for[key] = get_spxw_trading_days(c.start_date, c.end_date, Path(c.cache_dir), key[3])
+        cfg_days.append(set(days_for[key]))
+    all_days = sorted(set().union(*cfg_days))
+    if days is not None:
+        wanted = set(days)
+        all_days = [d for d in all_days if d in wanted]
+
+    rcaches = [_result_cache_for(c) for c in cfgs]
+    cfg_hashes = [config_hash(c) if rc is not None else None for c, rc in zip(cfgs, rcaches)]
+
+    if verbose:
+        print(f"\nRunning {len(cfgs)}-config batch backtest: "
+              f"{all_days[0] if all_days else '-'} → {all_days[-1] if all_days else '-'} "
+              f"({len(all_days)} days)\n")
+
+    for n, d in enumerate(all_days, 1):
+        # Configs with different FOMC T+1 sets (or cache dirs) can't share a call
+        calls: Dict[tuple, List[int]] = {}
+        day_results: Dict[int, Optional[DayResult]] = {}
+        keys: Dict[int, str] = {}
+        for i, c in enumerate(cfgs):
+            if d not in cfg_days[i] or _skip_fomc_day(c, d, *fomc[i]):
+                continue
+            is_t1 = d in fomc[i][0]
+            if rcaches[i] is not None:
+                keys[i] = day_key(cfg_hashes[i], d, is_t1, _day_data_files(d, c, Path(c.cache_dir)))
+                cached = rcaches[i].get(keys[i], _RESULT_MISS)
+                if cached is not _RESULT_MISS:
+                    day_results[i] = cached
+                    continue
+            calls.setdefault((is_t1, str(c.cache_dir)), []).append(i)
+        for (is_t1, cache_dir), idxs in calls.items():
+            simulated = simulate_day_batch(
+                d, [cfgs[i] for i in idxs], Path(cache_dir), {d} if is_t1 else set())
+            for i, day_result in zip(idxs, simulated):
+                day_results[i] = day_result
+                if i in keys:
+                    rcaches[i].put(keys[i], day_result)
+        for i in sorted(day_results):
+            if day_results[i] is not None:
+                results[i].append(day_results[i])
+        if verbose and (n % 50 == 0 or n == len(all_days)):
+            print(f"  [{n}/{len(all_days)}] {d}")
+
+    for rc in {id(rc): rc for rc in rcaches if rc is not None}.values():
+        rc.flush()
     return results
 
 
 # ── Results summary ─────────────────────────────────────────────────────────
 
+# EntryResult fields summarize() reports, in column order
+_SUMMARY_FIELDS = ("entry_num", "entry_type", "skip_reason", "spx_at_entry", "vix_at_entry",
+                   "short_call", "long_call", "short_put", "long_put", "call_credit",
+                   "put_credit", "call_stop", "put_stop", "call_outcome", "put_outcome",
+                   "call_close_cost", "put_close_cost", "gross_pnl", "commission", "net_pnl")
+
+
 def summarize(results: List[DayResult]) -> pd.DataFrame:
-    """Convert list of DayResult to a tidy daily DataFrame."""
+    """Convert list of DayResult (or a ResultTable) to a tidy daily DataFrame."""
+    from .result_table import ResultTable
+    if isinstance(results, ResultTable):
+        df = results.to_frame(_SUMMARY_FIELDS)
+        for name in ("entry_type", "skip_reason", "call_outcome", "put_outcome"):
+            df[name] = df[name].astype(object)
+        df["date"] = [d.item() for d in results.dates.repeat(np.diff(results.offsets))]
+        return df.rename(columns={"spx_at_entry": "spx", "vix_at_entry": "vix"})
     rows = []
     for day in results:
         for e in day.entries:
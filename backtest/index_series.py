@@ -0,0 +1,170 @@
+"""
+Sorted-array SPX / VIX index series for the backtest engine.
+
+The engine used to keep each day's 1-min index data as a DataFrame and
+answer every "price at or before t" with a full boolean mask — once per bar
+for price stops, movement-triggered entries, calm-entry delays and range
+exits, so O(bars²) per day.  load_index_day() also re-read the whole
+monthly SPX_YYYYMM / VIX_YYYYMM parquet for every single day.
+
+IndexSeries holds one day as two sorted NumPy arrays (ms_of_day, price) and
+answers as-of, range high/low and first-valid-price queries with
+np.searchsorted.  Monthly files are read once per process (re-read when the
+file changes) and each day is a zero-copy slice of its month.
+
+Semantics match the DataFrame code they replace:
+  - at(t): price of the last bar at/before t; the first bar's price when t
+    is before the first bar; 0.0 for an empty series.
+  - high/low/range(start, end): over bars with start <= ms <= end and
+    price > 0; None when there is no such bar.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class IndexSeries:
+    """One day of 1-min index prices as sorted (ms_of_day, price) arrays.  Read-only."""
+
+    __slots__ = ("ms", "price", "_valid_ms", "_valid_price")
+
+    def __init__(self, ms: np.ndarray, price: np.ndarray):
+        ms = np.asarray(ms, dtype=np.int64)
+        price = np.asarray(price, dtype=np.float64)
+        if len(ms) > 1 and not (ms[1:] >= ms[:-1]).all():
+            order = np.argsort(ms, kind="stable")
+            ms, price = ms[order], price[order]
+        self.ms = ms
+        self.price = price
+        valid = price > 0
+        self._valid_ms = ms[valid]
+        self._valid_price = price[valid]
+
+    @classmethod
+    def empty_series(cls) -> "IndexSeries":
+        return cls(np.zeros(0, dtype=np.int64), np.zeros(0))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "IndexSeries":
+        """From a DataFrame with ms_of_day / price columns (e.g. load_index_day)."""
+        if df.empty:
+            return cls.empty_series()
+        return cls(df["ms_of_day"].to_numpy(), df["price"].to_numpy())
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"ms_of_day": self.ms, "price": self.price})
+
+    def __len__(self) -> int:
+        return len(self.ms)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.ms) == 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.ms.nbytes + self.price.nbytes
+                   + self._valid_ms.nbytes + self._valid_price.nbytes)
+
+    @property
+    def valid_prices(self) -> np.ndarray:
+        """Every price > 0, in time order."""
+        return self._valid_price
+
+    # ── Point queries ─────────────────────────────────────────────────────
+
+    def at(self, target_ms: int) -> float:
+        """Price at or just before target_ms."""
+        if len(self.ms) == 0:
+            return 0.0
+        pos = int(np.searchsorted(self.ms, target_ms, side="right")) - 1
+        return float(self.price[max(pos, 0)])
+
+    def at_many(self, targets: np.ndarray) -> np.ndarray:
+        """at() for every timestamp in targets."""
+        if len(self.ms) == 0:
+            return np.zeros(len(targets))
+        pos = np.searchsorted(self.ms, targets, side="right") - 1
+        return self.price[np.maximum(pos, 0)]
+
+    def first_valid(self) -> float:
+        """First price > 0 of the day (0.0 if none)."""
+        return float(self._valid_price[0]) if len(self._valid_price) else 0.0
+
+    # ── Range queries ─────────────────────────────────────────────────────
+
+    def _window(self, start_ms: int, end_ms: int) -> np.ndarray:
+        lo = np.searchsorted(self._valid_ms, start_ms, side="left")
+        hi = np.searchsorted(self._valid_ms, end_ms, side="right")
+        return self._valid_price[lo:hi]
+
+    def high(self, start_ms: int, end_ms: int) -> Optional[float]:
+        w = self._window(start_ms, end_ms)
+        return float(w.max()) if len(w) else None
+
+    def low(self, start_ms: int, end_ms: int) -> Optional[float]:
+        w = self._window(start_ms, end_ms)
+        return float(w.min()) if len(w) else None
+
+    def range(self, start_ms: int, end_ms: int) -> Optional[Tuple[float, float]]:
+        """(low, high) over the window."""
+        w = self._window(start_ms, end_ms)
+        return (float(w.min()), float(w.max())) if len(w) else None
+
+
+# ── Monthly file cache ──────────────────────────────────────────────────────
+
+_MonthArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]   # (day, ms, price), sorted
+_MONTHS: Dict[str, Tuple[Tuple[int, int], _MonthArrays]] = {}
+_MONTHS_LOCK = threading.Lock()
+
+
+def _month_arrays(path: Path) -> Optional[_MonthArrays]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    stamp = (st.st_size, st.st_mtime_ns)
+    key = str(path)
+    with _MONTHS_LOCK:
+        cached = _MONTHS.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    df = pd.read_parquet(path, columns=["date", "ms_of_day", "price"])
+    day = pd.to_datetime(df["date"]).to_numpy().astype("datetime64[D]")
+    ms = df["ms_of_day"].to_numpy(dtype=np.int64)
+    price = df["price"].to_numpy(dtype=np.float64)
+    order = np.lexsort((ms, day))
+    arrays = (day[order], ms[order], price[order])
+    with _MONTHS_LOCK:
+        _MONTHS[key] = (stamp, arrays)
+    return arrays
+
+
+def index_month_path(symbol: str, d: date, cache_dir: Path) -> Path:
+    return Path(cache_dir) / "index" / f"{symbol}_{d.year}{d.month:02d}.parquet"
+
+
+def load_index_series(symbol: str, d: date, cache_dir: Path) -> IndexSeries:
+    """The day's 1-min series for SPX / VIX (empty if not cached)."""
+    arrays = _month_arrays(index_month_path(symbol, d, cache_dir))
+    if arrays is None:
+        return IndexSeries.empty_series()
+    day, ms, price = arrays
+    key = np.datetime64(d, "D")
+    lo = np.searchsorted(day, key, side="left")
+    hi = np.searchsorted(day, key, side="right")
+    return IndexSeries(ms[lo:hi], price[lo:hi])
+
+
+def clear_index_cache() -> None:
+    with _MONTHS_LOCK:
+        _MONTHS.clear()
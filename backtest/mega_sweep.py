@@ -13,10 +13,14 @@ Outputs:
 Run: python -m backtest.mega_sweep
      python -m backtest.mega_sweep --workers 8
      python -m backtest.mega_sweep --top 100
+     python -m backtest.mega_sweep --halving    # successive halving (only finalists run all days)
+     python -m backtest.mega_sweep --queue /mnt/sweeps/queue.sqlite   # workers on other hosts
+                                               # (see backtest/work_queue.py)
 
 Expected runtime: ~7 hours with 8 workers on 1-min data.
 """
 import argparse
+import contextlib
 import csv
 import multiprocessing as mp
 import statistics
@@ -24,10 +28,12 @@ import time
 from datetime import date, datetime as dt
 from itertools import product
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from backtest.config import live_config, BacktestConfig
 from backtest.engine import run_backtest, DayResult
+from backtest.optimize import compute_metrics
+from backtest.sweep_runner import SweepPoint, SweepRunner, successive_halving
 
 # ── Date range ───────────────────────────────────────────────────────────────
 FULL_START = date(2022, 5, 16)
@@ -102,7 +108,11 @@ def _worker(args):
     combo_idx, combo = args
     cfg = _build_combo_cfg(combo)
     results = run_backtest(cfg, verbose=False)
+    return _summarize(combo_idx, combo, results)
 
+
+def _summarize(combo_idx: int, combo: dict, results: List[DayResult]) -> dict:
+    """Result row of one combo (the dict printed, ranked and written to CSV)."""
     pnls = [r.net_pnl for r in results]
     total_pnl = sum(pnls)
     days = len(results)
@@ -140,6 +150,32 @@ def _worker(args):
     }
 
 
+def _run_halving(all_combos: List[dict], n_workers: int, keep: int,
+                 eta: int, min_days: int, queue: Optional[str] = None) -> List[dict]:
+    """Successive halving over all_combos; result rows for the finalists only."""
+    pts = [SweepPoint(_combo_label(c), _build_combo_cfg(c), key=(i, c))
+           for i, c in enumerate(all_combos)]
+
+    def on_rung(k, n_days, n_points):
+        print(f"  Rung {k + 1}: {n_points:,} combos × {n_days} days", flush=True)
+
+    with SweepRunner(workers=n_workers, metrics_fn=compute_metrics, queue=queue) as runner:
+        report = successive_halving(runner, pts, eta=eta, min_days=min_days, keep=keep,
+                                    keep_results=True, on_rung=on_rung)
+    print(f"  {len(report.finalists)} finalists on the full period — simulated "
+          f"{report.day_runs:,} of {report.full_day_runs:,} combo-days ({report.savings:.0%} saved)")
+    return [_summarize(r.key[0], r.key[1], r.results) for r in report.finalists]
+
+
+def _run_queued(all_combos: List[dict], queue: str) -> Iterator[dict]:
+    """Result rows of every combo, computed by the work queue's workers (completion order)."""
+    pts = [SweepPoint(_combo_label(c), _build_combo_cfg(c), key=(i, c))
+           for i, c in enumerate(all_combos)]
+    with SweepRunner(metrics_fn=lambda results: {}, queue=queue) as runner:
+        for r in runner.run(pts, keep_results=True):
+            yield _summarize(r.key[0], r.key[1], r.results)
+
+
 def _run_best_with_daily(combo: dict) -> List[dict]:
     """Run the best combo and return per-day results."""
     cfg = _build_combo_cfg(combo)
@@ -160,6 +196,14 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Mega combinatorial sweep")
     parser.add_argument("--workers", type=int, default=8)
     parser.add_argument("--top", type=int, default=50, help="Show top N results")
+    parser.add_argument("--halving", action="store_true",
+                        help="Successive halving: prune on sampled days, only the top "
+                             "combos run the full period (rankings cover finalists only)")
+    parser.add_argument("--eta", type=int, default=3, help="Halving rate (keep 1/eta per rung)")
+    parser.add_argument("--min-days", type=int, default=40, help="Days in the first halving rung")
+    parser.add_argument("--queue", default=None,
+                        help="Shared work-queue file: run the combos on `python -m "
+                             "backtest.work_queue worker` hosts instead of a local pool")
     args = parser.parse_args()
 
     n_workers = args.workers
@@ -183,19 +227,28 @@ if __name__ == "__main__":
     all_results = []
     t0 = time.time()
 
-    with mp.Pool(processes=n_workers) as pool:
-        for i, result in enumerate(pool.imap_unordered(_worker, worker_args), 1):
-            all_results.append(result)
-            if i % 100 == 0 or i == total:
-                elapsed = time.time() - t0
-                rate = i / elapsed
-                eta = (total - i) / rate if rate > 0 else 0
-                best_so_far = max(all_results, key=lambda r: r["sharpe"])
-                print(
-                    f"  [{i:>6,}/{total:,}] "
-                    f"{elapsed/60:.0f}m elapsed, {eta/60:.0f}m remaining | "
-                    f"Best Sharpe so far: {best_so_far['sharpe']:.3f}"
-                )
+    if args.halving:
+        all_results = _run_halving(all_combos, n_workers, keep=max(args.top, 10),
+                                   eta=args.eta, min_days=args.min_days, queue=args.queue)
+    else:
+        with contextlib.ExitStack() as stack:
+            if args.queue:
+                rows = _run_queued(all_combos, args.queue)
+            else:
+                pool = stack.enter_context(mp.Pool(processes=n_workers))
+                rows = pool.imap_unordered(_worker, worker_args)
+            for i, result in enumerate(rows, 1):
+                all_results.append(result)
+                if i % 100 == 0 or i == total:
+                    elapsed = time.time() - t0
+                    rate = i / elapsed
+                    eta = (total - i) / rate if rate > 0 else 0
+                    best_so_far = max(all_results, key=lambda r: r["sharpe"])
+                    print(
+                        f"  [{i:>6,}/{total:,}] "
+                        f"{elapsed/60:.0f}m elapsed, {eta/60:.0f}m remaining | "
+                        f"Best Sharpe so far: {best_so_far['sharpe']:.3f}"
+                    )
 
     elapsed = time.time() - t0
     print(f"\n  Completed {total:,} combos in {elapsed/60:.0f} minutes ({elapsed/3600:.1f} hours)")
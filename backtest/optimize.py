@@ -14,6 +14,10 @@ Usage:
     python -m backtest.optimize --no-validate
     python -m backtest.optimize --output results.csv
     python -m backtest.optimize --no-rich          # plain progress bar (no rich TUI)
+    python -m backtest.optimize --halving          # successive halving: prune on sampled days
+    python -m backtest.optimize --halving --eta 4 --min-days 60
+    python -m backtest.optimize --search 120       # TPE search: 120 combos instead of the full grid
+    python -m backtest.optimize --profile          # per-phase engine timings (prof_* CSV columns)
 """
 import argparse
 import contextlib
@@ -30,7 +34,7 @@ import time
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 # Rich TUI (graceful fallback to plain progress if not installed)
 try:
@@ -54,6 +58,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backtest.config import BacktestConfig, live_config
 from backtest.engine import run_backtest, DayResult
+from backtest.profiler import PROFILER, Profiler, enable_profiling, snapshot_columns
+from backtest.result_table import ResultTable
+from backtest.robustness import pnl_matrix, robustness
+from backtest.shared_day_data import SharedDayStore, attach_shared_days
+from backtest.sweep_runner import SweepPoint, SweepRunner, successive_halving
+from backtest.tpe import TPESampler
 
 
 # ── Entry schedule presets ───────────────────────────────────────────────────
@@ -189,6 +199,13 @@ class OptCombo:
     train_total_skipped: int = 0
     train_days: int = 0
 
+    # Bootstrap robustness of the training P&L (backtest.robustness)
+    train_sharpe_lo: Optional[float] = None     # 90% CI of the Sharpe
+    train_sharpe_hi: Optional[float] = None
+    train_p_positive: Optional[float] = None    # P(Sharpe > 0)
+    train_p_best: Optional[float] = None        # P(highest Sharpe of all combos trained)
+    train_max_dd_p05: Optional[float] = None    # worst-5% max DD over reshuffled day orders
+
     # Validation metrics (populated for top-N only)
     val_net_pnl: Optional[float] = None
     val_sharpe: Optional[float] = None
@@ -198,6 +215,9 @@ class OptCombo:
     val_stop_rate: Optional[float] = None
     val_days: Optional[int] = None
 
+    # Engine phase timings for the training run (--profile only; prof_* CSV columns)
+    profile: Dict[str, float] = dataclasses.field(default_factory=dict, repr=False)
+
 
 # ── Grid builder ─────────────────────────────────────────────────────────────
 
@@ -213,19 +233,43 @@ def build_grid(grid_def: dict) -> List[dict]:
 
 # ── Metrics computation ──────────────────────────────────────────────────────
 
-def compute_metrics(results: List[DayResult]) -> dict:
+def compute_metrics(results: Union[ResultTable, List[DayResult]]) -> dict:
     """
-    Compute all ranking metrics from a list of DayResult objects.
+    Compute all ranking metrics from a list of DayResult objects (or the
+    ResultTable sweep workers return — read column-wise, same numbers).
     Mirrors engine.py:print_stats() exactly for consistency.
+
+    "_daily" carries (dates, daily net P&L) for the leaderboard's bootstrap
+    statistics; _train_columns passes it through unprefixed.
     """
     if not results:
         return {
             "net_pnl": 0.0, "sharpe": -999.0, "max_dd": 0.0,
             "win_rate": 0.0, "avg_net_per_day": 0.0, "stop_rate": 0.0,
-            "total_entries": 0, "total_skipped": 0, "days": 0,
+            "total_entries": 0, "total_skipped": 0, "days": 0, "_daily": ([], []),
         }
 
-    daily_net = [r.net_pnl for r in results]
+    if isinstance(results, ResultTable):
+        dates = results.dates.tolist()
+        daily_net = results.daily_sum("net_pnl").tolist()
+        skipped_mask = results.mask("entry_type", "skipped")
+        n_placed = int((~skipped_mask).sum())
+        n_skipped = int(skipped_mask.sum())
+        total_stops = int((results.mask("call_outcome", "stopped") & ~skipped_mask).sum()
+                          + (results.mask("put_outcome", "stopped") & ~skipped_mask).sum())
+    else:
+        dates = [r.date for r in results]
+        daily_net = [r.net_pnl for r in results]
+        all_entries = [e for r in results for e in r.entries]
+        placed = [e for e in all_entries if e.entry_type != "skipped"]
+        n_placed = len(placed)
+        n_skipped = len(all_entries) - n_placed
+        total_stops = sum(
+            (1 if e.call_outcome == "stopped" else 0) +
+            (1 if e.put_outcome == "stopped" else 0)
+            for e in placed
+        )
+
     total_net = sum(daily_net)
     winning_days = sum(1 for x in daily_net if x > 0)
     win_rate = winning_days / len(daily_net) * 100
@@ -237,17 +281,7 @@ def compute_metrics(results: List[DayResult]) -> dict:
     max_dd = float((cumulative - cumulative.cummax()).min())
 
     avg_net_per_day = total_net / len(results)
-
-    all_entries = [e for r in results for e in r.entries]
-    placed = [e for e in all_entries if e.entry_type != "skipped"]
-    skipped = [e for e in all_entries if e.entry_type == "skipped"]
-
-    total_stops = sum(
-        (1 if e.call_outcome == "stopped" else 0) +
-        (1 if e.put_outcome == "stopped" else 0)
-        for e in placed
-    )
-    stop_rate = total_stops / (len(placed) * 2) * 100 if placed else 0.0
+    stop_rate = total_stops / (n_placed * 2) * 100 if n_placed else 0.0
 
     return {
         "net_pnl": total_net,
@@ -256,12 +290,18 @@ def compute_metrics(results: List[DayResult]) -> dict:
         "win_rate": win_rate,
         "avg_net_per_day": avg_net_per_day,
         "stop_rate": stop_rate,
-        "total_entries": len(placed),
-        "total_skipped": len(skipped),
+        "total_entries": n_placed,
+        "total_skipped": n_skipped,
         "days": len(results),
+        "_daily": (dates, daily_net),
     }
 
 
+def _train_columns(metrics: dict) -> dict:
+    """compute_metrics output as train_* columns (private "_" keys pass through as-is)."""
+    return {k if k.startswith("_") else f"train_{k}": v for k, v in metrics.items()}
+
+
 # ── Progress display ─────────────────────────────────────────────────────────
 
 def _print_progress(done: int, total: int, start_time: float, prefix: str = ""):
@@ -284,16 +324,8 @@ def _print_progress(done: int, total: int, start_time: float, prefix: str = ""):
 
 # ── Worker function (must be top-level for macOS spawn pickling) ─────────────
 
-def _worker(args: Tuple[dict, date, date, str]) -> dict:
-    """
-    Top-level worker — module-level required for macOS multiprocessing spawn.
-
-    Runs one backtest for the given combo + date range.
-    Returns the combo dict merged with train_* metrics.
-    Never raises — returns sentinel metrics on error.
-    """
-    combo, start, end, cache_dir = args
-
+def _combo_cfg(combo: dict, start: date, end: date, cache_dir: str) -> BacktestConfig:
+    """live_config() with the combo's parameters and the given date range applied."""
     cfg = copy.deepcopy(live_config())
     cfg.start_date = start
     cfg.end_date = end
@@ -354,17 +386,135 @@ def _worker(args: Tuple[dict, date, date, str]) -> dict:
         cfg.price_based_stop_points = combo["price_based_stop_points"]
     if "stop_slippage_per_leg" in combo:
         cfg.stop_slippage_per_leg = combo["stop_slippage_per_leg"]
+    return cfg
 
-    try:
-        # Suppress run_backtest()'s internal print() calls
-        with contextlib.redirect_stdout(io.StringIO()):
-            results = run_backtest(cfg)
-        metrics = compute_metrics(results)
-    except Exception as e:
-        metrics = compute_metrics([])
-        metrics["_error"] = str(e)
 
-    return {**combo, **{f"train_{k}": v for k, v in metrics.items()}}
+def _worker(args: Tuple[dict, date, date, str]) -> dict:
+    """
+    Top-level worker — module-level required for macOS multiprocessing spawn.
+
+    Runs one backtest for the given combo + date range.
+    Returns the combo dict merged with train_* metrics.
+    Never raises — returns sentinel metrics on error.
+    """
+    combo, start, end, cache_dir = args
+    cfg = _combo_cfg(combo, start, end, cache_dir)
+
+    with PROFILER.capture() as prof:
+        try:
+            # Suppress run_backtest()'s internal print() calls
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = run_backtest(cfg)
+            metrics = compute_metrics(results)
+        except Exception as e:
+            metrics = compute_metrics([])
+            metrics["_error"] = str(e)
+
+    return {**combo, **_train_columns(metrics), **snapshot_columns(prof), "_profile": prof}
+
+
+# ── Successive-halving training ──────────────────────────────────────────────
+
+def train_halving(
+    combos_raw: List[dict],
+    start: date,
+    end: date,
+    cache_dir: str,
+    workers: int,
+    keep: int,
+    eta: int = 3,
+    min_days: int = 40,
+    store: Optional[SharedDayStore] = None,
+) -> List[dict]:
+    """
+    Training phase via successive halving (backtest.sweep_runner).
+
+    Every combo runs on a random sample of training days; the bottom
+    (1 - 1/eta) by Sharpe (then P&L) are dropped and survivors are extended
+    to eta× more days, until at least `keep` combos run the full period.
+    Returns worker-style dicts (combo + train_* metrics) for those finalists
+    only — pruned combos' metrics cover fewer days and are not comparable.
+    """
+    pts = [SweepPoint(str(c["combo_id"]), _combo_cfg(c, start, end, cache_dir), key=c)
+           for c in combos_raw]
+
+    def on_rung(k: int, n_days: int, n_points: int):
+        print(f"  Rung {k + 1}: {n_points:,} combos × {n_days} days")
+
+    with SweepRunner(workers=workers, metrics_fn=compute_metrics,
+                     shared_memory=store if store is not None else False) as runner:
+        report = successive_halving(runner, pts, eta=eta, min_days=min_days, keep=keep,
+                                    on_rung=on_rung)
+
+    print(f"  {len(report.finalists)} finalists on the full period — simulated "
+          f"{report.day_runs:,} of {report.full_day_runs:,} combo-days "
+          f"({report.savings:.0%} saved)")
+    if PROFILER.enabled:
+        # Combos are batched per task, so timings are only available per sweep
+        print(f"\n  Engine profile (all rungs, all workers):\n{runner.profile.report()}\n")
+    return [{**r.key, **_train_columns(r.metrics)} for r in report.finalists]
+
+
+# ── Surrogate-guided training ────────────────────────────────────────────────
+
+def train_search(
+    grid_def: dict,
+    start: date,
+    end: date,
+    cache_dir: str,
+    workers: int,
+    budget: int,
+    batch: Optional[int] = None,
+    seed: int = 0,
+    store: Optional[SharedDayStore] = None,
+) -> List[dict]:
+    """
+    Training phase via TPE search (backtest.tpe) over the grid's axes.
+
+    Evaluates `budget` combos on the full training period — a random start,
+    then batches of `batch` (default: one per worker) proposed from the
+    results so far, ranked by (Sharpe, P&L) like the leaderboard.  Returns
+    worker-style dicts for every evaluated combo, with the combo_id each
+    has in build_grid(grid_def).
+    """
+    combos_raw = build_grid(grid_def)
+    ids = {_grid_key(grid_def, c): c["combo_id"] for c in combos_raw}
+    batch = batch or workers
+    sampler = TPESampler(grid_def, n_startup=max(10, 2 * batch), seed=seed)
+    budget = min(budget, sampler.size)
+
+    out: List[dict] = []
+    best = None
+    with SweepRunner(workers=workers, metrics_fn=compute_metrics,
+                     shared_memory=store if store is not None else False) as runner:
+        while len(out) < budget:
+            asked = sampler.ask(min(batch, budget - len(out)))
+            if not asked:
+                break
+            pts = []
+            for params in asked:
+                combo = {"combo_id": ids[_grid_key(grid_def, params)], **params}
+                pts.append(SweepPoint(str(combo["combo_id"]), _combo_cfg(combo, start, end, cache_dir),
+                                      key=combo))
+            for r in runner.run(pts):
+                sampler.tell({k: v for k, v in r.key.items() if k != "combo_id"},
+                             (r.metrics["sharpe"], r.metrics["net_pnl"]))
+                out.append({**r.key, **_train_columns(r.metrics)})
+                if best is None or (r.metrics["sharpe"], r.metrics["net_pnl"]) > best:
+                    best = (r.metrics["sharpe"], r.metrics["net_pnl"])
+            print(f"  Search: {len(out):>5,}/{budget:,} combos evaluated  "
+                  f"best Sharpe {best[0]:.3f}  P&L ${best[1]:>+10,.0f}", flush=True)
+
+    print(f"  Evaluated {len(out):,} of {sampler.size:,} grid combos "
+          f"({len(out) / sampler.size:.0%})")
+    if PROFILER.enabled:
+        print(f"\n  Engine profile (all batches, all workers):\n{runner.profile.report()}\n")
+    return out
+
+
+def _grid_key(grid_def: dict, combo: dict) -> tuple:
+    # type() keeps True / 1 and 0 / False apart
+    return tuple((type(combo[k]).__name__, combo[k]) for k in grid_def)
 
 
 # ── Rich leaderboard table (printed at intervals during training) ─────────────
@@ -622,10 +772,23 @@ def _make_dashboard(
 
 # ── Results assembly ─────────────────────────────────────────────────────────
 
+def _robustness_columns(raw_results: List[dict]) -> List[dict]:
+    """Per raw result, train_* bootstrap statistics over all combos with daily P&L."""
+    out: List[dict] = [{} for _ in raw_results]
+    have = [i for i, r in enumerate(raw_results) if r.get("_daily") and r["_daily"][0]]
+    if not have:
+        return out
+    _, matrix = pnl_matrix([raw_results[i]["_daily"] for i in have])
+    for i, row in zip(have, robustness(matrix).rows()):
+        out[i] = {f"train_{k}": v for k, v in row.items()}
+    return out
+
+
 def build_opt_combos(raw_results: List[dict]) -> List[OptCombo]:
     """Convert raw worker output dicts to OptCombo list sorted by Sharpe then P&L."""
     combos = []
-    for r in raw_results:
+    robust = _robustness_columns(raw_results)
+    for r, rob in zip(raw_results, robust):
         c = OptCombo(
             combo_id=r["combo_id"],
             put_stop_buffer=r["put_stop_buffer"],
@@ -663,6 +826,8 @@ def build_opt_combos(raw_results: List[dict]) -> List[OptCombo]:
             train_total_entries=r.get("train_total_entries", 0),
             train_total_skipped=r.get("train_total_skipped", 0),
             train_days=r.get("train_days", 0),
+            **rob,
+            profile={k: v for k, v in r.items() if k.startswith("prof_")},
         )
         combos.append(c)
 
@@ -672,6 +837,16 @@ def build_opt_combos(raw_results: List[dict]) -> List[OptCombo]:
 
 # ── Output tables ────────────────────────────────────────────────────────────
 
+def _ci_str(c: OptCombo) -> str:
+    if c.train_sharpe_lo is None:
+        return "—"
+    return f"{c.train_sharpe_lo:.2f}…{c.train_sharpe_hi:.2f}"
+
+
+def _pct_str(p: Optional[float]) -> str:
+    return "—" if p is None else f"{p:.1%}"
+
+
 def print_training_table(combos: List[OptCombo], top_n: int = 20):
     """Print top-N training results as an aligned table."""
     top_n = min(top_n, len(combos))
@@ -686,17 +861,17 @@ def print_training_table(combos: List[OptCombo], top_n: int = 20):
     )
 
     if has_xl:
-        print(f"\n{'='*155}")
+        print(f"\n{'='*177}")
         print(f"  TOP {top_n} CONFIGURATIONS — TRAINING (ranked by Sharpe)")
-        print(f"{'='*155}")
+        print(f"{'='*177}")
         print(
             f"  {'#':>3}  {'PutBuf':>7}  {'PutMin':>7}  {'CallMin':>7}  {'CallBuf':>7}  "
             f"{'1-Sided':>7}  {'Schedule':>9}  {'Exit':>6}  {'NRet%':>6}  "
             f"{'DnCall%':>7}  {'UpPut%':>6}  "
-            f"{'Sharpe':>7}  {'Net P&L':>10}  {'Win%':>5}  "
+            f"{'Sharpe':>7}  {'90% CI':>11}  {'P(best)':>7}  {'Net P&L':>10}  {'Win%':>5}  "
             f"{'MaxDD':>10}  {'Stops%':>7}  {'Entries':>7}  {'Days':>5}"
         )
-        print(f"  {'-'*168}")
+        print(f"  {'-'*190}")
         for rank, c in enumerate(combos[:top_n], 1):
             buf_str  = f"${c.put_stop_buffer/100:.2g}"
             cbuf_str = f"${c.call_stop_buffer/100:.2f}"
@@ -709,22 +884,23 @@ def print_training_table(combos: List[OptCombo], top_n: int = 20):
                 f"  {rank:>3}  {buf_str:>7}  {c.min_put_credit:>7.2f}  {c.min_call_credit:>7.2f}  "
                 f"{cbuf_str:>7}  {one_sided:>7}  {c.entry_schedule:>9}  {exit_str:>6}  {nret_str:>6}  "
                 f"{dn_str:>7}  {up_str:>6}  "
-                f"{c.train_sharpe:>7.2f}  ${c.train_net_pnl:>9,.0f}  "
+                f"{c.train_sharpe:>7.2f}  {_ci_str(c):>11}  {_pct_str(c.train_p_best):>7}  "
+                f"${c.train_net_pnl:>9,.0f}  "
                 f"{c.train_win_rate:>4.1f}%  ${c.train_max_dd:>9,.0f}  "
                 f"{c.train_stop_rate:>6.1f}%  {c.train_total_entries:>7}  {c.train_days:>5}"
             )
-        print(f"{'='*168}\n")
+        print(f"{'='*190}\n")
     else:
-        print(f"\n{'='*115}")
+        print(f"\n{'='*137}")
         print(f"  TOP {top_n} CONFIGURATIONS — TRAINING (ranked by Sharpe)")
-        print(f"{'='*115}")
+        print(f"{'='*137}")
         print(
             f"  {'#':>3}  {'PutBuf':>7}  {'PutMin':>7}  {'CallMin':>7}  "
             f"{'1-Sided':>7}  {'FomcT1':>7}  "
-            f"{'Sharpe':>7}  {'Net P&L':>10}  {'Win%':>5}  "
+            f"{'Sharpe':>7}  {'90% CI':>11}  {'P(best)':>7}  {'Net P&L':>10}  {'Win%':>5}  "
             f"{'MaxDD':>10}  {'Stops%':>7}  {'Entries':>7}  {'Days':>5}"
         )
-        print(f"  {'-'*110}")
+        print(f"  {'-'*132}")
         for rank, c in enumerate(combos[:top_n], 1):
             buf_str = f"${c.put_stop_buffer/100:.2g}"
             one_sided = "Yes" if c.one_sided_entries_enabled else "No"
@@ -732,11 +908,12 @@ def print_training_table(combos: List[OptCombo], top_n: int = 20):
             print(
                 f"  {rank:>3}  {buf_str:>7}  {c.min_put_credit:>7.2f}  {c.min_call_credit:>7.2f}  "
                 f"{one_sided:>7}  {fomc_t1:>7}  "
-                f"{c.train_sharpe:>7.2f}  ${c.train_net_pnl:>9,.0f}  "
+                f"{c.train_sharpe:>7.2f}  {_ci_str(c):>11}  {_pct_str(c.train_p_best):>7}  "
+                f"${c.train_net_pnl:>9,.0f}  "
                 f"{c.train_win_rate:>4.1f}%  ${c.train_max_dd:>9,.0f}  "
                 f"{c.train_stop_rate:>6.1f}%  {c.train_total_entries:>7}  {c.train_days:>5}"
             )
-        print(f"{'='*115}\n")
+        print(f"{'='*137}\n")
 
 
 def print_validation_comparison(combos: List[OptCombo], val_count: int = 5):
@@ -798,10 +975,13 @@ def print_best_config(best: OptCombo):
         print(f"  fomc_t1_callonly_enabled:   {best.fomc_t1_callonly_enabled}")
     print(f"")
     print(f"  ── Training ─────────────────────────────────────────")
-    print(f"  Sharpe:       {best.train_sharpe:.2f}")
+    print(f"  Sharpe:       {best.train_sharpe:.2f}  (90% CI {_ci_str(best)}, "
+          f"P(>0) {_pct_str(best.train_p_positive)}, P(best) {_pct_str(best.train_p_best)})")
     print(f"  Net P&L:      ${best.train_net_pnl:+,.0f}")
     print(f"  Win rate:     {best.train_win_rate:.1f}%")
     print(f"  Max drawdown: ${best.train_max_dd:,.0f}")
+    if best.train_max_dd_p05 is not None:
+        print(f"  Max DD (5% worst ordering): ${best.train_max_dd_p05:,.0f}")
     print(f"  Avg/day:      ${best.train_avg_net_per_day:+.0f}")
     print(f"  Stop rate:    {best.train_stop_rate:.1f}%")
     print(f"  Days:         {best.train_days}")
@@ -820,15 +1000,18 @@ def print_best_config(best: OptCombo):
 # ── CSV export ───────────────────────────────────────────────────────────────
 
 def save_results_csv(combos: List[OptCombo], path: Path):
-    """Save all results to CSV, one row per combination."""
+    """Save all results to CSV, one row per combination (+ prof_* columns with --profile)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [f.name for f in dataclasses.fields(OptCombo)]
+    fieldnames = [f.name for f in dataclasses.fields(OptCombo) if f.name != "profile"]
+    prof_cols = list(dict.fromkeys(k for c in combos for k in c.profile))
 
     with open(path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=fieldnames + prof_cols)
         writer.writeheader()
         for c in combos:
-            writer.writerow(dataclasses.asdict(c))
+            row = dataclasses.asdict(c)
+            row.update(row.pop("profile"))
+            writer.writerow(row)
 
     print(f"  Full results saved to: {path}")
 
@@ -842,6 +1025,7 @@ def run_validation(
     cache_dir: str,
     n: int = 5,
     workers: int = None,
+    pool_kwargs: Optional[dict] = None,
 ) -> List[OptCombo]:
     """
     Run the top-N combos against the validation period.
@@ -869,7 +1053,7 @@ def run_validation(
     start_time = time.time()
 
     raw_val = []
-    with mp.Pool(processes=n_workers) as pool:
+    with mp.Pool(processes=n_workers, **(pool_kwargs or {})) as pool:
         for i, result_dict in enumerate(
             pool.imap_unordered(_worker, worker_args), 1
         ):
@@ -927,6 +1111,24 @@ def parse_args():
                    help="Use plain text progress bar instead of rich TUI")
     p.add_argument("--cache-dir", default="backtest/data/cache",
                    help="Path to cached data (default: backtest/data/cache)")
+    p.add_argument("--shared-memory", action="store_true",
+                   help="Load each day once into shared memory; workers attach zero-copy "
+                        "(flat RAM as --workers grows)")
+    p.add_argument("--halving", action="store_true",
+                   help="Successive halving: rank all combos on sampled days, prune the bottom "
+                        "and extend survivors until the top combos run the full period")
+    p.add_argument("--eta", type=int, default=3,
+                   help="Halving rate: keep 1/eta of combos per rung (default: 3)")
+    p.add_argument("--min-days", type=int, default=40,
+                   help="Training days in the first halving rung (default: 40)")
+    p.add_argument("--search", type=int, default=None, metavar="N",
+                   help="TPE search: evaluate N combos proposed from the results so far "
+                        "instead of the full grid (batches of --workers)")
+    p.add_argument("--seed", type=int, default=0,
+                   help="Random seed for --search (default: 0)")
+    p.add_argument("--profile", action="store_true",
+                   help="Time engine phases per combo (prof_* CSV columns) and print "
+                        "the sweep total")
     return p.parse_args()
 
 
@@ -934,6 +1136,8 @@ def parse_args():
 
 def main():
     args = parse_args()
+    if args.search is not None and args.halving:
+        raise SystemExit("--search and --halving are alternative training modes; pick one")
 
     train_start = date.fromisoformat(args.train_start)
     train_end = date.fromisoformat(args.train_end)
@@ -953,6 +1157,8 @@ def main():
     combos_raw = build_grid(grid_def)
     total = len(combos_raw)
     n_workers = args.workers or mp.cpu_count()
+    if args.profile:
+        enable_profiling()   # before any pool starts, so workers inherit it
 
     print(f"\n{'='*60}")
     print(f"  HYDRA PARAMETER OPTIMIZER")
@@ -970,15 +1176,43 @@ def main():
         for c in combos_raw
     ]
 
+    # ── Shared-memory day data (optional) ─────────────────────────────────
+    pool_kwargs: dict = {}
+    store = None
+    if args.shared_memory:
+        store = SharedDayStore()
+        for start, end in [(train_start, train_end)] + (
+                [] if args.no_validate or val_start >= val_end else [(val_start, val_end)]):
+            data_cfg = live_config()
+            data_cfg.start_date, data_cfg.end_date = start, end
+            data_cfg.cache_dir = args.cache_dir
+            store.publish_range(data_cfg)
+        pool_kwargs = {"initializer": attach_shared_days, "initargs": (store.prefix,)}
+        print(f"  Shared memory: {len(store)} days, {store.nbytes / 1e9:.2f} GB\n")
+
     # ── Training phase ────────────────────────────────────────────────────
     use_rich = _RICH_AVAILABLE and not args.no_rich
-    print(f"Running {total} backtests across {n_workers} workers...\n")
+    n_runs = min(args.search, total) if args.search is not None else total
+    print(f"Running {n_runs} backtests across {n_workers} workers"
+          + (f" (TPE search over the {total}-combo grid)" if args.search is not None else "")
+          + "...\n")
     print(f"  (first results arrive in ~20-30s while workers load {len(build_grid(grid_def))//n_workers} combos each)\n")
     t0 = time.time()
 
     raw_results = []
 
-    if use_rich:
+    if args.halving:
+        raw_results = train_halving(
+            combos_raw, train_start, train_end, args.cache_dir, n_workers,
+            keep=max(args.top_n, args.val_n), eta=args.eta, min_days=args.min_days, store=store,
+        )
+    elif args.search is not None:
+        raw_results = train_search(
+            grid_def, train_start, train_end, args.cache_dir, n_workers,
+            budget=args.search, seed=args.seed, store=store,
+        )
+        total = len(raw_results)
+    elif use_rich:
         console = Console()
         # Leaderboard print interval: every 5% or every 60s, whichever comes first
         lb_interval = max(1, total // 20)
@@ -1002,7 +1236,7 @@ def main():
             task = progress.add_task(
                 f"Training ({grid_label})", total=total, rate=0.0
             )
-            with mp.Pool(processes=n_workers) as pool:
+            with mp.Pool(processes=n_workers, **pool_kwargs) as pool:
                 for i, result_dict in enumerate(
                     pool.imap_unordered(_worker, worker_args), 1
                 ):
@@ -1018,7 +1252,7 @@ def main():
                         )
                         last_lb_print = i
     else:
-        with mp.Pool(processes=n_workers) as pool:
+        with mp.Pool(processes=n_workers, **pool_kwargs) as pool:
             for i, result_dict in enumerate(
                 pool.imap_unordered(_worker, worker_args), 1
             ):
@@ -1026,8 +1260,14 @@ def main():
                 _print_progress(i, total, t0, prefix="  Training: ")
 
     elapsed = time.time() - t0
-    print(f"\n  Completed {total} runs in {elapsed:.1f}s "
-          f"({elapsed/total:.2f}s avg/run, {n_workers} workers)\n")
+    mode = "combos (halving)" if args.halving else "combos (search)" if args.search else "runs"
+    print(f"\n  Completed {total} {mode} in {elapsed:.1f}s "
+          f"({elapsed/max(total, 1):.2f}s avg/combo, {n_workers} workers)\n")
+    if args.profile and not args.halving and args.search is None:
+        sweep_prof = Profiler(enabled=True)
+        for r in raw_results:
+            sweep_prof.merge(r.get("_profile", {}))
+        print(f"  Engine profile (all combos, all workers):\n{sweep_prof.report()}\n")
 
     combos = build_opt_combos(raw_results)
     print_training_table(combos, top_n=args.top_n)
@@ -1036,7 +1276,7 @@ def main():
     if not args.no_validate and val_start < val_end:
         run_validation(
             combos, val_start, val_end, args.cache_dir,
-            n=args.val_n, workers=n_workers,
+            n=args.val_n, workers=n_workers, pool_kwargs=pool_kwargs,
         )
         print_validation_comparison(combos, val_count=args.val_n)
 
@@ -1053,6 +1293,9 @@ def main():
 
     save_results_csv(combos, out_path)
 
+    if store is not None:
+        store.close()
+
 
 if __name__ == "__main__":
     main()
@@ -15,24 +15,26 @@ Phase 4: Overfitting validation
 Run: python -m backtest.overnight_pipeline
 """
 import csv
-import multiprocessing as mp
 import os
-import random
 import statistics
 import time
 from copy import deepcopy
 from datetime import date, datetime as dt
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from backtest.config import BacktestConfig, live_config
 from backtest.engine import run_backtest, DayResult
+from backtest.robustness import bootstrap_sharpes
+from backtest.sweep_runner import SweepPoint, SweepRunner
 
 START_DATE = date(2022, 5, 16)
 END_DATE = date(2026, 3, 27)
 N_WORKERS = min(8, os.cpu_count() or 4)
 CONVERGE_THRESHOLD = 0.01
 MAX_PASSES = 5
+RESULT_CACHE_DIR = "backtest/data/result_cache"  # persistent DayResult cache (None = off)
+SHARED_DAY_DATA = True  # publish day data once in shared memory (flat RAM per worker)
 
 LOG_FILE = Path("backtest/results") / f"overnight_pipeline_{dt.now().strftime('%Y%m%d_%H%M%S')}.log"
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -75,19 +77,25 @@ def _metrics(results: List[DayResult]) -> Dict[str, Any]:
     }
 
 
-def _run_one(args: Tuple) -> Tuple:
-    idx, label, cfg = args
-    results = run_backtest(cfg, verbose=False)
-    m = _metrics(results)
-    return (idx, label, m, results)
+# One worker pool for the whole pipeline: workers keep their day caches warm
+# from phase 1 through phase 4 and pick up (combo, day-chunk) tasks as they
+# free up — see backtest/sweep_runner.py.
+_RUNNER: Optional[SweepRunner] = None
 
 
-def _run_one_no_results(args: Tuple) -> Tuple:
-    """Same but don't return raw results (saves memory for large sweeps)."""
-    idx, label, cfg = args
-    results = run_backtest(cfg, verbose=False)
-    m = _metrics(results)
-    return (idx, label, m)
+def _runner() -> SweepRunner:
+    global _RUNNER
+    if _RUNNER is None:
+        _RUNNER = SweepRunner(workers=N_WORKERS, metrics_fn=_metrics,
+                              shared_memory=SHARED_DAY_DATA)
+    return _RUNNER
+
+
+def _run_tasks(tasks: List[Tuple]) -> Iterator[Tuple]:
+    """Run (idx, label, cfg) tasks; yields (idx, label, metrics) as combos complete."""
+    pts = [SweepPoint(label, cfg, key=idx) for idx, label, cfg in tasks]
+    for res in _runner().run(pts):
+        yield (res.key, res.label, res.metrics)
 
 
 def _sweep_param(base_cfg: BacktestConfig, param_name: str,
@@ -100,11 +108,10 @@ def _sweep_param(base_cfg: BacktestConfig, param_name: str,
         setattr(cfg, param_name, val)
         tasks.append((i, f"{param_name}={label_fn(val)}", cfg))
     results = []
-    with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-        for res in pool.imap_unordered(_run_one_no_results, tasks):
-            results.append(res)
-            idx, label, m = res
-            log(f"    {label:45s} Sharpe {m['sharpe']:.3f}  P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}")
+    for res in _run_tasks(tasks):
+        results.append(res)
+        idx, label, m = res
+        log(f"    {label:45s} Sharpe {m['sharpe']:.3f}  P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}")
     results.sort(key=lambda x: x[0])
     best_idx = max(range(len(results)), key=lambda i: results[i][2]["sharpe"])
     return values[best_idx], results[best_idx][2]
@@ -124,12 +131,11 @@ def _sweep_2d(base_cfg: BacktestConfig, param_a: str, values_a: list,
             tasks.append((i, label, cfg)); grid.append((va, vb)); i += 1
     results = []
     total = len(tasks)
-    with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-        for res in pool.imap_unordered(_run_one_no_results, tasks):
-            results.append(res)
-            idx, label, m = res
-            log(f"    [{len(results)}/{total}] {label:55s} Sharpe {m['sharpe']:.3f}  "
-                f"P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}")
+    for res in _run_tasks(tasks):
+        results.append(res)
+        idx, label, m = res
+        log(f"    [{len(results)}/{total}] {label:55s} Sharpe {m['sharpe']:.3f}  "
+            f"P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}")
     results.sort(key=lambda x: x[0])
     best_idx = max(range(len(results)), key=lambda i: results[i][2]["sharpe"])
     best_a, best_b = grid[best_idx]
@@ -213,11 +219,10 @@ def run_convergence_pass(cfg: BacktestConfig, pass_num: int) -> Tuple[BacktestCo
         c = deepcopy(cfg); c.conditional_upday_e6_enabled = True; c.upday_threshold_pct = thr
         tasks.append((i, f"E6=ON thr={thr:.2f}%", c)); vals_map[i] = (True, thr); i += 1
     results = []
-    with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-        for res in pool.imap_unordered(_run_one_no_results, tasks):
-            results.append(res)
-            idx, label, m_r = res
-            log(f"    {label:45s} Sharpe {m_r['sharpe']:.3f}  P&L ${m_r['net_pnl']:+>9,.0f}  MaxDD ${m_r['max_dd']:>7,.0f}")
+    for res in _run_tasks(tasks):
+        results.append(res)
+        idx, label, m_r = res
+        log(f"    {label:45s} Sharpe {m_r['sharpe']:.3f}  P&L ${m_r['net_pnl']:+>9,.0f}  MaxDD ${m_r['max_dd']:>7,.0f}")
     results.sort(key=lambda x: x[0])
     best_idx = max(range(len(results)), key=lambda i_r: results[i_r][2]["sharpe"])
     best_e6, best_thr = vals_map[best_idx]
@@ -247,6 +252,7 @@ def phase1_reconverge() -> BacktestConfig:
     cfg = live_config()
     cfg.start_date = START_DATE; cfg.end_date = END_DATE
     cfg.use_real_greeks = True; cfg.data_resolution = "1min"
+    cfg.result_cache_dir = RESULT_CACHE_DIR  # passes re-test incumbents — reuse their days
 
     prev_sharpe = 0.0
     for pass_num in range(1, MAX_PASSES + 1):
@@ -352,12 +358,11 @@ def phase2_features(base_cfg: BacktestConfig) -> Tuple[str, BacktestConfig, Dict
     # Run all
     tasks = [(i, label, cfg) for i, (label, cfg) in enumerate(configs)]
     all_results = []
-    with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-        for res in pool.imap_unordered(_run_one_no_results, tasks):
-            all_results.append(res)
-            idx, label, m = res
-            log(f"  [{len(all_results)}/{len(tasks)}] {label:35s} Sharpe {m['sharpe']:.3f}  "
-                f"P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}")
+    for res in _run_tasks(tasks):
+        all_results.append(res)
+        idx, label, m = res
+        log(f"  [{len(all_results)}/{len(tasks)}] {label:35s} Sharpe {m['sharpe']:.3f}  "
+            f"P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}")
 
     all_results.sort(key=lambda x: x[0])
     baseline_sharpe = all_results[0][2]["sharpe"]
@@ -411,9 +416,8 @@ def phase3_contracts(base_cfg: BacktestConfig, best_cfg: BacktestConfig,
 
     tasks = [(i, label, cfg) for i, (label, cfg) in enumerate(configs)]
     results = []
-    with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-        for res in pool.imap_unordered(_run_one_no_results, tasks):
-            results.append(res)
+    for res in _run_tasks(tasks):
+        results.append(res)
 
     results.sort(key=lambda x: x[0])
     log(f"  {'Config':<35s}  {'Days':>4s}  {'P&L':>10s}  {'Sharpe':>7s}  {'MaxDD':>8s}  {'Win%':>5s}")
@@ -456,9 +460,8 @@ def phase4_validation(base_cfg: BacktestConfig, best_cfg: BacktestConfig,
         tasks.append((i, f"Best {yr_label}", cfg)); i += 1
 
     results = []
-    with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-        for res in pool.imap_unordered(_run_one_no_results, tasks):
-            results.append(res)
+    for res in _run_tasks(tasks):
+        results.append(res)
     results.sort(key=lambda x: x[0])
 
     log(f"  {'Year':<20s}  {'Baseline Sharpe':>15s}  {'Best Sharpe':>12s}  {'Δ':>7s}  "
@@ -502,9 +505,8 @@ def phase4_validation(base_cfg: BacktestConfig, best_cfg: BacktestConfig,
             tasks.append((j * 2 + 1, f"{label} [OOS]", cfg))
 
         results = []
-        with mp.Pool(N_WORKERS, maxtasksperchild=4) as pool:
-            for res in pool.imap_unordered(_run_one_no_results, tasks):
-                results.append(res)
+        for res in _run_tasks(tasks):
+            results.append(res)
         results.sort(key=lambda x: x[0])
 
         for idx, label, m in results:
@@ -554,21 +556,8 @@ def phase4_validation(base_cfg: BacktestConfig, best_cfg: BacktestConfig,
             log(f"  {label}: Insufficient data ({n} days), skipping bootstrap")
             continue
 
-        random.seed(42)
-        bootstrap_sharpes = []
-        for _ in range(10000):
-            sample = random.choices(daily_pnls, k=n)
-            mean = statistics.mean(sample)
-            std = statistics.stdev(sample) if len(sample) > 1 else 0
-            bs_sharpe = mean / std * (252 ** 0.5) if std > 0 else 0
-            bootstrap_sharpes.append(bs_sharpe)
-
-        bootstrap_sharpes.sort()
-        p5 = bootstrap_sharpes[int(0.05 * len(bootstrap_sharpes))]
-        p25 = bootstrap_sharpes[int(0.25 * len(bootstrap_sharpes))]
-        p50 = bootstrap_sharpes[int(0.50 * len(bootstrap_sharpes))]
-        p75 = bootstrap_sharpes[int(0.75 * len(bootstrap_sharpes))]
-        p95 = bootstrap_sharpes[int(0.95 * len(bootstrap_sharpes))]
+        boot = sorted(bootstrap_sharpes(daily_pnls, n_resamples=10000, seed=42).tolist())
+        p5, p25, p50, p75, p95 = (boot[int(q * len(boot))] for q in (0.05, 0.25, 0.50, 0.75, 0.95))
 
         std = statistics.stdev(daily_pnls)
         actual_sharpe = statistics.mean(daily_pnls) / std * 252**0.5 if std > 0 else 0
@@ -593,17 +582,20 @@ def main():
     log(f"Log: {LOG_FILE}")
     log(f"{'═'*80}")
 
-    # Phase 1: Re-convergence
-    converged_cfg = phase1_reconverge()
+    try:
+        # Phase 1: Re-convergence
+        converged_cfg = phase1_reconverge()
 
-    # Phase 2: New features
-    best_label, best_cfg, best_m = phase2_features(converged_cfg)
+        # Phase 2: New features
+        best_label, best_cfg, best_m = phase2_features(converged_cfg)
 
-    # Phase 3: Contract scaling
-    phase3_contracts(converged_cfg, best_cfg, best_label)
+        # Phase 3: Contract scaling
+        phase3_contracts(converged_cfg, best_cfg, best_label)
 
-    # Phase 4: Overfitting validation
-    phase4_validation(converged_cfg, best_cfg, best_label)
+        # Phase 4: Overfitting validation
+        phase4_validation(converged_cfg, best_cfg, best_label)
+    finally:
+        _runner().close()
 
     # ── Final summary ─────────────────────────────────────────────────
     elapsed = time.time() - pipeline_start
@@ -0,0 +1,211 @@
+"""
+Intraday mark-to-market P&L of a day's entries, shared by the exit passes.
+
+_apply_return_threshold and _apply_range_exit each walked every monitor bar
+and, per bar, re-priced every open side with two quote lookups — O(bars ×
+entries × legs) per pass, with the same close costs recomputed by each.
+
+PnLCurve prices every placed side once per day: one
+ChainLookup.close_cost_series per side gives its close cost at every
+monitor bar.  From those (entries × bars) arrays:
+
+  net()        per-entry net P&L if closed at each bar (entries × bars)
+  portfolio()  summed net P&L and credit of the entries open before each bar
+  mae()/mfe()  per-entry worst / best mark over the bars it was open
+  exit_at()    close every surviving side at a bar (the passes' phase 2)
+
+net() reads outcomes from the entries each time it is called, so a pass
+that closes sides early is reflected in the next pass's curve; the close
+costs themselves depend only on strikes and never change.
+
+Arithmetic mirrors the per-bar loops it replaces operation for operation
+(same order of additions, same commission expression), so exit bars and
+P&L are bit-identical.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .config import BacktestConfig
+    from .engine import ChainLookup, EntryResult
+
+_CLOSED = ("stopped", "early_exit")
+
+
+def _sides(e) -> Tuple[bool, bool]:
+    return e.entry_type in ("full_ic", "call_only"), e.entry_type in ("full_ic", "put_only")
+
+
+class PnLCurve:
+    """Per-bar close costs of a day's placed entries and the P&L derived from them.
+
+    entries:   entries that were placed when the curve was built (file order)
+    times:     monitor bars (ms_of_day)
+    call_cost: close cost of each entry's call spread at each bar (0 if no call side)
+    put_cost:  same for the put spread
+    """
+
+    __slots__ = ("entries", "times", "call_cost", "put_cost", "contracts", "commission_per_leg")
+
+    def __init__(self, entries: List["EntryResult"], times: np.ndarray, call_cost: np.ndarray,
+                 put_cost: np.ndarray, contracts: int, commission_per_leg: float):
+        self.entries = entries
+        self.times = times
+        self.call_cost = call_cost
+        self.put_cost = put_cost
+        self.contracts = contracts
+        self.commission_per_leg = commission_per_leg
+
+    @classmethod
+    def build(cls, entries: Sequence["EntryResult"], lookup: "ChainLookup",
+              monitor_times: Sequence[int], cfg: "BacktestConfig") -> "PnLCurve":
+        placed = [e for e in entries if e.entry_type != "skipped"]
+        times = np.asarray(monitor_times, dtype=np.int64)
+        call_cost = np.zeros((len(placed), len(times)))
+        put_cost = np.zeros((len(placed), len(times)))
+        markup = cfg.broker_spread_markup
+        for i, e in enumerate(placed):
+            call_active, put_active = _sides(e)
+            if call_active:
+                call_cost[i] = lookup.close_cost_series(e.short_call, e.long_call, "C", times, markup)
+            if put_active:
+                put_cost[i] = lookup.close_cost_series(e.short_put, e.long_put, "P", times, markup)
+        return cls(placed, times, call_cost, put_cost, cfg.contracts, cfg.commission_per_leg)
+
+    # ── Marks ──────────────────────────────────────────────────────────────
+
+    def _side_gross(self, credit: float, outcome: str, exit_ms: int, close_cost: float,
+                    cost_row: np.ndarray) -> np.ndarray:
+        """Side P&L per bar: realised once stopped/exited at or before the bar, else marked."""
+        gross = credit - cost_row
+        if outcome in _CLOSED and exit_ms > 0:
+            gross = np.where(self.times >= exit_ms, credit - close_cost, gross)
+        return gross
+
+    def active(self) -> np.ndarray:
+        """(entries × bars) bool: entry still placed and opened before the bar."""
+        out = np.zeros((len(self.entries), len(self.times)), dtype=bool)
+        for i, e in enumerate(self.entries):
+            if e.entry_type != "skipped":
+                out[i] = e.entry_time_ms < self.times
+        return out
+
+    def net(self) -> np.ndarray:
+        """(entries × bars) net P&L if every open side were closed at the bar.
+
+        Closing commission is charged for every side (as the bar's exit
+        would), so the mark includes all four legs' round trip.
+        """
+        out = np.zeros((len(self.entries), len(self.times)))
+        for i, e in enumerate(self.entries):
+            if e.entry_type == "skipped":
+                continue
+            call_active, put_active = _sides(e)
+            legs_placed = (2 if call_active else 0) + (2 if put_active else 0)
+            gross = np.zeros(len(self.times))
+            if call_active:
+                gross = gross + self._side_gross(e.call_credit, e.call_outcome, e.call_exit_ms,
+                                                 e.call_close_cost, self.call_cost[i])
+            if put_active:
+                gross = gross + self._side_gross(e.put_credit, e.put_outcome, e.put_exit_ms,
+                                                 e.put_close_cost, self.put_cost[i])
+            commission = self.commission_per_leg * (legs_placed + legs_placed) * self.contracts
+            out[i] = gross * self.contracts - commission
+        return out
+
+    def credits(self) -> np.ndarray:
+        """Credit collected per entry (dollars × contracts; 0 for skipped)."""
+        out = np.zeros(len(self.entries))
+        for i, e in enumerate(self.entries):
+            if e.entry_type == "skipped":
+                continue
+            call_active, put_active = _sides(e)
+            out[i] = ((e.call_credit if call_active else 0.0)
+                      + (e.put_credit if put_active else 0.0)) * self.contracts
+        return out
+
+    def portfolio(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(net P&L, credit, any entry open) per bar, over entries opened before the bar."""
+        active = self.active()
+        net = self.net()
+        credits = self.credits()
+        total_net = np.zeros(len(self.times))
+        total_credit = np.zeros(len(self.times))
+        # Entry by entry, in entry order: the same sums the per-bar loop made
+        for i in range(len(self.entries)):
+            total_net += np.where(active[i], net[i], 0.0)
+            total_credit += np.where(active[i], credits[i], 0.0)
+        return total_net, total_credit, active.any(axis=0)
+
+    def mae(self) -> np.ndarray:
+        """Per-entry lowest net mark over the bars it was open (NaN if never open)."""
+        return self._extreme(np.min)
+
+    def mfe(self) -> np.ndarray:
+        """Per-entry highest net mark over the bars it was open (NaN if never open)."""
+        return self._extreme(np.max)
+
+    def _extreme(self, fn) -> np.ndarray:
+        active = self.active()
+        net = self.net()
+        out = np.full(len(self.entries), np.nan)
+        for i in range(len(self.entries)):
+            if active[i].any():
+                out[i] = fn(net[i][active[i]])
+        return out
+
+    # ── Exit ───────────────────────────────────────────────────────────────
+
+    def exit_at(self, bar: int, reason: str):
+        """Close every side still open at bar `bar`; skip entries placed at/after it.
+
+        Sides stopped (or exited) at or before the bar keep their outcome.
+        Opening legs are always charged commission; closing legs for
+        stopped and early-exit sides.
+        """
+        exit_ms = int(self.times[bar])
+        contracts = self.contracts
+        for i, e in enumerate(self.entries):
+            if e.entry_type == "skipped":
+                continue
+            call_active, put_active = _sides(e)
+
+            # Entries that would have been placed at or after exit_ms: skip them
+            if e.entry_time_ms >= exit_ms:
+                e.entry_type      = "skipped"
+                e.skip_reason     = reason
+                e.short_call      = e.long_call = e.short_put = e.long_put = 0.0
+                e.call_credit     = e.put_credit  = 0.0
+                e.call_stop       = e.put_stop    = 0.0
+                e.call_outcome    = e.put_outcome = ""
+                e.call_close_cost = e.put_close_cost = 0.0
+                e.gross_pnl = e.commission = e.net_pnl = 0.0
+                continue
+
+            legs_placed = (2 if call_active else 0) + (2 if put_active else 0)
+            gross       = 0.0
+            legs_closed = 0
+
+            if call_active:
+                if not (e.call_outcome in _CLOSED and 0 < e.call_exit_ms <= exit_ms):
+                    e.call_outcome    = "early_exit"
+                    e.call_exit_ms    = exit_ms
+                    e.call_close_cost = float(self.call_cost[i, bar])
+                gross += e.call_credit - e.call_close_cost
+                legs_closed += 2
+
+            if put_active:
+                if not (e.put_outcome in _CLOSED and 0 < e.put_exit_ms <= exit_ms):
+                    e.put_outcome    = "early_exit"
+                    e.put_exit_ms    = exit_ms
+                    e.put_close_cost = float(self.put_cost[i, bar])
+                gross += e.put_credit - e.put_close_cost
+                legs_closed += 2
+
+            commission   = self.commission_per_leg * (legs_placed + legs_closed) * contracts
+            e.gross_pnl  = gross * contracts
+            e.commission = commission
+            e.net_pnl    = e.gross_pnl - commission
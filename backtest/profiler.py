@@ -0,0 +1,222 @@
+"""
+Per-phase timing and counters for the backtest engine.
+
+The engine wraps each of its phases in PROFILER.phase(name):
+
+    load_index     SPX/VIX IndexSeries for the day
+    load_parquet   chain (+ Greeks) parquet / chain-store read
+    build_lookup   ChainLookup over the chain
+    delta_index    DeltaIndex over the Greeks (real-Greeks mode)
+    select         entry gating + strike scan (_select_entry)
+    stops          stop monitoring for every variant (_finish_entry_variants)
+    replacements   _generate_replacements
+    pnl_curve      PnLCurve.build for the exit passes
+    return_exit    _apply_return_threshold
+    range_exit     _apply_range_exit
+    day            one simulate_day / simulate_day_batch call, end to end
+
+Times are inclusive wall-clock seconds (replacements contain their own
+select/stops).  Load phases only appear on day-cache misses.
+
+Disabled (the default), phase() hands back a shared no-op context manager
+and count() returns immediately — no clock reads, nothing recorded.
+
+Enabled, totals are kept per phase and per simulated day.  Sweep workers
+run each task under capture() and ship its snapshot() back to the parent,
+which merge()s them into one per-sweep profile.  enable() also sets
+BACKTEST_PROFILE=1 so spawn-started worker processes come up enabled.
+
+Usage:
+    from backtest.profiler import PROFILER, enable_profiling
+    enable_profiling()
+    run_backtest(cfg)
+    print(PROFILER.report())
+"""
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+ENV_VAR = "BACKTEST_PROFILE"
+
+# Report order; phases not listed here follow alphabetically
+PHASES = ("day", "load_index", "load_parquet", "build_lookup", "delta_index",
+          "select", "stops", "replacements", "pnl_curve", "return_exit", "range_exit")
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof: "Profiler", name: str):
+        self.prof = prof
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.prof.add(self.name, time.perf_counter() - self.t0)
+        return False
+
+
+class Profiler:
+    """Phase timers and counters, in total and per simulated day."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+        self.days: Dict[date, Dict[str, float]] = {}
+        self._day: Optional[Dict[str, float]] = None
+
+    # ── Recording ──────────────────────────────────────────────────────────
+
+    def phase(self, name: str):
+        """Context manager timing one occurrence of `name`."""
+        return _Phase(self, name) if self.enabled else _NULL_PHASE
+
+    def add(self, name: str, seconds: float, calls: int = 1):
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + calls
+        if self._day is not None:
+            self._day[name] = self._day.get(name, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    @contextmanager
+    def day(self, d: date) -> Iterator[None]:
+        """Attribute phases inside the block to day d (and time it as "day")."""
+        if not self.enabled:
+            yield
+            return
+        outer = self._day
+        self._day = self.days.setdefault(d, {})
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add("day", time.perf_counter() - t0)
+            self._day = outer
+
+    # ── Snapshots ──────────────────────────────────────────────────────────
+
+    def snapshot(self, per_day: bool = False) -> dict:
+        """Picklable copy of the totals (and per-day seconds if asked)."""
+        snap = {"seconds": dict(self.seconds), "calls": dict(self.calls),
+                "counts": dict(self.counts)}
+        if per_day:
+            snap["days"] = {d: dict(v) for d, v in self.days.items()}
+        return snap
+
+    def merge(self, snap: dict):
+        """Add a snapshot (e.g. from a worker process) into these totals."""
+        for name, s in snap.get("seconds", {}).items():
+            self.seconds[name] = self.seconds.get(name, 0.0) + s
+        for name, n in snap.get("calls", {}).items():
+            self.calls[name] = self.calls.get(name, 0) + n
+        for name, n in snap.get("counts", {}).items():
+            self.counts[name] = self.counts.get(name, 0) + n
+        for d, phases in snap.get("days", {}).items():
+            mine = self.days.setdefault(d, {})
+            for name, s in phases.items():
+                mine[name] = mine.get(name, 0.0) + s
+
+    @contextmanager
+    def capture(self, per_day: bool = False) -> Iterator[dict]:
+        """Profile just the block: yields a dict filled with its snapshot on exit.
+
+        The block's numbers are still added to the running totals afterwards.
+        Disabled, the dict stays empty.
+        """
+        out: dict = {}
+        if not self.enabled:
+            yield out
+            return
+        saved = (self.seconds, self.calls, self.counts, self.days, self._day)
+        self.reset()
+        try:
+            yield out
+        finally:
+            full = self.snapshot(per_day=True)
+            self.seconds, self.calls, self.counts, self.days, self._day = saved
+            self.merge(full)
+            if not per_day:
+                del full["days"]
+            out.update(full)
+
+    # ── Output ─────────────────────────────────────────────────────────────
+
+    def columns(self, prefix: str = "prof_") -> Dict[str, float]:
+        """Flat {column: value} totals for CSV output."""
+        return snapshot_columns(self.snapshot(), prefix)
+
+    def report(self, slowest_days: int = 5) -> str:
+        """Phase table, counters and the slowest days, as printable text."""
+        if not self.seconds and not self.counts:
+            return "  Profile: nothing recorded"
+        day_s = self.seconds.get("day", 0.0)
+        lines = [f"  {'Phase':<14} {'Total s':>9} {'Calls':>8} {'ms/call':>9} {'% of day':>9}"]
+        for name in _ordered(self.seconds):
+            s, n = self.seconds[name], self.calls.get(name, 0)
+            share = f"{s / day_s:8.1%}" if day_s and name != "day" else " " * 8
+            lines.append(f"  {name:<14} {s:9.2f} {n:8d} {s / n * 1e3 if n else 0:9.2f} {share:>9}")
+        if self.counts:
+            lines.append("  " + "  ".join(f"{k}={v:,}" for k, v in sorted(self.counts.items())))
+        if self.days and slowest_days:
+            worst = sorted(self.days.items(), key=lambda kv: kv[1].get("day", 0.0), reverse=True)
+            lines.append("  Slowest days:")
+            for d, phases in worst[:slowest_days]:
+                parts = ", ".join(f"{k} {phases[k]:.3f}" for k in _ordered(phases) if k != "day")
+                lines.append(f"    {d}  {phases.get('day', 0.0):.3f}s  ({parts})")
+        return "\n".join(lines)
+
+
+def _ordered(names) -> List[str]:
+    known = [p for p in PHASES if p in names]
+    return known + sorted(n for n in names if n not in PHASES)
+
+
+def snapshot_columns(snap: dict, prefix: str = "prof_") -> Dict[str, float]:
+    """Flatten a snapshot: <prefix><phase>_s, <prefix><phase>_calls, <prefix><counter>."""
+    out: Dict[str, float] = {}
+    for name in _ordered(snap.get("seconds", {})):
+        out[f"{prefix}{name}_s"] = round(snap["seconds"][name], 6)
+        out[f"{prefix}{name}_calls"] = snap.get("calls", {}).get(name, 0)
+    for name, n in sorted(snap.get("counts", {}).items()):
+        out[f"{prefix}{name}"] = n
+    return out
+
+
+PROFILER = Profiler(enabled=os.environ.get(ENV_VAR) == "1")
+
+
+def enable_profiling(on: bool = True):
+    """Turn PROFILER on/off here and in worker processes started afterwards."""
+    PROFILER.enabled = on
+    if on:
+        os.environ[ENV_VAR] = "1"
+    else:
+        os.environ.pop(ENV_VAR, None)
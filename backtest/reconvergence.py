@@ -17,23 +17,25 @@ Order per pass (most impactful first):
 Run: python -m backtest.reconvergence
 """
 import csv
-import multiprocessing as mp
 import os
 import statistics
 import time
 from copy import copy
 from datetime import date, datetime as dt
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from backtest.config import BacktestConfig, live_config
-from backtest.engine import run_backtest, DayResult
+from backtest.engine import DayResult
+from backtest.sweep_runner import SweepPoint, SweepRunner
 
 START_DATE = date(2022, 5, 16)
 END_DATE = date(2026, 3, 27)
 N_WORKERS = min(8, os.cpu_count() or 4)
 CONVERGE_THRESHOLD = 0.01  # stop when Sharpe improves less than this between passes
 MAX_PASSES = 5             # safety cap
+RESULT_CACHE_DIR = "backtest/data/result_cache"  # persistent DayResult cache (None = off)
+SHARED_DAY_DATA = True  # publish day data once in shared memory (flat RAM per worker)
 
 
 def _metrics(results: List[DayResult]) -> Dict[str, Any]:
@@ -63,11 +65,24 @@ def _metrics(results: List[DayResult]) -> Dict[str, Any]:
     }
 
 
-def _run_one(args: Tuple) -> Tuple:
-    idx, label, cfg = args
-    results = run_backtest(cfg, verbose=False)
-    m = _metrics(results)
-    return (idx, label, m)
+# Shared worker pool for every round of every pass (warm day caches, chunked
+# work stealing — see backtest/sweep_runner.py).
+_RUNNER: Optional[SweepRunner] = None
+
+
+def _runner() -> SweepRunner:
+    global _RUNNER
+    if _RUNNER is None:
+        _RUNNER = SweepRunner(workers=N_WORKERS, metrics_fn=_metrics,
+                              shared_memory=SHARED_DAY_DATA)
+    return _RUNNER
+
+
+def _run_tasks(tasks: List[Tuple]) -> Iterator[Tuple]:
+    """Run (idx, label, cfg) tasks; yields (idx, label, metrics) as combos complete."""
+    pts = [SweepPoint(label, cfg, key=idx) for idx, label, cfg in tasks]
+    for res in _runner().run(pts):
+        yield (res.key, res.label, res.metrics)
 
 
 def _sweep_param(base_cfg: BacktestConfig, param_name: str,
@@ -83,12 +98,11 @@ def _sweep_param(base_cfg: BacktestConfig, param_name: str,
         tasks.append((i, f"{param_name}={label_fn(val)}", cfg))
 
     results = []
-    with mp.Pool(N_WORKERS) as pool:
-        for res in pool.imap_unordered(_run_one, tasks):
-            results.append(res)
-            idx, label, m = res
-            print(f"    {label:45s} Sharpe {m['sharpe']:.3f}  P&L ${m['net_pnl']:+>9,.0f}  "
-                  f"MaxDD ${m['max_dd']:>7,.0f}", flush=True)
+    for res in _run_tasks(tasks):
+        results.append(res)
+        idx, label, m = res
+        print(f"    {label:45s} Sharpe {m['sharpe']:.3f}  P&L ${m['net_pnl']:+>9,.0f}  "
+              f"MaxDD ${m['max_dd']:>7,.0f}", flush=True)
 
     results.sort(key=lambda x: x[0])
     best_idx = max(range(len(results)), key=lambda i: results[i][2]["sharpe"])
@@ -120,12 +134,11 @@ def _sweep_2d(base_cfg: BacktestConfig, param_a: str, values_a: list,
             i += 1
 
     results = []
-    with mp.Pool(N_WORKERS) as pool:
-        for res in pool.imap_unordered(_run_one, tasks):
-            results.append(res)
-            idx, label, m = res
-            print(f"    [{len(results)}/{len(tasks)}] {label:55s} Sharpe {m['sharpe']:.3f}  "
-                  f"P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}", flush=True)
+    for res in _run_tasks(tasks):
+        results.append(res)
+        idx, label, m = res
+        print(f"    [{len(results)}/{len(tasks)}] {label:55s} Sharpe {m['sharpe']:.3f}  "
+              f"P&L ${m['net_pnl']:+>9,.0f}  MaxDD ${m['max_dd']:>7,.0f}", flush=True)
 
     results.sort(key=lambda x: x[0])
     best_idx = max(range(len(results)), key=lambda i: results[i][2]["sharpe"])
@@ -222,12 +235,11 @@ def run_one_pass(cfg: BacktestConfig, pass_num: int) -> Tuple[BacktestConfig, fl
         tasks.append((i, f"E6=ON thr={thr:.2f}%", c)); vals_map[i] = (True, thr); i += 1
 
     results = []
-    with mp.Pool(N_WORKERS) as pool:
-        for res in pool.imap_unordered(_run_one, tasks):
-            results.append(res)
-            idx, label, m_r = res
-            print(f"    {label:45s} Sharpe {m_r['sharpe']:.3f}  P&L ${m_r['net_pnl']:+>9,.0f}  "
-                  f"MaxDD ${m_r['max_dd']:>7,.0f}", flush=True)
+    for res in _run_tasks(tasks):
+        results.append(res)
+        idx, label, m_r = res
+        print(f"    {label:45s} Sharpe {m_r['sharpe']:.3f}  P&L ${m_r['net_pnl']:+>9,.0f}  "
+              f"MaxDD ${m_r['max_dd']:>7,.0f}", flush=True)
 
     results.sort(key=lambda x: x[0])
     best_idx = max(range(len(results)), key=lambda i_r: results[i_r][2]["sharpe"])
@@ -268,6 +280,7 @@ def main():
     cfg.end_date = END_DATE
     cfg.use_real_greeks = True
     cfg.data_resolution = "1min"
+    cfg.result_cache_dir = RESULT_CACHE_DIR  # passes re-test incumbents — reuse their days
 
     prev_sharpe = 0.0
     all_pass_logs = []
@@ -289,6 +302,7 @@ def main():
 
         prev_sharpe = sharpe
 
+    _runner().close()
     elapsed = time.time() - start_time
 
     # ── Final summary ─────────────────────────────────────────────────
@@ -0,0 +1,223 @@
+"""
+Persistent on-disk cache of simulated days (DayResult) for the backtest engine.
+
+overnight_pipeline.py / reconvergence.py re-run the same (config, day) pairs
+across convergence passes and phases — every pass re-tests the incumbent
+value of each parameter, and the phase 2–4 baselines repeat phase 1's best
+config.  With result caching on, a (config, day) pair is simulated once and
+every later run reads the pickled DayResult back.
+
+Key (content-addressed, SHA-256):
+  - config hash: every BacktestConfig field simulate_day reads (all fields
+    except the date range, the FOMC list, the data path and switches that
+    never change results — see _NOT_HASHED)
+  - the trading date and whether it is an FOMC T+1 day
+  - a fingerprint (path, size, mtime) of each data file the day reads, so a
+    re-downloaded chain invalidates its day
+Store: one SQLite file per ENGINE VERSION — a hash of the engine sources —
+so any edit to backtest/engine.py (or config.py / downloader.py) starts a
+fresh store automatically.  Stale stores are removed by prune_stale().
+
+Usage:
+    cfg.result_cache_dir = "backtest/data/result_cache"   # on the base config
+    results = run_backtest(cfg)                         # reads / fills the cache
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_RESULT_CACHE_DIR = "backtest/data/result_cache"
+
+# Sources whose code determines a DayResult.  Any change → new store.
+_ENGINE_SOURCES = ("engine.py", "config.py", "downloader.py", "chain_store.py", "index_series.py",
+                  "delta_index.py", "pnl_curve.py")
+
+# Config fields simulate_day never reads, or that cannot change its output.
+# The date range only decides WHICH days run (the day is part of the key);
+# fomc_t1_dates is folded into the per-day is_fomc_t1 flag; cache_dir is
+# covered by the data-file fingerprint.
+_NOT_HASHED = frozenset({
+    "start_date", "end_date", "fomc_t1_dates", "theta_host", "cache_dir",
+    "result_cache_dir", "vectorized_stop_monitoring", "strike_band_pruning",
+})
+
+_FLUSH_EVERY = 256
+_MISSING = object()
+
+_engine_version: Optional[str] = None
+
+
+def engine_version() -> str:
+    """Hash of the engine sources (computed once per process)."""
+    global _engine_version
+    if _engine_version is None:
+        h = hashlib.sha256()
+        here = Path(__file__).parent
+        for name in _ENGINE_SOURCES:
+            h.update(name.encode())
+            h.update((here / name).read_bytes())
+        _engine_version = h.hexdigest()[:16]
+    return _engine_version
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(_jsonable(v) for v in value)
+    if isinstance(value, float) and value != value:
+        return "nan"
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def config_hash(cfg) -> str:
+    """Stable hash of the result-relevant fields of a BacktestConfig.
+
+    Uses vars(cfg), so attributes added ad hoc by sweep scripts are hashed
+    too (a field the engine doesn't know about can only split the cache,
+    never merge two different configs).
+    """
+    fields = {k: _jsonable(v) for k, v in vars(cfg).items() if k not in _NOT_HASHED}
+    blob = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def file_fingerprint(paths: Iterable[Path]) -> List[Tuple[str, int, int]]:
+    """(path, size, mtime_ns) per file; (path, -1, -1) for missing files."""
+    out = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+            out.append((str(Path(p).resolve()), st.st_size, st.st_mtime_ns))
+        except OSError:
+            out.append((str(p), -1, -1))
+    return out
+
+
+def day_key(cfg_hash: str, trading_date: date, is_fomc_t1: bool,
+            data_files: Iterable[Path]) -> str:
+    """Cache key of one (config, day) pair."""
+    blob = json.dumps([cfg_hash, trading_date.isoformat(), bool(is_fomc_t1),
+                       file_fingerprint(data_files)], separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed {key: pickled DayResult-or-None} store for one engine version.
+
+    Safe to share between sweep worker processes (WAL mode, busy timeout);
+    each process opens its own connection.  Writes are buffered and written
+    in one transaction by flush() (also every _FLUSH_EVERY puts).
+    """
+
+    def __init__(self, cache_dir, version: Optional[str] = None):
+        self.cache_dir = Path(cache_dir)
+        self.version = version or engine_version()
+        self.path = self.cache_dir / f"day_results_{self.version}.sqlite"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._pending: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            # Never reuse a connection inherited across fork()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS day_results "
+                         "(key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+            self._pending = {}
+        return self._conn
+
+    # ── Lookup / store ─────────────────────────────────────────────────────
+
+    def get(self, key: str, default=_MISSING):
+        """Cached DayResult (or None for a no-data day); `default` on a miss."""
+        with self._lock:
+            blob = self._pending.get(key)
+            if blob is None:
+                row = self._connect().execute(
+                    "SELECT value FROM day_results WHERE key = ?", (key,)).fetchone()
+                blob = row[0] if row else None
+            if blob is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return pickle.loads(blob)
+
+    def contains(self, key: str) -> bool:
+        return self.get(key) is not _MISSING
+
+    def put(self, key: str, day_result) -> None:
+        with self._lock:
+            self._connect()
+            self._pending[key] = pickle.dumps(day_result, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(self._pending) >= _FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending or self._conn is None:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO day_results (key, value) VALUES (?, ?)",
+                list(self._pending.items()))
+        self.writes += len(self._pending)
+        self._pending = {}
+
+    # ── Housekeeping ───────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._connect().execute("SELECT COUNT(*) FROM day_results").fetchone()[0]
+
+    def prune_stale(self) -> List[Path]:
+        """Delete stores written by other engine versions.  Returns removed files."""
+        removed = []
+        for p in self.cache_dir.glob("day_results_*.sqlite*"):
+            if not p.name.startswith(self.path.name):
+                p.unlink(missing_ok=True)
+                removed.append(p)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "version": self.version, "path": str(self.path)}
+
+
+_OPEN: Dict[str, ResultCache] = {}
+
+
+def open_result_cache(cache_dir) -> ResultCache:
+    """Process-wide ResultCache for a directory (one connection per process)."""
+    key = str(Path(cache_dir).resolve())
+    if key not in _OPEN:
+        _OPEN[key] = ResultCache(cache_dir)
+    return _OPEN[key]
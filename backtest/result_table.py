@@ -0,0 +1,231 @@
+"""
+Columnar (struct-of-arrays) form of a backtest's List[DayResult].
+
+A sweep keeps every combo's daily results in memory and ships them from
+worker to parent by pickle.  As dataclasses that is one object, one
+__dict__ and ~15 boxed floats per entry; ResultTable stores the same
+values as one NumPy column per EntryResult field:
+
+    dates      datetime64[D], one per day
+    offsets    int64, n_days + 1 — day i's entries are rows offsets[i]:offsets[i+1]
+    columns    {field: array} — int fields int32, float fields float64,
+               str fields uint16 codes into vocab[field]
+
+Floats stay float64 and ints are ms-of-day sized, so the table round-trips
+losslessly: to_days() rebuilds DayResults equal to the originals, and
+daily_sum() adds each day's entries left to right exactly as the DayResult
+properties do — metrics computed from columns are bit-identical.
+
+Consumers that only iterate still work: a ResultTable is a sequence of
+DayResult (rebuilt on access).  Fast consumers (compute_metrics,
+sweep_metrics, summarize) read the columns directly.
+
+Usage:
+    table = ResultTable.from_days(run_backtest(cfg))
+    daily = table.daily_sum("net_pnl")
+    stops = (table.mask("call_outcome", "stopped") | table.mask("put_outcome", "stopped")).sum()
+    table.to_parquet("combo_017.parquet")
+"""
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .engine import DayResult, EntryResult
+
+_DTYPES = {"int": np.int32, "float": np.float64, "str": np.uint16}
+
+FIELDS = [f.name for f in dataclasses.fields(EntryResult)]
+KINDS: Dict[str, str] = {
+    f.name: f.type if isinstance(f.type, str) else f.type.__name__
+    for f in dataclasses.fields(EntryResult)
+}
+
+
+class ResultTable:
+    """One combo's daily results as columns; a read-only sequence of DayResult."""
+
+    __slots__ = ("dates", "offsets", "columns", "vocab")
+
+    def __init__(self, dates: np.ndarray, offsets: np.ndarray,
+                 columns: Dict[str, np.ndarray], vocab: Dict[str, List[str]]):
+        self.dates = dates
+        self.offsets = offsets
+        self.columns = columns
+        self.vocab = vocab
+
+    # ── Construction ───────────────────────────────────────────────────────
+
+    @classmethod
+    def from_days(cls, days: Sequence[DayResult]) -> "ResultTable":
+        entries = [e for d in days for e in d.entries]
+        n = len(entries)
+        offsets = np.zeros(len(days) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(d.entries) for d in days])
+        columns: Dict[str, np.ndarray] = {}
+        vocab: Dict[str, List[str]] = {}
+        for name in FIELDS:
+            values = (getattr(e, name) for e in entries)
+            if KINDS[name] == "str":
+                codes: Dict[str, int] = {}
+                columns[name] = np.fromiter((codes.setdefault(v, len(codes)) for v in values),
+                                            dtype=np.uint16, count=n)
+                vocab[name] = list(codes)
+            else:
+                columns[name] = np.fromiter(values, dtype=_DTYPES[KINDS[name]], count=n)
+        dates = np.array([d.date for d in days], dtype="datetime64[D]")
+        return cls(dates, offsets, columns, vocab)
+
+    @classmethod
+    def concat(cls, tables: Sequence["ResultTable"]) -> "ResultTable":
+        """Days of every table in order (vocabularies are merged)."""
+        tables = [t for t in tables if len(t)] or list(tables[:1])
+        if not tables:
+            return cls.from_days([])
+        if len(tables) == 1:
+            return tables[0]
+        vocab: Dict[str, List[str]] = {}
+        columns: Dict[str, np.ndarray] = {}
+        for name in FIELDS:
+            if KINDS[name] != "str":
+                columns[name] = np.concatenate([t.columns[name] for t in tables])
+                continue
+            merged: Dict[str, int] = {}
+            parts = []
+            for t in tables:
+                remap = np.array([merged.setdefault(v, len(merged)) for v in t.vocab[name]],
+                                 dtype=np.uint16)
+                parts.append(remap[t.columns[name]] if len(remap) else t.columns[name])
+            columns[name] = np.concatenate(parts)
+            vocab[name] = list(merged)
+        counts = np.concatenate([np.diff(t.offsets) for t in tables])
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        return cls(np.concatenate([t.dates for t in tables]), offsets, columns, vocab)
+
+    def sorted_by_date(self) -> "ResultTable":
+        """Same days in date order (stable, entries keep their order within a day)."""
+        order = np.argsort(self.dates, kind="stable")
+        if np.array_equal(order, np.arange(len(order))):
+            return self
+        starts, counts = self.offsets[:-1][order], np.diff(self.offsets)[order]
+        rows = np.concatenate([np.arange(s, s + c) for s, c in zip(starts, counts)]
+                              or [np.zeros(0, dtype=np.int64)])
+        offsets = np.zeros(len(order) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        columns = {name: col[rows] for name, col in self.columns.items()}
+        return ResultTable(self.dates[order], offsets, columns, dict(self.vocab))
+
+    # ── Sequence of DayResult ──────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __iter__(self) -> Iterator[DayResult]:
+        return iter(self.to_days())
+
+    def __getitem__(self, i: int) -> DayResult:
+        i = range(len(self))[i]
+        return self._days(i, i + 1)[0]
+
+    def to_days(self) -> List[DayResult]:
+        """DayResults equal (field for field) to the ones the table was built from."""
+        return self._days(0, len(self))
+
+    def _days(self, start: int, stop: int) -> List[DayResult]:
+        lo, hi = int(self.offsets[start]), int(self.offsets[stop])
+        values = {}
+        for name, col in self.columns.items():
+            if name in self.vocab:
+                words = self.vocab[name]
+                values[name] = [words[c] for c in col[lo:hi].tolist()]
+            else:
+                values[name] = col[lo:hi].tolist()
+        rows = [EntryResult(**dict(zip(FIELDS, vals)))
+                for vals in zip(*(values[n] for n in FIELDS))]
+        out = []
+        for i in range(start, stop):
+            a, b = int(self.offsets[i]) - lo, int(self.offsets[i + 1]) - lo
+            out.append(DayResult(date=self.dates[i].item(), entries=rows[a:b]))
+        return out
+
+    # ── Columns ────────────────────────────────────────────────────────────
+
+    @property
+    def n_entries(self) -> int:
+        return int(self.offsets[-1])
+
+    @property
+    def nbytes(self) -> int:
+        return (self.dates.nbytes + self.offsets.nbytes
+                + sum(col.nbytes for col in self.columns.values()))
+
+    def mask(self, name: str, value: str) -> np.ndarray:
+        """Per-entry bool: str field `name` equals value."""
+        words = self.vocab[name]
+        if value not in words:
+            return np.zeros(self.n_entries, dtype=bool)
+        return self.columns[name] == words.index(value)
+
+    def daily_sum(self, name: str = "net_pnl") -> np.ndarray:
+        """Per-day sum of a numeric field, added in entry order like DayResult's properties."""
+        col = self.columns[name]
+        counts = np.diff(self.offsets)
+        out = np.zeros(len(self))
+        starts = self.offsets[:-1]
+        # Slot k of every day in turn: each day's running sum sees its
+        # entries left to right, so floats match sum(e.x for e in entries)
+        for k in range(int(counts.max()) if len(counts) else 0):
+            has = counts > k
+            out[has] += col[starts[has] + k]
+        return out
+
+    # ── DataFrame / parquet ────────────────────────────────────────────────
+
+    def to_frame(self, fields: Sequence[str] = FIELDS) -> pd.DataFrame:
+        """One row per entry: date + the given fields (str fields as categoricals)."""
+        data = {"date": np.repeat(self.dates, np.diff(self.offsets))}
+        for name in fields:
+            if name in self.vocab:
+                data[name] = pd.Categorical.from_codes(self.columns[name].astype(np.int32),
+                                                       categories=self.vocab[name])
+            else:
+                data[name] = self.columns[name]
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ResultTable":
+        """Inverse of to_frame() (rows grouped by date, in day order).
+
+        Days without entries have no rows, so they do not survive the trip.
+        """
+        dates = df["date"].to_numpy().astype("datetime64[D]")
+        starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]]) if len(dates) else \
+            np.zeros(0, dtype=np.int64)
+        offsets = np.r_[starts, len(dates)].astype(np.int64)
+        columns: Dict[str, np.ndarray] = {}
+        vocab: Dict[str, List[str]] = {}
+        for name in FIELDS:
+            if KINDS[name] == "str":
+                cat = pd.Categorical(df[name].astype(str))
+                columns[name] = cat.codes.astype(np.uint16)
+                vocab[name] = [str(c) for c in cat.categories]
+            else:
+                columns[name] = df[name].to_numpy(dtype=_DTYPES[KINDS[name]])
+        return cls(dates[starts], offsets, columns, vocab)
+
+    def to_parquet(self, path: Union[str, Path]):
+        self.to_frame().to_parquet(path, index=False)
+
+    @classmethod
+    def read_parquet(cls, path: Union[str, Path]) -> "ResultTable":
+        return cls.from_frame(pd.read_parquet(path))
+
+
+def as_table(results: Union[ResultTable, Sequence[DayResult]]) -> ResultTable:
+    """results as a ResultTable (returned as-is if it already is one)."""
+    return results if isinstance(results, ResultTable) else ResultTable.from_days(results)
@@ -0,0 +1,186 @@
+"""
+Bootstrap and reshuffle robustness statistics for sweep leaderboards.
+
+compute_metrics gives one number per combo (Sharpe, max DD, ...), so
+telling a stable winner from a lucky one meant re-running sweeps on other
+periods.  robustness() instead resamples the daily P&L of every combo at
+once — the combos × days matrix — and reports per combo:
+
+  sharpe_lo / sharpe_hi   bootstrap confidence interval of the Sharpe ratio
+  p_positive              fraction of resamples with Sharpe > 0
+  p_best                  fraction of resamples in which this combo has the
+                          highest Sharpe of all combos (probability of
+                          outperformance; sums to 1 over the leaderboard)
+  p_beats                 fraction of resamples beating a reference combo
+                          (e.g. the live config), if one is given
+  max_dd_p05              5th percentile (worst 5%) of max drawdown over
+                          random reorderings of the same days
+
+Resampling is a circular block bootstrap (blocks of `block` consecutive
+days keep short-range autocorrelation such as volatility clustering).
+Every combo is resampled with the same day draws, so the comparisons are
+paired.  A bootstrap sample only changes how often each day counts, so
+each resample is a row of day multiplicities and every combo's resampled
+Sharpe comes out of two matrix products — no combos × resamples × days
+array.  Drawdown depends on order, so the reshuffle paths are gathered in
+chunks bounded by max_elems.
+
+Usage:
+    dates, matrix = pnl_matrix([(dates_i, daily_i) for each combo])
+    rob = robustness(matrix)
+    rob.rows()[i]     # {"sharpe_lo": ..., "p_best": ..., ...} for combo i
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_BLOCK = 5           # trading days per bootstrap block (~1 week)
+DEFAULT_SHUFFLES = 500
+DEFAULT_CI = 0.90
+DEFAULT_MAX_ELEMS = 20_000_000   # per gathered chunk (~160 MB of float64)
+
+ANNUALIZE = math.sqrt(252)
+
+
+def pnl_matrix(series: Sequence[Tuple[Sequence[date], Sequence[float]]]
+               ) -> Tuple[List[date], np.ndarray]:
+    """(dates, combos × days) from per-combo (dates, daily P&L), aligned on the union of dates.
+
+    A day a combo has no result for counts as 0 P&L (no trade).
+    """
+    all_dates = sorted({d for dates, _ in series for d in dates})
+    col = {d: j for j, d in enumerate(all_dates)}
+    out = np.zeros((len(series), len(all_dates)))
+    for i, (dates, daily) in enumerate(series):
+        out[i, [col[d] for d in dates]] = daily
+    return all_dates, out
+
+
+# ── Statistics along the day axis ──────────────────────────────────────────
+
+def sharpe(x: np.ndarray) -> np.ndarray:
+    """Annualised Sharpe of each row (0 where the stdev is 0)."""
+    x = np.atleast_2d(x)
+    if x.shape[1] < 2:
+        return np.zeros(x.shape[0])
+    std = x.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, x.mean(axis=1) / std * ANNUALIZE, 0.0)
+
+
+def max_drawdown(x: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Largest peak-to-trough fall of the cumulative sum along `axis` (<= 0; peak starts at 0)."""
+    cum = np.cumsum(x, axis=axis)
+    peak = np.maximum(np.maximum.accumulate(cum, axis=axis), 0.0)
+    return np.minimum((cum - peak).min(axis=axis), 0.0)
+
+
+# ── Resampling ─────────────────────────────────────────────────────────────
+
+def block_bootstrap_counts(n_days: int, n_resamples: int, block: int,
+                           rng: np.random.Generator) -> np.ndarray:
+    """(resamples × days) multiplicity of each day in a circular block bootstrap."""
+    block = max(1, min(block, n_days))
+    n_blocks = -(-n_days // block)
+    starts = rng.integers(0, n_days, size=(n_resamples, n_blocks))
+    idx = ((starts[:, :, None] + np.arange(block)) % n_days).reshape(n_resamples, -1)[:, :n_days]
+    flat = (idx + np.arange(n_resamples)[:, None] * n_days).ravel()
+    return np.bincount(flat, minlength=n_resamples * n_days).reshape(n_resamples, n_days).astype(float)
+
+
+def resampled_sharpes(matrix: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """(combos × resamples) Sharpe of every combo under every resample's day counts."""
+    n = matrix.shape[1]
+    if n < 2:
+        return np.zeros((matrix.shape[0], counts.shape[0]))
+    mu = matrix.mean(axis=1, keepdims=True)
+    xc = matrix - mu                      # centred: no cancellation in the variance
+    m = (xc @ counts.T) / n
+    var = ((xc * xc) @ counts.T - n * m * m) / (n - 1)
+    std = np.sqrt(np.maximum(var, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 1e-12 * (np.abs(mu) + 1), (mu + m) / std * ANNUALIZE, 0.0)
+
+
+def bootstrap_sharpes(daily: Sequence[float], n_resamples: int = 10_000, block: int = 1,
+                      seed: int = 42) -> np.ndarray:
+    """Resampled Sharpe ratios of one daily P&L series (block=1: iid bootstrap)."""
+    x = np.asarray(daily, dtype=float)[None, :]
+    counts = block_bootstrap_counts(x.shape[1], n_resamples, block, np.random.default_rng(seed))
+    return resampled_sharpes(x, counts)[0]
+
+
+def shuffled_max_drawdowns(matrix: np.ndarray, n_shuffles: int, rng: np.random.Generator,
+                           max_elems: int = DEFAULT_MAX_ELEMS) -> np.ndarray:
+    """(combos × shuffles) max drawdown with the days in random order (same orders for all)."""
+    n_combos, n_days = matrix.shape
+    out = np.empty((n_combos, n_shuffles))
+    step = max(1, max_elems // max(1, n_combos * n_days))
+    for s in range(0, n_shuffles, step):
+        k = min(step, n_shuffles - s)
+        perms = np.argsort(rng.random((k, n_days)), axis=1)
+        out[:, s:s + k] = max_drawdown(matrix[:, perms], axis=2)
+    return out
+
+
+# ── Report ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class Robustness:
+    sharpe: np.ndarray
+    sharpe_lo: np.ndarray
+    sharpe_hi: np.ndarray
+    p_positive: np.ndarray
+    p_best: np.ndarray
+    max_dd: np.ndarray
+    max_dd_p05: np.ndarray
+    p_beats: Optional[np.ndarray] = None
+
+    def rows(self) -> List[Dict[str, float]]:
+        """One {statistic: value} dict per combo (leaderboard / CSV columns)."""
+        names = ["sharpe_lo", "sharpe_hi", "p_positive", "p_best", "max_dd_p05"]
+        if self.p_beats is not None:
+            names.append("p_beats")
+        cols = {n: getattr(self, n).tolist() for n in names}
+        return [{n: cols[n][i] for n in names} for i in range(len(self.sharpe))]
+
+
+def robustness(matrix: np.ndarray, n_resamples: int = DEFAULT_RESAMPLES,
+               block: int = DEFAULT_BLOCK, n_shuffles: int = DEFAULT_SHUFFLES,
+               ci: float = DEFAULT_CI, reference: Optional[int] = None, seed: int = 42,
+               max_elems: int = DEFAULT_MAX_ELEMS) -> Robustness:
+    """Bootstrap / reshuffle statistics of every row of a combos × days P&L matrix.
+
+    reference: row index of a combo to compare every other against (p_beats).
+    """
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=float))
+    n_combos, n_days = matrix.shape
+    if n_days < 2:
+        nan = np.full(n_combos, np.nan)
+        return Robustness(sharpe(matrix), nan, nan, nan, nan, max_drawdown(matrix), nan,
+                          nan if reference is not None else None)
+
+    rng = np.random.default_rng(seed)
+    counts = block_bootstrap_counts(n_days, n_resamples, block, rng)
+    boot = resampled_sharpes(matrix, counts)
+    tail = (1 - ci) / 2 * 100
+    lo, hi = np.percentile(boot, [tail, 100 - tail], axis=1)
+
+    winners = np.bincount(boot.argmax(axis=0), minlength=n_combos)
+    dd = shuffled_max_drawdowns(matrix, n_shuffles, rng, max_elems) if n_shuffles else None
+    return Robustness(
+        sharpe=sharpe(matrix),
+        sharpe_lo=lo,
+        sharpe_hi=hi,
+        p_positive=(boot > 0).mean(axis=1),
+        p_best=winners / n_resamples,
+        max_dd=max_drawdown(matrix),
+        max_dd_p05=np.percentile(dd, 5, axis=1) if dd is not None else np.full(n_combos, np.nan),
+        p_beats=(boot > boot[reference]).mean(axis=1) if reference is not None else None,
+    )
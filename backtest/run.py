@@ -22,6 +22,9 @@ Usage:
 
     # Save results to CSV:
     python -m backtest.run --output results.csv
+
+    # Time each engine phase (load, strike scan, stops, exit passes) per day:
+    python -m backtest.run --profile
 """
 import argparse
 import sys
@@ -34,6 +37,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from backtest.config import BacktestConfig, live_config
 from backtest.downloader import download_all
 from backtest.engine import run_backtest, summarize, print_stats
+from backtest.profiler import PROFILER, enable_profiling
 
 
 def parse_args():
@@ -46,6 +50,8 @@ def parse_args():
     p.add_argument("--end", default=str(date.today()), help="End date YYYY-MM-DD")
     p.add_argument("--compare", action="store_true", help="Compare preset configs")
     p.add_argument("--output", default="", help="Save entry-level CSV to this path")
+    p.add_argument("--profile", action="store_true",
+                   help="Print per-phase engine timings (total and slowest days)")
 
     # All major parameters
     p.add_argument("--entry-times", nargs="+", default=None,
@@ -202,6 +208,8 @@ def main():
         return
 
     cfg = build_config(args)
+    if args.profile:
+        enable_profiling()
     results = run_backtest(cfg)
 
     if not results:
@@ -209,6 +217,10 @@ def main():
         return
 
     print_stats(results)
+    if args.profile:
+        print("  ── Profile ──────────────────────────────────────────────")
+        print(PROFILER.report())
+        print()
 
     if args.output:
         df = summarize(results)
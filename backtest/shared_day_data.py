@@ -0,0 +1,306 @@
+"""
+Shared-memory day data for multiprocessing sweeps.
+
+backtest.day_cache gives every worker its own copy of each day's chain,
+lookup arrays and index series.  With 1-min data and many workers that is
+N copies of the same multi-GB history, and RAM runs out long before the
+CPUs are busy.
+
+Here the parent loads each day once and copies it into a
+multiprocessing.shared_memory segment: the flat chain / Greeks columns,
+the SPX / VIX IndexSeries arrays, the DeltaIndex and the dense ChainLookup
+arrays, plus a small pickled header that describes the layout.  Workers attach by name and rebuild DataFrames and the
+lookup as zero-copy NumPy views over the segment, so resident memory stays
+flat as the worker count grows.  Workers need no manifest: a segment's name
+is derived from the day-cache key, and a day that was never published just
+falls back to the normal per-process load.
+
+String columns (the "right" column) are stored as categorical codes, so
+they come back with a category dtype — comparisons and masks behave the
+same.  Views are read-only, like everything else in the day cache.
+
+Usage (parent):
+    with SharedDayStore() as store:
+        store.publish_range(cfg)                       # load + publish once
+        with mp.Pool(n, initializer=attach_shared_days,
+                     initargs=(store.prefix,)) as pool:
+            ...
+SweepRunner(shared_memory=True) does both steps itself.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import struct
+import uuid
+from datetime import date
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import BacktestConfig
+from .day_cache import DAY_CACHE, SOURCE_MISS
+from .downloader import get_spxw_trading_days
+from .engine import ChainLookup, DayData, _day_cache_key, _load_day_data, _strike_reach
+from .delta_index import DeltaIndex
+from .index_series import IndexSeries
+
+_ALIGN = 64
+_HEADER = struct.Struct("<Q")       # length of the pickled layout header
+_FRAMES = ("chain_df", "greeks_df")
+_SERIES = ("spx", "vix")
+_LOOKUP = ("strikes", "times", "bid", "ask", "mid", "present")
+
+
+def segment_name(prefix: str, key: Hashable) -> str:
+    """Shared-memory segment name of a day-cache key (short: macOS allows 31 chars)."""
+    return prefix + hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+
+
+# ── Packing ────────────────────────────────────────────────────────────────
+
+def _frame_columns(df: pd.DataFrame, arrays: List[np.ndarray]) -> Dict[str, Any]:
+    """Layout spec of a DataFrame; appends its column arrays to `arrays`."""
+    cols = []
+    for name in df.columns:
+        s = df[name]
+        if isinstance(s.dtype, np.dtype) and s.dtype.kind in "biufmM":
+            cols.append((name, "array", len(arrays)))
+            arrays.append(np.ascontiguousarray(s.to_numpy()))
+        else:
+            cat = pd.Categorical(s)
+            cols.append((name, "cat", len(arrays), list(cat.categories)))
+            arrays.append(np.ascontiguousarray(cat.codes))
+    index = None
+    if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+        index = len(arrays)
+        arrays.append(np.ascontiguousarray(df.index.to_numpy()))
+    return {"columns": cols, "index": index, "length": len(df)}
+
+
+def _layout(day: Optional[DayData]) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+    if day is None:
+        return {"none": True}, []
+    arrays: List[np.ndarray] = []
+    meta: Dict[str, Any] = {"frames": {}, "all_times": list(day.all_times)}
+    for name in _FRAMES:
+        df = getattr(day, name)
+        meta["frames"][name] = None if df is None else _frame_columns(df, arrays)
+    meta["series"] = {}
+    for name in _SERIES:
+        series = getattr(day, name)
+        meta["series"][name] = (len(arrays), len(arrays) + 1)
+        arrays.append(np.ascontiguousarray(series.ms))
+        arrays.append(np.ascontiguousarray(series.price))
+    meta["deltas"] = None
+    if day.deltas is not None:
+        meta["deltas"] = {}
+        for name in DeltaIndex.__slots__:
+            meta["deltas"][name] = len(arrays)
+            arrays.append(np.ascontiguousarray(getattr(day.deltas, name)))
+    meta["lookup"] = {}
+    for name in _LOOKUP:
+        meta["lookup"][name] = len(arrays)
+        arrays.append(np.ascontiguousarray(getattr(day.lookup, name)))
+    return meta, arrays
+
+
+def _pad(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def pack_day(day: Optional[DayData], name: str) -> shared_memory.SharedMemory:
+    """Copy a DayData (or None = no data that day) into a new named segment."""
+    meta, arrays = _layout(day)
+    offsets = []
+    pos = 0
+    for a in arrays:
+        offsets.append((pos, a.dtype.str, a.shape))
+        pos = _pad(pos + a.nbytes)
+    meta["arrays"] = offsets
+    header = pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL)
+    data_start = _pad(_HEADER.size + len(header))
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, data_start + pos))
+    _HEADER.pack_into(shm.buf, 0, len(header))
+    shm.buf[_HEADER.size:_HEADER.size + len(header)] = header
+    for a, (off, _, _) in zip(arrays, offsets):
+        dst = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf, offset=data_start + off)
+        dst[...] = a
+    return shm
+
+
+# ── Unpacking (zero-copy) ──────────────────────────────────────────────────
+
+def _views(shm: shared_memory.SharedMemory, meta: Dict[str, Any], data_start: int) -> List[np.ndarray]:
+    out = []
+    for off, dtype, shape in meta["arrays"]:
+        a = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=data_start + off)
+        a.flags.writeable = False
+        out.append(a)
+    return out
+
+
+def _frame(spec: Dict[str, Any], views: List[np.ndarray]) -> pd.DataFrame:
+    data = {}
+    for col in spec["columns"]:
+        name, kind, i = col[:3]
+        data[name] = views[i] if kind == "array" else pd.Categorical.from_codes(views[i], col[3])
+    index = None if spec["index"] is None else views[spec["index"]]
+    if not data:
+        return pd.DataFrame(index=index if index is not None else pd.RangeIndex(spec["length"]))
+    return pd.DataFrame(data, index=index, copy=False)
+
+
+def unpack_day(shm: shared_memory.SharedMemory) -> Optional[DayData]:
+    """Rebuild the DayData stored in a segment as views over its buffer."""
+    (header_len,) = _HEADER.unpack_from(shm.buf, 0)
+    meta = pickle.loads(bytes(shm.buf[_HEADER.size:_HEADER.size + header_len]))
+    if meta.get("none"):
+        return None
+    views = _views(shm, meta, _pad(_HEADER.size + header_len))
+    frames = {name: (None if spec is None else _frame(spec, views))
+              for name, spec in meta["frames"].items()}
+    series = {name: IndexSeries(views[ms], views[price])
+              for name, (ms, price) in meta["series"].items()}
+    deltas = None
+    if meta["deltas"] is not None:
+        deltas = DeltaIndex(**{name: views[i] for name, i in meta["deltas"].items()})
+    lk = {name: views[i] for name, i in meta["lookup"].items()}
+    lookup = ChainLookup(lk["strikes"], lk["times"], lk["bid"], lk["ask"], lk["mid"], lk["present"])
+    return DayData(lookup=lookup, all_times=meta["all_times"],
+                   deltas=deltas, **frames, **series)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)   # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# ── Day-cache source ───────────────────────────────────────────────────────
+
+class SharedDaySource:
+    """DAY_CACHE source that serves days published under a name prefix.
+
+    Keeps every attached segment open for the life of the process — the
+    DayData views returned point into it.
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._segments: Dict[Hashable, shared_memory.SharedMemory] = {}
+
+    def __call__(self, key: Hashable) -> Any:
+        try:
+            shm = self._segments.get(key) or _attach(segment_name(self.prefix, key))
+        except FileNotFoundError:
+            return SOURCE_MISS
+        self._segments[key] = shm
+        return unpack_day(shm)
+
+    @property
+    def keys(self) -> List[Hashable]:
+        return list(self._segments)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SharedDaySource) and other.prefix == self.prefix
+
+    __hash__ = None
+
+    def close(self):
+        for shm in self._segments.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass  # views still alive; the mapping goes away with the process
+        self._segments.clear()
+
+
+_ATTACHED: Dict[str, SharedDaySource] = {}
+
+
+def attach_shared_days(prefix: str) -> None:
+    """Pool initializer: serve days the parent published under `prefix`."""
+    if prefix not in _ATTACHED:
+        _ATTACHED[prefix] = SharedDaySource(prefix)
+        DAY_CACHE.attach_source(_ATTACHED[prefix])
+
+
+def detach_shared_days(prefix: str) -> None:
+    source = _ATTACHED.pop(prefix, None)
+    if source is not None:
+        DAY_CACHE.detach_source(source, source.keys)   # drop views before closing
+        source.close()
+
+
+# ── Parent-side store ──────────────────────────────────────────────────────
+
+class SharedDayStore:
+    """Owner of the published segments (parent process).
+
+    Segments live until close() (or interpreter exit via the resource
+    tracker).  Publishing is idempotent, so each sweep phase can publish its
+    own date range and only the new days are loaded.
+    """
+
+    def __init__(self, prefix: Optional[str] = None):
+        self.prefix = prefix or f"cdd{os.getpid() % 100000}{uuid.uuid4().hex[:4]}_"
+        self._segments: Dict[Hashable, shared_memory.SharedMemory] = {}
+
+    def __enter__(self) -> "SharedDayStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._segments
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(shm.size for shm in self._segments.values())
+
+    def publish(self, key: Hashable, day: Optional[DayData]) -> None:
+        if key not in self._segments:
+            self._segments[key] = pack_day(day, segment_name(self.prefix, key))
+
+    def publish_range(self, cfg: BacktestConfig, days: Optional[List[date]] = None) -> int:
+        """Load and publish every day of cfg's range (or `days`).  Returns days added.
+
+        The parent itself attaches too, so the days it loaded are not kept
+        twice in its own heap.
+        """
+        cache_dir = Path(cfg.cache_dir)
+        resolution = getattr(cfg, "data_resolution", "5min")
+        use_greeks = getattr(cfg, "use_real_greeks", False)
+        reach = _strike_reach(cfg)
+        if days is None:
+            days = get_spxw_trading_days(cfg.start_date, cfg.end_date, cache_dir, resolution)
+        n = 0
+        for d in days:
+            key = _day_cache_key(d, cache_dir, resolution, use_greeks, reach)
+            if key in self._segments:
+                continue
+            self.publish(key, _load_day_data(d, cache_dir, resolution, use_greeks, reach))
+            n += 1
+        attach_shared_days(self.prefix)
+        return n
+
+    def close(self) -> None:
+        detach_shared_days(self.prefix)
+        for shm in self._segments.values():
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments.clear()
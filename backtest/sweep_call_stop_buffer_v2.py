@@ -14,15 +14,13 @@ Run: python -u -m backtest.sweep_call_stop_buffer_v2 --workers 10
 """
 import argparse
 import csv
-import multiprocessing as mp
 import sys
 import time
 from datetime import date, datetime as dt
-from itertools import product
 from pathlib import Path
 
 from backtest.config import live_config, BacktestConfig
-from backtest.engine import run_backtest
+from backtest.sweep_runner import SweepPoint, SweepRunner, grid
 
 FULL_START = date(2022, 5, 16)
 FULL_END = date(2026, 4, 8)
@@ -90,61 +88,46 @@ def _build_cfg(baseline: dict, combo: dict, call_stop_buf: int) -> BacktestConfi
     return cfg
 
 
-def _worker(args):
-    """Run single backtest. Returns dict or None on error."""
-    call_stop_buf, combo_id, combo = args
-    t0 = time.time()
-
-    try:
-        cfg = _build_cfg(BASE_BASELINE, combo, call_stop_buf)
-        results = run_backtest(cfg, verbose=False)
-        elapsed = time.time() - t0
-
-        if not results:
-            return None
-
-        import pandas as pd
-        import math
-
-        daily_net = [r.net_pnl for r in results]
-        total_net = sum(daily_net)
-        winning_days = sum(1 for x in daily_net if x > 0)
-        win_rate = winning_days / len(daily_net) if daily_net else 0
-
-        all_entries = [e for r in results for e in r.entries]
-        placed = [e for e in all_entries if e.entry_type != "skipped"]
-        stops = sum(1 for e in placed if e.call_outcome == "stopped" or e.put_outcome == "stopped")
-        stop_rate = stops / len(placed) if placed else 0
-
-        if len(daily_net) > 1:
-            arr = pd.Series(daily_net)
-            sharpe = arr.mean() / arr.std() * math.sqrt(252) if arr.std() > 0 else 0
-        else:
-            sharpe = 0
-
-        cumulative = pd.Series(daily_net).cumsum()
-        rolling_max = cumulative.cummax()
-        drawdown = cumulative - rolling_max
-        max_dd = float(drawdown.min())
-        calmar = sharpe * (arr.std() / abs(max_dd)) if max_dd < 0 else 0
-
-        return {
-            "call_stop_buffer": call_stop_buf,
-            "combo_id": combo_id,
-            "sharpe": sharpe,
-            "total_pnl": total_net,
-            "max_dd": max_dd,
-            "calmar": calmar,
-            "win_rate": win_rate,
-            "num_stops": stops,
-            "stop_rate": stop_rate,
-            "days": len(results),
-            "min_call_credit": combo["min_call_credit"],
-            "min_put_credit": combo["min_put_credit"],
-            "elapsed": elapsed,
-        }
-    except Exception as e:
-        return None
+def _metrics(results) -> dict:
+    """Sweep metrics for one combo (computed in the parent from its DayResults)."""
+    import pandas as pd
+    import math
+
+    if not results:
+        return {}
+
+    daily_net = [r.net_pnl for r in results]
+    total_net = sum(daily_net)
+    winning_days = sum(1 for x in daily_net if x > 0)
+    win_rate = winning_days / len(daily_net) if daily_net else 0
+
+    all_entries = [e for r in results for e in r.entries]
+    placed = [e for e in all_entries if e.entry_type != "skipped"]
+    stops = sum(1 for e in placed if e.call_outcome == "stopped" or e.put_outcome == "stopped")
+    stop_rate = stops / len(placed) if placed else 0
+
+    arr = pd.Series(daily_net)
+    if len(daily_net) > 1:
+        sharpe = arr.mean() / arr.std() * math.sqrt(252) if arr.std() > 0 else 0
+    else:
+        sharpe = 0
+
+    cumulative = arr.cumsum()
+    rolling_max = cumulative.cummax()
+    drawdown = cumulative - rolling_max
+    max_dd = float(drawdown.min())
+    calmar = sharpe * (arr.std() / abs(max_dd)) if max_dd < 0 else 0
+
+    return {
+        "sharpe": sharpe,
+        "total_pnl": total_net,
+        "max_dd": max_dd,
+        "calmar": calmar,
+        "win_rate": win_rate,
+        "num_stops": stops,
+        "stop_rate": stop_rate,
+        "days": len(results),
+    }
 
 
 def _write_progress(overall_pct, call_buf, call_pct, completed_overall, total_overall, best_overall):
@@ -180,8 +163,7 @@ if __name__ == "__main__":
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    combos = list(product(CREDIT_GRID["min_call_credit"], CREDIT_GRID["min_put_credit"]))
-    combos = [{"min_call_credit": c[0], "min_put_credit": c[1]} for c in combos]
+    combos = grid(CREDIT_GRID)
     combo_count = len(combos)
 
     total_backtests = len(CALL_STOP_BUFFERS) * combo_count
@@ -206,84 +188,92 @@ if __name__ == "__main__":
     completed_overall = 0
     t_overall_start = time.time()
 
+    # One pool for all buffer values — workers stay warm between them
+    runner = SweepRunner(workers=args.workers, metrics_fn=_metrics)
+
     for buf_idx, call_stop_buf in enumerate(CALL_STOP_BUFFERS):
         print(f"\n[{buf_idx+1}/{len(CALL_STOP_BUFFERS)}] CALL_STOP_BUFFER = ${call_stop_buf/100:.2f}")
         print(f"{'='*90}\n")
 
         buf_best_sharpe = -999
         buf_best_result = None
-        worker_args = [(call_stop_buf, i+1, combo) for i, combo in enumerate(combos)]
         completed_combo = 0
         t_start = time.time()
 
         print(f"Running {combo_count} credit gate combos with {args.workers} workers...\n")
 
-        with mp.Pool(args.workers) as pool:
-            for result in pool.imap_unordered(_worker, worker_args, chunksize=1):
-                if result:
-                    completed_combo += 1
-                    completed_overall += 1
-
-                    with open(RESULTS_CSV, "a", newline="") as f:
-                        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-                        writer.writerow({
-                            "call_stop_buffer": f'${result["call_stop_buffer"]/100:.2f}',
-                            "combo_id": result["combo_id"],
-                            "sharpe": f'{result["sharpe"]:.3f}',
-                            "total_pnl": f'{result["total_pnl"]:.0f}',
-                            "max_dd": f'{result["max_dd"]:.0f}',
-                            "calmar": f'{result["calmar"]:.3f}',
-                            "win_rate": f'{result["win_rate"]:.1%}',
-                            "stop_rate": f'{result["stop_rate"]:.1%}',
-                            "stops": result["num_stops"],
-                            "days": result["days"],
-                            "min_call_credit": f'{result["min_call_credit"]:.2f}',
-                            "min_put_credit": f'{result["min_put_credit"]:.2f}',
-                            "elapsed_sec": f'{result["elapsed"]:.1f}',
-                            "timestamp": dt.now().isoformat(),
-                        })
-
-                    if result["sharpe"] > buf_best_sharpe:
-                        buf_best_sharpe = result["sharpe"]
-                        buf_best_result = result
-
-                    if result["sharpe"] > global_best_sharpe:
-                        global_best_sharpe = result["sharpe"]
-                        global_best_result = result
-
-                    elapsed = time.time() - t_start
-                    rate = completed_combo / elapsed if elapsed > 0 else 0
-                    remaining = (combo_count - completed_combo) / rate if rate > 0 else 0
-                    pct = completed_combo / combo_count
-
-                    bar_width = 35
-                    bar = "█" * int(bar_width * pct) + "░" * (bar_width - int(bar_width * pct))
-
-                    overall_pct = completed_overall / total_backtests
-                    buf_pct = completed_combo / combo_count
-                    best_info = {
-                        "status": "✓ FOUND" if (global_best_sharpe > CURRENT_BEST + 0.01) else ("~ TIED" if abs(global_best_sharpe - CURRENT_BEST) < 0.01 else "✗ WORSE"),
-                        "call_buf": global_best_result["call_stop_buffer"]/100 if global_best_result else 0,
-                        "call": global_best_result["min_call_credit"] if global_best_result else 0,
-                        "put": global_best_result["min_put_credit"] if global_best_result else 0,
-                        "sharpe": global_best_sharpe,
-                        "delta": global_best_sharpe - CURRENT_BEST,
-                        "pnl": global_best_result["total_pnl"] if global_best_result else 0,
-                    }
-                    _write_progress(overall_pct, call_stop_buf, buf_pct, completed_overall, total_backtests, best_info)
-
-                    if completed_combo % 5 == 0 or completed_combo == combo_count:
-                        print(f"  [{bar}] {pct*100:.1f}% | Sharpe {result['sharpe']:.3f} | ETA {remaining/60:.1f}min")
-                        sys.stdout.flush()
-                else:
-                    completed_combo += 1
-                    completed_overall += 1
+        pts = [SweepPoint(label, _build_cfg(BASE_BASELINE, combo, call_stop_buf), key=(i + 1, combo))
+               for i, (label, combo) in enumerate(combos)]
+        for res in runner.run(pts):
+            completed_combo += 1
+            completed_overall += 1
+            if not res.metrics:
+                continue
+            combo_id, combo = res.key
+            result = {**res.metrics, "call_stop_buffer": call_stop_buf, "combo_id": combo_id,
+                      "min_call_credit": combo["min_call_credit"],
+                      "min_put_credit": combo["min_put_credit"],
+                      "elapsed": time.time() - t_start}
+
+            with open(RESULTS_CSV, "a", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writerow({
+                    "call_stop_buffer": f'${result["call_stop_buffer"]/100:.2f}',
+                    "combo_id": result["combo_id"],
+                    "sharpe": f'{result["sharpe"]:.3f}',
+                    "total_pnl": f'{result["total_pnl"]:.0f}',
+                    "max_dd": f'{result["max_dd"]:.0f}',
+                    "calmar": f'{result["calmar"]:.3f}',
+                    "win_rate": f'{result["win_rate"]:.1%}',
+                    "stop_rate": f'{result["stop_rate"]:.1%}',
+                    "stops": result["num_stops"],
+                    "days": result["days"],
+                    "min_call_credit": f'{result["min_call_credit"]:.2f}',
+                    "min_put_credit": f'{result["min_put_credit"]:.2f}',
+                    "elapsed_sec": f'{result["elapsed"]:.1f}',
+                    "timestamp": dt.now().isoformat(),
+                })
+
+            if result["sharpe"] > buf_best_sharpe:
+                buf_best_sharpe = result["sharpe"]
+                buf_best_result = result
+
+            if result["sharpe"] > global_best_sharpe:
+                global_best_sharpe = result["sharpe"]
+                global_best_result = result
+
+            elapsed = time.time() - t_start
+            rate = completed_combo / elapsed if elapsed > 0 else 0
+            remaining = (combo_count - completed_combo) / rate if rate > 0 else 0
+            pct = completed_combo / combo_count
+
+            bar_width = 35
+            bar = "█" * int(bar_width * pct) + "░" * (bar_width - int(bar_width * pct))
+
+            overall_pct = completed_overall / total_backtests
+            buf_pct = completed_combo / combo_count
+            best_info = {
+                "status": "✓ FOUND" if (global_best_sharpe > CURRENT_BEST + 0.01) else ("~ TIED" if abs(global_best_sharpe - CURRENT_BEST) < 0.01 else "✗ WORSE"),
+                "call_buf": global_best_result["call_stop_buffer"]/100 if global_best_result else 0,
+                "call": global_best_result["min_call_credit"] if global_best_result else 0,
+                "put": global_best_result["min_put_credit"] if global_best_result else 0,
+                "sharpe": global_best_sharpe,
+                "delta": global_best_sharpe - CURRENT_BEST,
+                "pnl": global_best_result["total_pnl"] if global_best_result else 0,
+            }
+            _write_progress(overall_pct, call_stop_buf, buf_pct, completed_overall, total_backtests, best_info)
+
+            if completed_combo % 5 == 0 or completed_combo == combo_count:
+                print(f"  [{bar}] {pct*100:.1f}% | Sharpe {result['sharpe']:.3f} | ETA {remaining/60:.1f}min")
+                sys.stdout.flush()
 
         if buf_best_result:
             diff = buf_best_sharpe - CURRENT_BEST
             status = "🟢 BETTER" if diff > 0.01 else ("🔴 WORSE" if diff < -0.01 else "🟡 SIMILAR")
             print(f"\n  {status}: Sharpe {buf_best_sharpe:.3f} (Δ{diff:+.3f}), P&L ${buf_best_result['total_pnl']:+,.0f}\n")
 
+    runner.close()
+
     print(f"\n{'='*90}")
     print(f"✅ CALL STOP BUFFER SWEEP COMPLETE")
     print(f"Total: {completed_overall}/{total_backtests}, Time: {(time.time()-t_overall_start)/60:.1f}min")
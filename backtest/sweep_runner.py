@@ -0,0 +1,491 @@
+"""
+Unified sweep runner — one persistent worker pool for every parameter sweep.
+
+The sweep scripts each used to build their own mp.Pool per phase and
+submit whole combos (every day of the range) as single tasks.  A phase then
+ends with one or two long combos running while the other cores sit idle,
+and every new pool starts with cold day caches.
+
+SweepRunner instead:
+  - splits the work into (combo batch, day chunk) tasks.  Workers pull the
+    next task from the shared queue as soon as they finish one, so the tail
+    of a phase is a few short chunks rather than a few full backtests;
+  - runs each task through run_backtest_batch(), so combos that differ only
+    in exit parameters (stop buffers, decay, slippage, ...) share entry
+    selection within a chunk;
+  - keeps the same worker processes alive across phases (no maxtasksperchild
+    recycling), so each worker's DAY_CACHE stays warm from phase to phase;
+  - reassembles each combo's chunks in date order and reports it through a
+    callback the moment its last chunk lands;
+  - ships results back as one ResultTable (backtest.result_table) per combo
+    and chunk — NumPy columns instead of pickled EntryResult objects — and
+    hands metrics_fn the concatenated table;
+  - with shared_memory=True, publishes every day once into shared memory so
+    workers attach zero-copy instead of each holding its own copy;
+  - with a work queue (queue=path or BACKTEST_WORK_QUEUE), hands the tasks
+    to worker processes on any number of hosts instead of a local pool —
+    see backtest/work_queue.py.
+
+successive_halving() layers an adaptive mode on top: every point runs on a
+small random sample of days, the bottom (1 - 1/eta) by metric are dropped,
+and the survivors are extended to eta× more days, until the last few run on
+the full range.  Each rung only simulates the days the previous rung did not.
+
+Sweep definitions are declarative: grid() expands axes into labelled
+override dicts and points() applies them to a base config.
+
+Usage:
+    from backtest.sweep_runner import SweepRunner, grid, points
+
+    with SweepRunner(workers=8) as runner:
+        pts = points(base_cfg, grid({"call_stop_buffer": [50.0, 75.0, 100.0],
+                                     "put_stop_buffer": [150.0, 200.0]}))
+        for res in runner.run(pts):
+            print(res.label, res.metrics["sharpe"])
+
+        report = successive_halving(runner, pts, keep=20)   # 10k-point grids
+        for res in report.finalists[:10]:
+            print(res.label, res.metrics["sharpe"])
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import multiprocessing as mp
+import os
+import pickle
+import random
+import statistics
+import sys
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from backtest.config import BacktestConfig
+from backtest.downloader import get_spxw_trading_days
+from backtest.engine import DayResult, _group_by_selection, _strike_reach, run_backtest_batch
+from backtest.profiler import PROFILER, Profiler
+from backtest.result_cache import config_hash, engine_version
+from backtest.result_table import ResultTable
+from backtest.shared_day_data import SharedDayStore, attach_shared_days
+from backtest.work_queue import ENV_VAR as QUEUE_ENV_VAR, WorkQueue
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 4)
+DEFAULT_CHUNK_DAYS = 63      # ~one quarter of trading days per task
+DEFAULT_BATCH_SIZE = 8       # max combos evaluated together in one task
+
+
+# ── Declarative grids ──────────────────────────────────────────────────────
+
+def _fmt(value: Any) -> str:
+    if value is None:
+        return "OFF"
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+def grid(axes: Dict[str, Sequence[Any]],
+         fmt: Optional[Dict[str, Callable[[Any], str]]] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """Cartesian product of parameter axes as (label, overrides) pairs.
+
+    Axes are expanded in insertion order (first axis outermost).  `fmt` maps
+    a parameter name to a label formatter, e.g. {"call_stop_buffer":
+    lambda v: f"${v/100:.2f}"}.
+    """
+    fmt = fmt or {}
+    names = list(axes)
+    out = []
+    for values in product(*(axes[n] for n in names)):
+        overrides = dict(zip(names, values))
+        label = " ".join(f"{n}={fmt.get(n, _fmt)(v)}" for n, v in overrides.items())
+        out.append((label, overrides))
+    return out
+
+
+@dataclass
+class SweepPoint:
+    """One config of a sweep.  `key` is echoed back in the SweepResult."""
+    label: str
+    cfg: BacktestConfig
+    key: Any = None
+
+
+def points(base_cfg: BacktestConfig, variants: Sequence[Tuple[str, Dict[str, Any]]],
+           **fixed: Any) -> List[SweepPoint]:
+    """Apply each (label, overrides) variant (plus `fixed` overrides) to a copy of base_cfg."""
+    out = []
+    for label, overrides in variants:
+        cfg = deepcopy(base_cfg)
+        for k, v in {**fixed, **overrides}.items():
+            setattr(cfg, k, v)
+        out.append(SweepPoint(label, cfg, key=overrides))
+    return out
+
+
+# ── Metrics ────────────────────────────────────────────────────────────────
+
+def sweep_metrics(results: Union[ResultTable, List[DayResult]]) -> Dict[str, Any]:
+    """Standard sweep summary of one combo's daily results."""
+    if isinstance(results, ResultTable):
+        daily = results.daily_sum("net_pnl").tolist()
+        placed_mask = ~results.mask("entry_type", "skipped")
+        n_placed = int(placed_mask.sum())
+        stops = int((results.mask("call_outcome", "stopped") & placed_mask).sum()
+                    + (results.mask("put_outcome", "stopped") & placed_mask).sum())
+    else:
+        daily = [r.net_pnl for r in results]
+        placed = [e for r in results for e in r.entries if e.entry_type != "skipped"]
+        n_placed = len(placed)
+        stops = sum((e.call_outcome == "stopped") + (e.put_outcome == "stopped") for e in placed)
+    n = len(daily)
+    if n == 0:
+        return {"days": 0, "net_pnl": 0, "sharpe": 0, "sortino": 0, "calmar": 0,
+                "max_dd": 0, "win_rate": 0, "avg_daily": 0, "entries": 0, "stops": 0}
+    total = sum(daily)
+    mean = statistics.mean(daily)
+    std = statistics.stdev(daily) if n > 1 else 0
+    sharpe = mean / std * math.sqrt(252) if std > 0 else 0
+    neg = [p for p in daily if p < 0]
+    dd_dev = math.sqrt(sum(p ** 2 for p in neg) / n) if neg else 0
+    sortino = mean / dd_dev * math.sqrt(252) if dd_dev > 0 else 0
+    peak = cum = max_dd = 0.0
+    for p in daily:
+        cum += p
+        peak = max(peak, cum)
+        max_dd = min(max_dd, cum - peak)
+    calmar = mean * 252 / abs(max_dd) if max_dd < 0 else 0
+    return {
+        "days": n, "net_pnl": total, "sharpe": sharpe, "sortino": sortino, "calmar": calmar,
+        "max_dd": max_dd, "win_rate": sum(1 for p in daily if p > 0) / n * 100,
+        "avg_daily": mean, "entries": n_placed, "stops": stops,
+    }
+
+
+@dataclass
+class SweepResult:
+    index: int                   # position in the submitted points list
+    label: str
+    key: Any
+    metrics: Dict[str, Any]
+    results: Optional[ResultTable] = field(default=None, repr=False)
+
+
+# ── Worker side ────────────────────────────────────────────────────────────
+
+def _run_task(task: Tuple[int, List[BacktestConfig], Optional[List[date]]]):
+    task_id, cfgs, days = task
+    with PROFILER.capture() as prof:
+        results = run_backtest_batch(cfgs, days=days)
+    return task_id, [ResultTable.from_days(r) for r in results], prof
+
+
+def _task_key(cfgs: Sequence[BacktestConfig], days: Optional[Sequence[date]]) -> str:
+    """Content key of a task: same engine, configs and days → same results."""
+    blob = json.dumps([
+        engine_version(),
+        [[config_hash(c), str(c.start_date), str(c.end_date), str(c.cache_dir),
+          sorted(str(d) for d in getattr(c, "fomc_t1_dates", None) or ())] for c in cfgs],
+        [str(d) for d in days] if days is not None else None,
+    ], separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+# ── Runner ─────────────────────────────────────────────────────────────────
+
+class SweepRunner:
+    """Persistent process pool that evaluates sweep points chunk by chunk.
+
+    workers=1 runs everything in-process (no pool) — handy for debugging and
+    tests.  The pool is created on first use and lives until close().
+
+    metrics_fn gets each point's results as a ResultTable; it is also a
+    sequence of DayResult, so functions written for List[DayResult] work
+    unchanged (the columns are just faster).
+
+    With profiling enabled (backtest.profiler), `profile` accumulates every
+    task's phase timings across all workers and phases.
+
+    queue (a path, or BACKTEST_WORK_QUEUE when None) makes the runner a
+    coordinator: tasks go to the shared work queue and are computed by
+    `python -m backtest.work_queue worker` processes on any host; `workers`
+    and shared_memory then do not apply.  Tasks already finished in the
+    queue (an earlier, crashed run) are not computed again.  `queue_run`
+    labels the tasks in the queue's status output.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_days: int = DEFAULT_CHUNK_DAYS,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 metrics_fn: Callable[[ResultTable], Dict[str, Any]] = sweep_metrics,
+                 shared_memory: Union[bool, SharedDayStore] = False,
+                 queue: Union[None, str, Path, WorkQueue] = None,
+                 queue_run: Optional[str] = None):
+        self.workers = workers or DEFAULT_WORKERS
+        self.chunk_days = max(1, chunk_days)
+        self.batch_size = max(1, batch_size)
+        self.metrics_fn = metrics_fn
+        self.profile = Profiler(enabled=True)
+        self._pool = None
+        queue = queue or os.environ.get(QUEUE_ENV_VAR) or None
+        self._queue = queue if isinstance(queue, WorkQueue) or queue is None else WorkQueue(queue)
+        self.queue_run = queue_run or Path(sys.argv[0]).stem or "sweep"
+        if self._queue is not None:
+            shared_memory = False           # remote workers cannot attach
+        # shared_memory=True: the parent loads each day once into shared
+        # memory and workers attach zero-copy (see shared_day_data.py).
+        # A SharedDayStore is used as-is and left open for its owner.
+        if isinstance(shared_memory, SharedDayStore):
+            self._store, self._owns_store = shared_memory, False
+        else:
+            self._store, self._owns_store = (SharedDayStore() if shared_memory else None), True
+
+    def __enter__(self) -> "SweepRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._store is not None and self._owns_store:
+            self._store.close()
+        if self._queue is not None:
+            self._queue.close()
+
+    def _imap(self, tasks):
+        if self._queue is not None:
+            return self._imap_queue(tasks)
+        if self.workers <= 1:
+            return map(_run_task, tasks)
+        if self._pool is None:
+            if self._store is not None:
+                self._pool = mp.Pool(self.workers, initializer=attach_shared_days,
+                                     initargs=(self._store.prefix,))
+            else:
+                self._pool = mp.Pool(self.workers)
+        return self._pool.imap_unordered(_run_task, tasks, chunksize=1)
+
+    def _imap_queue(self, tasks):
+        """_imap through the work queue: submit every task, yield results as they land."""
+        ids: Dict[str, List[int]] = {}
+        items = []
+        for task in tasks:
+            key = _task_key(task[1], task[2])
+            if key not in ids:
+                items.append((key, pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL)))
+            ids.setdefault(key, []).append(task[0])
+        self._queue.submit(self.queue_run, items)
+        for key, blob in self._queue.wait(list(ids)):
+            results, prof = pickle.loads(blob)
+            for task_id in ids[key]:
+                yield task_id, results, prof
+
+    def _publish(self, pts: Sequence[SweepPoint]) -> None:
+        """Publish every day the points read (new days only) to shared memory.
+
+        One publish per distinct data source, strike reach included: points
+        in different reach buckets load different days (see _strike_reach).
+        """
+        seen = set()
+        for p in pts:
+            c = p.cfg
+            src = (c.start_date, c.end_date, str(c.cache_dir),
+                   getattr(c, "data_resolution", "5min"), getattr(c, "use_real_greeks", False),
+                   _strike_reach(c))
+            if src not in seen:
+                seen.add(src)
+                self._store.publish_range(c)
+
+    # ── Scheduling ────────────────────────────────────────────────────────
+
+    def trading_days(self, pts: Sequence[SweepPoint]) -> List[date]:
+        """Union of the points' trading days, sorted."""
+        days = set()
+        seen = set()
+        for p in pts:
+            c = p.cfg
+            src = (c.start_date, c.end_date, str(c.cache_dir), getattr(c, "data_resolution", "5min"))
+            if src not in seen:
+                seen.add(src)
+                days.update(get_spxw_trading_days(src[0], src[1], Path(src[2]), src[3]))
+        return sorted(days)
+
+    def _day_chunks(self, pts: Sequence[SweepPoint],
+                    days: Optional[Sequence[date]] = None) -> List[Optional[List[date]]]:
+        """Split the points' trading days (or `days`) into chunk_days-sized chunks."""
+        if days is None:
+            days = self.trading_days(pts)
+            if len(days) <= self.chunk_days:
+                return [None]
+        days = sorted(days)
+        return [days[i:i + self.chunk_days] for i in range(0, len(days), self.chunk_days)]
+
+    def _batches(self, pts: Sequence[SweepPoint]) -> List[List[int]]:
+        """Group points that share entry selection, at most batch_size per group."""
+        out = []
+        for group in _group_by_selection([p.cfg for p in pts]):
+            out.extend(group[i:i + self.batch_size] for i in range(0, len(group), self.batch_size))
+        return out
+
+    # ── Public API ────────────────────────────────────────────────────────
+
+    def run(self, pts: Sequence[SweepPoint], keep_results: bool = False,
+            days: Optional[Sequence[date]] = None) -> Iterator[SweepResult]:
+        """Evaluate every point; yields each SweepResult as soon as it completes.
+
+        Completion order is not submission order — use SweepResult.index.
+        `days` restricts the run to those trading days (FOMC handling still
+        follows each config's full range, see run_backtest_batch).
+        """
+        if not pts or (days is not None and not days):
+            return
+        if self._store is not None:
+            self._publish(pts)
+        chunks = self._day_chunks(pts, days)
+        batches = self._batches(pts)
+
+        # Batch-major order: early batches finish early, so results stream
+        # out during the phase instead of all arriving at the end.
+        tasks = []
+        for b, idxs in enumerate(batches):
+            for c, days in enumerate(chunks):
+                tasks.append((b * len(chunks) + c, [pts[i].cfg for i in idxs], days))
+
+        parts: Dict[int, Dict[int, ResultTable]] = {i: {} for i in range(len(pts))}
+        for task_id, batch_results, prof in self._imap(tasks):
+            self.profile.merge(prof)
+            b, c = divmod(task_id, len(chunks))
+            for i, day_results in zip(batches[b], batch_results):
+                parts[i][c] = day_results
+                if len(parts[i]) == len(chunks):
+                    by_chunk = parts.pop(i)
+                    merged = ResultTable.concat([by_chunk[cc] for cc in range(len(chunks))])
+                    p = pts[i]
+                    yield SweepResult(i, p.label, p.key, self.metrics_fn(merged),
+                                      merged if keep_results else None)
+
+    def run_all(self, pts: Sequence[SweepPoint], keep_results: bool = False,
+                on_result: Optional[Callable[[SweepResult], None]] = None,
+                days: Optional[Sequence[date]] = None) -> List[SweepResult]:
+        """run() collected into a list in submission order."""
+        out = []
+        for res in self.run(pts, keep_results=keep_results, days=days):
+            if on_result is not None:
+                on_result(res)
+            out.append(res)
+        out.sort(key=lambda r: r.index)
+        return out
+
+    def best(self, pts: Sequence[SweepPoint], metric: str = "sharpe",
+             on_result: Optional[Callable[[SweepResult], None]] = None) -> SweepResult:
+        """Run pts and return the result with the highest `metric` (first wins ties)."""
+        results = self.run_all(pts, on_result=on_result)
+        return max(results, key=lambda r: (r.metrics[metric], -r.index))
+
+
+# ── Successive halving ─────────────────────────────────────────────────────
+
+@dataclass
+class HalvingReport:
+    finalists: List[SweepResult]   # points that reached the full range, best first
+    results: List[SweepResult]     # every point at the deepest rung it reached (submission order)
+    rungs: List[Tuple[int, int]]   # (days evaluated, points evaluated) per rung
+    day_runs: int                  # point-days simulated
+    full_day_runs: int             # point-days an exhaustive sweep would simulate
+
+    @property
+    def savings(self) -> float:
+        """Fraction of the exhaustive sweep's point-days that were skipped."""
+        return 1 - self.day_runs / self.full_day_runs if self.full_day_runs else 0.0
+
+
+def halving_schedule(n_points: int, n_days: int, eta: int = 3,
+                     min_days: int = 40, keep: int = 20) -> List[int]:
+    """Cumulative day budget per rung; the last rung is always n_days.
+
+    Enough rungs to shrink n_points to `keep` survivors by a factor of eta
+    per rung; each rung has eta× the days of the previous one, but never
+    fewer than min_days.
+    """
+    if n_days <= 0:
+        return []
+    if n_points <= keep or eta < 2:
+        return [n_days]
+    rungs = math.ceil(math.log(n_points / keep) / math.log(eta))
+    out: List[int] = []
+    for k in range(rungs, -1, -1):
+        m = min(n_days, max(min_days, math.ceil(n_days / eta ** k)))
+        if not out or m > out[-1]:
+            out.append(m)
+    return out
+
+
+def successive_halving(runner: SweepRunner, pts: Sequence[SweepPoint],
+                       metric: str = "sharpe", tiebreak: str = "net_pnl",
+                       eta: int = 3, min_days: int = 40, keep: int = 20,
+                       seed: int = 0, keep_results: bool = False,
+                       on_rung: Optional[Callable[[int, int, int], None]] = None) -> HalvingReport:
+    """Rank pts adaptively instead of running every point on every day.
+
+    Rung k evaluates the surviving points on the first schedule[k] days of
+    one seeded random permutation of the trading days (so samples are
+    nested and span the whole range), ranks them by (metric, tiebreak) via
+    runner.metrics_fn, and keeps the top max(keep, ceil(n / eta)).  Survivors
+    carry their per-day results forward, so every (point, day) pair is
+    simulated at most once and finalists' metrics are exactly those of a
+    full-range run.  Use keep >= the top-N you care about: a point is only
+    lost if it ranks outside the top 1/eta on a sample of days.
+
+    on_rung(rung, days, points) is called as each rung starts.
+    """
+    all_days = runner.trading_days(pts)
+    order = list(all_days)
+    random.Random(seed).shuffle(order)
+    schedule = halving_schedule(len(pts), len(all_days), eta, min_days, keep)
+
+    def rank(i: int, res: SweepResult) -> tuple:
+        return (res.metrics.get(metric, 0), res.metrics.get(tiebreak, 0), -i)
+
+    alive = list(range(len(pts)))
+    partial: Dict[int, ResultTable] = {i: ResultTable.from_days([]) for i in alive}
+    latest: Dict[int, SweepResult] = {}
+    rungs: List[Tuple[int, int]] = []
+    day_runs = done = 0
+    for k, n_days in enumerate(schedule):
+        final = k == len(schedule) - 1
+        if on_rung is not None:
+            on_rung(k, n_days, len(alive))
+        new_days = order[done:n_days]
+        sub = [pts[i] for i in alive]
+        for res in runner.run(sub, keep_results=True, days=new_days):
+            i = alive[res.index]
+            merged = ResultTable.concat([partial[i], res.results]).sorted_by_date()
+            partial[i] = merged
+            latest[i] = SweepResult(i, res.label, res.key, runner.metrics_fn(merged),
+                                    merged if (final and keep_results) else None)
+        day_runs += len(new_days) * len(alive)
+        rungs.append((n_days, len(alive)))
+        done = n_days
+        if final:
+            break
+        ranked = sorted(alive, key=lambda i: rank(i, latest[i]), reverse=True)
+        n_keep = max(keep, math.ceil(len(alive) / eta))
+        for i in ranked[n_keep:]:
+            del partial[i]          # pruned: drop its day results
+        alive = sorted(ranked[:n_keep])
+
+    finalists = sorted((latest[i] for i in alive), key=lambda r: rank(r.index, r), reverse=True)
+    return HalvingReport(
+        finalists=finalists,
+        results=[latest[i] for i in sorted(latest)],
+        rungs=rungs,
+        day_runs=day_runs,
+        full_day_runs=len(pts) * len(all_days),
+    )
@@ -0,0 +1,145 @@
+"""Synthetic ThetaData-shaped cache for engine tests and benchmarks.
+
+Writes the same parquet layout backtest.downloader produces (options/,
+options_1min/, greeks/, index/) from a seeded random walk, so the engine
+tests and backtest.benchmark run without a real ThetaData cache.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+RTH_START_MS = 34_200_000
+RTH_END_MS = 57_600_000
+
+_RES_STEP_MS = {"5min": 300_000, "1min": 60_000, "5sec": 5_000}
+_OPT_DIRS = {"5min": "options", "1min": "options_1min", "5sec": "options_5sec"}
+_GRK_DIRS = {"5min": "greeks", "1min": "greeks_1min", "5sec": "greeks_1min"}
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    # Abramowitz-Stegun 7.1.26 — plenty for synthetic quotes
+    sign = np.sign(x)
+    z = np.abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741
+                + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + sign * erf)
+
+
+def trading_days(start: date, n: int) -> List[date]:
+    days, d = [], start
+    while len(days) < n:
+        if d.weekday() < 5:
+            days.append(d)
+        d += timedelta(days=1)
+    return days
+
+
+def synthetic_index_day(d: date, seed: int, spx0: float = 5000.0, vix0: float = 16.0) -> Dict[str, np.ndarray]:
+    """1-min SPX/VIX random walk for one RTH session."""
+    rng = np.random.default_rng(seed)
+    ms = np.arange(RTH_START_MS, RTH_END_MS + 1, 60_000, dtype=np.int64)
+    vix = max(10.0, vix0 + rng.normal(0, 3))
+    step_sd = spx0 * vix / 100 / math.sqrt(252 * 390) * rng.uniform(0.5, 1.4)
+    drift = rng.normal(0, step_sd * 0.03)
+    spx = spx0 + np.cumsum(rng.normal(drift, step_sd, len(ms)))
+    vix_path = np.clip(vix + np.cumsum(rng.normal(0, 0.05, len(ms))), 9.0, 80.0)
+    return {"ms": ms, "spx": np.round(spx, 2), "vix": np.round(vix_path, 2)}
+
+
+def synthetic_chain_day(index: Dict[str, np.ndarray], resolution: str = "5min",
+                        half_width: int = 400, seed: int = 0) -> pd.DataFrame:
+    """Quote chain (strike, right, ms_of_day, bid, ask, mid) priced off the index path."""
+    rng = np.random.default_rng(seed)
+    step = _RES_STEP_MS[resolution]
+    times = np.arange(RTH_START_MS, RTH_END_MS + 1, step, dtype=np.int64)
+    spx_t = np.interp(times, index["ms"], index["spx"])
+    vix_t = np.interp(times, index["ms"], index["vix"])
+    center = round(index["spx"][0] / 5) * 5
+    strikes = np.arange(center - half_width, center + half_width + 5, 5, dtype=np.float64)
+
+    T = np.maximum((RTH_END_MS - times) / (365 * 24 * 3600 * 1000), 1e-7)[:, None]
+    S = spx_t[:, None]
+    K = strikes[None, :]
+    sig = (vix_t / 100)[:, None] * (1 + 0.6 * np.abs(K - S) / S * 10)  # crude skew
+    d1 = (np.log(S / K) + 0.5 * sig ** 2 * T) / (sig * np.sqrt(T))
+    d2 = d1 - sig * np.sqrt(T)
+    call = S * _norm_cdf(d1) - K * _norm_cdf(d2)
+    put = call - S + K
+
+    frames = []
+    for right, px in (("C", call), ("P", put)):
+        px = np.maximum(px, 0.0)
+        half = np.maximum(0.05, px * 0.03) * rng.uniform(0.8, 1.2, px.shape)
+        bid = np.floor(np.maximum(px - half, 0.0) * 20) / 20
+        ask = np.ceil((px + half) * 20) / 20
+        ask = np.where(px < 0.03, np.where(rng.random(px.shape) < 0.5, 0.05, 0.0), ask)
+        bid = np.where(ask == 0, 0.0, bid)
+        mid = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, 0.0)
+        tt, kk = np.meshgrid(times, strikes, indexing="ij")
+        frames.append(pd.DataFrame({
+            "strike": kk.ravel(), "right": right, "ms_of_day": tt.ravel(),
+            "bid": bid.ravel(), "ask": ask.ravel(), "mid": mid.ravel(),
+        }))
+    df = pd.concat(frames, ignore_index=True)
+    # Real chains are gappy: drop a few quotes at random
+    df = df[rng.random(len(df)) > 0.01]
+    return df.astype({"strike": "float32", "ms_of_day": "int32",
+                      "bid": "float32", "ask": "float32", "mid": "float32"}).reset_index(drop=True)
+
+
+def synthetic_greeks_day(chain_df: pd.DataFrame, index: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Delta per quote row, computed from the same index path."""
+    g = chain_df[chain_df["ms_of_day"] % 60_000 == 0][["strike", "right", "ms_of_day"]].copy()
+    spx = np.interp(g["ms_of_day"].to_numpy(), index["ms"], index["spx"])
+    vix = np.interp(g["ms_of_day"].to_numpy(), index["ms"], index["vix"]) / 100
+    T = np.maximum((RTH_END_MS - g["ms_of_day"].to_numpy()) / (365 * 24 * 3600 * 1000), 1e-7)
+    K = g["strike"].to_numpy(dtype=np.float64)
+    d1 = (np.log(spx / K) + 0.5 * vix ** 2 * T) / (vix * np.sqrt(T))
+    delta = _norm_cdf(d1)
+    delta = np.where(g["right"].to_numpy() == "C", delta, delta - 1.0)
+    g["delta"] = delta.astype("float32")
+    g["implied_vol"] = vix.astype("float32")
+    return g.reset_index(drop=True)
+
+
+def write_synthetic_cache(cache_dir: Path, days: List[date], resolution: str = "5min",
+                          with_greeks: bool = True, seed: int = 7, half_width: int = 400) -> Path:
+    """Write chain, Greeks and monthly SPX/VIX parquet files for `days`."""
+    cache_dir = Path(cache_dir)
+    opts = cache_dir / _OPT_DIRS[resolution]
+    grks = cache_dir / _GRK_DIRS[resolution]
+    idx_dir = cache_dir / "index"
+    for p in (opts, grks, idx_dir):
+        p.mkdir(parents=True, exist_ok=True)
+
+    months: Dict[tuple, Dict[str, list]] = {}
+    spx0 = 5000.0
+    for i, d in enumerate(days):
+        index = synthetic_index_day(d, seed * 1000 + i, spx0=spx0)
+        spx0 = float(index["spx"][-1])
+        chain = synthetic_chain_day(index, resolution, half_width=half_width, seed=seed * 1000 + i)
+        chain.to_parquet(opts / f"SPXW_{d:%Y%m%d}.parquet", index=False)
+        if with_greeks:
+            synthetic_greeks_day(chain, index).to_parquet(
+                grks / f"SPXW_{d:%Y%m%d}_greeks.parquet", index=False)
+        m = months.setdefault((d.year, d.month), {"SPX": [], "VIX": []})
+        for sym, key in (("SPX", "spx"), ("VIX", "vix")):
+            m[sym].append(pd.DataFrame({
+                "ms_of_day": index["ms"].astype(int), "price": index[key],
+                "date": pd.Timestamp(d),
+            }))
+
+    for (y, mo), syms in months.items():
+        for sym, frames in syms.items():
+            pd.concat(frames, ignore_index=True).to_parquet(
+                idx_dir / f"{sym}_{y}{mo:02d}.parquet", index=False)
+    return cache_dir
@@ -0,0 +1,165 @@
+"""
+Tree-structured Parzen Estimator (TPE) search over a discrete parameter grid.
+
+optimize.py's grids are Cartesian products of a handful of values per
+parameter; evaluating all of them is what pushed us into hand-run "fine",
+"ultra" and "final" follow-up sweeps.  TPESampler instead proposes combos
+in batches from the results so far:
+
+  1. the first n_startup combos are drawn uniformly from the grid;
+  2. after that, evaluated combos are split into the best `gamma` fraction
+     ("good") and the rest ("bad").  Per parameter, a smoothed histogram of
+     the values in each group gives l(value) and g(value);
+  3. candidates are sampled from l, and the one maximising
+     Σ log l(v) − log g(v) over its parameters (not yet evaluated or
+     pending) is proposed.  Each batch slot draws its own candidates, so
+     a batch spreads out instead of repeating the same argmax.
+
+Parameters whose values are all numbers are ordinal: a value's density
+also counts good/bad observations at neighbouring grid positions (Gaussian
+kernel over the index distance), so "near the best threshold" gets credit.
+Everything else (bools, None-or-number switches, names) is categorical.
+Parameters with a single value are passed through unchanged.
+
+Every combo is proposed at most once; asking past the grid size returns
+fewer combos, so a search with budget >= grid size is an exhaustive sweep.
+
+Usage:
+    sampler = TPESampler(FULL_GRID, seed=0)
+    while len(done) < budget:
+        for params in sampler.ask(8):
+            sampler.tell(params, (sharpe, net_pnl))     # any comparable score
+    sampler.best()
+"""
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_GAMMA = 0.15
+DEFAULT_CANDIDATES = 24
+_PRIOR = 1.0              # pseudo-count per value in both densities
+_BANDWIDTH = 1.0          # ordinal kernel width, in grid steps
+_RANDOM_TRIES = 256       # rejection-sampling attempts before enumerating the rest
+
+Index = Tuple[int, ...]
+
+
+def _is_ordinal(values: Sequence[Any]) -> bool:
+    return all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+
+
+def _position(values: Sequence[Any], value: Any) -> int:
+    # list.index would match True to 1 and 0 to False
+    for i, v in enumerate(values):
+        if v is value or (type(v) is type(value) and v == value):
+            return i
+    raise ValueError(f"{value!r} is not one of {values!r}")
+
+
+class TPESampler:
+    """Batched TPE proposals over {param: [values]}; see the module docstring."""
+
+    def __init__(self, axes: Dict[str, Sequence[Any]], gamma: float = DEFAULT_GAMMA,
+                 n_startup: int = 10, n_candidates: int = DEFAULT_CANDIDATES, seed: int = 0):
+        self.names = [k for k, v in axes.items() if len(v) > 1]
+        self.values = [list(axes[k]) for k in self.names]
+        self.fixed = {k: v[0] for k, v in axes.items() if len(v) == 1}
+        self.ordinal = [_is_ordinal(v) for v in self.values]
+        self.gamma = gamma
+        self.n_startup = n_startup
+        self.n_candidates = n_candidates
+        self.rng = random.Random(seed)
+        self.observed: List[Tuple[Index, Any]] = []
+        self._seen: set = set()          # evaluated or pending
+
+    @property
+    def size(self) -> int:
+        """Number of distinct combos in the grid."""
+        return math.prod(len(v) for v in self.values)
+
+    # ── Index <-> params ───────────────────────────────────────────────────
+
+    def params(self, idx: Index) -> Dict[str, Any]:
+        return {**self.fixed, **{k: vals[i] for k, vals, i in zip(self.names, self.values, idx)}}
+
+    def index(self, params: Dict[str, Any]) -> Index:
+        return tuple(_position(vals, params[k]) for k, vals in zip(self.names, self.values))
+
+    # ── Ask / tell ─────────────────────────────────────────────────────────
+
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        """Up to n new combos to evaluate (fewer once the grid runs out)."""
+        out = []
+        for _ in range(n):
+            if len(self._seen) >= self.size:
+                break
+            idx = None
+            if len(self.observed) >= self.n_startup:
+                idx = self._propose()
+            if idx is None:
+                idx = self._random_unseen()
+            self._seen.add(idx)
+            out.append(self.params(idx))
+        return out
+
+    def tell(self, params: Dict[str, Any], score: Any):
+        """Record a combo's score (higher is better; any mutually comparable values)."""
+        idx = self.index(params)
+        self._seen.add(idx)
+        self.observed.append((idx, score))
+
+    def best(self) -> Optional[Tuple[Dict[str, Any], Any]]:
+        if not self.observed:
+            return None
+        idx, score = max(self.observed, key=lambda o: o[1])
+        return self.params(idx), score
+
+    # ── Model ──────────────────────────────────────────────────────────────
+
+    def _densities(self, group: List[Index]) -> List[List[float]]:
+        """Per parameter, smoothed probability of each value within `group`."""
+        out = []
+        for a, vals in enumerate(self.values):
+            w = [_PRIOR] * len(vals)
+            for idx in group:
+                if self.ordinal[a]:
+                    for j in range(len(vals)):
+                        w[j] += math.exp(-0.5 * ((j - idx[a]) / _BANDWIDTH) ** 2)
+                else:
+                    w[idx[a]] += 1.0
+            total = sum(w)
+            out.append([x / total for x in w])
+        return out
+
+    def _propose(self) -> Optional[Index]:
+        ranked = sorted(self.observed, key=lambda o: o[1], reverse=True)
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = self._densities([idx for idx, _ in ranked[:n_good]])
+        bad = self._densities([idx for idx, _ in ranked[n_good:]])
+        ratio = [[math.log(lp) - math.log(gp) for lp, gp in zip(l, g)]
+                 for l, g in zip(good, bad)]
+        choices = [range(len(v)) for v in self.values]
+
+        best, best_score = None, -math.inf
+        for _ in range(self.n_candidates):
+            idx = tuple(self.rng.choices(choices[a], weights=good[a])[0]
+                        for a in range(len(self.values)))
+            if idx in self._seen:
+                continue
+            score = sum(ratio[a][i] for a, i in enumerate(idx))
+            if score > best_score:
+                best, best_score = idx, score
+        return best
+
+    def _random_unseen(self) -> Index:
+        for _ in range(_RANDOM_TRIES):
+            idx = tuple(self.rng.randrange(len(v)) for v in self.values)
+            if idx not in self._seen:
+                return idx
+        # Mostly explored: pick uniformly among what is left
+        rest = [idx for idx in itertools.product(*(range(len(v)) for v in self.values))
+                if idx not in self._seen]
+        return self.rng.choice(rest)
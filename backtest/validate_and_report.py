@@ -9,7 +9,6 @@ Run: python -m backtest.validate_and_report
 import csv
 import math
 import os
-import random
 import statistics
 from collections import defaultdict
 from copy import deepcopy
@@ -19,6 +18,7 @@ from typing import Any, Dict, List, Optional
 
 from backtest.config import live_config
 from backtest.engine import run_backtest, DayResult
+from backtest.robustness import bootstrap_sharpes
 
 START_DATE = date(2022, 5, 16)
 END_DATE = date(2026, 4, 4)
@@ -178,22 +178,8 @@ def phase1_validate(results: List[DayResult]) -> bool:
 
     # ── 1D: Bootstrap confidence intervals ────────────────────────────
     print(f"\n── 1D: Bootstrap Confidence Intervals (10,000 resamples) ──")
-    random.seed(42)
-    n = len(daily_pnls)
-    bootstrap_sharpes = []
-    for _ in range(10000):
-        sample = random.choices(daily_pnls, k=n)
-        s_mean = statistics.mean(sample)
-        s_std = statistics.stdev(sample) if len(sample) > 1 else 0
-        bs = s_mean / s_std * math.sqrt(252) if s_std > 0 else 0
-        bootstrap_sharpes.append(bs)
-
-    bootstrap_sharpes.sort()
-    p5 = bootstrap_sharpes[int(0.05 * len(bootstrap_sharpes))]
-    p25 = bootstrap_sharpes[int(0.25 * len(bootstrap_sharpes))]
-    p50 = bootstrap_sharpes[int(0.50 * len(bootstrap_sharpes))]
-    p75 = bootstrap_sharpes[int(0.75 * len(bootstrap_sharpes))]
-    p95 = bootstrap_sharpes[int(0.95 * len(bootstrap_sharpes))]
+    boot = sorted(bootstrap_sharpes(daily_pnls, n_resamples=10000, seed=42).tolist())
+    p5, p25, p50, p75, p95 = (boot[int(q * len(boot))] for q in (0.05, 0.25, 0.50, 0.75, 0.95))
 
     print(f"  Actual Sharpe: {m['sharpe']:.3f}")
     print(f"  Bootstrap:  5th={p5:.3f}  25th={p25:.3f}  50th={p50:.3f}  "
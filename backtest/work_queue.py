@@ -0,0 +1,428 @@
+"""
+Shared SQLite work queue — run one sweep on any number of hosts.
+
+SweepRunner normally feeds its (combo batch, day chunk) tasks to a local
+process pool.  Given a queue (SweepRunner(queue=path), or
+BACKTEST_WORK_QUEUE=path in the environment) it becomes a coordinator
+instead: it writes every task into an SQLite file on shared disk and waits
+for the results, which any number of worker hosts pull and compute:
+
+    # on every host (repo checked out, same cache_dir path, same code)
+    python -m backtest.work_queue worker --db /mnt/sweeps/queue.sqlite --procs 8
+
+    # on one host
+    BACKTEST_WORK_QUEUE=/mnt/sweeps/queue.sqlite python -m backtest.overnight_pipeline
+
+    python -m backtest.work_queue status --db /mnt/sweeps/queue.sqlite
+
+Tasks are content-addressed: the key is a hash of the engine version, the
+configs and the days (see sweep_runner._task_key).  A finished task's
+result stays in the file, so a coordinator restarted after a crash
+resubmits the same keys and only waits for the ones not yet done.
+
+Liveness is lease-based.  A worker heartbeats its running task every
+lease/4 seconds; a task whose heartbeat is older than the lease (the
+worker was killed, its host rebooted, ...) goes back to pending and the
+next claim picks it up.  A task that raises is retried up to max_attempts
+times, then marked failed and the coordinator raises with its traceback.
+Expired leases count as attempts too: a task that keeps killing its worker
+(out of memory, say) is marked failed once it has used them all.
+Results are deterministic, so a task finished twice (a slow worker whose
+lease expired) keeps whichever result landed first.
+
+The file uses SQLite's rollback journal, not WAL: WAL needs shared memory
+between the processes, which network file systems cannot provide.  The
+shared disk must support POSIX file locks.
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import pickle
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Allow running from repo root (workers import backtest.sweep_runner)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ENV_VAR = "BACKTEST_WORK_QUEUE"
+
+DEFAULT_LEASE = 120.0        # seconds without a heartbeat before a task is re-queued
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_POLL = 1.0
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key       TEXT PRIMARY KEY,
+    run       TEXT NOT NULL,
+    payload   BLOB NOT NULL,
+    state     TEXT NOT NULL,
+    worker    TEXT,
+    attempts  INTEGER NOT NULL DEFAULT 0,
+    submitted REAL,
+    claimed   REAL,
+    heartbeat REAL,
+    finished  REAL,
+    result    BLOB,
+    error     TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state);
+CREATE TABLE IF NOT EXISTS workers (
+    worker    TEXT PRIMARY KEY,
+    host      TEXT,
+    pid       INTEGER,
+    started   REAL,
+    heartbeat REAL,
+    task      TEXT,
+    done      INTEGER NOT NULL DEFAULT 0,
+    exited    REAL
+);
+"""
+
+_SQL_BATCH = 500             # keys per IN (...) query
+
+
+class TaskFailed(RuntimeError):
+    pass
+
+
+class WorkQueue:
+    """Task table in one SQLite file, shared by a coordinator and its workers.
+
+    Each process (and fork) opens its own connection; threads of one
+    process share it under a lock.
+    """
+
+    def __init__(self, path: Union[str, Path], lease: float = DEFAULT_LEASE,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            # Never reuse a connection inherited across fork()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None,
+                                   check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        """One write transaction, holding the database lock from the start."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # ── Coordinator side ───────────────────────────────────────────────────
+
+    def submit(self, run: str, items: Sequence[Tuple[str, bytes]]) -> int:
+        """Queue (key, payload) tasks.  Returns how many were not already done.
+
+        Known keys keep their state — done ones are not recomputed, running
+        ones keep their worker — except failed ones, which get a fresh set
+        of attempts.
+        """
+        now = time.time()
+        with self._tx() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (key, run, payload, state, submitted) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(key, run, payload, PENDING, now) for key, payload in items])
+            conn.executemany(
+                "UPDATE tasks SET state = ?, attempts = 0, error = NULL "
+                "WHERE key = ? AND state = ?",
+                [(PENDING, key, FAILED) for key, _ in items])
+            done = sum(len(self._select(conn, "SELECT key FROM tasks WHERE state = ? AND key IN",
+                                        [DONE], keys))
+                       for keys in _batched([k for k, _ in items]))
+        return len(items) - done
+
+    def wait(self, keys: Sequence[str], poll: float = DEFAULT_POLL
+             ) -> Iterator[Tuple[str, bytes]]:
+        """Yield (key, result) for every key as its task completes (any order).
+
+        Raises TaskFailed for a task that ran out of attempts.  Also
+        re-queues expired leases while it waits, so dead workers' tasks
+        come back even when every live worker is busy.
+        """
+        remaining = set(keys)
+        while remaining:
+            self.requeue_expired()
+            with self._lock:
+                conn = self._connect()
+                rows = [row for batch in _batched(sorted(remaining))
+                        for row in self._select(
+                            conn, "SELECT key, state, result, error, worker FROM tasks "
+                                  "WHERE state IN (?, ?) AND key IN", [DONE, FAILED], batch)]
+            for key, state, result, error, worker in rows:
+                if state == FAILED:
+                    raise TaskFailed(f"task {key[:12]} failed on {worker}:\n{error}")
+                remaining.discard(key)
+                yield key, result
+            if remaining and not rows:
+                time.sleep(poll)
+
+    def purge(self, run: Optional[str] = None) -> int:
+        """Delete the tasks of `run` (all tasks if None).  Returns how many."""
+        with self._tx() as conn:
+            if run is None:
+                return conn.execute("DELETE FROM tasks").rowcount
+            return conn.execute("DELETE FROM tasks WHERE run = ?", (run,)).rowcount
+
+    # ── Worker side ────────────────────────────────────────────────────────
+
+    def claim(self, worker: str) -> Optional[Tuple[str, bytes]]:
+        """Take the oldest pending task as `worker`: (key, payload), or None."""
+        now = time.time()
+        with self._tx() as conn:
+            self._requeue_expired(conn, now)
+            row = conn.execute("SELECT key, payload FROM tasks WHERE state = ? "
+                               "ORDER BY rowid LIMIT 1", (PENDING,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE tasks SET state = ?, worker = ?, attempts = attempts + 1, "
+                         "claimed = ?, heartbeat = ? WHERE key = ?",
+                         (RUNNING, worker, now, now, row[0]))
+        return row[0], row[1]
+
+    def complete(self, key: str, worker: str, result: bytes):
+        with self._tx() as conn:
+            conn.execute("UPDATE tasks SET state = ?, worker = ?, result = ?, finished = ?, "
+                         "payload = x'' WHERE key = ? AND state != ?",
+                         (DONE, worker, result, time.time(), key, DONE))
+            conn.execute("UPDATE workers SET done = done + 1, task = NULL WHERE worker = ?",
+                         (worker,))
+
+    def fail(self, key: str, worker: str, error: str):
+        """Record a failed attempt: back to pending, or failed after max_attempts."""
+        with self._tx() as conn:
+            conn.execute("UPDATE tasks SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                         "error = ?, worker = ? WHERE key = ? AND state = ?",
+                         (self.max_attempts, FAILED, PENDING, error, worker, key, RUNNING))
+            conn.execute("UPDATE workers SET task = NULL WHERE worker = ?", (worker,))
+
+    def register(self, worker: str):
+        now = time.time()
+        with self._tx() as conn:
+            conn.execute("INSERT OR REPLACE INTO workers (worker, host, pid, started, heartbeat) "
+                         "VALUES (?, ?, ?, ?, ?)",
+                         (worker, socket.gethostname(), os.getpid(), now, now))
+
+    def beat(self, worker: str, key: Optional[str] = None):
+        """Heartbeat of `worker` and (if given) the task it is running."""
+        now = time.time()
+        with self._tx() as conn:
+            conn.execute("UPDATE workers SET heartbeat = ?, task = ? WHERE worker = ?",
+                         (now, key, worker))
+            if key is not None:
+                conn.execute("UPDATE tasks SET heartbeat = ? WHERE key = ? AND worker = ? "
+                             "AND state = ?", (now, key, worker, RUNNING))
+
+    def unregister(self, worker: str):
+        with self._tx() as conn:
+            conn.execute("UPDATE workers SET exited = ?, task = NULL WHERE worker = ?",
+                         (time.time(), worker))
+
+    # ── Leases ─────────────────────────────────────────────────────────────
+
+    def requeue_expired(self) -> int:
+        """Put running tasks whose heartbeat is older than the lease back to pending.
+
+        Tasks that have used max_attempts are marked failed instead.
+        Returns how many tasks were re-queued or failed.
+        """
+        with self._tx() as conn:
+            return self._requeue_expired(conn, time.time())
+
+    def _requeue_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        return conn.execute(
+            "UPDATE tasks SET "
+            "state = CASE WHEN attempts >= :max THEN :failed ELSE :pending END, "
+            "error = CASE WHEN attempts >= :max THEN 'lease expired ' || attempts || "
+            "' times (last worker ' || COALESCE(worker, '?') || ')' ELSE error END "
+            "WHERE state = :running AND heartbeat < :cutoff",
+            {"max": self.max_attempts, "failed": FAILED, "pending": PENDING,
+             "running": RUNNING, "cutoff": now - self.lease}).rowcount
+
+    # ── Status ─────────────────────────────────────────────────────────────
+
+    def counts(self, run: Optional[str] = None) -> Dict[str, int]:
+        """{state: tasks} (of one run, or all)."""
+        with self._lock:
+            conn = self._connect()
+            if run is None:
+                rows = conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state")
+            else:
+                rows = conn.execute("SELECT state, COUNT(*) FROM tasks WHERE run = ? "
+                                    "GROUP BY state", (run,))
+            return dict(rows.fetchall())
+
+    def status(self) -> str:
+        """Per-run task counts and every worker's last heartbeat, as printable text."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            runs = conn.execute("SELECT run, state, COUNT(*) FROM tasks GROUP BY run, state "
+                                "ORDER BY run").fetchall()
+            workers = conn.execute("SELECT worker, heartbeat, task, done, exited FROM workers "
+                                   "ORDER BY worker").fetchall()
+        by_run: Dict[str, Dict[str, int]] = {}
+        for run, state, n in runs:
+            by_run.setdefault(run, {})[state] = n
+        lines = [f"  {'Run':<28} {PENDING:>8} {RUNNING:>8} {DONE:>8} {FAILED:>8}"]
+        for run, c in by_run.items():
+            lines.append(f"  {run:<28} " + " ".join(f"{c.get(s, 0):>8,}"
+                                                  for s in (PENDING, RUNNING, DONE, FAILED)))
+        if workers:
+            lines.append(f"\n  {'Worker':<36} {'Seen':>8} {'Done':>7}  Task")
+            for worker, hb, task, done, exited in workers:
+                seen = "exited" if exited else f"{now - hb:6.0f}s"
+                lines.append(f"  {worker:<36} {seen:>8} {done:>7}  {(task or '-')[:12]}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _select(conn: sqlite3.Connection, sql: str, params: list, keys: Sequence[str]):
+        marks = ",".join("?" * len(keys))
+        return conn.execute(f"{sql} ({marks})", [*params, *keys]).fetchall()
+
+
+def _batched(keys: Sequence[str]) -> Iterator[Sequence[str]]:
+    for i in range(0, len(keys), _SQL_BATCH):
+        yield keys[i:i + _SQL_BATCH]
+
+
+# ── Worker loop ────────────────────────────────────────────────────────────
+
+def serve(path: Union[str, Path], worker: Optional[str] = None, lease: float = DEFAULT_LEASE,
+          poll: float = DEFAULT_POLL, idle_exit: Optional[float] = None,
+          max_tasks: Optional[int] = None, log=print) -> int:
+    """Claim and run sweep tasks from the queue at `path` until stopped.
+
+    Returns after `idle_exit` seconds with nothing to claim (never, if
+    None) or after `max_tasks` tasks.  Returns the number of tasks run.
+    The day cache stays warm across tasks, as in a local pool worker.
+    """
+    from backtest.sweep_runner import _run_task
+
+    q = WorkQueue(path, lease=lease)
+    name = worker or f"{socket.gethostname()}:{os.getpid()}"
+    q.register(name)
+    current: List[Optional[str]] = [None]
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(lease / 4):
+            try:
+                q.beat(name, current[0])
+            except sqlite3.Error as e:           # shared disk hiccup: try again next beat
+                log(f"  [{name}] heartbeat failed: {e}")
+
+    threading.Thread(target=heartbeat, name="work-queue-heartbeat", daemon=True).start()
+    n = 0
+    idle_since = time.monotonic()
+    try:
+        while max_tasks is None or n < max_tasks:
+            claimed = q.claim(name)
+            if claimed is None:
+                if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                    break
+                time.sleep(poll)
+                continue
+            key, payload = claimed
+            current[0] = key
+            t0 = time.time()
+            try:
+                _, results, prof = _run_task(pickle.loads(payload))
+            except Exception:
+                q.fail(key, name, traceback.format_exc())
+                log(f"  [{name}] task {key[:12]} failed")
+            else:
+                q.complete(key, name, pickle.dumps((results, prof), protocol=pickle.HIGHEST_PROTOCOL))
+                log(f"  [{name}] task {key[:12]} done in {time.time() - t0:.1f}s")
+            current[0] = None
+            n += 1
+            idle_since = time.monotonic()
+    finally:
+        stop.set()
+        q.unregister(name)
+        q.close()
+    return n
+
+
+def _serve_proc(path: str, lease: float, poll: float, idle_exit: Optional[float]):
+    serve(path, lease=lease, poll=poll, idle_exit=idle_exit)
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Distributed sweep work queue")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    w = sub.add_parser("worker", help="pull and run sweep tasks")
+    w.add_argument("--db", required=True, help="queue file (on shared disk)")
+    w.add_argument("--procs", type=int, default=1, help="worker processes on this host")
+    w.add_argument("--lease", type=float, default=DEFAULT_LEASE,
+                   help=f"seconds without heartbeat before a task is re-queued "
+                        f"(default {DEFAULT_LEASE:.0f})")
+    w.add_argument("--poll", type=float, default=DEFAULT_POLL, help="idle poll interval (s)")
+    w.add_argument("--idle-exit", type=float, default=None,
+                   help="exit after this many idle seconds (default: run until killed)")
+
+    s = sub.add_parser("status", help="task counts per run and worker heartbeats")
+    s.add_argument("--db", required=True)
+
+    p = sub.add_parser("purge", help="delete a run's tasks (and their results)")
+    p.add_argument("--db", required=True)
+    p.add_argument("--run", default=None, help="run name (default: every run)")
+
+    args = ap.parse_args(argv)
+    if args.cmd == "status":
+        print(WorkQueue(args.db).status())
+        return 0
+    if args.cmd == "purge":
+        print(f"  Deleted {WorkQueue(args.db).purge(args.run):,} tasks")
+        return 0
+
+    if args.procs <= 1:
+        serve(args.db, lease=args.lease, poll=args.poll, idle_exit=args.idle_exit)
+        return 0
+    procs = [mp.Process(target=_serve_proc, args=(args.db, args.lease, args.poll, args.idle_exit))
+             for _ in range(args.procs)]
+    for pr in procs:
+        pr.start()
+    for pr in procs:
+        pr.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -699,7 +699,8 @@ def run_bot(config: dict, dry_run: bool = False, check_interval: int = 30):
                     try:
                         # First, clean up any stale subscriptions on Saxo's side
                         # This prevents "Subscription Key already in use" errors
-                        client.stop_price_streaming()
+                        # CONN-019: keep the instrument set so every stream is re-subscribed in one batch
+                        client.stop_price_streaming(forget_subscriptions=False)
                         time.sleep(1)  # Brief pause before reconnecting
 
                         if client.start_price_streaming(subscriptions, price_update_handler):
@@ -118,7 +118,7 @@ CONN-007 to CONN-016: WebSocket Reliability (saxo_client.py) [Added 2026-01-28]
    CONN-009: WebSocket health monitoring (is_websocket_healthy() checks thread/heartbeat)
    CONN-010: Heartbeat timeout detection (_last_heartbeat_time, 60s threshold)
    CONN-011: Binary parser bounds checking (validates lengths at each step)
-   CONN-012: Thread-safe cache locking (_price_cache_lock mutex)
+   CONN-012: Thread-safe price cache (QuoteStore since CONN-018)
    CONN-013: Dual format handling (snapshot Data[] vs streaming ref_id format)
    CONN-014: Limit order $0 price fix (limit_price is None or <= 0)
    CONN-015: Never use $0 fallback price (skip to retry if both quote and leg_price zero)
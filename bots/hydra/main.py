@@ -533,6 +533,9 @@ def run_bot(config: dict, dry_run: bool = False, check_interval: int = 1, config
                         f"Return: {return_sign}{return_pct:.1f}%"
                     )
 
+                    # CONN-007: REST latency / throttling since startup
+                    trade_logger.log_event(f"  {client.request_metrics.summary()}")
+
                     # MKT-018: Early close ROC tracking
                     ec_status = status.get('early_close_status', {})
                     if ec_status.get('tracking'):
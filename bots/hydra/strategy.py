@@ -8778,6 +8778,9 @@ class HydraStrategy(MEICStrategy):
                 # blackout text but the runtime gate is letting entries through.
                 "dry_run": bool(getattr(self, 'dry_run', False)),
                 "dry_run_force_normal_day": bool(getattr(self, 'dry_run_force_normal_day', False)),
+                # Dashboard: CONN-007 per-endpoint REST latency (p50/p95/p99), 429s, retries
+                "api_metrics": (self.client.get_request_metrics()
+                                if hasattr(self.client, "get_request_metrics") else None),
                 "entries": []
             }
 
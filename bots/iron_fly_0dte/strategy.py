@@ -3518,11 +3518,13 @@ class IronFlyStrategy:
 
         # Step 5: Subscribe to option price updates for position monitoring
         # LIVE-001: Use StockIndexOption for SPX/SPXW index options (not StockOption)
+        # CONN-019: All four legs in one batched list subscription
         try:
-            self.client.subscribe_to_option(short_call_uic, self.handle_price_update, asset_type="StockIndexOption")
-            self.client.subscribe_to_option(short_put_uic, self.handle_price_update, asset_type="StockIndexOption")
-            self.client.subscribe_to_option(long_call_uic, self.handle_price_update, asset_type="StockIndexOption")
-            self.client.subscribe_to_option(long_put_uic, self.handle_price_update, asset_type="StockIndexOption")
+            self.client.subscribe_to_options(
+                [short_call_uic, short_put_uic, long_call_uic, long_put_uic],
+                self.handle_price_update,
+                asset_type="StockIndexOption"
+            )
             logger.info("Subscribed to option price streams for position monitoring (StockIndexOption)")
         except Exception as e:
             logger.warning(f"Failed to subscribe to option streams (will use polling): {e}")
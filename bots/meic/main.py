@@ -515,7 +515,8 @@ def run_bot(config: dict, dry_run: bool = False, check_interval: int = 5):
                 if USE_WEBSOCKET_STREAMING and subscriptions and not client.is_streaming:
                     trade_logger.log_event("WebSocket disconnected - reconnecting...")
                     try:
-                        client.stop_price_streaming()
+                        # CONN-019: keep the instrument set so every stream is re-subscribed in one batch
+                        client.stop_price_streaming(forget_subscriptions=False)
                         time.sleep(1)
                         streaming_started = client.start_price_streaming(subscriptions, price_update_handler)
                         if streaming_started:
@@ -38,6 +38,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from shared.saxo_client import SaxoClient, BuySell, OrderType
+from shared.saxo_async import AsyncSaxoClient
 from shared.alert_service import AlertService, AlertType, AlertPriority
 from shared.market_hours import get_us_market_time, is_market_open, is_early_close_day
 from shared.event_calendar import is_fomc_meeting_day, is_fomc_announcement_day
@@ -232,6 +233,7 @@ def round_to_spx_tick(price: float, round_up: bool = False) -> float:
 EMERGENCY_SPREAD_MAX_PERCENT = 50.0  # Max acceptable spread for emergency close
 EMERGENCY_SPREAD_WAIT_SECONDS = 10  # Wait time for spread normalization
 EMERGENCY_SPREAD_MAX_WAIT_ATTEMPTS = 3
+EMERGENCY_SPREAD_TICK_POLL_SECONDS = 0.5  # CONN-018: Poll streamed ticks during the wait
 
 # ACTIVITIES-001: Fill verification retry
 ACTIVITIES_RETRY_ATTEMPTS = 3
@@ -844,6 +846,8 @@ class MEICStrategy:
             alert_service: Optional AlertService for Telegram/Email notifications
         """
         self.client = saxo_client
+        # CONN-008: concurrent fan-out for independent lookups (shares client's session + limiter)
+        self.async_client = AsyncSaxoClient(saxo_client)
         self.config = config
         self.trade_logger = logger_service
         self.dry_run = dry_run
@@ -4813,7 +4817,7 @@ class MEICStrategy:
                 f"spread to normalize (attempt {wait_num}/{EMERGENCY_SPREAD_MAX_WAIT_ATTEMPTS})..."
             )
 
-            time.sleep(EMERGENCY_SPREAD_WAIT_SECONDS)
+            self._sleep_until_streamed_spread_ok(uic, EMERGENCY_SPREAD_WAIT_SECONDS)
 
             spread_ok, spread_pct = self._check_spread_for_emergency_close(uic)
             if spread_ok:
@@ -4835,6 +4839,28 @@ class MEICStrategy:
         )
         return False
 
+    def _sleep_until_streamed_spread_ok(self, uic: int, max_wait_seconds: float) -> None:
+        """
+        CONN-018: Sleep up to max_wait_seconds, waking early once a streamed tick
+        shows an acceptable spread.
+
+        Reads the client's WebSocket tick buffer (no REST calls). When the UIC
+        is not streamed (REST-only mode) there are no ticks and this is a plain
+        sleep of the full wait.
+        """
+        deadline = time.monotonic() + max_wait_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(EMERGENCY_SPREAD_TICK_POLL_SECONDS, remaining))
+            ticks = self.client.get_tick_history(uic, seconds=EMERGENCY_SPREAD_TICK_POLL_SECONDS * 2, limit=1)
+            if ticks:
+                _, bid, ask = ticks[-1]
+                mid = (bid + ask) / 2
+                if bid > 0 and ask > 0 and (ask - bid) / mid * 100 <= EMERGENCY_SPREAD_MAX_PERCENT:
+                    return
+
     def _get_close_fill_price(self, order_id: str, uic: int, leg_name: str) -> Optional[float]:
         """
         FIX #42 (2026-02-05): Get actual fill price for a close order.
@@ -4918,65 +4944,77 @@ class MEICStrategy:
         )
         time.sleep(3)
 
+        # CONN-008: legs are independent — look them all up concurrently
+        lookups = self.async_client.gather_sync(*(
+            self._lookup_deferred_fill(order_id, uic, leg_name)
+            for order_id, uic, leg_name in deferred_legs
+        ))
+
         all_found = True
         updated_cost = current_close_cost
 
-        for order_id, uic, leg_name in deferred_legs:
-            fill_price = None
-            source = None
-
-            try:
-                # Tier 1: Activities endpoint (AveragePrice - should work now with Fix #76)
-                filled, fill_details = self.client.check_order_filled_by_activity(
-                    order_id=order_id,
-                    uic=uic,
-                    max_retries=3,
-                    retry_delay=1.5
-                )
-                if filled and fill_details:
-                    fp = fill_details.get("fill_price", 0)
-                    if fp and fp > 0:
-                        fill_price = fp
-                        source = "activities"
-
-                # Tier 2: Closed positions endpoint (authoritative fallback)
-                if fill_price is None:
-                    buy_or_sell = "Sell" if leg_name.startswith("short") else "Buy"
-                    closed_info = self.client.get_closed_position_price(uic, buy_or_sell=buy_or_sell)
-                    if closed_info:
-                        cp = closed_info.get("closing_price")
-                        if cp and cp > 0:
-                            fill_price = cp
-                            source = "closedpositions"
-
-                if fill_price is not None:
-                    if leg_name.startswith("short"):
-                        updated_cost += fill_price * 100 * entry.contracts
-                        logger.info(
-                            f"FIX-76: Deferred fill price for {leg_name} via {source}: "
-                            f"${fill_price:.2f} (close cost +${fill_price * 100 * entry.contracts:.2f})"
-                        )
-                    else:
-                        updated_cost -= fill_price * 100 * entry.contracts
-                        logger.info(
-                            f"FIX-76: Deferred fill price for {leg_name} via {source}: "
-                            f"${fill_price:.2f} (close proceeds -${fill_price * 100 * entry.contracts:.2f})"
-                        )
-                    continue
+        for (order_id, uic, leg_name), (fill_price, source) in zip(deferred_legs, lookups):
+            if fill_price is not None:
+                if leg_name.startswith("short"):
+                    updated_cost += fill_price * 100 * entry.contracts
+                    logger.info(
+                        f"FIX-76: Deferred fill price for {leg_name} via {source}: "
+                        f"${fill_price:.2f} (close cost +${fill_price * 100 * entry.contracts:.2f})"
+                    )
+                else:
+                    updated_cost -= fill_price * 100 * entry.contracts
+                    logger.info(
+                        f"FIX-76: Deferred fill price for {leg_name} via {source}: "
+                        f"${fill_price:.2f} (close proceeds -${fill_price * 100 * entry.contracts:.2f})"
+                    )
+                continue
 
-                # Still no price after both lookups
+            # Still no price after both lookups (or the lookup raised)
+            if source != "error":
                 logger.warning(
                     f"FIX-76: Deferred lookup still has no fill price for {leg_name} "
                     f"(order {order_id}). P&L may be inaccurate."
                 )
-                all_found = False
-
-            except Exception as e:
-                logger.warning(f"FIX-76: Deferred lookup error for {leg_name}: {e}")
-                all_found = False
+            all_found = False
 
         return updated_cost, all_found
 
+    async def _lookup_deferred_fill(
+        self, order_id: str, uic: int, leg_name: str
+    ) -> Tuple[Optional[float], Optional[str]]:
+        """
+        FIX #76 two-tier fill lookup for one leg, as a coroutine (CONN-008).
+
+        Returns:
+            (fill_price, source) — source is "activities", "closedpositions",
+            None when neither has a price yet, or "error" if the lookup raised.
+        """
+        try:
+            # Tier 1: Activities endpoint (AveragePrice - should work now with Fix #76)
+            filled, fill_details = await self.async_client.check_order_filled_by_activity(
+                order_id=order_id,
+                uic=uic,
+                max_retries=3,
+                retry_delay=1.5
+            )
+            if filled and fill_details:
+                fp = fill_details.get("fill_price", 0)
+                if fp and fp > 0:
+                    return fp, "activities"
+
+            # Tier 2: Closed positions endpoint (authoritative fallback)
+            buy_or_sell = "Sell" if leg_name.startswith("short") else "Buy"
+            closed_info = await self.async_client.get_closed_position_price(uic, buy_or_sell=buy_or_sell)
+            if closed_info:
+                cp = closed_info.get("closing_price")
+                if cp and cp > 0:
+                    return cp, "closedpositions"
+            return None, None
+
+        except Exception as e:
+            logger.warning(f"FIX-76: Deferred lookup error for {leg_name}: {e}")
+            return None, "error"
+
     def _spawn_async_fill_correction(
         self,
         deferred_legs: list,
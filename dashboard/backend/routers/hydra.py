@@ -92,6 +92,15 @@ async def get_state():
     return data
 
 
+@router.get("/api-metrics")
+async def get_api_metrics():
+    """Saxo REST latency percentiles, errors, 429s and retries per endpoint (CONN-007)."""
+    data = state_reader.read_latest()
+    if data is None or not data.get("api_metrics"):
+        return {"error": "API metrics not available"}
+    return data["api_metrics"]
+
+
 @router.get("/entries")
 async def get_entries(date_str: str | None = None):
     """Today's entries (or specific date) with full details."""
@@ -16,6 +16,7 @@ Tests:
 8. Fix #8: Thread-safe cache access with locking
 9. Fix #9: Improved on_error handler
 10. Fix #10: Bounds checking in binary parser
+11. CONN-019: Batched, diffed streaming subscriptions
 
 Usage:
     python scripts/test_websocket_fixes.py
@@ -134,16 +135,14 @@ def test_fix_1_cache_invalidation_on_disconnect(results: TestResults):
     client._update_cache(67890, {"Quote": {"Bid": 200.0, "Ask": 201.0}})
 
     # Verify cache is populated
-    with client._price_cache_lock:
-        cache_size_before = len(client._price_cache)
+    cache_size_before = len(client._quote_store)
     results.record("Cache populated before disconnect", cache_size_before == 2)
 
     # Simulate disconnect by calling _clear_cache (what on_close does)
     client._clear_cache()
 
     # Verify cache is empty
-    with client._price_cache_lock:
-        cache_size_after = len(client._price_cache)
+    cache_size_after = len(client._quote_store)
     results.record("Cache cleared after disconnect", cache_size_after == 0)
 
 
@@ -161,15 +160,12 @@ def test_fix_2_cache_timestamps_and_staleness(results: TestResults):
     results.record("Fresh data returned from cache", fresh_data is not None)
 
     # Verify timestamp was stored
-    with client._price_cache_lock:
-        entry = client._price_cache.get(12345)
-    has_timestamp = entry is not None and 'timestamp' in entry
-    results.record("Cache entry has timestamp", has_timestamp)
+    age = client._quote_store.age(12345)
+    results.record("Cache entry has timestamp", age is not None and age < 1.0)
 
-    # Manually set old timestamp to simulate stale data
-    with client._price_cache_lock:
-        if 12345 in client._price_cache:
-            client._price_cache[12345]['timestamp'] = datetime.now() - timedelta(seconds=120)
+    # Advance the store's monotonic clock to simulate stale data
+    now = time.monotonic()
+    client._quote_store.clock = lambda: now + 120
 
     # Verify stale data is rejected
     stale_data = client._get_from_cache(12345, max_age_seconds=60)
@@ -308,7 +304,7 @@ def test_fix_8_thread_safe_cache_access(results: TestResults):
     client = create_mock_client()
 
     # Verify lock exists
-    has_lock = hasattr(client, '_price_cache_lock') and client._price_cache_lock is not None
+    has_lock = getattr(client._quote_store, '_lock', None) is not None
     results.record("Cache lock exists", has_lock)
 
     # Test concurrent access (simplified)
@@ -418,6 +414,42 @@ def test_get_quote_uses_healthy_check(results: TestResults):
     )
 
 
+def test_batched_subscription_deltas(results: TestResults):
+    """CONN-019: Subscriptions are batched per asset type and diffed."""
+    print("\n--- Test CONN-019: Batched Subscription Deltas ---")
+
+    client = create_mock_client()
+
+    calls = []
+    def mock_request(method, endpoint, data=None, **kwargs):
+        calls.append((method, endpoint, data))
+        if method == "POST":
+            uics = [int(u) for u in data["Arguments"]["Uics"].split(",")]
+            return {"Snapshot": {"Data": [{"Uic": u, "Quote": {"Bid": 1.0, "Ask": 1.1}} for u in uics]}}
+        return {}
+
+    client._make_request = mock_request
+
+    legs = [{"uic": u, "asset_type": "StockIndexOption"} for u in (1, 2, 3, 4)]
+    client.sync_price_subscriptions(legs + [{"uic": 10606, "asset_type": "StockIndex"}])
+    posts = [c for c in calls if c[0] == "POST"]
+    results.record("One list subscription per asset type", len(posts) == 2)
+    results.record("Snapshots cached", client._get_from_cache(3) is not None)
+
+    calls.clear()
+    client.sync_price_subscriptions(legs + [{"uic": 10606, "asset_type": "StockIndex"}])
+    results.record("Unchanged set sends no requests", calls == [])
+
+    calls.clear()
+    client.sync_price_subscriptions(legs[:3] + [{"uic": 10606, "asset_type": "StockIndex"}])
+    methods = [c[0] for c in calls]
+    resubscribed = calls[-1][2]["Arguments"]["Uics"] if calls and calls[-1][0] == "POST" else ""
+    results.record(
+        "Removing a leg only rebuilds its batch",
+        methods == ["DELETE", "POST"] and resubscribed == "1,2,3"
+    )
+
+
 def main():
     print("=" * 70)
     print("WEBSOCKET/QUOTE FIXES TEST SUITE (2026-01-28)")
@@ -436,6 +468,7 @@ def main():
     test_fix_8_thread_safe_cache_access(results)
     test_fix_10_binary_parser_bounds_checking(results)
     test_get_quote_uses_healthy_check(results)
+    test_batched_subscription_deltas(results)
 
     # Summary
     all_passed = results.summary()
@@ -108,18 +108,16 @@ def main():
     print()
 
     print("6. Checking cache contents...")
-    with client._price_cache_lock:
-        cache_keys = list(client._price_cache.keys())
-        print(f"   Cache contains UICs: {cache_keys}")
-        for uic in cache_keys:
-            entry = client._price_cache.get(uic, {})
-            timestamp = entry.get('timestamp')
-            data = entry.get('data', {})
-            age = (datetime.now() - timestamp).total_seconds() if timestamp else -1
-            quote_data = data.get("Quote", {}) if isinstance(data, dict) else {}
-            bid = quote_data.get("Bid", 0)
-            ask = quote_data.get("Ask", 0)
-            print(f"   UIC {uic}: age={age:.1f}s, Bid=${bid:.2f}, Ask=${ask:.2f}")
+    store = client._quote_store
+    cache_keys = store.uics()
+    print(f"   Cache contains UICs: {cache_keys}")
+    for uic in cache_keys:
+        quote_data = (store.get(uic) or {}).get("Quote", {})
+        age = store.age(uic) or 0.0
+        bid = quote_data.get("Bid") or 0
+        ask = quote_data.get("Ask") or 0
+        print(f"   UIC {uic}: age={age:.1f}s, Bid=${bid:.2f}, Ask=${ask:.2f}, "
+              f"ticks={len(store.ticks(uic))}")
 
     if spy_uic in cache_keys:
         print("   ✅ PASS: SPY in cache")
@@ -153,8 +151,7 @@ def main():
     print()
 
     print("10. Verifying cache cleared on stop...")
-    with client._price_cache_lock:
-        cache_size = len(client._price_cache)
+    cache_size = len(client._quote_store)
     if cache_size == 0:
         print("   ✅ PASS: Cache cleared after stop")
     else:
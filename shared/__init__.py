@@ -208,9 +208,9 @@ Full documentation: docs/SAXO_API_PATTERNS.md
    - Track _last_heartbeat_time (Saxo sends every ~15s)
    - Connection is zombie if no heartbeat in 60+ seconds
 
-   Fix #8 (CONN-012): Thread-safe cache locking
-   - _price_cache_lock mutex protects all cache operations
-   - Prevents race conditions between threads
+   Fix #8 (CONN-012): Thread-safe price cache
+   - CONN-018: shared/quote_store.py QuoteStore (delta merge, locked writes,
+     copy-on-write lock-free reads, per-UIC tick ring buffers)
 
    Fix #10 (CONN-011): Binary parser bounds checking
    - Validates message length at each parsing step
@@ -133,11 +133,11 @@ class SaxoStreamingProxy(StreamingInterface):
     call seeds the cache; subsequent quote reads via
     `client.get_quote(uic, skip_cache=False)` come from cache.
 
-    This proxy maintains a private subscription set and restarts the
-    Saxo WS when it changes. That's inefficient (restart on every
-    add/remove) but matches Saxo's natural shape — and per-instrument
-    add/remove is rare in practice (HYDRA subscribes a known set at
-    boot and never changes it intraday).
+    This proxy maintains a private subscription set. The first
+    subscribe starts the Saxo WS; later changes are pushed with
+    `sync_price_subscriptions`, which only sends the subscribe /
+    unsubscribe deltas (batched list subscriptions, CONN-019) instead
+    of restarting the WS on every add/remove.
 
     Greeks: Saxo doesn't push greeks via WS. `subscribe_option` falls
     through to `subscribe_quote`; callers fetch greeks separately via
@@ -159,14 +159,39 @@ class SaxoStreamingProxy(StreamingInterface):
         regardless. Useful for callers that want to be notified per tick."""
         self._user_callback = cb
 
+    def _internal_cb(self, uic: int, data: dict) -> None:
+        if self._user_callback is not None:
+            try:
+                self._user_callback(uic, data)
+            except Exception as exc:
+                logger.warning(
+                    "SaxoStreamingProxy user callback raised "
+                    "(swallowed): %s", exc,
+                )
+
     def _restart_streaming(self) -> None:
-        """Stop + restart Saxo's WS with the current subscription set.
+        """Bring Saxo's WS in line with the current subscription set.
 
-        Cheap when the set is empty (just `stop_price_streaming`).
+        While the WS is up, only the delta is sent (`sync_price_subscriptions`).
+        Otherwise stop + start with the full set. Cheap when the set is
+        empty (just `stop_price_streaming`).
         """
         with self._lock:
             uics = sorted(int(s) for s in self._subscriptions)
 
+        # Build the subscriptions payload Saxo expects
+        payload = [
+            {"uic": uic, "asset_type": self._asset_type} for uic in uics
+        ]
+
+        if uics and self._saxo.is_streaming:
+            if not self._saxo.sync_price_subscriptions(payload, self._internal_cb):
+                logger.warning(
+                    "SaxoStreamingProxy: sync_price_subscriptions failed "
+                    "for part of uics=%s", uics,
+                )
+            return
+
         # Stop the existing WS (idempotent on SaxoClient)
         try:
             self._saxo.stop_price_streaming()
@@ -176,22 +201,7 @@ class SaxoStreamingProxy(StreamingInterface):
         if not uics:
             return
 
-        # Build the subscriptions payload Saxo expects
-        payload = [
-            {"uic": uic, "asset_type": self._asset_type} for uic in uics
-        ]
-
-        def _internal_cb(uic: int, data: dict) -> None:
-            if self._user_callback is not None:
-                try:
-                    self._user_callback(uic, data)
-                except Exception as exc:
-                    logger.warning(
-                        "SaxoStreamingProxy user callback raised "
-                        "(swallowed): %s", exc,
-                    )
-
-        ok = self._saxo.start_price_streaming(payload, _internal_cb)
+        ok = self._saxo.start_price_streaming(payload, self._internal_cb)
         if not ok:
             logger.warning(
                 "SaxoStreamingProxy: start_price_streaming returned False — "
@@ -0,0 +1,189 @@
+"""Streaming quote store with per-UIC tick history — CONN-018.
+
+Saxo's price stream sends a full snapshot once per subscription and then
+*deltas*: only the fields that changed (`{"Quote": {"Bid": 12.3}}`).  The
+old price cache stored each message as-is, so a Bid-only delta replaced the
+whole quote and the cached Ask/Mid/PriceInfo vanished until the next full
+message.  QuoteStore keeps what the stream actually describes:
+
+  • Full quote per UIC: every delta is deep-merged into the last known quote
+    (nested groups like Quote / PriceInfo merge key by key).
+
+  • Monotonic timestamps: staleness uses time.monotonic(), immune to wall
+    clock jumps (NTP steps, VM resume).
+
+  • Copy-free readers: merges are copy-on-write — a new quote dict is built
+    and published with one dict assignment, and published quotes are never
+    mutated afterwards.  get() takes no lock and returns the stored dict
+    itself; treat it as read-only.
+
+  • Tick history: a fixed-size ring of (ts, bid, ask) per UIC in compact
+    array('d') buffers, appended whenever an update touches the Quote
+    group.  Strategies can look at recent spreads/prices (stop confirmation,
+    spread-normalization waits) without another REST call.
+
+Only writers and tick readers take the (single) lock, and only for the
+merge or slice itself.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_TICK_BUFFER = 512
+
+Tick = Tuple[float, float, float]   # (monotonic ts, bid, ask)
+
+
+def merge_quote(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a new quote with `delta` merged into `base` (neither is modified).
+
+    Nested dicts merge recursively; any other value replaces the old one.
+    Unchanged nested groups are shared with `base`, which is safe because
+    published quotes are never mutated.
+    """
+    merged = dict(base)
+    for key, value in delta.items():
+        old = merged.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            merged[key] = merge_quote(old, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class TickRing:
+    """Fixed-capacity ring of (ts, bid, ask) in three parallel float arrays."""
+
+    __slots__ = ("capacity", "count", "_ts", "_bid", "_ask")
+
+    def __init__(self, capacity: int = DEFAULT_TICK_BUFFER):
+        self.capacity = capacity
+        self.count = 0                      # ticks ever written
+        self._ts = array("d", bytes(8 * capacity))
+        self._bid = array("d", bytes(8 * capacity))
+        self._ask = array("d", bytes(8 * capacity))
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, ts: float, bid: float, ask: float) -> None:
+        i = self.count % self.capacity
+        self._ts[i] = ts
+        self._bid[i] = bid
+        self._ask[i] = ask
+        self.count += 1
+
+    def latest(self) -> Optional[Tick]:
+        if not self.count:
+            return None
+        i = (self.count - 1) % self.capacity
+        return (self._ts[i], self._bid[i], self._ask[i])
+
+    def since(self, ts_min: float = float("-inf"), limit: Optional[int] = None) -> List[Tick]:
+        """Ticks with ts >= ts_min, oldest first, at most `limit` most recent."""
+        n = len(self)
+        if limit is not None:
+            n = min(n, limit)
+        out: List[Tick] = []
+        for seq in range(self.count - 1, self.count - 1 - n, -1):
+            i = seq % self.capacity
+            ts = self._ts[i]
+            if ts < ts_min:
+                break
+            out.append((ts, self._bid[i], self._ask[i]))
+        out.reverse()
+        return out
+
+
+class QuoteStore:
+    """Delta-merged quotes plus tick rings, keyed by UIC (see module docstring)."""
+
+    def __init__(self, tick_buffer: int = DEFAULT_TICK_BUFFER,
+                 clock: Callable[[], float] = time.monotonic):
+        self.tick_buffer = tick_buffer
+        self.clock = clock
+        self._quotes: Dict[int, Tuple[Dict[str, Any], float]] = {}   # uic -> (quote, ts)
+        self._rings: Dict[int, TickRing] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, uic: int) -> bool:
+        return uic in self._quotes
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def uics(self) -> List[int]:
+        return list(self._quotes)
+
+    # ── Writers ────────────────────────────────────────────────────────────
+
+    def update(self, uic: int, data: Dict[str, Any], replace: bool = False) -> Dict[str, Any]:
+        """Merge a streaming delta (or, with replace=True, a full snapshot).
+
+        Returns the published full quote for `uic`.
+        """
+        with self._lock:
+            now = self.clock()
+            current = self._quotes.get(uic)
+            quote = dict(data) if replace or current is None else merge_quote(current[0], data)
+            self._quotes[uic] = (quote, now)
+
+            if isinstance(data.get("Quote"), dict):
+                q = quote["Quote"]
+                ring = self._rings.get(uic)
+                if ring is None:
+                    ring = self._rings[uic] = TickRing(self.tick_buffer)
+                ring.append(now, float(q.get("Bid") or 0.0), float(q.get("Ask") or 0.0))
+            return quote
+
+    def clear(self) -> int:
+        """Drop all quotes and tick history; returns how many UICs were held."""
+        with self._lock:
+            size = len(self._quotes)
+            # Swap in new dicts so lock-free readers see old or new, never a half-cleared one
+            self._quotes = {}
+            self._rings = {}
+            return size
+
+    # ── Readers ────────────────────────────────────────────────────────────
+
+    def get(self, uic: int, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Current full quote (read-only), or None if unknown or older than max_age seconds."""
+        entry = self._quotes.get(uic)
+        if entry is None:
+            return None
+        quote, ts = entry
+        if max_age is not None and self.clock() - ts > max_age:
+            return None
+        return quote
+
+    def age(self, uic: int) -> Optional[float]:
+        """Seconds since the last update for `uic`, or None if never seen."""
+        entry = self._quotes.get(uic)
+        return None if entry is None else self.clock() - entry[1]
+
+    def latest_tick(self, uic: int) -> Optional[Tick]:
+        ring = self._rings.get(uic)
+        if ring is None:
+            return None
+        with self._lock:
+            return ring.latest()
+
+    def ticks(self, uic: int, seconds: Optional[float] = None,
+              limit: Optional[int] = None) -> List[Tick]:
+        """Recent (ts, bid, ask) ticks for `uic`, oldest first.
+
+        Args:
+            seconds: Only ticks from the last N seconds.
+            limit: At most this many (most recent) ticks.
+        """
+        ring = self._rings.get(uic)
+        if ring is None:
+            return []
+        ts_min = self.clock() - seconds if seconds is not None else float("-inf")
+        with self._lock:
+            return ring.since(ts_min, limit)
@@ -0,0 +1,159 @@
+"""Per-endpoint REST latency and error accounting for SaxoClient.
+
+Every `_make_request` / emergency request records one sample here: wall
+time, HTTP status (None for a transport error), and whether it timed out.
+429 and 401 retries are counted separately so a slow quote path can be
+told apart from one that is being throttled.
+
+Design:
+
+  • Endpoints are grouped by method + path with per-request IDs collapsed
+    ("/trade/v2/orders/5012345678" → "/trade/v2/orders/{id}"), so order and
+    position lookups share one row instead of one row per ID.
+
+  • Latency percentiles (p50/p95/p99) come from a rolling window of the
+    last `window` samples per endpoint; counters (requests, errors,
+    timeouts, 429s, retries) are lifetime totals since the last reset().
+
+  • snapshot() returns plain dicts (JSON-safe) for the bot state file /
+    dashboard; summary() is a one-line string for the heartbeat log.
+
+Thread-safe via internal lock — the main loop, the WebSocket thread and
+stop-loss paths all issue REST calls.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+
+DEFAULT_WINDOW = 1000
+
+
+def _is_id_segment(segment: str) -> bool:
+    # Order IDs, position IDs and account keys; "v1"/"v2" version segments are kept
+    return sum(c.isdigit() for c in segment) >= 3 or "|" in segment or "=" in segment
+
+
+def normalize_endpoint(method: str, endpoint: str) -> str:
+    """'GET /port/v1/positions/123456?x=1' → 'GET /port/v1/positions/{id}'."""
+    path = endpoint.split("?", 1)[0]
+    parts = ["{id}" if _is_id_segment(seg) else seg for seg in path.split("/")]
+    return f"{method.upper()} {'/'.join(parts)}"
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    # Nearest-rank: the value at or above the q-th fraction of samples
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+@dataclass
+class EndpointStats:
+    """Counters + rolling latency window (seconds) for one endpoint."""
+    window: int = DEFAULT_WINDOW
+    requests: int = 0
+    errors: int = 0          # non-2xx responses (incl. 429/401) and transport errors
+    timeouts: int = 0
+    rate_limited: int = 0    # 429 responses
+    retries: int = 0         # requests re-issued after a 429 or 401
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    _latencies: Deque[float] = field(default_factory=deque, repr=False)
+
+    def __post_init__(self):
+        self._latencies = deque(maxlen=self.window)
+
+    def add(self, seconds: float, status: Optional[int], timeout: bool) -> None:
+        self.requests += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self._latencies.append(seconds)
+        if status is None or not 200 <= status < 300:
+            self.errors += 1
+        if status == 429:
+            self.rate_limited += 1
+        if timeout:
+            self.timeouts += 1
+
+    def merge(self, other: "EndpointStats") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.timeouts += other.timeouts
+        self.rate_limited += other.rate_limited
+        self.retries += other.retries
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self._latencies.extend(other._latencies)
+
+    def as_dict(self) -> Dict[str, Any]:
+        lat = sorted(self._latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "avg_ms": round(self.total_seconds / self.requests * 1000, 1) if self.requests else 0.0,
+            "p50_ms": round(_percentile(lat, 0.50) * 1000, 1),
+            "p95_ms": round(_percentile(lat, 0.95) * 1000, 1),
+            "p99_ms": round(_percentile(lat, 0.99) * 1000, 1),
+            "max_ms": round(self.max_seconds * 1000, 1),
+        }
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint request statistics (see module docstring)."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+
+    def _stats(self, method: str, endpoint: str) -> EndpointStats:
+        key = normalize_endpoint(method, endpoint)
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats(window=self.window)
+        return stats
+
+    def record(self, method: str, endpoint: str, seconds: float,
+               status: Optional[int] = None, timeout: bool = False) -> None:
+        """One completed request; status=None for a transport error / timeout."""
+        with self._lock:
+            self._stats(method, endpoint).add(seconds, status, timeout)
+
+    def record_retry(self, method: str, endpoint: str) -> None:
+        """The request is being re-issued (after a 429 backoff or a 401 token refresh)."""
+        with self._lock:
+            self._stats(method, endpoint).retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """{"total": {...}, "endpoints": {"GET /path": {...}}} — busiest endpoints first."""
+        with self._lock:
+            total = EndpointStats(window=self.window * max(1, len(self._endpoints)))
+            for stats in self._endpoints.values():
+                total.merge(stats)
+            endpoints = sorted(self._endpoints.items(), key=lambda kv: kv[1].requests, reverse=True)
+            return {
+                "total": total.as_dict(),
+                "endpoints": {key: stats.as_dict() for key, stats in endpoints},
+            }
+
+    def summary(self) -> str:
+        """One-line heartbeat summary across all endpoints."""
+        t = self.snapshot()["total"]
+        return (
+            f"API: {t['requests']} req | p50 {t['p50_ms']:.0f}ms / p95 {t['p95_ms']:.0f}ms / "
+            f"p99 {t['p99_ms']:.0f}ms | errors {t['errors']} | 429s {t['rate_limited']} | "
+            f"retries {t['retries']}"
+        )
@@ -0,0 +1,158 @@
+"""Asyncio counterpart of SaxoClient for concurrent REST fan-out — CONN-008.
+
+Entry, stop and reconciliation paths issue several independent Saxo calls
+back to back (per-leg fill lookups, position checks, activity polls), each
+paying a full round trip.  AsyncSaxoClient wraps an existing SaxoClient so
+those calls can run concurrently:
+
+  • Same method surface: every public SaxoClient method is available as a
+    coroutine (`await aclient.get_positions()`), delegated to the wrapped
+    client.  Token refresh, circuit breaker, 429 backoff and the pooled
+    keep-alive session (CONN-007) are all the sync client's — nothing is
+    reimplemented here.
+
+  • Calls run on a bounded thread pool (max_concurrency), so at most that
+    many requests are in flight; the session's connection pool is sized
+    for it (saxo_api.http.pool_maxsize).
+
+  • A shared token-bucket RateLimiter (max_rate calls/second, burst)
+    spaces call starts across everything issued through this client,
+    from any thread or event loop.  It limits client method calls, not
+    HTTP requests — a method with internal retries counts once.
+
+  • Sync façade for the (synchronous) bots: run() / gather_sync() execute
+    coroutines on a private event-loop thread and block for the result.
+
+Usage:
+    aclient = AsyncSaxoClient(client)
+    positions, orders = aclient.gather_sync(aclient.get_positions(),
+                                            aclient.get_open_orders())
+
+Only use fan-out for calls that are independent of each other (lookups,
+verifications).  Orders whose sequence matters — short leg bought back
+before the long is sold — stay sequential on the sync client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RATE = 10.0     # calls/second across the client (Saxo allows ~120/min per service group)
+DEFAULT_BURST = 4
+
+
+class RateLimiter:
+    """Token bucket shared by every caller; loop- and thread-agnostic."""
+
+    def __init__(self, rate: float = DEFAULT_MAX_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token; returns how long the caller must wait before starting."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncSaxoClient:
+    """Async wrapper over a SaxoClient (see module docstring)."""
+
+    def __init__(
+        self,
+        client: Any,
+        max_concurrency: Optional[int] = None,
+        max_rate: Optional[float] = None,
+        burst: Optional[int] = None,
+    ):
+        http_config = getattr(client, "http_config", None)
+        if not isinstance(http_config, dict):
+            http_config = {}
+        self.client = client
+        self.max_concurrency = max_concurrency or http_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        self.limiter = RateLimiter(
+            rate=max_rate or http_config.get("max_rate_per_second", DEFAULT_MAX_RATE),
+            burst=burst or http_config.get("rate_burst", DEFAULT_BURST),
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix="saxo-async")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    # ── Async surface ──────────────────────────────────────────────────────
+
+    async def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client call on the pool once the rate limiter allows it."""
+        await self.limiter.acquire()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not defined on this wrapper
+        if name == "client":
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self.call(attr, *args, **kwargs)
+        return method
+
+    # ── Sync façade ────────────────────────────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever,
+                                                     name="saxo-async-loop", daemon=True)
+                self._loop_thread.start()
+            return self._loop
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the client's event-loop thread and block for its result."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._loop_thread:
+            raise RuntimeError("AsyncSaxoClient.run() called from its own event loop; await instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def gather_sync(self, *coros: Awaitable[Any], timeout: Optional[float] = None) -> List[Any]:
+        """Run coroutines concurrently; results in argument order (exceptions are raised)."""
+        async def _gather() -> List[Any]:
+            return list(await asyncio.gather(*coros))
+        return self.run(_gather(), timeout)
+
+    def close(self) -> None:
+        """Stop the event-loop thread and the worker pool."""
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                if self._loop_thread is not None:
+                    self._loop_thread.join(timeout=5)
+                self._loop.close()
+                self._loop = None
+                self._loop_thread = None
+        self._executor.shutdown(wait=False)
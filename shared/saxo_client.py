@@ -8,6 +8,9 @@ This module handles all interactions with the Saxo Bank OpenAPI including:
 - Circuit breaker pattern for error handling
 - Token refresh on 401 errors (CONN-004)
 - Rate limiting with exponential backoff on 429 errors (CONN-006)
+- Pooled keep-alive HTTP session with per-endpoint latency metrics (CONN-007)
+- Delta-merging streaming quote store with per-UIC tick history (CONN-018)
+- Batched, diffed list price subscriptions re-established on reconnect (CONN-019)
 - Multi-bot token coordination via TokenCoordinator
 
 AssetType enum includes:
@@ -49,7 +52,7 @@ import threading
 import webbrowser
 import struct
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any, Callable, Tuple
+from typing import Optional, Dict, List, Any, Callable, Tuple, Set, Iterable
 from urllib.parse import urlencode
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from dataclasses import dataclass
@@ -57,6 +60,7 @@ from enum import Enum
 
 import requests
 import websocket
+from requests.adapters import HTTPAdapter
 
 # Import external price feed for simulation fallback
 from shared.external_price_feed import ExternalPriceFeed
@@ -67,6 +71,12 @@ from shared.token_coordinator import get_token_coordinator, TokenCoordinator
 # Import ET time for DTE calculations (VM runs UTC, trading is ET)
 from shared.market_hours import get_us_market_time
 
+# Per-endpoint REST latency / 429 / retry accounting
+from shared.request_metrics import RequestMetrics
+
+# Delta-merged streaming quotes + tick ring buffers
+from shared.quote_store import QuoteStore, Tick
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -233,6 +243,13 @@ class SaxoClient:
         # Circuit breaker for error handling
         self.circuit_breaker = CircuitBreakerState()
 
+        # CONN-007: Long-lived pooled HTTP session (keep-alive) for all REST calls,
+        # so quotes/orders/positions reuse TLS connections instead of a fresh
+        # handshake per call. Pool sizes configurable under saxo_api.http.
+        self.http_config = self.saxo_config.get("http", {})
+        self._http_session = self._create_http_session()
+        self.request_metrics = RequestMetrics(window=self.http_config.get("latency_window", 1000))
+
         # Heartbeat tracking for debugging and health monitoring
         self._heartbeat_count = 0
         self._last_heartbeat_time: Optional[datetime] = None  # Fix #6: Heartbeat timeout detection
@@ -246,9 +263,22 @@ class SaxoClient:
         self.is_streaming = False
 
         # Fix #8: Thread-safe price cache with locking
-        # Cache structure: {uic: {'data': {...}, 'timestamp': datetime}}
-        self._price_cache: Dict[int, Dict] = {}
-        self._price_cache_lock = threading.Lock()
+        # CONN-018: Streaming deltas are merged into a full quote per UIC (monotonic
+        # timestamps, lock-free reads) and each Quote update is kept in a per-UIC
+        # tick ring buffer (saxo_api.streaming.tick_buffer_size).
+        streaming_config = self.saxo_config.get("streaming", {})
+        self._quote_store = QuoteStore(tick_buffer=streaming_config.get("tick_buffer_size", 512))
+
+        # CONN-019: Streaming subscriptions are batched per asset type into list
+        # subscriptions (/trade/v1/infoprices/subscriptions, one request for many
+        # UICs). The desired instrument set is remembered so changes only send
+        # subscribe/unsubscribe deltas and a reconnect re-subscribes in one batch.
+        self._stream_max_uics = streaming_config.get("max_uics_per_subscription", 100)
+        self._stream_instruments: Dict[int, str] = {}          # desired UIC -> asset type
+        self._stream_batches: Dict[str, Dict[str, Any]] = {}   # ReferenceId -> {"asset_type", "uics"}
+        self._stream_uic_ref: Dict[int, str] = {}              # subscribed UIC -> ReferenceId
+        self._stream_batch_seq = 0
+        self._stream_lock = threading.RLock()
 
         # Fix #2: Cache staleness configuration (seconds)
         self._cache_max_age_seconds = 60  # Consider cached data stale after 60s
@@ -343,6 +373,32 @@ class SaxoClient:
 
         logger.info(f"SaxoClient initialized in {self.environment} environment")
 
+    def _create_http_session(self) -> requests.Session:
+        """
+        Build the pooled REST session (CONN-007).
+
+        Retries stay in _make_request (429 backoff, 401 refresh), so the
+        adapter itself never retries.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.http_config.get("pool_connections", 4),
+            pool_maxsize=self.http_config.get("pool_maxsize", 16),
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close_http_session(self) -> None:
+        """Close pooled REST connections (a new session is opened on the next request)."""
+        self._http_session.close()
+        self._http_session = self._create_http_session()
+
+    def get_request_metrics(self) -> Dict[str, Any]:
+        """Per-endpoint REST latency percentiles, errors, 429s and retries (CONN-007)."""
+        return self.request_metrics.snapshot()
+
     @property
     def is_simulation(self) -> bool:
         """Check if running in simulation environment."""
@@ -1020,8 +1076,9 @@ class SaxoClient:
 
         url = f"{self.base_url}{endpoint}"
 
+        start = time.perf_counter()
         try:
-            response = requests.request(
+            response = self._http_session.request(
                 method=method,
                 url=url,
                 headers=self._get_auth_headers(),
@@ -1029,6 +1086,8 @@ class SaxoClient:
                 json=data,
                 timeout=30
             )
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start,
+                                        response.status_code)
 
             # Added 202 to the success list
             if response.status_code in [200, 201, 202]:
@@ -1058,6 +1117,7 @@ class SaxoClient:
                     self._rate_limit_backoff_until = datetime.now() + timedelta(seconds=delay)
                     # Retry the request after backoff
                     time.sleep(delay)
+                    self.request_metrics.record_retry(method, endpoint)
                     return self._make_request(method, endpoint, params, data)
                 else:
                     logger.error(f"CONN-006: Rate limit retries exhausted ({self._rate_limit_max_retries})")
@@ -1068,6 +1128,7 @@ class SaxoClient:
                 logger.warning("CONN-004: 401 Unauthorized - attempting token refresh")
                 if self.authenticate(force_refresh=True):
                     logger.info("CONN-004: Token refreshed, retrying request")
+                    self.request_metrics.record_retry(method, endpoint)
                     return self._make_request(method, endpoint, params, data)
                 else:
                     logger.error("CONN-004: Token refresh failed")
@@ -1079,10 +1140,12 @@ class SaxoClient:
                 return None
 
         except requests.exceptions.Timeout:
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start, timeout=True)
             logger.error(f"Request timeout for {endpoint}")
             self._record_error()
             return None
         except requests.exceptions.RequestException as e:
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start)
             logger.error(f"Request error for {endpoint}: {e}")
             self._record_error()
             return None
@@ -1091,7 +1154,9 @@ class SaxoClient:
         """
         Get data from price cache with staleness check (Fix #2).
 
-        Thread-safe cache access with timestamp validation.
+        CONN-018: Lock-free read of the merged full quote. The returned dict is
+        the cached object itself (never mutated once published) - treat it as
+        read-only.
 
         Args:
             uic: Unique Instrument Code
@@ -1104,57 +1169,64 @@ class SaxoClient:
         if max_age_seconds is None:
             max_age_seconds = self._cache_max_age_seconds
 
-        with self._price_cache_lock:
-            if uic not in self._price_cache:
-                return None
-
-            cache_entry = self._price_cache[uic]
-            if not cache_entry:
-                return None
-
-            # Check staleness (Fix #2)
-            timestamp = cache_entry.get('timestamp')
-            if timestamp:
-                age = (datetime.now() - timestamp).total_seconds()
-                if age > max_age_seconds:
-                    logger.debug(f"Cache stale for UIC {uic}: {age:.1f}s old > {max_age_seconds}s max")
-                    return None
-
-            data = cache_entry.get('data')
-            if not data:
-                return None
-
-            # Return a copy to prevent mutation issues
-            return data.copy() if isinstance(data, dict) else data
+        data = self._quote_store.get(uic, max_age=max_age_seconds)
+        if data is None and uic in self._quote_store:
+            logger.debug(f"Cache stale for UIC {uic}: {self._quote_store.age(uic):.1f}s old > {max_age_seconds}s max")
+        return data or None
 
-    def _update_cache(self, uic: int, data: Dict) -> None:
+    def _update_cache(self, uic: int, data: Dict, replace: bool = False) -> Dict:
         """
         Update price cache with timestamp (Fix #2).
 
-        Thread-safe cache update with automatic timestamping.
+        CONN-018: Streaming messages are deltas, so they are merged into the
+        cached quote rather than replacing it. Pass replace=True for full
+        subscription snapshots.
 
         Args:
             uic: Unique Instrument Code
-            data: Quote data to cache
+            data: Quote data (delta or snapshot) to cache
+            replace: Replace the cached quote instead of merging into it
+
+        Returns:
+            dict: The merged full quote now cached for this UIC.
         """
-        with self._price_cache_lock:
-            self._price_cache[uic] = {
-                'data': data,
-                'timestamp': datetime.now()
-            }
+        return self._quote_store.update(uic, data, replace=replace)
 
     def _clear_cache(self) -> None:
         """
-        Clear all cached price data (Fix #1, #7).
+        Clear all cached price data and tick history (Fix #1, #7).
 
         Thread-safe cache clearing. Called on WebSocket disconnect
         and before reconnection to prevent stale data usage.
         """
-        with self._price_cache_lock:
-            cache_size = len(self._price_cache)
-            self._price_cache.clear()
-            if cache_size > 0:
-                logger.info(f"Cleared {cache_size} entries from price cache")
+        cache_size = self._quote_store.clear()
+        if cache_size > 0:
+            logger.info(f"Cleared {cache_size} entries from price cache")
+
+    def get_tick_history(
+        self,
+        uic: int,
+        seconds: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[Tick]:
+        """
+        Get recent streamed (timestamp, bid, ask) ticks for an instrument (CONN-018).
+
+        Served from the WebSocket tick buffer - no API call. Timestamps are
+        time.monotonic() values. Empty if the UIC is not streamed or the
+        WebSocket is unhealthy.
+
+        Args:
+            uic: Unique Instrument Code
+            seconds: Only ticks from the last N seconds
+            limit: At most this many (most recent) ticks
+
+        Returns:
+            list: (ts, bid, ask) tuples, oldest first.
+        """
+        if not self.is_websocket_healthy():
+            return []
+        return self._quote_store.ticks(int(uic), seconds=seconds, limit=limit)
 
     def get_quote(self, uic: int, asset_type: str = "Stock", skip_cache: bool = False) -> Optional[Dict]:
         """
@@ -2133,8 +2205,8 @@ class SaxoClient:
 
         # PRIORITY 1: Check WebSocket streaming cache (no API call, instant)
         # Only use cache if WebSocket is healthy (Fix: match get_quote() pattern)
-        if self.is_websocket_healthy() and spy_uic_int in self._price_cache:
-            cached = self._price_cache[spy_uic_int]
+        if self.is_websocket_healthy() and spy_uic_int in self._quote_store:
+            cached = self._get_from_cache(spy_uic_int)
             # Defensive: check cached is dict and Quote exists and is not None
             if cached and isinstance(cached, dict) and cached.get("Quote"):
                 quote = cached["Quote"]
@@ -2249,8 +2321,8 @@ class SaxoClient:
 
         # 1. Check the price cache (from subscription snapshots)
         # Only use cache if WebSocket is healthy (Fix: match get_quote() pattern)
-        if self.is_websocket_healthy() and vix_uic in self._price_cache:
-            cached_data = self._price_cache[vix_uic]
+        if self.is_websocket_healthy() and vix_uic in self._quote_store:
+            cached_data = self._get_from_cache(vix_uic)
             price = self._extract_price_from_data(cached_data, "VIX cache")
             if price:
                 return price
@@ -2918,8 +2990,9 @@ class SaxoClient:
 
         url = f"{self.base_url}{endpoint}"
 
+        start = time.perf_counter()
         try:
-            response = requests.request(
+            response = self._http_session.request(
                 method=method,
                 url=url,
                 headers=self._get_auth_headers(),
@@ -2927,6 +3000,8 @@ class SaxoClient:
                 json=data,
                 timeout=30
             )
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start,
+                                        response.status_code)
 
             if response.status_code in [200, 201, 202]:
                 return response.json() if response.text else {}
@@ -2937,9 +3012,11 @@ class SaxoClient:
                 return None
 
         except requests.exceptions.Timeout:
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start, timeout=True)
             logger.error(f"Emergency request timeout for {endpoint}")
             return None
         except requests.exceptions.RequestException as e:
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start)
             logger.error(f"Emergency request error for {endpoint}: {e}")
             return None
 
@@ -2970,8 +3047,9 @@ class SaxoClient:
 
         url = f"{self.base_url}{endpoint}"
 
+        start = time.perf_counter()
         try:
-            response = requests.request(
+            response = self._http_session.request(
                 method=method,
                 url=url,
                 headers=self._get_auth_headers(),
@@ -2979,6 +3057,8 @@ class SaxoClient:
                 json=data,
                 timeout=30
             )
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start,
+                                        response.status_code)
 
             if response.status_code in [200, 201, 202]:
                 return response.json() if response.text else {}, None
@@ -2992,10 +3072,12 @@ class SaxoClient:
                 return None, error_info_str
 
         except requests.exceptions.Timeout:
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start, timeout=True)
             error_msg = f"Timeout for {endpoint}"
             logger.error(f"Emergency request timeout for {endpoint}")
             return None, error_msg
         except requests.exceptions.RequestException as e:
+            self.request_metrics.record(method, endpoint, time.perf_counter() - start)
             error_msg = str(e)
             logger.error(f"Emergency request error for {endpoint}: {e}")
             return None, error_msg
@@ -3743,16 +3825,20 @@ class SaxoClient:
         Start WebSocket streaming for real-time price updates.
 
         This is the primary method for enabling real-time price data without
-        REST API calls. Once started, prices are cached in self._price_cache
+        REST API calls. Once started, prices are cached in self._quote_store
         and automatically used by get_quote(), get_spy_price(), get_vix_price().
 
         CRITICAL (2026-01-26): Saxo sends BINARY WebSocket frames, not JSON text.
         The binary parsing is handled by _decode_binary_ws_message() using struct.
         Previous code tried to decode binary as UTF-8 which silently failed.
 
+        CONN-019: Instruments are subscribed in list subscriptions batched by
+        asset type (see _apply_subscription_changes()). Instruments already
+        streaming are skipped, so calling this again only adds the new ones.
+
         Architecture:
         - WebSocket receives binary frames -> _decode_binary_ws_message() parses
-        - Parsed data updates self._price_cache[uic] in _handle_streaming_message()
+        - Parsed deltas are merged into self._quote_store in _handle_streaming_message()
         - get_quote()/get_spy_price()/get_vix_price() check cache first (instant)
         - If cache miss or skip_cache=True, falls back to REST API
 
@@ -3761,7 +3847,7 @@ class SaxoClient:
             callback: Function to call with price updates (uic, data)
 
         Returns:
-            bool: True if all subscriptions were attempted.
+            bool: True if at least one of the requested instruments is subscribed.
         """
         if self.is_streaming:
             logger.warning("Streaming already active. Adding new subscriptions...")
@@ -3789,69 +3875,183 @@ class SaxoClient:
             self._last_message_time = None
             self._last_heartbeat_time = None
 
+            # CONN-019: Subscriptions belonged to the old context; forget them so
+            # the remembered instruments are re-subscribed below in one batch
+            with self._stream_lock:
+                self._stream_batches.clear()
+                self._stream_uic_ref.clear()
+
             self._start_websocket()
             # Give the socket a moment to connect
             time.sleep(2)
 
-        success_count = 0
-
-        # 2. Loop through each instrument and subscribe individually
+        # 2. Register callbacks and subscribe everything not already streaming.
+        # CONN-019: Batched by asset type - one list subscription request per
+        # asset type instead of one POST per UIC. On a fresh connection this
+        # also re-establishes instruments remembered from before the reconnect.
+        requested: Dict[int, str] = {}
         for item in subscriptions:
             uic = int(item["uic"])  # Ensure UIC is always int for consistent cache keys
-            asset_type = item["asset_type"]
-
-            # Store callback
+            requested[uic] = item["asset_type"]
             self.price_callbacks[uic] = callback
 
-            # Create individual subscription request
-            # CRITICAL FIX: Use "Uic" (singular), not "Uics"
-            # Include AccountKey for proper sim environment access
-            subscription_request = {
-                "ContextId": self.subscription_context_id,
-                "ReferenceId": f"ref_{uic}",
-                "Arguments": {
-                    "AccountKey": self.account_key,
-                    "Uic": int(uic),           # Fix: Must be Int, singular
-                    "AssetType": asset_type,   # Fix: Specific type for this UIC
-                    # FieldGroups: MUST include PriceInfoDetails for indices like VIX!
-                    # - Quote: bid/ask/mid for tradable instruments (stocks, ETFs, options)
-                    # - PriceInfo: high/low/netChange
-                    # - PriceInfoDetails: LastTraded (REQUIRED for VIX which has no bid/ask)
-                    # Without PriceInfoDetails, VIX cache lookups fail and fall back to Yahoo.
-                    # See: get_vix_price() and _extract_price_from_data() for price extraction logic.
-                    "FieldGroups": ["DisplayAndFormat", "Quote", "PriceInfo", "PriceInfoDetails"]
-                }
+        with self._stream_lock:
+            self._apply_subscription_changes({**self._stream_instruments, **requested}, set())
+            logger.debug(f"  Cache now contains UICs: {self._quote_store.uics()}")
+            return any(uic in self._stream_uic_ref for uic in requested)
+
+    # =========================================================================
+    # BATCHED STREAMING SUBSCRIPTIONS (CONN-019)
+    # =========================================================================
+
+    def _subscribe_batch(self, asset_type: str, uics: List[int]) -> bool:
+        """
+        Subscribe several instruments of one asset type in a single list subscription.
+
+        Caches the snapshot for each UIC and passes it to its callback right
+        away so we don't have to wait for the first tick. Caller holds
+        self._stream_lock.
+
+        Args:
+            asset_type: Asset type shared by all UICs (Saxo list constraint)
+            uics: UICs to subscribe
+
+        Returns:
+            bool: True if the subscription was created.
+        """
+        self._stream_batch_seq += 1
+        ref_id = f"lst_{self._stream_batch_seq}"
+        subscription_request = {
+            "ContextId": self.subscription_context_id,
+            "ReferenceId": ref_id,
+            "Arguments": {
+                "AccountKey": self.account_key,
+                "Uics": ",".join(str(uic) for uic in uics),
+                "AssetType": asset_type,
+                # FieldGroups: MUST include PriceInfoDetails for indices like VIX!
+                # PriceInfoDetails carries LastTraded, the only price VIX has (no bid/ask).
+                # See: get_vix_price() and _extract_price_from_data() for price extraction logic.
+                "FieldGroups": ["DisplayAndFormat", "Quote", "PriceInfo", "PriceInfoDetails"]
             }
+        }
 
-            endpoint = "/trade/v1/prices/subscriptions"
-            response = self._make_request("POST", endpoint, data=subscription_request)
-
-            if response and "Snapshot" in response:
-                logger.info(f"✓ Subscribed to UIC {uic} ({asset_type})")
-                success_count += 1
-
-                # Cache the snapshot price data for later retrieval
-                # Fix #2: Use timestamp-aware cache update
-                snapshot = response["Snapshot"]
-                self._update_cache(uic, snapshot)
-
-                # Log the snapshot structure for debugging
-                snapshot_keys = list(snapshot.keys()) if isinstance(snapshot, dict) else str(type(snapshot))
-                logger.debug(f"  Cached UIC {uic} (type={type(uic).__name__}), keys: {snapshot_keys}")
-                with self._price_cache_lock:
-                    logger.debug(f"  Cache now contains UICs: {list(self._price_cache.keys())}")
-                # Show price data if available
-                if isinstance(snapshot, dict):
-                    if "Quote" in snapshot:
-                        logger.debug(f"  Quote data: {snapshot['Quote']}")
-
-                # Immediately process the snapshot so we don't have to wait for a tick
-                if callback:
-                    callback(uic, snapshot)
-            else:
-                logger.error(f"✗ Failed to subscribe to UIC {uic} ({asset_type})")
+        endpoint = "/trade/v1/infoprices/subscriptions"
+        response = self._make_request("POST", endpoint, data=subscription_request)
+
+        if not response or "Snapshot" not in response:
+            logger.error(f"✗ Failed to subscribe to {len(uics)} {asset_type} instrument(s): {uics}")
+            return False
+
+        self._stream_batches[ref_id] = {"asset_type": asset_type, "uics": list(uics)}
+        for uic in uics:
+            self._stream_uic_ref[uic] = ref_id
+        logger.info(f"✓ Subscribed to {len(uics)} {asset_type} instrument(s) in one request ({ref_id}): {uics}")
+
+        # List snapshots come wrapped in "Data", one item per UIC
+        for item in response["Snapshot"].get("Data", []):
+            uic = item.get("Uic")
+            if not uic:
+                continue
+            uic = int(uic)
+            quote = self._update_cache(uic, item, replace=True)
+            if "Quote" in item:
+                logger.debug(f"  Quote data for UIC {uic}: {item['Quote']}")
+            callback = self.price_callbacks.get(uic)
+            if callback:
+                callback(uic, quote)
+        return True
+
+    def _unsubscribe_batch(self, ref_id: str) -> None:
+        """Delete one list subscription. Caller holds self._stream_lock."""
+        batch = self._stream_batches.pop(ref_id, None)
+        if batch is None:
+            return
+        for uic in batch["uics"]:
+            if self._stream_uic_ref.get(uic) == ref_id:
+                del self._stream_uic_ref[uic]
+
+        endpoint = f"/trade/v1/infoprices/subscriptions/{self.subscription_context_id}/{ref_id}"
+        self._make_request("DELETE", endpoint)
+        logger.info(f"Unsubscribed {ref_id} ({len(batch['uics'])} instrument(s))")
+
+    def _apply_subscription_changes(self, add: Dict[int, str], remove: Set[int]) -> bool:
+        """
+        Apply a subscribe/unsubscribe delta to the streamed instrument set.
+
+        Only instruments that are not already streaming are subscribed, grouped
+        by asset type and chunked to saxo_api.streaming.max_uics_per_subscription.
+        A list subscription can't be edited, so a batch losing some of its UICs
+        is deleted and its remaining UICs re-subscribed together with `add`.
+
+        Args:
+            add: UIC -> asset type to stream
+            remove: UICs to stop streaming
+
+        Returns:
+            bool: True if every needed subscription request succeeded.
+        """
+        with self._stream_lock:
+            resubscribe: Dict[int, str] = {}
+            for ref_id in {self._stream_uic_ref[uic] for uic in remove if uic in self._stream_uic_ref}:
+                batch = self._stream_batches[ref_id]
+                for uic in batch["uics"]:
+                    if uic not in remove:
+                        resubscribe[uic] = batch["asset_type"]
+                self._unsubscribe_batch(ref_id)
+
+            for uic in remove:
+                self._stream_instruments.pop(uic, None)
+                self.price_callbacks.pop(uic, None)
+            self._stream_instruments.update(add)
+
+            pending: Dict[str, List[int]] = {}
+            for uic, asset_type in {**resubscribe, **add}.items():
+                if uic not in self._stream_uic_ref:
+                    pending.setdefault(asset_type, []).append(uic)
+
+            all_ok = True
+            for asset_type, uics in pending.items():
+                for i in range(0, len(uics), self._stream_max_uics):
+                    if not self._subscribe_batch(asset_type, uics[i:i + self._stream_max_uics]):
+                        all_ok = False
+            return all_ok
+
+    def sync_price_subscriptions(
+        self,
+        subscriptions: List[Dict[str, Any]],
+        callback: Optional[Callable[[int, Dict], None]] = None
+    ) -> bool:
+        """
+        Make the streamed instrument set exactly `subscriptions` (CONN-019).
+
+        Diffs against what is already streaming: new instruments are
+        subscribed in batches, dropped ones unsubscribed, unchanged ones are
+        left alone. Requires an open WebSocket (start_price_streaming()).
 
-        return success_count > 0
+        Args:
+            subscriptions: List of dicts, e.g. [{"uic": 211, "asset_type": "Stock"}, ...]
+            callback: Function to call with price updates for new instruments
+
+        Returns:
+            bool: True if every needed subscription request succeeded.
+        """
+        desired = {int(item["uic"]): item["asset_type"] for item in subscriptions}
+        with self._stream_lock:
+            remove = set(self._stream_instruments) - set(desired)
+            if callback:
+                for uic in desired:
+                    self.price_callbacks.setdefault(uic, callback)
+            return self._apply_subscription_changes(desired, remove)
+
+    def unsubscribe_instruments(self, uics: Iterable[int]) -> None:
+        """Stop streaming the given UICs, e.g. legs of a closed position (CONN-019)."""
+        self._apply_subscription_changes({}, {int(uic) for uic in uics})
+
+    def get_streamed_instruments(self) -> Dict[int, str]:
+        """UIC -> asset type for every instrument currently subscribed (CONN-019)."""
+        with self._stream_lock:
+            return {uic: self._stream_instruments[uic] for uic in self._stream_uic_ref
+                    if uic in self._stream_instruments}
 
     def _decode_binary_ws_message(self, raw: bytes):
         """
@@ -3972,7 +4172,7 @@ class SaxoClient:
         - 4 bytes: Payload size (int32 little-endian)
         - N bytes: JSON payload
 
-        The WebSocket updates self._price_cache which is used by get_quote(),
+        The WebSocket updates self._quote_store which is used by get_quote(),
         get_spy_price(), and get_vix_price() to avoid REST API calls.
         """
         def on_message(ws, message):
@@ -4004,6 +4204,11 @@ class SaxoClient:
                         if isinstance(msg_data, dict):
                             self._handle_streaming_message(msg_data, ref_id)
                             self._record_success()
+                        elif isinstance(msg_data, list):
+                            # CONN-019: List subscriptions send a JSON array of
+                            # per-UIC deltas, each carrying its "Uic"
+                            self._handle_streaming_message({"Data": msg_data}, ref_id)
+                            self._record_success()
                 else:
                     # Text message (fallback, shouldn't happen with Saxo)
                     data = json.loads(message)
@@ -4091,9 +4296,14 @@ class SaxoClient:
         1. Wrapped format: {"Data": [{"Uic": 123, "Quote": {...}}]}
         2. Direct format: {"Quote": {...}, "PriceInfo": {...}} with UIC in ref_id
 
+        CONN-018: Updates after the snapshot only carry the fields that changed,
+        so each one is merged into the cached quote and callbacks receive the
+        merged full quote (a Bid-only delta still has Ask/Mid/PriceInfo).
+
         Args:
             data: The parsed message data
-            ref_id: Reference ID from binary message (e.g., "ref_36590" for UIC 36590)
+            ref_id: Reference ID from binary message (e.g., "ref_36590" for UIC 36590,
+                    "opt_<uic>" for subscribe_to_option())
         """
         # Format 1: Wrapped in "Data" array (from initial snapshot or some updates)
         if "Data" in data:
@@ -4101,23 +4311,22 @@ class SaxoClient:
                 uic = item.get("Uic")
                 if uic:
                     uic = int(uic)
-                    # Fix #2: Use timestamp-aware cache update
-                    self._update_cache(uic, item)
+                    quote = self._update_cache(uic, item)
                     if uic in self.price_callbacks:
-                        self.price_callbacks[uic](uic, item)
+                        self.price_callbacks[uic](uic, quote)
             return
 
         # Format 2: Direct message with UIC in ref_id (e.g., "ref_36590")
         # This is the format for streaming price updates after initial snapshot
-        if ref_id and ref_id.startswith("ref_"):
+        if ref_id and ref_id.startswith(("ref_", "opt_")):
             try:
                 uic = int(ref_id.split("_")[1])
-                # Fix #2: Use timestamp-aware cache update
-                self._update_cache(uic, data)
-                if uic in self.price_callbacks:
-                    self.price_callbacks[uic](uic, data)
             except (ValueError, IndexError):
                 logger.debug(f"Could not extract UIC from ref_id: {ref_id}")
+                return
+            quote = self._update_cache(uic, data)
+            if uic in self.price_callbacks:
+                self.price_callbacks[uic](uic, quote)
 
     def is_websocket_healthy(self) -> bool:
         """
@@ -4176,22 +4385,36 @@ class SaxoClient:
         age = (datetime.now() - self._last_heartbeat_time).total_seconds()
         return age <= max_age_seconds
 
-    def stop_price_streaming(self):
-        """Stop WebSocket streaming and clean up subscriptions."""
+    def stop_price_streaming(self, forget_subscriptions: bool = True):
+        """
+        Stop WebSocket streaming and clean up subscriptions.
+
+        Args:
+            forget_subscriptions: If False, keep the instrument set and callbacks
+                so the next start_price_streaming() re-subscribes all of them in
+                one batch (CONN-019) - use when reconnecting mid-session.
+        """
         self._intentional_ws_close = True  # Flag to suppress warning in on_close
         if self.ws_connection:
             self.ws_connection.close()
             self.ws_connection = None
 
         self.is_streaming = False
-        self.price_callbacks.clear()
+        with self._stream_lock:
+            self._stream_batches.clear()
+            self._stream_uic_ref.clear()
+            if forget_subscriptions:
+                self._stream_instruments.clear()
+                self.price_callbacks.clear()
 
         # Fix #7: Clear cache on stop to prevent stale data if restarted later
         self._clear_cache()
 
-        # Delete subscription via REST
+        # Delete subscriptions via REST (whole context: single + list subscriptions)
         endpoint = f"/trade/v1/prices/subscriptions/{self.subscription_context_id}"
         self._make_request("DELETE", endpoint)
+        endpoint = f"/trade/v1/infoprices/subscriptions/{self.subscription_context_id}"
+        self._make_request("DELETE", endpoint)
 
         logger.info("Price streaming stopped")
 
@@ -4220,15 +4443,15 @@ class SaxoClient:
             # We need an existing streaming connection
             return False
 
-        # Check if already subscribed
-        if uic in self._price_cache:
-            cached = self._price_cache[uic]
-            if cached and "Quote" in cached:
-                bid = cached["Quote"].get("Bid", 0)
-                ask = cached["Quote"].get("Ask", 0)
-                if bid > 0 and ask > 0:
-                    logger.debug(f"Option UIC {uic} already subscribed with valid quotes")
-                    return True
+        # Check if already subscribed (no staleness check: quiet options can go
+        # a while without a tick while the subscription is still live)
+        cached = self._quote_store.get(uic)
+        if cached and "Quote" in cached:
+            bid = cached["Quote"].get("Bid", 0)
+            ask = cached["Quote"].get("Ask", 0)
+            if bid > 0 and ask > 0:
+                logger.debug(f"Option UIC {uic} already subscribed with valid quotes")
+                return True
 
         # Create subscription for this option
         # LIVE-001: Use correct asset type (StockIndexOption for SPX/SPXW, StockOption for SPY)
@@ -4248,7 +4471,7 @@ class SaxoClient:
 
         if response and "Snapshot" in response:
             snapshot = response["Snapshot"]
-            self._price_cache[uic] = snapshot
+            self._update_cache(uic, snapshot, replace=True)
 
             # Store callback if provided
             if callback:
@@ -4267,8 +4490,8 @@ class SaxoClient:
                     time.sleep(1)
 
                     # Check if streaming updated the cache
-                    if uic in self._price_cache:
-                        cached = self._price_cache[uic]
+                    cached = self._quote_store.get(uic)
+                    if cached:
                         if "Quote" in cached:
                             bid = cached["Quote"].get("Bid", 0)
                             ask = cached["Quote"].get("Ask", 0)
@@ -4285,6 +4508,39 @@ class SaxoClient:
             logger.error(f"✗ Failed to subscribe to option UIC {uic}")
             return False
 
+    def subscribe_to_options(
+        self,
+        uics: List[int],
+        callback: Callable[[int, Dict], None] = None,
+        asset_type: str = "StockOption"
+    ) -> bool:
+        """
+        Subscribe to streaming prices for several options in one request (CONN-019).
+
+        Batched counterpart of subscribe_to_option() for multi-leg positions:
+        all legs share one list subscription instead of one REST round trip
+        (plus quote wait) per leg. Prices come from the infoprices stream, the
+        same source get_quote()/get_quotes_batch() poll. Legs already streaming
+        are skipped.
+
+        Args:
+            uics: Option Unique Instrument Codes
+            callback: Optional callback for price updates
+            asset_type: Asset type - "StockOption" for SPY, "StockIndexOption" for SPX/SPXW
+
+        Returns:
+            bool: True if every leg is subscribed
+        """
+        if not self.is_streaming:
+            logger.warning("WebSocket not connected. Start streaming before subscribing to options")
+            return False
+
+        legs = {int(uic): asset_type for uic in uics}
+        if callback:
+            for uic in legs:
+                self.price_callbacks[uic] = callback
+        return self._apply_subscription_changes(legs, set())
+
     def get_streaming_option_quote(self, uic: int, max_wait_seconds: float = 3.0) -> Optional[Dict]:
         """
         Get option quote from streaming cache, subscribing if needed.
@@ -4300,9 +4556,9 @@ class SaxoClient:
             dict: Quote data with Bid/Ask, or None if unavailable
         """
         # First check if we already have valid cached data
-        if uic in self._price_cache:
-            cached = self._price_cache[uic]
-            if cached and "Quote" in cached:
+        cached = self._quote_store.get(uic)
+        if cached:
+            if "Quote" in cached:
                 bid = cached["Quote"].get("Bid", 0)
                 ask = cached["Quote"].get("Ask", 0)
                 if bid > 0 and ask > 0:
@@ -4319,9 +4575,9 @@ class SaxoClient:
         poll_interval = 0.2
 
         while time.time() - start_time < max_wait_seconds:
-            if uic in self._price_cache:
-                cached = self._price_cache[uic]
-                if cached and "Quote" in cached:
+            cached = self._quote_store.get(uic)
+            if cached:
+                if "Quote" in cached:
                     bid = cached["Quote"].get("Bid", 0)
                     ask = cached["Quote"].get("Ask", 0)
                     if bid > 0 and ask > 0:
@@ -4333,7 +4589,7 @@ class SaxoClient:
         logger.warning(f"Timeout waiting for streaming quote for UIC {uic}")
 
         # Return whatever we have, even if quotes are 0
-        return self._price_cache.get(uic)
+        return self._quote_store.get(uic)
 
     # =========================================================================
     # UTILITY METHODS
@@ -0,0 +1,101 @@
+"""Tests for batched multi-config evaluation (simulate_day_batch / run_backtest_batch)."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from copy import deepcopy
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 2, 5), 30)
+
+
+@pytest.fixture(scope="module")
+def base_cfg(tmp_path_factory):
+    d = tmp_path_factory.mktemp("batch")
+    write_synthetic_cache(d, DAYS, half_width=300, seed=5)
+    cfg = live_config()
+    cfg.cache_dir = str(d)
+    cfg.start_date, cfg.end_date = DAYS[0], DAYS[-1]
+    yield cfg
+    DAY_CACHE.clear(shared=True)
+
+
+def _variant(base, **overrides):
+    c = deepcopy(base)
+    for k, v in overrides.items():
+        setattr(c, k, v)
+    return c
+
+
+def _assert_same(expected, actual):
+    assert [d.date for d in expected] == [d.date for d in actual]
+    for de, da in zip(expected, actual):
+        assert [dataclasses.asdict(e) for e in de.entries] == \
+               [dataclasses.asdict(e) for e in da.entries], de.date
+
+
+class TestBatchMatchesSingleRuns:
+    def test_stop_buffer_sweep(self, base_cfg):
+        cfgs = [_variant(base_cfg, call_stop_buffer=b) for b in range(25, 205, 5)]
+        batch = engine.run_backtest_batch(cfgs)
+        for c, got in zip(cfgs, batch):
+            _assert_same(engine.run_backtest(c, verbose=False), got)
+
+    def test_mixed_selection_and_exit_params(self, base_cfg):
+        cfgs = [
+            _variant(base_cfg),
+            _variant(base_cfg, min_call_credit=1.0),                      # own selection group
+            _variant(base_cfg, put_stop_buffer=60.0, buffer_decay_start_mult=None),
+            _variant(base_cfg, price_based_stop_points=10.0),
+            _variant(base_cfg, trailing_stop_enabled=True),               # per-bar loop
+            _variant(base_cfg, cushion_nearstop_pct=0.8, cushion_recovery_pct=0.5),
+            _variant(base_cfg, stop_spread_markup_pct=0.1, broker_spread_markup=0.05,
+                     spread_value_cap_at_stop=True, stop_slippage_per_leg=0.0),
+            _variant(base_cfg, net_return_exit_pct=0.3, commission_per_leg=1.0),
+            _variant(base_cfg, replacement_entry_enabled=True, call_stop_buffer=20.0),
+            _variant(base_cfg, daily_loss_limit=-300.0, call_stop_buffer=20.0),
+            _variant(base_cfg, daily_loss_limit=-300.0, call_stop_buffer=150.0),
+            _variant(base_cfg, vix_regime_enabled=True, vix_regime_breakpoints=[14.0, 18.0],
+                     vix_regime_call_stop_buffer=[40.0, None, 200.0]),
+            _variant(base_cfg, movement_entry_pct=0.2, daily_loss_limit=-200.0),
+            _variant(base_cfg, start_date=DAYS[10]),                       # shorter range
+        ]
+        batch = engine.run_backtest_batch(cfgs)
+        for c, got in zip(cfgs, batch):
+            _assert_same(engine.run_backtest(c, verbose=False), got)
+
+
+class TestGrouping:
+    def test_exit_only_variants_share_one_group(self, base_cfg):
+        cfgs = [_variant(base_cfg, call_stop_buffer=b, put_stop_buffer=b * 2) for b in (10, 50, 90)]
+        cfgs.append(_variant(base_cfg, target_delta=12.0))
+        assert engine._group_by_selection(cfgs) == [[0, 1, 2], [3]]
+
+    def test_ad_hoc_attributes_split_groups(self, base_cfg):
+        a = _variant(base_cfg)
+        b = _variant(base_cfg)
+        b.some_new_knob = 3
+        assert len(engine._group_by_selection([a, b])) == 2
+
+    def test_selection_runs_once_per_slot(self, base_cfg, monkeypatch):
+        calls = []
+        real = engine._select_entry
+        monkeypatch.setattr(engine, "_select_entry",
+                            lambda *a, **k: calls.append(a[1]) or real(*a, **k))
+        cfgs = [_variant(base_cfg, call_stop_buffer=b) for b in (25, 75, 125, 175)]
+        engine.simulate_day_batch(DAYS[3], cfgs, Path(base_cfg.cache_dir), set())
+        n_batch = len(calls)
+        calls.clear()
+        engine.simulate_day(DAYS[3], cfgs[0], Path(base_cfg.cache_dir), set())
+        assert n_batch == len(calls) > 0
@@ -0,0 +1,51 @@
+"""Tests for backtest.benchmark — regression check and a smoke run of the harness."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("pandas")
+
+from backtest import benchmark
+from backtest.day_cache import DAY_CACHE
+
+
+class TestCompare:
+    def test_flags_only_drops_beyond_threshold(self):
+        baseline = {"cases": {"a": {"score": 100.0}, "b": {"score": 100.0},
+                              "c": {"score": 100.0}}}
+        now = {"a": {"score": 80.0}, "b": {"score": 70.0}, "c": {"score": 150.0},
+               "new": {"score": 1.0}}
+        regs = benchmark.compare(now, baseline, threshold=0.25)
+        assert [r.name for r in regs] == ["b"]
+        assert regs[0].change == pytest.approx(-0.30)
+
+
+class TestHarness:
+    def test_smoke_run_and_baseline_roundtrip(self, tmp_path):
+        try:
+            results = benchmark.run_cases(tmp_path / "cache", resolutions=("5min",),
+                                          entry_counts=(1,), n_days=2, repeat=1,
+                                          min_time=0.0, calibration=0.01, log=lambda s: None)
+        finally:
+            DAY_CACHE.clear(shared=True)
+        assert set(results) == {"build_lookup/5min", "scan_strike/5min",
+                                "simulate_day/5min/e1", "run_backtest/5min"}
+        assert all(r.rate > 0 and r.score == pytest.approx(r.rate * 0.01)
+                   for r in results.values())
+
+        path = tmp_path / "baseline.json"
+        benchmark.save_baseline(results, 0.01, path)
+        baseline = benchmark.load_baseline(path)
+        assert set(baseline["cases"]) == set(results)
+        assert benchmark.compare({n: r.as_dict() for n, r in results.items()}, baseline) == []
+
+        only = benchmark.run_cases(tmp_path / "cache", resolutions=("5min",), entry_counts=(1,),
+                                   n_days=2, repeat=1, min_time=0.0, only="scan_strike",
+                                   calibration=0.01, log=lambda s: None)
+        assert list(only) == ["scan_strike/5min"]
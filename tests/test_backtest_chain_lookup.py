@@ -0,0 +1,131 @@
+"""Tests for backtest.engine.ChainLookup — array-backed chain quote lookup.
+
+Every helper must return exactly what the original tuple-keyed dict produced,
+including for missing strikes, missing times and gappy chains.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.engine import ChainLookup
+from backtest.synthetic import synthetic_chain_day, synthetic_index_day
+
+
+def _reference_lookup(chain_df: pd.DataFrame) -> dict:
+    """The original dict-based _build_chain_lookup."""
+    lookup = {}
+    for row in chain_df.itertuples(index=False):
+        lookup[(row.strike, row.right, row.ms_of_day)] = (row.bid, row.ask, row.mid)
+    return lookup
+
+
+def _ref_bid(lk, k, r, ms):
+    return lk.get((k, r, ms), (0.0, 0.0, 0.0))[0]
+
+
+def _ref_ask(lk, k, r, ms):
+    return lk.get((k, r, ms), (0.0, 0.0, 0.0))[1]
+
+
+def _ref_open_credit(lk, short_k, long_k, r, ms):
+    key = (short_k, r, ms)
+    if key not in lk:
+        return 0.0
+    short_bid, short_ask, _ = lk[key]
+    if short_bid == 0:
+        return 0.0
+    if short_ask > 0 and (short_ask - short_bid) > short_bid:
+        return 0.0
+    if (long_k, r, ms) not in lk:
+        return 0.0
+    return max(0.0, (short_bid - _ref_ask(lk, long_k, r, ms)) * 100)
+
+
+def _ref_close_cost(lk, short_k, long_k, r, ms, markup=0.0):
+    short_ask = _ref_ask(lk, short_k, r, ms)
+    if short_ask == 0:
+        return 0.0
+    long_bid = _ref_bid(lk, long_k, r, ms)
+    return max(0.0, ((short_ask + markup) - max(0.0, long_bid - markup)) * 100)
+
+
+@pytest.fixture(scope="module")
+def chain():
+    index = synthetic_index_day(date(2024, 3, 4), seed=3)
+    return synthetic_chain_day(index, "5min", half_width=200, seed=3)
+
+
+@pytest.fixture(scope="module")
+def keys(chain):
+    """Random probe keys: mostly real quotes, plus missing strikes/times/rights."""
+    rng = np.random.default_rng(11)
+    strikes = chain["strike"].unique().tolist() + [1.0, 4999.5, 99999.0]
+    times = chain["ms_of_day"].unique().tolist() + [0, 34_200_001, 57_600_001]
+    out = []
+    for _ in range(4000):
+        out.append((float(rng.choice(strikes)), str(rng.choice(["C", "P", "X"], p=[.45, .45, .1])),
+                    int(rng.choice(times))))
+    return out
+
+
+class TestChainLookupEquivalence:
+    def test_mapping_protocol_matches_dict(self, chain, keys):
+        ref = _reference_lookup(chain)
+        lk = ChainLookup.from_frame(chain)
+        assert len(lk) == len(ref)
+        for key in keys:
+            assert (key in lk) == (key in ref)
+            assert lk.get(key) == ref.get(key)
+        for key, val in list(ref.items())[:500]:
+            assert lk[key] == val
+
+    def test_single_leg_helpers(self, chain, keys):
+        ref = _reference_lookup(chain)
+        lk = engine._build_chain_lookup(chain)
+        for k, r, ms in keys:
+            assert engine._get_bid(lk, k, r, ms) == _ref_bid(ref, k, r, ms)
+            assert engine._get_ask(lk, k, r, ms) == _ref_ask(ref, k, r, ms)
+            assert engine._strike_exists(lk, k, r, ms) == ((k, r, ms) in ref)
+
+    @pytest.mark.parametrize("markup", [0.0, 0.10])
+    def test_spread_helpers(self, chain, keys, markup):
+        ref = _reference_lookup(chain)
+        lk = engine._build_chain_lookup(chain)
+        for k, r, ms in keys:
+            for width in (5.0, 25.0, 60.0):
+                long_k = k + width if r == "C" else k - width
+                assert (engine._get_spread_open_credit(lk, k, long_k, r, ms)
+                        == _ref_open_credit(ref, k, long_k, r, ms))
+                assert (engine._get_spread_close_cost(lk, k, long_k, r, ms, markup)
+                        == _ref_close_cost(ref, k, long_k, r, ms, markup))
+
+    def test_duplicate_rows_last_wins(self):
+        df = pd.DataFrame({
+            "strike": [5000.0, 5000.0, 5005.0], "right": ["C", "C", "P"],
+            "ms_of_day": [34_200_000] * 3,
+            "bid": [1.0, 2.0, 3.0], "ask": [1.5, 2.5, 3.5], "mid": [1.25, 2.25, 3.25],
+        })
+        lk = ChainLookup.from_frame(df)
+        assert lk[(5000.0, "C", 34_200_000)] == _reference_lookup(df)[(5000.0, "C", 34_200_000)]
+        assert len(lk) == 2
+
+    def test_empty_chain(self):
+        lk = engine._build_chain_lookup(pd.DataFrame())
+        assert len(lk) == 0
+        assert engine._get_bid(lk, 5000.0, "C", 34_200_000) == 0.0
+        assert not engine._strike_exists(lk, 5000.0, "P", 34_200_000)
+
+    def test_numpy_scalar_keys(self, chain):
+        lk = ChainLookup.from_frame(chain)
+        row = chain.iloc[0]
+        assert lk.locate(row["strike"], row["right"], row["ms_of_day"]) is not None
@@ -0,0 +1,123 @@
+"""Tests for backtest.chain_store — consolidated memory-mapped chain store."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import shutil
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.chain_store import (
+    convert_cache, convert_dataset, day_parquet_path, load_stored_day, open_chain_store,
+)
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.downloader import get_spxw_trading_days
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 6, 3), 6)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    write_synthetic_cache(tmp_path, DAYS, half_width=250, seed=5)
+    DAY_CACHE.clear(shared=True)
+    yield tmp_path
+    DAY_CACHE.clear(shared=True)
+
+
+def _rows(results):
+    return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+
+class TestConvert:
+    def test_days_roundtrip_exactly(self, cache_dir):
+        assert convert_cache(cache_dir, verbose=False) == {"options": len(DAYS), "greeks": len(DAYS)}
+        for dataset in ("options", "greeks"):
+            store = open_chain_store(cache_dir, dataset)
+            assert store.days == DAYS
+            for d in DAYS:
+                exp = pd.read_parquet(day_parquet_path(cache_dir, dataset, d))
+                pd.testing.assert_frame_equal(store.day(d), exp)
+
+    def test_column_and_range_selection(self, cache_dir):
+        store = convert_dataset(cache_dir, "options", verbose=False)
+        d = DAYS[2]
+        full = pd.read_parquet(day_parquet_path(cache_dir, "options", d))
+        got = store.day(d, columns=["strike", "mid"], ms_range=(36_000_000, 40_000_000),
+                        strike_range=(4950.0, 5050.0))
+        mask = (full["ms_of_day"].between(36_000_000, 40_000_000)
+                & full["strike"].between(4950.0, 5050.0))
+        exp = full.loc[mask, ["strike", "mid"]].reset_index(drop=True)
+        pd.testing.assert_frame_equal(got, exp)
+
+    def test_missing_day_is_empty(self, cache_dir):
+        store = convert_dataset(cache_dir, "options", verbose=False)
+        assert store.day(date(2020, 1, 2)).empty
+        assert list(store.day(date(2020, 1, 2)).columns) == store.columns
+
+    def test_up_to_date_store_is_not_rebuilt(self, cache_dir):
+        convert_dataset(cache_dir, "options", verbose=False)
+        manifest = cache_dir / "store" / "options" / "manifest.json"
+        before = manifest.stat().st_mtime_ns
+        convert_dataset(cache_dir, "options", verbose=False)
+        assert manifest.stat().st_mtime_ns == before
+
+    def test_rebuild_keeps_days_whose_parquet_was_deleted(self, cache_dir):
+        first, new = DAYS[0], DAYS[-1]
+        kept = pd.read_parquet(day_parquet_path(cache_dir, "options", first))
+        new_path = day_parquet_path(cache_dir, "options", new)
+        new_df = pd.read_parquet(new_path)
+        new_path.unlink()
+        convert_dataset(cache_dir, "options", verbose=False)
+
+        day_parquet_path(cache_dir, "options", first).unlink()
+        new_df.to_parquet(new_path, index=False)            # a newly downloaded day
+        store = convert_dataset(cache_dir, "options", verbose=False)
+        assert store.days == DAYS
+        pd.testing.assert_frame_equal(store.day(first), kept)
+        pd.testing.assert_frame_equal(store.day(new), new_df)
+        pd.testing.assert_frame_equal(load_stored_day(cache_dir, "options", first), kept)
+
+        # Forced rebuild with every carried-over day still intact
+        store = convert_dataset(cache_dir, "options", rebuild=True, verbose=False)
+        pd.testing.assert_frame_equal(store.day(first), kept)
+
+
+class TestEngineReads:
+    def test_stale_day_falls_back_to_parquet(self, cache_dir):
+        convert_dataset(cache_dir, "options", verbose=False)
+        d = DAYS[0]
+        path = day_parquet_path(cache_dir, "options", d)
+        df = pd.read_parquet(path)
+        df["mid"] = np.float32(1.0)
+        df.to_parquet(path, index=False)
+        os.utime(path, ns=(0, 0))   # distinct mtime even on coarse filesystems
+        assert load_stored_day(cache_dir, "options", d) is None
+        assert (engine._load_chain(d, cache_dir / "options")["mid"] == 1.0).all()
+        # Rebuilding picks up the change
+        convert_dataset(cache_dir, "options", verbose=False)
+        assert (load_stored_day(cache_dir, "options", d)["mid"] == 1.0).all()
+
+    def test_backtest_identical_from_store_only(self, cache_dir):
+        cfg = live_config()
+        cfg.cache_dir = str(cache_dir)
+        cfg.start_date, cfg.end_date = DAYS[0], DAYS[-1]
+        cfg.use_real_greeks = True
+        expected = _rows(engine.run_backtest(cfg, verbose=False))
+
+        convert_cache(cache_dir, verbose=False)
+        shutil.rmtree(cache_dir / "options")
+        shutil.rmtree(cache_dir / "greeks")
+        DAY_CACHE.clear(shared=True)
+        assert get_spxw_trading_days(DAYS[0], DAYS[-1], cache_dir) == DAYS
+        assert _rows(engine.run_backtest(cfg, verbose=False)) == expected
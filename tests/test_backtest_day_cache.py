@@ -0,0 +1,92 @@
+"""Tests for backtest.day_cache — per-process day-data cache."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE, DayDataCache
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+
+class TestDayDataCache:
+    def test_miss_then_hit(self):
+        c = DayDataCache()
+        calls = []
+        loader = lambda: calls.append(1) or "v"
+        assert c.get("k", loader) == "v"
+        assert c.get("k", loader) == "v"
+        assert len(calls) == 1
+        st = c.stats()
+        assert st["misses"] == 1 and st["hits"] == 1
+
+    def test_none_is_cached(self):
+        c = DayDataCache()
+        calls = []
+        c.get("k", lambda: calls.append(1))
+        c.get("k", lambda: calls.append(1))
+        assert len(calls) == 1
+
+    def test_lru_evicts_oldest_by_count(self):
+        c = DayDataCache(max_days=2)
+        for k in ("a", "b", "c"):
+            c.get(k, lambda k=k: k)
+        assert c.stats()["evictions"] == 1
+        c.get("a", lambda: "a2")
+        assert c.stats()["misses"] == 4  # "a" was evicted and reloaded
+
+    def test_lru_evicts_by_size(self):
+        c = DayDataCache(max_days=100, max_mb=1.0)
+        for k in ("a", "b", "c"):
+            c.get(k, lambda k=k: k, sizer=lambda v: 600 * 1024)
+        assert c.stats()["lru_days"] == 1
+
+    def test_prewarmed_days_never_evicted(self):
+        c = DayDataCache(max_days=1)
+        assert c.prewarm([("a", lambda: 1), ("b", lambda: 2)]) == 2
+        c.get("x", lambda: 3)
+        c.get("y", lambda: 4)
+        assert c.get("a", lambda: pytest.fail("reloaded")) == 1
+        assert c.stats()["shared_hits"] == 1
+
+    def test_disabled_never_stores(self):
+        c = DayDataCache(max_days=0)
+        c.get("k", lambda: 1)
+        c.get("k", lambda: 1)
+        assert c.stats()["misses"] == 2
+
+
+class TestEngineUsesCache:
+    @pytest.fixture
+    def cfg(self, tmp_path):
+        days = trading_days(date(2024, 3, 4), 3)
+        write_synthetic_cache(tmp_path, days)
+        cfg = live_config()
+        cfg.cache_dir = str(tmp_path)
+        cfg.start_date, cfg.end_date = days[0], days[-1]
+        DAY_CACHE.clear(shared=True)
+        DAY_CACHE.reset_stats()
+        yield cfg
+        DAY_CACHE.clear(shared=True)
+
+    def test_second_run_is_all_hits_and_identical(self, cfg):
+        first = engine.run_backtest(cfg, verbose=False)
+        st = DAY_CACHE.stats()
+        assert st["misses"] == 3 and st["hits"] == 0
+        second = engine.run_backtest(cfg, verbose=False)
+        st = DAY_CACHE.stats()
+        assert st["misses"] == 3 and st["hits"] == 3
+        assert [d.net_pnl for d in first] == [d.net_pnl for d in second]
+
+    def test_prewarm_serves_from_shared_tier(self, cfg):
+        assert engine.prewarm_day_cache(cfg) == 3
+        engine.run_backtest(cfg, verbose=False)
+        st = DAY_CACHE.stats()
+        assert st["misses"] == 0 and st["shared_hits"] == 3
@@ -0,0 +1,95 @@
+"""Tests for backtest.delta_index — precomputed delta → strike search."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.delta_index import DeltaIndex
+from backtest.synthetic import (
+    synthetic_chain_day, synthetic_greeks_day, synthetic_index_day,
+)
+
+
+def _frame_nearest_strike(greeks_df: pd.DataFrame, spx: float, ms: int, side: str,
+                          target: float) -> Optional[float]:
+    # The per-call DataFrame search DeltaIndex replaces
+    right = "C" if side == "call" else "P"
+    available_ms = greeks_df["ms_of_day"].unique()
+    if len(available_ms) == 0:
+        return None
+    nearest_ms = int(available_ms[np.argmin(np.abs(available_ms - ms))])
+    mask = (greeks_df["right"] == right) & (greeks_df["ms_of_day"] == nearest_ms)
+    mask &= (greeks_df["strike"] > spx) if side == "call" else (greeks_df["strike"] < spx)
+    sub = greeks_df.loc[mask].copy()
+    sub = sub[sub["delta"].notna() & (sub["delta"] != 0)]
+    if sub.empty:
+        return None
+    sub["delta_dist"] = (sub["delta"].abs() - target).abs()
+    return float(sub.loc[sub["delta_dist"].idxmin()]["strike"])
+
+
+@pytest.fixture(scope="module")
+def greeks_df():
+    index = synthetic_index_day(date(2024, 3, 4), seed=3)
+    g = synthetic_greeks_day(synthetic_chain_day(index, "1min", half_width=300, seed=3), index)
+    rng = np.random.default_rng(0)
+    delta = g["delta"].to_numpy().copy()
+    delta[rng.random(len(g)) < 0.03] = np.nan
+    delta[rng.random(len(g)) < 0.03] = 0.0
+    g["delta"] = delta
+    return g
+
+
+class TestParity:
+    def test_matches_frame_search(self, greeks_df):
+        idx = DeltaIndex.from_frame(greeks_df)
+        rng = np.random.default_rng(1)
+        times = greeks_df["ms_of_day"].unique()
+        for _ in range(400):
+            ms = int(rng.choice(times)) + int(rng.integers(-90_000, 90_000))
+            spx = float(rng.uniform(4900, 5100))
+            side = "call" if rng.random() < 0.5 else "put"
+            target = float(rng.choice([0.05, 0.08, 0.1, 0.16, 0.3]))
+            assert (idx.nearest_strike(spx, ms, side, target)
+                    == _frame_nearest_strike(greeks_df, spx, ms, side, target))
+
+    def test_ties_go_to_first_row(self):
+        df = pd.DataFrame({
+            "strike": [5030.0, 5020.0, 5040.0, 5010.0],
+            "right": ["C", "C", "C", "C"],
+            "ms_of_day": [36_000_000] * 4,
+            "delta": np.array([0.07, 0.09, 0.07, 0.6], dtype=np.float32),
+        })
+        idx = DeltaIndex.from_frame(df)
+        for spx in (5000.0, 5025.0, 5035.0):
+            assert idx.nearest_strike(spx, 36_000_000, "call", 0.08) \
+                == _frame_nearest_strike(df, spx, 36_000_000, "call", 0.08)
+        assert idx.nearest_strike(5000.0, 36_000_000, "put", 0.08) is None
+        assert idx.nearest_strike(5100.0, 36_000_000, "call", 0.08) is None
+
+    def test_nearest_time_prefers_earlier(self):
+        idx = DeltaIndex.from_frame(pd.DataFrame({
+            "strike": [5050.0, 5050.0], "right": ["C", "C"],
+            "ms_of_day": [36_000_000, 36_060_000], "delta": [0.1, 0.2],
+        }))
+        assert idx.nearest_time(36_030_000) == 0
+        assert idx.nearest_time(36_030_001) == 1
+        assert idx.nearest_time(0) == 0 and idx.nearest_time(90_000_000) == 1
+
+    def test_engine_otm_distance(self, greeks_df):
+        idx = DeltaIndex.from_frame(greeks_df)
+        ms = int(greeks_df["ms_of_day"].iloc[len(greeks_df) // 2])
+        for side in ("call", "put"):
+            strike = _frame_nearest_strike(greeks_df, 5000.0, ms, side, 0.08)
+            expected = max(25, min(120, int(round(abs(strike - 5000.0) / 5) * 5)))
+            assert engine._find_target_delta_otm(idx, 5000.0, ms, side, 8.0) == expected
@@ -0,0 +1,139 @@
+"""Tests for backtest.download_manifest and the downloader's adaptive limiter."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.chain_store import day_parquet_path
+from backtest.download_manifest import EMPTY, FAILED, OK, DownloadManifest, file_sha256
+from backtest.downloader import AdaptiveLimiter
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 5, 6), 5)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    write_synthetic_cache(tmp_path, DAYS[:3], half_width=100, seed=4)
+    # Zero-row placeholder, as download_all writes for days with no data
+    pd.DataFrame(columns=["strike", "right", "ms_of_day", "bid", "ask", "mid"]).to_parquet(
+        day_parquet_path(tmp_path, "options", DAYS[3]), index=False)
+    return tmp_path
+
+
+class TestManifest:
+    def test_adopts_existing_files_without_reading_data(self, cache_dir, monkeypatch):
+        pytest.importorskip("pyarrow")   # row counts come from parquet metadata
+        monkeypatch.setattr(pd, "read_parquet", lambda *a, **k: pytest.fail("read parquet data"))
+        m = DownloadManifest(cache_dir)
+        assert m.missing("options", DAYS) == [DAYS[4]]
+        assert m.missing("options", DAYS, retry_empty=True) == [DAYS[3], DAYS[4]]
+        e = m.entry("options", DAYS[0])
+        assert e.status == OK and e.rows > 0 and e.sha256 is None
+        assert m.status("options", DAYS[3]) == EMPTY
+        assert m.summary("options")[OK] == 3
+
+    def test_hit_is_a_stat_and_changes_are_noticed(self, cache_dir):
+        m = DownloadManifest(cache_dir)
+        m.record_file("options", DAYS[0])
+        assert m.entry("options", DAYS[0]).sha256 == file_sha256(
+            day_parquet_path(cache_dir, "options", DAYS[0]))
+        assert m.is_cached("options", DAYS[0])
+
+        path = day_parquet_path(cache_dir, "options", DAYS[0])
+        pd.read_parquet(path).iloc[:0].to_parquet(path, index=False)
+        os.utime(path, ns=(0, 0))
+        assert not m.is_cached("options", DAYS[0])
+        assert m.status("options", DAYS[0]) == EMPTY
+
+        path.unlink()
+        assert m.missing("options", [DAYS[0]]) == [DAYS[0]]
+
+    def test_failures_and_verify(self, cache_dir):
+        m = DownloadManifest(cache_dir)
+        m.record_failure("options", DAYS[4])
+        m.record_failure("options", DAYS[4])
+        e = m.entry("options", DAYS[4])
+        assert (e.status, e.attempts) == (FAILED, 2)
+        assert DAYS[4] in m.missing("options", DAYS)
+
+        m.missing("options", DAYS)   # adopt the files already on disk
+        m.record_file("options", DAYS[1])
+        assert m.verify("options") == []
+        assert all(m.entry("options", d).sha256 for d in DAYS[:3])
+        # Same size and mtime, different bytes: only verify() can tell
+        path = day_parquet_path(cache_dir, "options", DAYS[1])
+        st = path.stat()
+        raw = bytearray(path.read_bytes())
+        raw[len(raw) // 2] ^= 0xFF
+        path.write_bytes(bytes(raw))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert m.is_cached("options", DAYS[1])
+        assert m.verify("options") == [DAYS[1]]
+        assert m.status("options", DAYS[1]) == FAILED
+        assert not path.exists() and path.with_name(path.name + ".corrupt").exists()
+
+    def test_empty_without_placeholder_stays_empty(self, cache_dir):
+        m = DownloadManifest(cache_dir)
+        m.record_empty("options", DAYS[4])          # no file written
+        assert m.status("options", DAYS[4]) == EMPTY
+        assert m.missing("options", [DAYS[4]]) == []
+
+        m.record_empty("options", DAYS[3])          # zero-row placeholder on disk
+        day_parquet_path(cache_dir, "options", DAYS[3]).unlink()
+        assert m.missing("options", [DAYS[3]]) == [DAYS[3]]
+
+    def test_persists_across_instances(self, cache_dir):
+        DownloadManifest(cache_dir).record_failure("greeks", DAYS[4])
+        assert DownloadManifest(cache_dir).entry("greeks", DAYS[4]).status == FAILED
+
+
+class TestAdaptiveLimiter:
+    def test_grows_on_success_halves_on_failure(self):
+        lim = AdaptiveLimiter(start=4, lo=1, hi=6, grow_after=2)
+        for _ in range(4):
+            lim.acquire()
+            lim.release(True)
+        assert lim.limit == 6
+        for _ in range(2):
+            lim.acquire()
+            lim.release(True)
+        assert lim.limit == 6
+        lim.acquire()
+        lim.release(False)
+        assert lim.limit == 3
+        for _ in range(3):
+            lim.acquire()
+            lim.release(False)
+        assert lim.limit == 1
+
+    def test_caps_concurrency(self):
+        lim = AdaptiveLimiter(start=2, lo=1, hi=2)
+        peak, active, lock = [0], [0], threading.Lock()
+
+        def work():
+            lim.acquire()
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            lim.release(True)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak[0] <= 2 and lim.active == 0
@@ -0,0 +1,100 @@
+"""Tests for backtest.index_series — sorted-array SPX/VIX series."""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.downloader import load_index_day
+from backtest.index_series import (
+    IndexSeries, clear_index_cache, index_month_path, load_index_series,
+)
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+# Spans a month boundary so two monthly files are involved
+DAYS = trading_days(date(2024, 1, 29), 6)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    write_synthetic_cache(tmp_path, DAYS, half_width=100, seed=9)
+    clear_index_cache()
+    yield tmp_path
+    clear_index_cache()
+
+
+def _frame_price_at(df: pd.DataFrame, t: int) -> float:
+    # The DataFrame lookup IndexSeries.at replaces
+    if df.empty:
+        return 0.0
+    before = df[df["ms_of_day"] <= t]
+    row = df.iloc[0] if before.empty else before.iloc[-1]
+    return float(row["price"])
+
+
+class TestQueries:
+    SERIES = IndexSeries(np.array([34_200_000, 34_260_000, 34_320_000, 34_380_000, 34_440_000]),
+                         np.array([5000.0, 0.0, 5004.0, 4996.5, 5001.0]))
+
+    def test_as_of(self):
+        s = self.SERIES
+        assert s.at(0) == 5000.0                 # before the first bar
+        assert s.at(34_259_999) == 5000.0
+        assert s.at(34_260_000) == 0.0           # as-of is raw, zero bars included
+        assert s.at(60_000_000) == 5001.0
+        assert IndexSeries.empty_series().at(34_200_000) == 0.0
+
+    def test_range_skips_non_positive(self):
+        s = self.SERIES
+        assert s.high(34_200_000, 34_440_000) == 5004.0
+        assert s.low(34_200_000, 34_440_000) == 4996.5
+        assert s.range(34_260_000, 34_320_000) == (5004.0, 5004.0)
+        assert s.high(34_260_000, 34_260_000) is None
+        assert s.range(0, 1) is None
+
+    def test_first_valid(self):
+        s = IndexSeries(np.array([1, 2, 3]), np.array([0.0, 18.5, 19.0]))
+        assert s.first_valid() == 18.5
+        assert IndexSeries(np.array([1]), np.array([0.0])).first_valid() == 0.0
+
+    def test_frame_roundtrip(self):
+        df = self.SERIES.to_frame()
+        back = IndexSeries.from_frame(df)
+        np.testing.assert_array_equal(back.ms, self.SERIES.ms)
+        np.testing.assert_array_equal(back.price, self.SERIES.price)
+        assert IndexSeries.from_frame(pd.DataFrame()).empty
+
+
+class TestLoad:
+    @pytest.mark.parametrize("symbol", ["SPX", "VIX"])
+    def test_matches_load_index_day(self, cache_dir, symbol):
+        for d in DAYS:
+            df = load_index_day(symbol, d, cache_dir)
+            s = load_index_series(symbol, d, cache_dir)
+            np.testing.assert_array_equal(s.ms, df["ms_of_day"].to_numpy())
+            np.testing.assert_array_equal(s.price, df["price"].to_numpy())
+            probe = np.arange(34_000_000, 58_000_000, 45_000)
+            assert s.at_many(probe).tolist() == [_frame_price_at(df, int(t)) for t in probe]
+
+    def test_missing_month_or_day_is_empty(self, cache_dir):
+        assert load_index_series("SPX", date(2020, 1, 2), cache_dir).empty
+        assert load_index_series("SPX", date(2024, 1, 27), cache_dir).empty   # Saturday
+
+    def test_month_reread_when_file_changes(self, cache_dir):
+        d = DAYS[-1]
+        before = load_index_series("SPX", d, cache_dir)
+        path = index_month_path("SPX", d, cache_dir)
+        df = pd.read_parquet(path)
+        df["price"] = df["price"] + 1.0
+        df.to_parquet(path, index=False)
+        os.utime(path, ns=(0, 0))   # distinct mtime even on coarse filesystems
+        after = load_index_series("SPX", d, cache_dir)
+        np.testing.assert_allclose(after.price, before.price + 1.0)
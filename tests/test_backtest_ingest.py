@@ -0,0 +1,117 @@
+"""Tests for the streaming bulk_hist ingestion in backtest.downloader."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.downloader import (
+    RTH_END_MS, RTH_START_MS, _iter_bulk, greeks_extractor, ingest_bulk, quote_extractor,
+)
+
+QUOTE_FMT = ["ms_of_day", "bid_size", "bid_exchange", "bid", "bid_condition",
+             "ask_size", "ask_exchange", "ask", "ask_condition", "date"]
+
+
+def _quote_body(n_strikes: int = 12, seed: int = 0, header_first: bool = True) -> dict:
+    rng = np.random.default_rng(seed)
+    ms = list(range(RTH_START_MS - 600_000, RTH_END_MS + 600_001, 300_000))
+    response = []
+    for k in range(n_strikes):
+        for right in ("C", "P"):
+            ticks = []
+            for t in ms:
+                bid = float(np.round(rng.choice([0.0, rng.uniform(0.05, 9)]), 2))
+                ask = float(np.round(bid + rng.choice([0.0, 0.05, 0.1]), 2))
+                ticks.append([t, 10, 5, bid, 0, 12, 5, ask, 0, 20240603])
+            response.append({"ticks": ticks,
+                             "contract": {"root": "SPXW", "expiration": 20240603,
+                                          "strike": (4950 + 5 * k) * 1000, "right": right}})
+    header = {"id": 1, "latency_ms": 3, "format": QUOTE_FMT, "note": "déjà vu ✓"}
+    if header_first:
+        return {"header": header, "response": response}
+    return {"response": response, "header": header}
+
+
+def _legacy_quotes(body: dict, both_sided_mid: bool) -> pd.DataFrame:
+    # What download_chain_day built from r.json() before streaming
+    fmt = body["header"]["format"]
+    i_ms, i_bid, i_ask = fmt.index("ms_of_day"), fmt.index("bid"), fmt.index("ask")
+    records = []
+    for item in body["response"]:
+        strike, right = item["contract"]["strike"] / 1000, item["contract"]["right"]
+        for tick in item["ticks"]:
+            ms, bid, ask = tick[i_ms], tick[i_bid], tick[i_ask]
+            if ms < RTH_START_MS or ms > RTH_END_MS:
+                continue
+            quoted = (bid > 0 and ask > 0) if both_sided_mid else (bid + ask) > 0
+            records.append((strike, right, ms, bid, ask, (bid + ask) / 2 if quoted else 0.0))
+    df = pd.DataFrame(records, columns=["strike", "right", "ms_of_day", "bid", "ask", "mid"])
+    return df.astype({"strike": "float32", "ms_of_day": "int32",
+                      "bid": "float32", "ask": "float32", "mid": "float32"})
+
+
+def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+class TestIterBulk:
+    def test_items_and_fields_in_any_chunking(self):
+        body = _quote_body(n_strikes=3)
+        raw = json.dumps(body, ensure_ascii=False).encode()   # multi-byte chars split across chunks
+        for size in (3, 7, 4096, len(raw)):
+            got = list(_iter_bulk(_chunks(raw, size)))
+            assert got[0] == ("header", body["header"])
+            assert [v for k, v in got if k is None] == body["response"]
+
+    def test_null_response_and_truncation(self):
+        assert list(_iter_bulk([b'{"header": {"format": null}, "response": null}'])) == [
+            ("header", {"format": None}), ("response", None)]
+        raw = json.dumps(_quote_body(n_strikes=2)).encode()
+        with pytest.raises(ValueError):
+            list(_iter_bulk(_chunks(raw[:-200], 64)))
+
+
+class TestIngest:
+    @pytest.mark.parametrize("both_sided_mid", [True, False])
+    @pytest.mark.parametrize("header_first", [True, False])
+    def test_matches_in_memory_parse(self, tmp_path, both_sided_mid, header_first):
+        body = _quote_body(header_first=header_first)
+        out = tmp_path / "SPXW_20240603.parquet"
+        rows, strikes = ingest_bulk(_chunks(json.dumps(body).encode(), 1000), out,
+                                    quote_extractor(both_sided_mid), row_group=97)
+        expected = _legacy_quotes(body, both_sided_mid)
+        got = pd.read_parquet(out)
+        assert (rows, strikes) == (len(expected), 12)
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+        assert got["bid"].dtype == np.float32 and got["ms_of_day"].dtype == np.int32
+        assert not (tmp_path / "SPXW_20240603.parquet.part").exists()
+
+    def test_greeks_drop_empty(self, tmp_path):
+        fmt = ["ms_of_day", "bid", "ask", "delta", "theta", "implied_vol", "date"]
+        ticks = [[RTH_START_MS, 1, 1.1, 0.0, 0, 0.0, 0], [RTH_START_MS + 60_000, 1, 1.1, 0.2, 0, 0.15, 0],
+                 [RTH_START_MS + 120_000, 1, 1.1, 0.0, 0, 0.12, 0]]
+        body = {"header": {"format": fmt},
+                "response": [{"ticks": ticks, "contract": {"strike": 5000000, "right": "C"}}]}
+        out = tmp_path / "g.parquet"
+        assert ingest_bulk([json.dumps(body).encode()], out, greeks_extractor(True))[0] == 2
+        assert pd.read_parquet(out)["delta"].tolist() == pytest.approx([0.2, 0.0])
+        assert ingest_bulk([json.dumps(body).encode()], out, greeks_extractor(False))[0] == 3
+
+    def test_failed_or_empty_download_leaves_no_file(self, tmp_path):
+        out = tmp_path / "SPXW_20240603.parquet"
+        raw = json.dumps(_quote_body()).encode()
+        with pytest.raises(ValueError):
+            ingest_bulk(_chunks(raw[:len(raw) // 2], 512), out, quote_extractor(), row_group=50)
+        assert list(tmp_path.iterdir()) == []
+        empty = {"header": {"format": QUOTE_FMT}, "response": []}
+        assert ingest_bulk([json.dumps(empty).encode()], out, quote_extractor()) == (0, 0)
+        assert list(tmp_path.iterdir()) == []
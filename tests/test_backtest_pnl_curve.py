@@ -0,0 +1,207 @@
+"""Parity tests for backtest.pnl_curve and the exit passes that read it.
+
+The curve-based _apply_return_threshold / _apply_range_exit must reproduce
+the per-bar loops they replaced exactly — exit bar, outcomes and P&L.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import sys
+from copy import deepcopy
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.pnl_curve import PnLCurve
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2023, 6, 5), 40)
+
+EXITS = {
+    "pct": {"net_return_exit_pct": 0.3},
+    "pct_high": {"net_return_exit_pct": 0.8},
+    "dollars": {"net_pnl_exit_dollars": 150.0},
+    "time_scaled": {"time_scaled_return_base": 0.25},
+    "range": {"range_exit_pct": 0.6},
+    "range_after": {"range_exit_pct": 0.4, "range_exit_after": "12:00"},
+    "both": {"net_return_exit_pct": 0.5, "range_exit_pct": 0.5, "broker_spread_markup": 0.05},
+}
+
+
+def _side_close(e, side, lookup, bar_ms, cfg):
+    if side == "call":
+        return engine._get_spread_close_cost(lookup, e.short_call, e.long_call, "C", bar_ms,
+                                             cfg.broker_spread_markup)
+    return engine._get_spread_close_cost(lookup, e.short_put, e.long_put, "P", bar_ms,
+                                         cfg.broker_spread_markup)
+
+
+def _legacy_mark(e, lookup, bar_ms, cfg):
+    # Net P&L of one entry if closed at bar_ms, as the old per-bar loop priced it
+    gross, legs = 0.0, 0
+    for side, active in (("call", e.entry_type in ("full_ic", "call_only")),
+                         ("put", e.entry_type in ("full_ic", "put_only"))):
+        if not active:
+            continue
+        credit = getattr(e, f"{side}_credit")
+        exit_ms = getattr(e, f"{side}_exit_ms")
+        if getattr(e, f"{side}_outcome") in ("stopped", "early_exit") and 0 < exit_ms <= bar_ms:
+            gross += credit - getattr(e, f"{side}_close_cost")
+        else:
+            gross += credit - _side_close(e, side, lookup, bar_ms, cfg)
+        legs += 2
+    return gross * cfg.contracts - cfg.commission_per_leg * (legs + legs) * cfg.contracts
+
+
+def _legacy_exit(entries, lookup, exit_ms, reason, cfg):
+    for e in entries:
+        if e.entry_type == "skipped":
+            continue
+        if e.entry_time_ms >= exit_ms:
+            e.entry_type, e.skip_reason = "skipped", reason
+            e.short_call = e.long_call = e.short_put = e.long_put = 0.0
+            e.call_credit = e.put_credit = e.call_stop = e.put_stop = 0.0
+            e.call_outcome = e.put_outcome = ""
+            e.call_close_cost = e.put_close_cost = 0.0
+            e.gross_pnl = e.commission = e.net_pnl = 0.0
+            continue
+        gross, legs_placed = 0.0, 0
+        for side, active in (("call", e.entry_type in ("full_ic", "call_only")),
+                             ("put", e.entry_type in ("full_ic", "put_only"))):
+            if not active:
+                continue
+            legs_placed += 2
+            sx = getattr(e, f"{side}_exit_ms")
+            if not (getattr(e, f"{side}_outcome") in ("stopped", "early_exit") and 0 < sx <= exit_ms):
+                setattr(e, f"{side}_outcome", "early_exit")
+                setattr(e, f"{side}_exit_ms", exit_ms)
+                setattr(e, f"{side}_close_cost", _side_close(e, side, lookup, exit_ms, cfg))
+            gross += getattr(e, f"{side}_credit") - getattr(e, f"{side}_close_cost")
+        e.commission = cfg.commission_per_leg * (legs_placed + legs_placed) * cfg.contracts
+        e.gross_pnl = gross * cfg.contracts
+        e.net_pnl = e.gross_pnl - e.commission
+
+
+def _legacy_return_threshold(entries, lookup, monitor_times, cfg):
+    threshold = getattr(cfg, "net_return_exit_pct", None)
+    dollars = getattr(cfg, "net_pnl_exit_dollars", None)
+    base = getattr(cfg, "time_scaled_return_base", None)
+    placed = [e for e in entries if e.entry_type != "skipped"]
+    for bar_ms in monitor_times:
+        active = [e for e in placed if e.entry_time_ms < bar_ms]
+        if not active:
+            continue
+        credit = net = 0.0
+        for e in active:
+            credit += ((e.call_credit if e.entry_type in ("full_ic", "call_only") else 0.0)
+                       + (e.put_credit if e.entry_type in ("full_ic", "put_only") else 0.0)
+                       ) * cfg.contracts
+            net += _legacy_mark(e, lookup, bar_ms, cfg)
+        pct = threshold is not None and threshold > 0 and credit > 0 and net / credit >= threshold
+        dol = dollars is not None and net >= dollars
+        ts = False
+        if base is not None and credit > 0:
+            hours_left = max(0.25, (16 * 3600 * 1000 - bar_ms) / 3600000)
+            ts = net / credit >= base / math.sqrt(hours_left / 6.5)
+        if pct or dol or ts:
+            reason = (f"net_return_threshold_{threshold:.0%}" if pct else
+                      f"net_pnl_target_${dollars:.0f}" if dol else "time_scaled_exit")
+            _legacy_exit(entries, lookup, bar_ms, reason, cfg)
+            break
+    return entries
+
+
+def _legacy_range_exit(entries, lookup, monitor_times, cfg, spx_series, expected_move):
+    range_pct = cfg.range_exit_pct
+    placed = [e for e in entries if e.entry_type != "skipped"]
+    after = getattr(cfg, "range_exit_after", None)
+    after_ms = None
+    if after:
+        h, m = map(int, after.split(":"))
+        after_ms = (h * 3600 + m * 60) * 1000
+    for bar_ms in monitor_times:
+        if after_ms is not None and bar_ms < after_ms:
+            continue
+        if not [e for e in placed if e.entry_time_ms < bar_ms]:
+            continue
+        low_high = spx_series.range(9 * 3600000 + 30 * 60000, bar_ms)
+        if low_high is not None and (low_high[1] - low_high[0]) / expected_move >= range_pct:
+            _legacy_exit(entries, lookup, bar_ms, f"range_exit_{range_pct:.0%}", cfg)
+            break
+    return entries
+
+
+@pytest.fixture(scope="module")
+def days_with_entries(tmp_path_factory):
+    d = tmp_path_factory.mktemp("pnl_curve")
+    write_synthetic_cache(d, DAYS, half_width=300, seed=11)
+    cfg = live_config()
+    cfg.cache_dir = str(d)
+    cfg.start_date, cfg.end_date = DAYS[0], DAYS[-1]
+    out = []
+    for day in engine.run_backtest(cfg, verbose=False):
+        data = engine.get_day_data(day.date, cfg, d)
+        out.append((day, data))
+    yield cfg, out
+    DAY_CACHE.clear(shared=True)
+
+
+def _with(cfg, **overrides):
+    c = deepcopy(cfg)
+    for k, v in overrides.items():
+        setattr(c, k, v)
+    return c
+
+
+@pytest.mark.parametrize("name", list(EXITS))
+def test_exit_passes_match_per_bar_loops(days_with_entries, name):
+    base, days = days_with_entries
+    cfg = _with(base, **EXITS[name])
+    exited = 0
+    for day, data in days:
+        times = data.all_times
+        spx_open = data.spx.first_valid()
+        vix_open = data.vix.at(9 * 3600000 + 45 * 60000)
+        em = spx_open * (vix_open / 100) / (252 ** 0.5)
+
+        old = deepcopy(day.entries)
+        if getattr(cfg, "net_return_exit_pct", None) or getattr(cfg, "net_pnl_exit_dollars", None) \
+                or getattr(cfg, "time_scaled_return_base", None):
+            _legacy_return_threshold(old, data.lookup, times, cfg)
+        if getattr(cfg, "range_exit_pct", None):
+            _legacy_range_exit(old, data.lookup, times, cfg, data.spx, em)
+
+        new = deepcopy(day.entries)
+        curve = PnLCurve.build(new, data.lookup, times, cfg)
+        engine._apply_return_threshold(new, data.lookup, times, cfg, curve)
+        if getattr(cfg, "range_exit_pct", None):
+            engine._apply_range_exit(new, data.lookup, times, cfg, data.spx, em, curve)
+
+        assert [dataclasses.asdict(e) for e in new] == [dataclasses.asdict(e) for e in old], day.date
+        exited += any(e.call_outcome == "early_exit" or e.put_outcome == "early_exit" for e in new)
+    assert exited > 0   # the variant actually exercised an exit
+
+
+def test_marks_mae_mfe(days_with_entries):
+    cfg, days = days_with_entries
+    for day, data in days[:10]:
+        times = data.all_times
+        curve = PnLCurve.build(day.entries, data.lookup, times, cfg)
+        net, active = curve.net(), curve.active()
+        for i, e in enumerate(curve.entries):
+            marks = [_legacy_mark(e, data.lookup, t, cfg) for t in times]
+            assert net[i].tolist() == marks
+            open_marks = [m for m, a in zip(marks, active[i]) if a]
+            if open_marks:
+                assert curve.mae()[i] == min(open_marks) and curve.mfe()[i] == max(open_marks)
+            else:
+                assert np.isnan(curve.mae()[i]) and np.isnan(curve.mfe()[i])
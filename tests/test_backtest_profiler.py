@@ -0,0 +1,96 @@
+"""Tests for backtest.profiler and the engine's phase instrumentation."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.profiler import Profiler, _NULL_PHASE, snapshot_columns
+
+
+class TestProfiler:
+    def test_disabled_records_nothing(self):
+        p = Profiler()
+        assert p.phase("select") is _NULL_PHASE
+        with p.day(date(2024, 1, 2)), p.phase("select"):
+            p.count("entry_slots")
+        with p.capture() as snap:
+            pass
+        assert (p.seconds, p.counts, p.days, snap) == ({}, {}, {}, {})
+
+    def test_phases_days_and_counts(self):
+        p = Profiler(enabled=True)
+        d1, d2 = date(2024, 1, 2), date(2024, 1, 3)
+        for d in (d1, d2, d1):
+            with p.day(d):
+                with p.phase("select"):
+                    p.count("entry_slots")
+                with p.phase("stops"):
+                    pass
+        with p.phase("load_parquet"):   # outside any day: totals only
+            pass
+        assert p.calls == {"select": 3, "stops": 3, "day": 3, "load_parquet": 1}
+        assert p.counts == {"entry_slots": 3}
+        assert set(p.days) == {d1, d2} and set(p.days[d1]) == {"select", "stops", "day"}
+        assert p.days[d1]["day"] >= p.days[d1]["select"] + p.days[d1]["stops"]
+        assert "Slowest days" in p.report()
+
+    def test_capture_isolates_block_and_keeps_totals(self):
+        p = Profiler(enabled=True)
+        with p.phase("select"):
+            pass
+        with p.capture(per_day=True) as snap:
+            with p.day(date(2024, 1, 2)), p.phase("stops"):
+                p.count("stop_variants", 4)
+        assert snap["calls"] == {"stops": 1, "day": 1}
+        assert snap["counts"] == {"stop_variants": 4} and date(2024, 1, 2) in snap["days"]
+        assert p.calls == {"select": 1, "stops": 1, "day": 1}
+        assert p.counts == {"stop_variants": 4} and date(2024, 1, 2) in p.days
+
+    def test_merge_and_columns(self):
+        a, b = Profiler(enabled=True), Profiler(enabled=True)
+        a.add("stops", 1.5)
+        b.add("stops", 0.5, calls=2)
+        b.count("entry_slots", 7)
+        a.merge(b.snapshot())
+        assert a.seconds == {"stops": 2.0} and a.calls == {"stops": 3}
+        assert snapshot_columns(a.snapshot()) == {
+            "prof_stops_s": 2.0, "prof_stops_calls": 3, "prof_entry_slots": 7}
+        assert snapshot_columns({}) == {}
+
+
+class TestEngineInstrumentation:
+    def test_run_backtest_phases(self, tmp_path):
+        pytest.importorskip("pandas")
+        from backtest import engine
+        from backtest.config import live_config
+        from backtest.day_cache import DAY_CACHE
+        from backtest.profiler import PROFILER
+        from backtest.synthetic import trading_days, write_synthetic_cache
+
+        days = trading_days(date(2024, 4, 1), 4)
+        write_synthetic_cache(tmp_path, days, half_width=300, seed=2)
+        cfg = live_config()
+        cfg.cache_dir = str(tmp_path)
+        cfg.start_date, cfg.end_date = days[0], days[-1]
+        DAY_CACHE.clear(shared=True)
+
+        PROFILER.enabled = True
+        try:
+            with PROFILER.capture(per_day=True) as snap:
+                results = engine.run_backtest(cfg, verbose=False)
+        finally:
+            PROFILER.enabled = False
+            DAY_CACHE.clear(shared=True)
+
+        calls = snap["calls"]
+        assert calls["day"] == len(days)
+        assert calls["load_index"] == calls["load_parquet"] == calls["build_lookup"] == len(days)
+        assert calls["select"] == snap["counts"]["entry_slots"] > 0
+        assert calls.get("stops", 0) == snap["counts"].get("stop_variants", 0)
+        assert set(snap["days"]) == set(days) >= {r.date for r in results}
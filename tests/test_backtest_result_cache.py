@@ -0,0 +1,156 @@
+"""Tests for backtest.result_cache — persistent (config, day) → DayResult cache."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+from copy import deepcopy
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine, result_cache
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.result_cache import ResultCache, config_hash, day_key
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 4, 1), 6)
+
+
+@pytest.fixture
+def cfg(tmp_path):
+    write_synthetic_cache(tmp_path / "data", DAYS, half_width=250)
+    cfg = live_config()
+    cfg.cache_dir = str(tmp_path / "data")
+    cfg.result_cache_dir = str(tmp_path / "results")
+    cfg.start_date, cfg.end_date = DAYS[0], DAYS[-1]
+    result_cache._OPEN.clear()
+    yield cfg
+    result_cache._OPEN.clear()
+    DAY_CACHE.clear(shared=True)
+
+
+def _rows(results):
+    return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+
+class TestKeys:
+    def test_config_hash_ignores_range_and_paths(self):
+        a = live_config()
+        b = deepcopy(a)
+        b.start_date, b.end_date = date(2020, 1, 1), date(2020, 2, 1)
+        b.cache_dir = "/elsewhere"
+        b.vectorized_stop_monitoring = False
+        assert config_hash(a) == config_hash(b)
+
+    def test_config_hash_sees_every_simulated_field(self):
+        a = live_config()
+        for attr, value in (("call_stop_buffer", 11.0), ("entry_times", ["10:00"]),
+                            ("dow_max_entries", {4: 2}), ("skip_weekdays", [2])):
+            b = deepcopy(a)
+            setattr(b, attr, value)
+            assert config_hash(a) != config_hash(b), attr
+        c = deepcopy(a)
+        c.ad_hoc_knob = 1
+        assert config_hash(a) != config_hash(c)
+
+    def test_day_key_tracks_data_files(self, tmp_path):
+        f = tmp_path / "chain.parquet"
+        f.write_bytes(b"x")
+        k1 = day_key("h", DAYS[0], False, [f])
+        assert k1 == day_key("h", DAYS[0], False, [f])
+        assert k1 != day_key("h", DAYS[0], True, [f])
+        assert k1 != day_key("h", DAYS[1], False, [f])
+        f.write_bytes(b"xy")
+        assert k1 != day_key("h", DAYS[0], False, [f])
+
+
+class TestResultCache:
+    def test_roundtrip_including_none(self, tmp_path):
+        rc = ResultCache(tmp_path, version="v1")
+        day = engine.DayResult(date=DAYS[0])
+        rc.put("a", day)
+        rc.put("b", None)
+        assert rc.get("a").date == DAYS[0]   # served from the write buffer
+        rc.flush()
+        fresh = ResultCache(tmp_path, version="v1")
+        assert fresh.get("a").date == DAYS[0]
+        assert fresh.get("b", "miss") is None
+        assert fresh.get("c", "miss") == "miss"
+        assert fresh.stats()["hits"] == 2 and fresh.stats()["misses"] == 1
+
+    def test_new_engine_version_starts_empty_and_prunes_old(self, tmp_path):
+        old = ResultCache(tmp_path, version="old")
+        old.put("a", None)
+        old.flush()
+        new = ResultCache(tmp_path, version="new")
+        assert new.get("a", "miss") == "miss"
+        new.put("b", None)
+        new.flush()
+        removed = new.prune_stale()
+        assert old.path in removed and not old.path.exists() and new.path.exists()
+
+    def test_engine_version_hashes_engine_source(self, monkeypatch, tmp_path):
+        v1 = result_cache.engine_version()
+        assert v1 == result_cache.engine_version()
+        fake = tmp_path / "backtest"
+        fake.mkdir()
+        for name in result_cache._ENGINE_SOURCES:
+            (fake / name).write_bytes((Path(result_cache.__file__).parent / name).read_bytes())
+        (fake / "engine.py").write_bytes((fake / "engine.py").read_bytes() + b"\n# edit\n")
+        monkeypatch.setattr(result_cache, "__file__", str(fake / "result_cache.py"))
+        monkeypatch.setattr(result_cache, "_engine_version", None)
+        assert result_cache.engine_version() != v1
+
+
+class TestEngineIntegration:
+    def test_rerun_is_served_from_disk(self, cfg, monkeypatch):
+        first = engine.run_backtest(cfg, verbose=False)
+        result_cache._OPEN.clear()          # fresh process view of the same store
+        DAY_CACHE.clear()
+        monkeypatch.setattr(engine, "simulate_day",
+                            lambda *a, **k: pytest.fail("day was re-simulated"))
+        second = engine.run_backtest(cfg, verbose=False)
+        assert _rows(first) == _rows(second)
+        assert result_cache.open_result_cache(cfg.result_cache_dir).stats()["hits"] == len(DAYS)
+
+    def test_only_changed_config_is_recomputed(self, cfg):
+        engine.run_backtest(cfg, verbose=False)
+        other = deepcopy(cfg)
+        other.call_stop_buffer += 25
+        expected = deepcopy(other)
+        expected.result_cache_dir = None
+        assert _rows(engine.run_backtest(other, verbose=False)) == \
+               _rows(engine.run_backtest(expected, verbose=False))
+        st = result_cache.open_result_cache(cfg.result_cache_dir).stats()
+        assert st["hits"] == 0 and st["writes"] == 2 * len(DAYS)
+
+    def test_touched_chain_file_invalidates_that_day(self, cfg):
+        engine.run_backtest(cfg, verbose=False)
+        chain = Path(cfg.cache_dir) / "options" / f"SPXW_{DAYS[2]:%Y%m%d}.parquet"
+        st = chain.stat()
+        os.utime(chain, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        rc = result_cache.open_result_cache(cfg.result_cache_dir)
+        before = rc.stats()
+        engine.run_backtest(cfg, verbose=False)
+        after = rc.stats()
+        assert after["misses"] - before["misses"] == 1
+        assert after["hits"] - before["hits"] == len(DAYS) - 1
+
+    def test_batch_uses_and_fills_cache(self, cfg):
+        cfgs = [deepcopy(cfg) for _ in range(3)]
+        for c, b in zip(cfgs, (30.0, 60.0, 90.0)):
+            c.call_stop_buffer = b
+        engine.run_backtest(cfgs[0], verbose=False)   # pre-fills one variant
+        batch = engine.run_backtest_batch(cfgs)
+        st = result_cache.open_result_cache(cfg.result_cache_dir).stats()
+        assert st["hits"] == len(DAYS)
+        for c, got in zip(cfgs, batch):
+            plain = deepcopy(c)
+            plain.result_cache_dir = None
+            assert _rows(engine.run_backtest(plain, verbose=False)) == _rows(got)
@@ -0,0 +1,89 @@
+"""Tests for backtest.result_table — lossless round trip and column-wise metrics parity."""
+
+from __future__ import annotations
+
+import dataclasses
+import pickle
+import sys
+from copy import deepcopy
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pd = pytest.importorskip("pandas")
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.optimize import compute_metrics
+from backtest.result_table import ResultTable
+from backtest.sweep_runner import sweep_metrics
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2023, 9, 4), 30)
+
+
+@pytest.fixture(scope="module")
+def days(tmp_path_factory):
+    d = tmp_path_factory.mktemp("result_table")
+    write_synthetic_cache(d, DAYS, half_width=300, seed=5)
+    cfg = deepcopy(live_config())
+    cfg.cache_dir = str(d)
+    cfg.start_date, cfg.end_date = DAYS[0], DAYS[-1]
+    cfg.net_return_exit_pct = 0.5      # early exits: more outcomes / skip reasons
+    yield engine.run_backtest(cfg, verbose=False)
+    DAY_CACHE.clear(shared=True)
+
+
+def _rows(results):
+    return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+
+def test_round_trip_is_lossless(days):
+    table = ResultTable.from_days(days)
+    assert len(table) == len(days)
+    assert table.n_entries == sum(len(d.entries) for d in days)
+    assert _rows(table.to_days()) == _rows(days)
+    assert _rows(table) == _rows(days)                # iterates as DayResults
+    assert _rows([table[-1]]) == _rows(days[-1:])
+
+
+def test_daily_sums_match_day_properties(days):
+    table = ResultTable.from_days(days)
+    for name in ("net_pnl", "gross_pnl", "commission"):
+        assert table.daily_sum(name).tolist() == [getattr(d, name) for d in days]
+
+
+def test_metrics_read_columns_identically(days):
+    table = ResultTable.from_days(days)
+    assert compute_metrics(table) == compute_metrics(days)
+    assert sweep_metrics(table) == sweep_metrics(days)
+    assert compute_metrics(ResultTable.from_days([])) == compute_metrics([])
+
+
+def test_concat_and_sort_restore_order(days):
+    chunks = [ResultTable.from_days(days[i:i + 7]) for i in range(0, len(days), 7)]
+    merged = ResultTable.concat(chunks[::-1] + [ResultTable.from_days([])]).sorted_by_date()
+    assert _rows(merged) == _rows(days)
+    assert ResultTable.concat([]).n_entries == 0
+
+
+def test_summarize_matches(days):
+    got = engine.summarize(ResultTable.from_days(days))
+    pd.testing.assert_frame_equal(got, engine.summarize(days), check_dtype=False)
+
+
+def test_smaller_than_dataclasses(days):
+    table = ResultTable.from_days(days)
+    assert len(pickle.dumps(table)) < len(pickle.dumps(days))
+    assert _rows(pickle.loads(pickle.dumps(table))) == _rows(days)
+
+
+def test_parquet_round_trip(days, tmp_path):
+    pytest.importorskip("pyarrow")
+    table = ResultTable.from_days(days)
+    table.to_parquet(tmp_path / "r.parquet")
+    assert _rows(ResultTable.read_parquet(tmp_path / "r.parquet")) == _rows(days)
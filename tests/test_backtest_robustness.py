@@ -0,0 +1,83 @@
+"""Tests for backtest.robustness — vectorised statistics vs direct per-resample loops."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.robustness import (block_bootstrap_counts, bootstrap_sharpes, max_drawdown,
+                                 pnl_matrix, resampled_sharpes, robustness, sharpe,
+                                 shuffled_max_drawdowns)
+
+
+def _pnl(n_combos=6, n_days=120, seed=0, noise=300.0):
+    rng = np.random.default_rng(seed)
+    edge = np.linspace(-20, 60, n_combos)[:, None]
+    return edge + rng.normal(0, noise, size=(n_combos, n_days))
+
+
+def _loop_max_dd(daily):
+    cum = peak = dd = 0.0
+    for x in daily:
+        cum += x
+        peak = max(peak, cum)
+        dd = min(dd, cum - peak)
+    return dd
+
+
+def test_pnl_matrix_aligns_on_union_of_dates():
+    d = [date(2024, 1, 2) + timedelta(days=i) for i in range(3)]
+    dates, m = pnl_matrix([([d[0], d[2]], [1.0, 3.0]), (d[1:], [5.0, 7.0])])
+    assert dates == d
+    assert m.tolist() == [[1.0, 0.0, 3.0], [0.0, 5.0, 7.0]]
+
+
+def test_block_counts_cover_every_day_once_per_resample():
+    counts = block_bootstrap_counts(50, 200, 7, np.random.default_rng(1))
+    assert counts.shape == (200, 50)
+    assert (counts.sum(axis=1) == 50).all()
+
+
+def test_resampled_sharpes_match_gathered_resamples():
+    x = _pnl()
+    rng = np.random.default_rng(3)
+    n = x.shape[1]
+    idx = rng.integers(0, n, size=(40, n))
+    counts = np.stack([np.bincount(i, minlength=n) for i in idx]).astype(float)
+    expected = np.stack([sharpe(x[:, i]) for i in idx], axis=1)
+    assert np.allclose(resampled_sharpes(x, counts), expected)
+
+
+def test_max_drawdown_matches_loop_and_chunking():
+    x = _pnl(n_combos=4, n_days=60, seed=5)
+    assert np.allclose(max_drawdown(x), [_loop_max_dd(row) for row in x])
+    big = shuffled_max_drawdowns(x, 30, np.random.default_rng(9))
+    small = shuffled_max_drawdowns(x, 30, np.random.default_rng(9), max_elems=x.size * 4)
+    assert np.array_equal(big, small)
+
+
+def test_robustness_statistics():
+    x = _pnl(n_combos=6, n_days=250, seed=2, noise=60.0)
+    rob = robustness(x, n_resamples=1000, n_shuffles=100, reference=0, seed=7)
+    assert rob.p_best.sum() == pytest.approx(1.0)
+    assert (rob.sharpe_lo <= rob.sharpe).all() and (rob.sharpe <= rob.sharpe_hi).all()
+    # The strongest edge is most often best, and beats the weakest in most resamples
+    assert rob.p_best.argmax() == 5
+    assert rob.p_beats[5] > 0.9 and rob.p_beats[0] == 0.0
+    assert (rob.max_dd_p05 <= 0).all()
+    assert set(rob.rows()[0]) == {"sharpe_lo", "sharpe_hi", "p_positive", "p_best",
+                                  "max_dd_p05", "p_beats"}
+
+
+def test_bootstrap_sharpes_centre_on_actual():
+    daily = _pnl(n_combos=1, n_days=400, seed=4)[0]
+    boot = bootstrap_sharpes(daily, n_resamples=4000)
+    actual = sharpe(daily[None, :])[0]
+    assert abs(np.median(boot) - actual) < 0.1 * boot.std() + 0.05
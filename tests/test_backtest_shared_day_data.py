@@ -0,0 +1,145 @@
+"""Tests for backtest.shared_day_data — day data published in shared memory."""
+
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing as mp
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.shared_day_data import (
+    SharedDayStore, attach_shared_days, detach_shared_days, pack_day, segment_name, unpack_day,
+)
+from backtest.sweep_runner import SweepRunner, grid, points
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 9, 2), 10)
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    d = tmp_path_factory.mktemp("shm")
+    write_synthetic_cache(d, DAYS, half_width=300, seed=13)
+    yield d
+    DAY_CACHE.clear(shared=True)
+
+
+@pytest.fixture
+def cfg(cache_dir):
+    DAY_CACHE.clear(shared=True)
+    c = live_config()
+    c.cache_dir = str(cache_dir)
+    c.start_date, c.end_date = DAYS[0], DAYS[-1]
+    c.use_real_greeks = True
+    yield c
+    DAY_CACHE.clear(shared=True)
+
+
+def _rows(results):
+    return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+
+def _probe(key):
+    """Worker-side: fetch one day through the cache and report how it was served."""
+    DAY_CACHE.reset_stats()
+    day = DAY_CACHE.get(key, lambda: pytest.fail("worker loaded from disk"))
+    st = DAY_CACHE.stats()
+    return st["shared_hits"], st["misses"], day.lookup.bid.flags.writeable, float(day.lookup.bid.sum())
+
+
+class TestPackUnpack:
+    def test_roundtrip_is_identical_and_read_only(self, cache_dir):
+        day = engine._load_day_data(DAYS[0], Path(cache_dir), "5min", True)
+        shm = pack_day(day, segment_name("cddtest_", ("rt", 1)))
+        try:
+            got = unpack_day(shm)
+            for name in ("chain_df", "greeks_df"):
+                exp, act = getattr(day, name), getattr(got, name)
+                assert list(exp.columns) == list(act.columns)
+                for col in exp.columns:
+                    if isinstance(act[col].dtype, pd.CategoricalDtype):
+                        assert act[col].astype(str).tolist() == exp[col].astype(str).tolist()
+                    else:
+                        np.testing.assert_array_equal(act[col].to_numpy(), exp[col].to_numpy())
+            for name in ("spx", "vix"):
+                exp, act = getattr(day, name), getattr(got, name)
+                np.testing.assert_array_equal(act.ms, exp.ms)
+                np.testing.assert_array_equal(act.price, exp.price)
+                assert not act.price.flags.writeable
+            for name in ("times", "offsets", "abs_delta", "strike", "rank"):
+                np.testing.assert_array_equal(getattr(got.deltas, name), getattr(day.deltas, name))
+            for name in ("strikes", "times", "bid", "ask", "mid", "present"):
+                a = getattr(got.lookup, name)
+                np.testing.assert_array_equal(a, getattr(day.lookup, name))
+                assert not a.flags.writeable
+            assert got.all_times == day.all_times
+            assert got.lookup.strike_idx == day.lookup.strike_idx
+            del got
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_no_data_day_roundtrips_as_none(self):
+        shm = pack_day(None, segment_name("cddtest_", ("none",)))
+        try:
+            assert unpack_day(shm) is None
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+class TestStore:
+    def test_backtest_identical_when_served_from_shared_memory(self, cfg):
+        DAY_CACHE.clear(shared=True)
+        plain = engine.run_backtest(cfg, verbose=False)
+        DAY_CACHE.clear(shared=True)
+        with SharedDayStore() as store:
+            assert store.publish_range(cfg) == len(DAYS)
+            assert store.publish_range(cfg) == 0          # idempotent
+            DAY_CACHE.reset_stats()
+            shared = engine.run_backtest(cfg, verbose=False)
+            assert DAY_CACHE.stats()["misses"] == 0
+        assert _rows(shared) == _rows(plain)
+
+    def test_workers_attach_instead_of_loading(self, cfg):
+        with SharedDayStore() as store:
+            store.publish_range(cfg)
+            reach = engine._strike_reach(cfg)
+            keys = [engine._day_cache_key(d, Path(cfg.cache_dir), "5min", True, reach) for d in DAYS[:4]]
+            ctx = mp.get_context("fork")
+            with ctx.Pool(2, initializer=attach_shared_days, initargs=(store.prefix,)) as pool:
+                out = pool.map(_probe, keys)
+        expected = [float(engine._load_day_data(d, Path(cfg.cache_dir), "5min", True, reach).lookup.bid.sum())
+                    for d in DAYS[:4]]
+        assert [o[:3] for o in out] == [(1, 0, False)] * 4
+        assert [o[3] for o in out] == expected
+
+    def test_close_unlinks_segments_and_detaches(self, cfg):
+        store = SharedDayStore()
+        store.publish_range(cfg, days=DAYS[:2])
+        key = engine._day_cache_key(DAYS[0], Path(cfg.cache_dir), "5min", True, engine._strike_reach(cfg))
+        assert DAY_CACHE.get(key, lambda: None) is not None
+        store.close()
+        with pytest.raises(FileNotFoundError):
+            from multiprocessing import shared_memory
+            shared_memory.SharedMemory(name=segment_name(store.prefix, key))
+        assert DAY_CACHE.stats()["shared_days"] == 0
+        detach_shared_days(store.prefix)   # second detach is a no-op
+
+    def test_sweep_runner_with_shared_memory(self, cfg):
+        pts = points(cfg, grid({"call_stop_buffer": [30.0, 120.0]}))
+        with SweepRunner(workers=2, chunk_days=4, shared_memory=True) as runner:
+            got = runner.run_all(pts, keep_results=True)
+            assert len(runner._store) == len(DAYS)
+        for p, r in zip(pts, got):
+            assert _rows(r.results) == _rows(engine.run_backtest(p.cfg, verbose=False))
@@ -0,0 +1,121 @@
+"""Parity tests for the vectorized stop-monitoring kernel in backtest.engine.
+
+The array path (_monitor_stops_vectorized) must reproduce the per-bar loop
+exactly — every EntryResult field, every day of a synthetic year.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.index_series import IndexSeries
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+YEAR = trading_days(date(2023, 1, 3), 252)
+
+VARIANTS = {
+    "live": {},
+    "no_decay": {"buffer_decay_start_mult": None},
+    "per_side_decay": {"buffer_decay_call_mult": 1.5, "buffer_decay_call_hours": 1.0,
+                       "buffer_decay_put_mult": 3.0, "buffer_decay_put_hours": 2.5},
+    "tight_markup_cap": {"call_stop_buffer": 10.0, "put_stop_buffer": 40.0,
+                         "stop_spread_markup_pct": 0.1, "broker_spread_markup": 0.05,
+                         "spread_value_cap_at_stop": True},
+    "early_exit": {"early_exit_time": "13:30", "stop_slippage_per_leg": 0.0},
+    "price_stop_inward": {"price_based_stop_points": 10.0},
+    "price_stop_outward": {"price_based_stop_points": 5.0, "price_stop_inward": False,
+                           "early_exit_time": "15:00"},
+    "monitor_10min": {"monitor_interval_ms": 600_000, "buffer_decay_hours": 1.0},
+}
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    d = tmp_path_factory.mktemp("year")
+    write_synthetic_cache(d, YEAR, half_width=300, seed=21)
+    yield d
+    DAY_CACHE.clear(shared=True)
+
+
+def _run(cache_dir, overrides, vectorized):
+    cfg = live_config()
+    cfg.cache_dir = str(cache_dir)
+    cfg.start_date, cfg.end_date = YEAR[0], YEAR[-1]
+    for k, v in overrides.items():
+        setattr(cfg, k, v)
+    cfg.vectorized_stop_monitoring = vectorized
+    return engine.run_backtest(cfg, verbose=False)
+
+
+class TestVectorizedStopParity:
+    @pytest.mark.parametrize("name", list(VARIANTS))
+    def test_year_identical_to_scalar_loop(self, cache_dir, name):
+        scalar = _run(cache_dir, VARIANTS[name], vectorized=False)
+        vector = _run(cache_dir, VARIANTS[name], vectorized=True)
+        assert len(scalar) == len(vector) > 200
+        n_stops = 0
+        for ds, dv in zip(scalar, vector):
+            assert ds.net_pnl == dv.net_pnl, ds.date
+            assert len(ds.entries) == len(dv.entries)
+            for es, ev in zip(ds.entries, dv.entries):
+                assert dataclasses.asdict(es) == dataclasses.asdict(ev), (ds.date, es.entry_num)
+                n_stops += (es.call_outcome == "stopped") + (es.put_outcome == "stopped")
+        assert n_stops > 0  # the year must actually exercise the stop path
+
+    def test_path_dependent_rules_fall_back_to_loop(self, cache_dir, monkeypatch):
+        calls = []
+        real = engine._monitor_stops_vectorized
+        monkeypatch.setattr(engine, "_monitor_stops_vectorized",
+                            lambda *a, **k: calls.append(1) or real(*a, **k))
+        DAY_CACHE.clear()
+        cfg = live_config()
+        cfg.cache_dir = str(cache_dir)
+        cfg.start_date = cfg.end_date = YEAR[0]
+        cfg.trailing_stop_enabled = True
+        engine.run_backtest(cfg, verbose=False)
+        assert calls == []
+
+
+class TestKernelHelpers:
+    def test_close_cost_series_matches_scalar(self):
+        rng = np.random.default_rng(5)
+        times = np.arange(34_200_000, 57_600_001, 300_000)
+        rows = [(k, r, int(t), b, b + rng.uniform(0.05, 0.5))
+                for t in times for k in (5000.0, 5005.0, 5010.0) for r in "CP"
+                for b in [float(np.float32(rng.choice([0.0, rng.uniform(0, 5)])))]
+                if rng.random() > 0.1]
+        df = pd.DataFrame(rows, columns=["strike", "right", "ms_of_day", "bid", "ask"])
+        df["mid"] = (df["bid"] + df["ask"]) / 2
+        df = df.astype({"strike": "float32", "bid": "float32", "ask": "float32", "mid": "float32"})
+        lk = engine._build_chain_lookup(df)
+        probe = np.concatenate([times, [1, 57_600_001]])
+        for short_k, long_k, right in ((5000.0, 5010.0, "C"), (5010.0, 5000.0, "P"),
+                                       (5005.0, 5095.0, "C"), (4000.0, 3990.0, "P")):
+            for markup in (0.0, 0.07):
+                series = lk.close_cost_series(short_k, long_k, right, probe, markup)
+                expected = [engine._get_spread_close_cost(lk, short_k, long_k, right, int(t), markup)
+                            for t in probe]
+                assert series.tolist() == expected
+
+    def test_index_at_many_matches_scalar(self):
+        ms = np.array([34_200_000, 34_260_000, 34_260_000, 34_380_000])
+        price = np.array([5000.0, 5001.5, 5002.0, 4999.25])
+        probe = np.array([0, 34_200_000, 34_259_999, 34_260_000, 34_300_000, 60_000_000])
+        series = IndexSeries(ms, price)
+        assert series.at_many(probe).tolist() == [series.at(int(t)) for t in probe]
+        assert series.at_many(probe).tolist() == [5000.0, 5000.0, 5000.0, 5002.0, 5002.0, 4999.25]
+        shuffled = IndexSeries(ms[[0, 3, 1, 2]], price[[0, 3, 1, 2]])
+        assert shuffled.at_many(probe).tolist() == series.at_many(probe).tolist()
+        assert IndexSeries.empty_series().at_many(probe).tolist() == [0.0] * len(probe)
@@ -0,0 +1,86 @@
+"""Tests for strike-band pruning of the chain when loading a day."""
+
+from __future__ import annotations
+
+import dataclasses
+import shutil
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.chain_store import convert_dataset
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 4, 8), 6)
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    # Wide chain (±700 pts) so the band actually trims the wings
+    d = tmp_path_factory.mktemp("band")
+    write_synthetic_cache(d, DAYS, half_width=700, seed=21)
+    yield d
+    DAY_CACHE.clear(shared=True)
+
+
+@pytest.fixture
+def cfg(cache_dir):
+    DAY_CACHE.clear(shared=True)
+    c = live_config()
+    c.cache_dir = str(cache_dir)
+    c.start_date, c.end_date = DAYS[0], DAYS[-1]
+    c.use_real_greeks = True
+    yield c
+    DAY_CACHE.clear(shared=True)
+
+
+def _rows(results):
+    return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+
+class TestStrikeReach:
+    def test_covers_starting_otm_plus_spread_cap(self, cfg):
+        cfg.max_spread_width = 110
+        reach = engine._strike_reach(cfg)
+        assert reach >= engine._MAX_STARTING_OTM + 110 + 5
+        assert reach % 50 == 0
+
+    def test_disabled(self, cfg):
+        cfg.strike_band_pruning = False
+        assert engine._strike_reach(cfg) is None
+
+
+class TestPrunedLoad:
+    def test_only_band_strikes_loaded(self, cfg):
+        reach = engine._strike_reach(cfg)
+        full = engine._load_day_data(DAYS[0], Path(cfg.cache_dir), "5min", True)
+        pruned = engine._load_day_data(DAYS[0], Path(cfg.cache_dir), "5min", True, reach)
+        lo, hi = engine._strike_band(full.spx, reach)
+        assert len(pruned.chain_df) < len(full.chain_df)
+        assert pruned.chain_df["strike"].between(lo, hi).all()
+        assert len(pruned.chain_df) == full.chain_df["strike"].between(lo, hi).sum()
+        assert pruned.approx_bytes() < full.approx_bytes()
+
+    def test_store_and_parquet_prune_identically(self, cfg, cache_dir):
+        reach = engine._strike_reach(cfg)
+        from_parquet = engine._load_day_data(DAYS[1], Path(cache_dir), "5min", False, reach)
+        convert_dataset(cache_dir, "options", verbose=False)
+        try:
+            from_store = engine._load_day_data(DAYS[1], Path(cache_dir), "5min", False, reach)
+        finally:
+            shutil.rmtree(Path(cache_dir) / "store")
+        assert from_store.chain_df.equals(from_parquet.chain_df)
+
+    def test_results_identical_with_and_without_pruning(self, cfg):
+        pruned = engine.run_backtest(cfg, verbose=False)
+        cfg.strike_band_pruning = False
+        full = engine.run_backtest(cfg, verbose=False)
+        assert _rows(pruned) == _rows(full)
+        assert any(d.entries for d in full)
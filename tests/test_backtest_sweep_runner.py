@@ -0,0 +1,166 @@
+"""Tests for backtest.sweep_runner — chunked, pooled sweep execution."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from copy import deepcopy
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest import engine
+from backtest.config import live_config
+from backtest.day_cache import DAY_CACHE
+from backtest.shared_day_data import SharedDayStore
+from backtest.sweep_runner import (
+    SweepPoint, SweepRunner, grid, halving_schedule, points, successive_halving, sweep_metrics,
+)
+from backtest.synthetic import trading_days, write_synthetic_cache
+
+DAYS = trading_days(date(2024, 6, 3), 24)
+
+
+@pytest.fixture(scope="module")
+def base_cfg(tmp_path_factory):
+    d = tmp_path_factory.mktemp("sweep")
+    write_synthetic_cache(d, DAYS, half_width=300, seed=9)
+    cfg = live_config()
+    cfg.cache_dir = str(d)
+    cfg.start_date, cfg.end_date = DAYS[0], DAYS[-1]
+    yield cfg
+    DAY_CACHE.clear(shared=True)
+
+
+def _rows(results):
+    return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+
+class TestGrid:
+    def test_product_order_and_labels(self):
+        g = grid({"a": [1, 2], "b": [None, 0.5]}, fmt={"a": lambda v: f"#{v}"})
+        assert [label for label, _ in g] == ["a=#1 b=OFF", "a=#1 b=0.5", "a=#2 b=OFF", "a=#2 b=0.5"]
+        assert g[3][1] == {"a": 2, "b": 0.5}
+
+    def test_points_apply_overrides_to_copies(self, base_cfg):
+        before = (base_cfg.call_stop_buffer, base_cfg.contracts)
+        pts = points(base_cfg, grid({"call_stop_buffer": [10.0, 20.0]}), contracts=7)
+        assert [p.cfg.call_stop_buffer for p in pts] == [10.0, 20.0]
+        assert all(p.cfg.contracts == 7 for p in pts)
+        assert (base_cfg.call_stop_buffer, base_cfg.contracts) == before
+        assert pts[1].key == {"call_stop_buffer": 20.0}
+
+
+class TestRunnerMatchesRunBacktest:
+    def _points(self, base_cfg):
+        pts = points(base_cfg, grid({"call_stop_buffer": [20.0, 75.0, 150.0]}))
+        other = deepcopy(base_cfg)
+        other.min_call_credit = 1.0
+        other.start_date = DAYS[5]
+        pts.append(SweepPoint("min_call_credit=1.0", other, key="mcc"))
+        return pts
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_chunked_results_equal_full_runs(self, base_cfg, workers):
+        pts = self._points(base_cfg)
+        with SweepRunner(workers=workers, chunk_days=5, batch_size=2) as runner:
+            got = runner.run_all(pts, keep_results=True)
+        assert [r.index for r in got] == list(range(len(pts)))
+        for p, r in zip(pts, got):
+            expected = engine.run_backtest(p.cfg, verbose=False)
+            assert _rows(r.results) == _rows(expected), p.label
+            assert r.metrics == sweep_metrics(expected)
+            assert r.key == p.key and r.label == p.label
+
+    def test_pool_survives_across_runs(self, base_cfg):
+        pts = self._points(base_cfg)[:2]
+        with SweepRunner(workers=2, chunk_days=8) as runner:
+            first = runner.run_all(pts)
+            pool = runner._pool
+            second = runner.run_all(pts)
+            assert runner._pool is pool
+        assert runner._pool is None
+        assert [r.metrics for r in first] == [r.metrics for r in second]
+
+    def test_best_picks_first_of_ties(self, base_cfg):
+        pts = points(base_cfg, [("a", {}), ("b", {}), ("c", {"call_stop_buffer": 5.0})])
+        with SweepRunner(workers=1) as runner:
+            best = runner.best(pts, metric="days")
+        assert best.label == "a"
+
+    def test_custom_metrics_fn(self, base_cfg):
+        pts = points(base_cfg, grid({"call_stop_buffer": [30.0]}))
+        with SweepRunner(workers=1, chunk_days=7,
+                         metrics_fn=lambda res: {"dates": [r.date for r in res]}) as runner:
+            (res,) = runner.run_all(pts)
+        assert res.metrics["dates"] == [d.date for d in engine.run_backtest(pts[0].cfg, verbose=False)]
+
+
+class TestSharedMemoryPublish:
+    def test_every_strike_reach_is_published(self, base_cfg):
+        cfg = deepcopy(base_cfg)
+        cfg.end_date = DAYS[1]
+        pts = points(cfg, grid({"max_spread_width": [110, 160], "strike_band_pruning": [True, False]}))
+        reaches = {engine._strike_reach(p.cfg) for p in pts}
+        assert len(reaches) == 3      # two 50-pt buckets + pruning off
+        store = SharedDayStore()
+        try:
+            with SweepRunner(workers=1, shared_memory=store) as runner:
+                runner._publish(pts)
+            assert {key[3] for key in store._segments} == reaches
+            assert len(store) == len(reaches) * 2
+        finally:
+            store.close()
+
+
+class TestBatchDaysSubset:
+    def test_days_restrict_the_run(self, base_cfg):
+        cfgs = [deepcopy(base_cfg)]
+        full = engine.run_backtest_batch(cfgs)[0]
+        parts = [engine.run_backtest_batch(cfgs, days=DAYS[i:i + 10])[0] for i in (0, 10, 20)]
+        assert _rows([r for part in parts for r in part]) == _rows(full)
+        assert engine.run_backtest_batch(cfgs, days=[])[0] == []
+
+
+class TestSuccessiveHalving:
+    def test_schedule(self):
+        assert halving_schedule(10, 500, keep=20) == [500]
+        assert halving_schedule(1000, 500, eta=3, min_days=40, keep=20) == [40, 56, 167, 500]
+        assert halving_schedule(1000, 30, min_days=40) == [30]
+        assert halving_schedule(5, 0) == []
+
+    def test_days_subset_run(self, base_cfg):
+        pts = points(base_cfg, grid({"call_stop_buffer": [40.0]}))
+        with SweepRunner(workers=1, chunk_days=4) as runner:
+            (res,) = runner.run_all(pts, keep_results=True, days=DAYS[3:13])
+        assert [r.date for r in res.results] == [
+            r.date for r in engine.run_backtest(pts[0].cfg, verbose=False) if r.date in DAYS[3:13]]
+
+    def test_finalists_have_full_range_metrics(self, base_cfg):
+        pts = points(base_cfg, grid({"call_stop_buffer": [10.0, 40.0, 80.0, 150.0],
+                                     "min_call_credit": [0.5, 1.25]}))
+        with SweepRunner(workers=1, chunk_days=6) as runner:
+            report = successive_halving(runner, pts, eta=2, min_days=6, keep=2, keep_results=True)
+            exhaustive = runner.run_all(pts)
+        assert report.rungs[0] == (6, len(pts))
+        assert report.rungs[-1] == (len(DAYS), 2)
+        assert report.day_runs < report.full_day_runs
+        assert len(report.results) == len(pts)
+        for r in report.finalists:
+            assert r.metrics == exhaustive[r.index].metrics
+            assert _rows(r.results) == _rows(engine.run_backtest(pts[r.index].cfg, verbose=False))
+        ranks = [(r.metrics["sharpe"], r.metrics["net_pnl"]) for r in report.finalists]
+        assert ranks == sorted(ranks, reverse=True)
+
+    def test_no_pruning_when_grid_is_small(self, base_cfg):
+        pts = points(base_cfg, grid({"call_stop_buffer": [20.0, 90.0]}))
+        with SweepRunner(workers=1) as runner:
+            report = successive_halving(runner, pts, keep=5)
+            exhaustive = runner.run_all(pts)
+        assert report.rungs == [(len(DAYS), 2)]
+        assert report.savings == 0.0
+        assert sorted(r.index for r in report.finalists) == [0, 1]
+        assert [r.metrics for r in report.results] == [r.metrics for r in exhaustive]
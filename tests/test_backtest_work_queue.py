@@ -0,0 +1,135 @@
+"""Tests for backtest.work_queue — leases, retries, resume, and a queued sweep."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.work_queue import DONE, FAILED, PENDING, RUNNING, TaskFailed, WorkQueue, serve
+
+
+class TestQueue:
+    def test_claim_in_submission_order_and_collect(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite")
+        assert q.submit("r", [("a", b"1"), ("b", b"2")]) == 2
+        assert q.claim("w1") == ("a", b"1")
+        assert q.claim("w2") == ("b", b"2")
+        assert q.claim("w3") is None
+        q.complete("b", "w2", b"B")
+        q.complete("a", "w1", b"A")
+        assert sorted(q.wait(["a", "b"], poll=0.01)) == [("a", b"A"), ("b", b"B")]
+        assert q.counts("r") == {DONE: 2}
+
+    def test_resubmit_skips_finished_tasks(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite")
+        q.submit("r", [("a", b"1")])
+        q.complete(q.claim("w")[0], "w", b"A")
+        # A restarted coordinator resubmits everything: only "b" is new work
+        other = WorkQueue(tmp_path / "q.sqlite")
+        assert other.submit("r", [("a", b"1"), ("b", b"2")]) == 1
+        assert other.claim("w") == ("b", b"2")
+        assert other.counts() == {DONE: 1, RUNNING: 1}
+
+    def test_expired_lease_is_requeued(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite", lease=0.05)
+        q.submit("r", [("a", b"1")])
+        assert q.claim("dead")[0] == "a"
+        assert q.claim("live") is None
+        time.sleep(0.1)
+        assert q.claim("live") == ("a", b"1")
+        # The dead worker's late failure no longer touches the task
+        q.fail("a", "dead", "boom")
+        q.complete("a", "live", b"A")
+        assert list(q.wait(["a"], poll=0.01)) == [("a", b"A")]
+
+    def test_expired_leases_use_up_attempts(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite", lease=0.05, max_attempts=2)
+        q.submit("r", [("a", b"1")])
+        q.claim("w1")
+        time.sleep(0.1)
+        assert q.requeue_expired() == 1
+        assert q.counts() == {PENDING: 1}
+        q.claim("w2")
+        time.sleep(0.1)
+        assert q.requeue_expired() == 1
+        assert q.counts() == {FAILED: 1}
+        assert q.claim("w3") is None
+        with pytest.raises(TaskFailed, match="lease expired 2 times"):
+            list(q.wait(["a"], poll=0.01))
+
+    def test_heartbeat_keeps_the_lease(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite", lease=0.2)
+        q.register("w")
+        q.submit("r", [("a", b"1")])
+        q.claim("w")
+        for _ in range(4):
+            time.sleep(0.08)
+            q.beat("w", "a")
+        assert q.requeue_expired() == 0
+        assert q.counts() == {RUNNING: 1}
+
+    def test_failures_retry_then_raise(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite", max_attempts=2)
+        q.submit("r", [("a", b"1")])
+        q.fail(q.claim("w")[0], "w", "first")
+        assert q.counts() == {PENDING: 1}
+        q.fail(q.claim("w")[0], "w", "second")
+        assert q.counts() == {FAILED: 1}
+        with pytest.raises(TaskFailed, match="second"):
+            list(q.wait(["a"], poll=0.01))
+        # Resubmitting a failed task gives it fresh attempts
+        assert q.submit("r", [("a", b"1")]) == 1
+        assert q.counts() == {PENDING: 1}
+
+    def test_status_lists_runs_and_workers(self, tmp_path):
+        q = WorkQueue(tmp_path / "q.sqlite")
+        q.register("host:1")
+        q.submit("mega_sweep", [("a", b"1")])
+        text = q.status()
+        assert "mega_sweep" in text and "host:1" in text
+
+
+class TestQueuedSweep:
+    def test_queued_run_matches_local_and_resumes(self, tmp_path):
+        pytest.importorskip("pandas")
+        from backtest import engine
+        from backtest.config import live_config
+        from backtest.day_cache import DAY_CACHE
+        from backtest.sweep_runner import SweepRunner, grid, points
+        from backtest.synthetic import trading_days, write_synthetic_cache
+
+        days = trading_days(date(2024, 6, 3), 12)
+        write_synthetic_cache(tmp_path / "cache", days, half_width=300, seed=9)
+        cfg = live_config()
+        cfg.cache_dir = str(tmp_path / "cache")
+        cfg.start_date, cfg.end_date = days[0], days[-1]
+        pts = points(cfg, grid({"call_stop_buffer": [30.0, 75.0]}))
+        db = tmp_path / "queue.sqlite"
+
+        def rows(results):
+            return [(d.date, [dataclasses.asdict(e) for e in d.entries]) for d in results]
+
+        try:
+            worker = threading.Thread(target=serve, args=(db,),
+                                      kwargs={"poll": 0.05, "idle_exit": 1.0, "log": lambda s: None})
+            worker.start()
+            with SweepRunner(chunk_days=5, queue=db, queue_run="test") as runner:
+                got = runner.run_all(pts, keep_results=True)
+            worker.join()
+            for p, r in zip(pts, got):
+                assert rows(r.results) == rows(engine.run_backtest(p.cfg, verbose=False))
+
+            # No workers now: a rerun is served entirely from finished tasks
+            with SweepRunner(chunk_days=5, queue=db, queue_run="test") as runner:
+                again = runner.run_all(pts)
+            assert [r.metrics for r in again] == [r.metrics for r in got]
+        finally:
+            DAY_CACHE.clear(shared=True)
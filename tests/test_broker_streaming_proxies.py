@@ -169,7 +169,9 @@ class TestIBStreamingNotReady:
 def mock_saxo():
     s = MagicMock()
     s.is_websocket_healthy.return_value = True
+    s.is_streaming = False
     s.start_price_streaming.return_value = True
+    s.sync_price_subscriptions.return_value = True
     return s
 
 
@@ -214,6 +216,21 @@ class TestSaxoSubscribeBulkRestartModel:
         saxo_proxy.unsubscribe_quote("111")
         assert saxo_proxy.active_subscriptions() == ["222"]
 
+    def test_changes_while_streaming_send_delta_only(self, saxo_proxy, mock_saxo):
+        saxo_proxy.subscribe_quote("111")
+        mock_saxo.is_streaming = True
+        mock_saxo.reset_mock()
+        saxo_proxy.subscribe_quote("222")
+        saxo_proxy.unsubscribe_quote("111")
+        # No WS restart — the desired set is synced instead
+        mock_saxo.stop_price_streaming.assert_not_called()
+        mock_saxo.start_price_streaming.assert_not_called()
+        last_uics = [
+            entry["uic"] for entry in
+            mock_saxo.sync_price_subscriptions.call_args_list[-1].args[0]
+        ]
+        assert last_uics == [222]
+
     def test_unsubscribe_all_clears_and_stops_without_restart(
         self, saxo_proxy, mock_saxo,
     ):
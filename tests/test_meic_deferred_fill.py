@@ -0,0 +1,119 @@
+"""Tests for MEICStrategy's deferred stop fill lookup — CONN-008 fan-out.
+
+Verifies that:
+  • _deferred_stop_fill_lookup looks the legs up concurrently through
+    AsyncSaxoClient and still gives the same (updated_cost, all_found) as
+    the old sequential FIX #76 loop, for a leg priced via activities, one
+    via closedpositions and one whose lookup raises.
+  • A leg that raises leaves all_found False without affecting the others.
+
+Builds the strategy via __new__ with a mocked SaxoClient — no real network calls.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bots.meic.strategy import IronCondorEntry, MEICStrategy
+from shared.saxo_async import AsyncSaxoClient
+
+LEGS = [
+    ("ord-sc", 101, "short_call"),    # priced via activities
+    ("ord-lc", 102, "long_call"),     # priced via closedpositions
+    ("ord-sp", 103, "short_put"),     # lookup raises
+]
+
+
+def _mock_client():
+    client = MagicMock()
+
+    def by_activity(order_id, uic, max_retries=3, retry_delay=1.5):
+        if order_id == "ord-sc":
+            return True, {"fill_price": 2.10}
+        if order_id == "ord-sp":
+            raise ConnectionError("activities endpoint down")
+        return False, None
+
+    def closed_price(uic, buy_or_sell=None):
+        if uic == 102:
+            return {"closing_price": 0.40, "closed_pnl": -12.0}
+        return None
+
+    client.check_order_filled_by_activity.side_effect = by_activity
+    client.get_closed_position_price.side_effect = closed_price
+    return client
+
+
+def _sequential_lookup(client, deferred_legs, current_close_cost, entry):
+    """The FIX #76 loop as it was before CONN-008 (one leg after another)."""
+    all_found = True
+    updated_cost = current_close_cost
+    for order_id, uic, leg_name in deferred_legs:
+        fill_price = None
+        try:
+            filled, fill_details = client.check_order_filled_by_activity(
+                order_id=order_id, uic=uic, max_retries=3, retry_delay=1.5)
+            if filled and fill_details:
+                fp = fill_details.get("fill_price", 0)
+                if fp and fp > 0:
+                    fill_price = fp
+            if fill_price is None:
+                buy_or_sell = "Sell" if leg_name.startswith("short") else "Buy"
+                closed_info = client.get_closed_position_price(uic, buy_or_sell=buy_or_sell)
+                if closed_info:
+                    cp = closed_info.get("closing_price")
+                    if cp and cp > 0:
+                        fill_price = cp
+            if fill_price is not None:
+                if leg_name.startswith("short"):
+                    updated_cost += fill_price * 100 * entry.contracts
+                else:
+                    updated_cost -= fill_price * 100 * entry.contracts
+                continue
+            all_found = False
+        except Exception:
+            all_found = False
+    return updated_cost, all_found
+
+
+@pytest.fixture
+def strategy():
+    inst = MEICStrategy.__new__(MEICStrategy)
+    inst.client = _mock_client()
+    inst.async_client = AsyncSaxoClient(inst.client, max_rate=1000.0)
+    yield inst
+    inst.async_client.close()
+
+
+class TestDeferredStopFillLookup:
+    def test_matches_sequential_loop(self, strategy):
+        entry = IronCondorEntry(entry_number=1, contracts=2)
+        with patch("bots.meic.strategy.time.sleep"):
+            updated_cost, all_found = strategy._deferred_stop_fill_lookup(LEGS, 150.0, entry)
+
+        expected = _sequential_lookup(_mock_client(), LEGS, 150.0, entry)
+        assert (updated_cost, all_found) == pytest.approx(expected)
+        assert updated_cost == pytest.approx(150.0 + 2.10 * 200 - 0.40 * 200)
+        assert all_found is False
+
+    def test_sources_per_leg(self, strategy):
+        results = strategy.async_client.gather_sync(*(
+            strategy._lookup_deferred_fill(order_id, uic, leg_name)
+            for order_id, uic, leg_name in LEGS
+        ))
+        assert results == [(2.10, "activities"), (0.40, "closedpositions"), (None, "error")]
+        # Tier 2 only for the leg activities could not price (a long leg: Buy side)
+        strategy.client.get_closed_position_price.assert_called_once_with(102, buy_or_sell="Buy")
+
+    def test_all_found_when_every_leg_priced(self, strategy):
+        entry = IronCondorEntry(entry_number=1, contracts=1)
+        with patch("bots.meic.strategy.time.sleep"):
+            updated_cost, all_found = strategy._deferred_stop_fill_lookup(LEGS[:2], 0.0, entry)
+        assert updated_cost == pytest.approx(210.0 - 40.0)
+        assert all_found is True
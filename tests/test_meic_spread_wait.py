@@ -0,0 +1,96 @@
+"""Tests for MEICStrategy._sleep_until_streamed_spread_ok — CONN-018 tick wait.
+
+Verifies that:
+  • With no streamed ticks (REST-only mode) it sleeps the full wait.
+  • While the latest tick's spread is wider than EMERGENCY_SPREAD_MAX_PERCENT
+    it keeps waiting until the deadline.
+  • It returns at the first poll whose tick shows an acceptable spread.
+
+Uses a fake clock in place of the strategy module's `time` and a stubbed
+get_tick_history — no sleeping, no network.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bots.meic import strategy as meic_strategy
+from bots.meic.strategy import (
+    EMERGENCY_SPREAD_TICK_POLL_SECONDS,
+    EMERGENCY_SPREAD_WAIT_SECONDS,
+    MEICStrategy,
+)
+
+UIC = 4913
+POLLS = int(EMERGENCY_SPREAD_WAIT_SECONDS / EMERGENCY_SPREAD_TICK_POLL_SECONDS)
+
+WIDE = (0.0, 1.00, 3.00)      # 100% of mid
+NARROW = (0.0, 2.00, 2.20)    # ~9.5% of mid
+
+
+class FakeTime:
+    """monotonic() + sleep() that only advance a counter."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeTime()
+    with patch.object(meic_strategy, "time", fake):
+        yield fake
+
+
+def _strategy(tick_batches):
+    """Strategy whose client returns tick_batches[i] on the i-th poll (last one repeats)."""
+    inst = MEICStrategy.__new__(MEICStrategy)
+    inst.client = MagicMock()
+    calls = []
+
+    def get_tick_history(uic, seconds=None, limit=None):
+        calls.append((uic, seconds, limit))
+        return tick_batches[min(len(calls), len(tick_batches)) - 1]
+
+    inst.client.get_tick_history.side_effect = get_tick_history
+    return inst, calls
+
+
+class TestSleepUntilStreamedSpreadOk:
+    def test_no_ticks_sleeps_full_wait(self, clock):
+        inst, calls = _strategy([[]])
+        inst._sleep_until_streamed_spread_ok(UIC, EMERGENCY_SPREAD_WAIT_SECONDS)
+        assert sum(clock.sleeps) == pytest.approx(EMERGENCY_SPREAD_WAIT_SECONDS)
+        assert len(calls) == POLLS
+        assert calls[0] == (UIC, EMERGENCY_SPREAD_TICK_POLL_SECONDS * 2, 1)
+
+    def test_wide_spread_keeps_waiting(self, clock):
+        inst, calls = _strategy([[WIDE]])
+        inst._sleep_until_streamed_spread_ok(UIC, EMERGENCY_SPREAD_WAIT_SECONDS)
+        assert sum(clock.sleeps) == pytest.approx(EMERGENCY_SPREAD_WAIT_SECONDS)
+        assert len(calls) == POLLS
+
+    def test_acceptable_spread_returns_early(self, clock):
+        inst, calls = _strategy([[WIDE], [], [NARROW]])
+        inst._sleep_until_streamed_spread_ok(UIC, EMERGENCY_SPREAD_WAIT_SECONDS)
+        assert len(calls) == 3
+        assert sum(clock.sleeps) == pytest.approx(3 * EMERGENCY_SPREAD_TICK_POLL_SECONDS)
+
+    def test_last_sleep_is_clipped_to_deadline(self, clock):
+        inst, _ = _strategy([[]])
+        inst._sleep_until_streamed_spread_ok(UIC, 1.2)
+        assert clock.sleeps == pytest.approx([0.5, 0.5, 0.2])
@@ -0,0 +1,138 @@
+"""Tests for shared/quote_store.py — CONN-018 streaming quote store.
+
+Verifies that:
+  • Deltas merge into the full quote (nested groups key by key) instead of
+    replacing it; snapshots with replace=True start over.
+  • Published quotes are never mutated — a reader's dict stays as it was.
+  • Staleness uses the store's monotonic clock.
+  • Tick rings keep the most recent (ts, bid, ask) ticks, oldest first,
+    filtered by age and limit, and wrap at capacity.
+  • clear() drops quotes and ticks.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from shared.quote_store import QuoteStore, TickRing, merge_quote
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+SNAPSHOT = {
+    "Uic": 4913,
+    "Quote": {"Bid": 5.0, "Ask": 5.4, "Mid": 5.2, "MarketState": "Open"},
+    "PriceInfo": {"High": 6.0, "Low": 4.0},
+}
+
+
+class TestMerge:
+    def test_nested_merge_keeps_untouched_fields(self):
+        merged = merge_quote(SNAPSHOT, {"Quote": {"Bid": 5.1}, "LastUpdated": "t1"})
+        assert merged["Quote"] == {"Bid": 5.1, "Ask": 5.4, "Mid": 5.2, "MarketState": "Open"}
+        assert merged["PriceInfo"] is SNAPSHOT["PriceInfo"]
+        assert merged["LastUpdated"] == "t1"
+        assert SNAPSHOT["Quote"]["Bid"] == 5.0
+
+
+class TestQuoteStore:
+    def test_delta_merge_and_replace(self):
+        store = QuoteStore()
+        store.update(4913, SNAPSHOT, replace=True)
+        quote = store.update(4913, {"Quote": {"Ask": 5.3}})
+        assert quote["Quote"]["Bid"] == 5.0 and quote["Quote"]["Ask"] == 5.3
+        assert store.get(4913) is quote
+
+        store.update(4913, {"Quote": {"Bid": 1.0, "Ask": 1.2}}, replace=True)
+        assert "PriceInfo" not in store.get(4913)
+
+    def test_readers_see_immutable_versions(self):
+        store = QuoteStore()
+        store.update(1, SNAPSHOT, replace=True)
+        before = store.get(1)
+        store.update(1, {"Quote": {"Bid": 9.9}})
+        assert before["Quote"]["Bid"] == 5.0
+        assert store.get(1)["Quote"]["Bid"] == 9.9
+
+    def test_staleness_uses_clock(self):
+        clock = FakeClock()
+        store = QuoteStore(clock=clock)
+        store.update(1, SNAPSHOT, replace=True)
+        clock.now += 30
+        assert store.get(1, max_age=60) is not None
+        assert store.age(1) == 30
+        clock.now += 31
+        assert store.get(1, max_age=60) is None
+        assert store.get(1) is not None
+        assert store.get(2) is None and store.age(2) is None
+
+    def test_ticks_record_merged_bid_ask(self):
+        clock = FakeClock()
+        store = QuoteStore(clock=clock)
+        store.update(1, SNAPSHOT, replace=True)
+        clock.now += 1
+        store.update(1, {"Quote": {"Bid": 5.1}})
+        clock.now += 1
+        store.update(1, {"PriceInfo": {"High": 7.0}})   # no Quote group -> no tick
+        clock.now += 1
+        store.update(1, {"Quote": {"Ask": 5.2}})
+
+        assert store.ticks(1) == [(1000.0, 5.0, 5.4), (1001.0, 5.1, 5.4), (1003.0, 5.1, 5.2)]
+        assert store.ticks(1, seconds=2.5) == [(1001.0, 5.1, 5.4), (1003.0, 5.1, 5.2)]
+        assert store.ticks(1, limit=1) == [(1003.0, 5.1, 5.2)]
+        assert store.latest_tick(1) == (1003.0, 5.1, 5.2)
+        assert store.ticks(2) == [] and store.latest_tick(2) is None
+
+    def test_clear(self):
+        store = QuoteStore()
+        store.update(1, SNAPSHOT, replace=True)
+        store.update(2, SNAPSHOT, replace=True)
+        assert store.clear() == 2
+        assert len(store) == 0 and 1 not in store and store.ticks(1) == []
+
+    def test_concurrent_writers_and_readers(self):
+        store = QuoteStore(tick_buffer=64)
+        store.update(1, SNAPSHOT, replace=True)
+        errors = []
+
+        def writer():
+            for i in range(2000):
+                store.update(1, {"Quote": {"Bid": float(i)}})
+
+        def reader():
+            try:
+                for _ in range(2000):
+                    q = store.get(1)
+                    assert q["Quote"]["Ask"] == 5.4 and "PriceInfo" in q
+                    store.ticks(1, limit=10)
+            except AssertionError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer) for _ in range(2)] + \
+                  [threading.Thread(target=reader) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+        assert len(store.ticks(1)) == 64
+
+
+class TestTickRing:
+    def test_wraps_at_capacity(self):
+        ring = TickRing(capacity=3)
+        for i in range(5):
+            ring.append(float(i), i + 0.1, i + 0.2)
+        assert len(ring) == 3 and ring.count == 5
+        assert [t[0] for t in ring.since()] == [2.0, 3.0, 4.0]
+        assert ring.since(ts_min=3.0) == [(3.0, 3.1, 3.2), (4.0, 4.1, 4.2)]
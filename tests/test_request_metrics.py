@@ -0,0 +1,89 @@
+"""Tests for shared/request_metrics.py — CONN-007 REST latency accounting.
+
+Verifies that:
+  • Endpoint paths collapse per-request IDs but keep API version segments.
+  • Percentiles are nearest-rank over the rolling window.
+  • 429s, timeouts, transport errors and retries are counted separately.
+  • snapshot() is JSON-safe and orders endpoints busiest first.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from shared.request_metrics import RequestMetrics, normalize_endpoint
+
+
+class TestNormalize:
+    def test_ids_collapse(self):
+        assert normalize_endpoint("get", "/trade/v2/orders/5012345678") == "GET /trade/v2/orders/{id}"
+        assert normalize_endpoint("DELETE", "/trade/v2/orders/501,502,503/?AccountKey=x") == \
+            "DELETE /trade/v2/orders/{id}/"
+
+    def test_named_paths_kept(self):
+        assert normalize_endpoint("GET", "/trade/v1/infoprices/list?Uics=4913") == \
+            "GET /trade/v1/infoprices/list"
+        assert normalize_endpoint("GET", "/port/v1/positions/me") == "GET /port/v1/positions/me"
+
+
+class TestRequestMetrics:
+    def test_percentiles_and_counters(self):
+        m = RequestMetrics(window=100)
+        for i in range(1, 101):
+            m.record("GET", "/trade/v1/infoprices/list", i / 1000, 200)
+        m.record("GET", "/port/v1/positions/me", 0.5, 429)
+        m.record_retry("GET", "/port/v1/positions/me")
+        m.record("GET", "/port/v1/positions/me", 30.0, timeout=True)
+
+        snap = m.snapshot()
+        quotes = snap["endpoints"]["GET /trade/v1/infoprices/list"]
+        assert (quotes["p50_ms"], quotes["p95_ms"], quotes["p99_ms"], quotes["max_ms"]) == \
+            (50.0, 95.0, 99.0, 100.0)
+        assert quotes["errors"] == 0
+
+        positions = snap["endpoints"]["GET /port/v1/positions/me"]
+        assert positions["rate_limited"] == 1 and positions["retries"] == 1
+        assert positions["timeouts"] == 1 and positions["errors"] == 2
+        assert list(snap["endpoints"])[0] == "GET /trade/v1/infoprices/list"
+
+        total = snap["total"]
+        assert total["requests"] == 102 and total["rate_limited"] == 1
+        assert total["max_ms"] == 30000.0
+        json.dumps(snap)
+        assert "429s 1" in m.summary() and "retries 1" in m.summary()
+
+    def test_window_bounds_samples_not_counters(self):
+        m = RequestMetrics(window=10)
+        for _ in range(50):
+            m.record("GET", "/a", 1.0, 200)
+        for _ in range(10):
+            m.record("GET", "/a", 0.01, 200)
+        stats = m.snapshot()["endpoints"]["GET /a"]
+        assert stats["requests"] == 60
+        assert stats["p99_ms"] == 10.0
+
+    def test_concurrent_records(self):
+        m = RequestMetrics()
+
+        def worker():
+            for _ in range(1000):
+                m.record("POST", "/trade/v2/orders", 0.001, 201)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert m.snapshot()["total"]["requests"] == 8000
+
+    def test_reset(self):
+        m = RequestMetrics()
+        m.record("GET", "/a", 0.1, 200)
+        m.reset()
+        assert m.snapshot() == {"total": m.snapshot()["total"], "endpoints": {}}
+        assert m.snapshot()["total"]["requests"] == 0
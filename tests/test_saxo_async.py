@@ -0,0 +1,107 @@
+"""Tests for shared/saxo_async.py — CONN-008 concurrent REST fan-out.
+
+Verifies that:
+  • AsyncSaxoClient exposes the wrapped client's methods as coroutines and
+    passes plain attributes through.
+  • Independent calls overlap: N slow calls finish in ~one call's time.
+  • The shared RateLimiter spaces call starts once the burst is spent.
+  • The sync façade returns results in argument order and raises errors.
+
+Uses a fake client — no real network calls.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from shared.saxo_async import AsyncSaxoClient, RateLimiter
+
+
+class FakeClient:
+    http_config = {"max_concurrency": 4}
+    environment = "sim"
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.threads = set()
+
+    def get_positions(self):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [{"PositionId": "1"}]
+
+    def get_closed_position_price(self, uic, buy_or_sell=None):
+        time.sleep(self.delay)
+        return {"uic": uic, "side": buy_or_sell}
+
+    def get_order_status(self, order_id):
+        raise ValueError(f"unknown order {order_id}")
+
+
+@pytest.fixture
+def aclient():
+    c = AsyncSaxoClient(FakeClient(), max_rate=1000.0)
+    yield c
+    c.close()
+
+
+class TestSurface:
+    def test_attributes_and_config(self, aclient):
+        assert aclient.environment == "sim"
+        assert aclient.max_concurrency == 4
+
+    def test_method_is_coroutine(self, aclient):
+        assert aclient.run(aclient.get_positions()) == [{"PositionId": "1"}]
+        assert next(iter(aclient.client.threads)).startswith("saxo-async")
+
+
+class TestFanout:
+    def test_calls_overlap_and_keep_order(self, aclient):
+        start = time.perf_counter()
+        results = aclient.gather_sync(*(aclient.get_closed_position_price(uic, buy_or_sell="Buy")
+                                        for uic in (11, 12, 13, 14)))
+        elapsed = time.perf_counter() - start
+        assert [r["uic"] for r in results] == [11, 12, 13, 14]
+        assert elapsed < 0.2 * 2.5   # sequential would be 0.8s
+
+    def test_errors_propagate(self, aclient):
+        with pytest.raises(ValueError, match="unknown order 7"):
+            aclient.gather_sync(aclient.get_positions(), aclient.get_order_status("7"))
+
+    def test_usable_from_several_threads(self, aclient):
+        out = []
+
+        def worker():
+            out.append(aclient.run(aclient.get_positions()))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(out) == 3
+
+
+class TestRateLimiter:
+    def test_burst_then_spacing(self):
+        limiter = RateLimiter(rate=10.0, burst=2)
+        waits = [limiter.reserve() for _ in range(4)]
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.02)
+        assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+    def test_limits_fanout(self):
+        c = AsyncSaxoClient(FakeClient(delay=0.0), max_rate=20.0, burst=1)
+        try:
+            start = time.perf_counter()
+            c.gather_sync(*(c.get_positions() for _ in range(5)))
+            assert time.perf_counter() - start >= 4 / 20.0 * 0.9
+        finally:
+            c.close()